@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark embedding (de)serialization: per-row vs bulk.
+
+Compares loading N stored float32 blobs the old way (struct.unpack into a
+Python list per row, then np.array) with bytes_to_matrix (one join, one
+np.frombuffer), and serializing per row vs matrix_to_bytes.
+
+Usage:
+    python scripts/bench_embedding_vectors.py
+    python scripts/bench_embedding_vectors.py --rows 200000 --dim 1536
+"""
+
+import argparse
+import struct
+import time
+
+import numpy as np
+
+from kurt.tools.batch_embedding.vectors import bytes_to_matrix, matrix_to_bytes
+
+
+def _timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--dim", type=int, default=512)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    matrix = np.random.default_rng(0).standard_normal((args.rows, args.dim)).astype(np.float32)
+    vectors = matrix.tolist()
+    blobs = [np.array(v, dtype=np.float32).tobytes() for v in vectors]
+
+    def load_per_row():
+        rows = [list(struct.unpack(f"{len(b) // 4}f", b)) for b in blobs]
+        return np.array(rows, dtype=np.float32)
+
+    def load_bulk():
+        return bytes_to_matrix(blobs)[0]
+
+    def dump_per_row():
+        return [np.array(v, dtype=np.float32).tobytes() for v in vectors]
+
+    def dump_bulk():
+        return matrix_to_bytes(matrix)
+
+    np.testing.assert_array_equal(load_per_row(), load_bulk())
+    assert dump_per_row() == dump_bulk()
+
+    print(f"{args.rows} x {args.dim} float32 ({args.rows * args.dim * 4 / 1e6:.0f} MB)")
+    for label, slow, fast in (
+        ("load", load_per_row, load_bulk),
+        ("dump", dump_per_row, dump_bulk),
+    ):
+        t_slow = _timed(slow, args.repeat)
+        t_fast = _timed(fast, args.repeat)
+        print(
+            f"  {label}: per-row {t_slow * 1000:8.1f} ms   bulk {t_fast * 1000:8.1f} ms   "
+            f"speedup {t_slow / t_fast:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,8 @@
 Simplified CLI structure with ~13 top-level commands:
 - init, status, doctor, repair, serve: Core operations
 - workflow: Unified workflow management (TOML + MD in workflows/)
+- scheduler: Run scheduled workflows (long-running service)
+- workers: Warm worker pool for background runs (long-running service)
 - tool: All tools (map, fetch, llm, embed, save, sql, research, signals)
 - docs: Document management
 - sync: Version control (pull, push, branch, merge)
@@ -28,58 +30,81 @@ from kurt.cli.robot import OutputContext  # noqa: E402
 
 
 def _auto_migrate_schema():
-    """Auto-migrate schema on startup (adds missing columns and tables)."""
+    """Auto-migrate schema on startup (adds missing columns and tables).
+
+    Migration checks only run when the model sources or Kurt version differ
+    from those recorded in the schema stamp, so a normal invocation neither
+    imports the models nor introspects the schema. Stale workflow cleanup
+    runs in a periodic background sweep.
+    """
+    from pathlib import Path
+
     try:
-        from kurt.db.auto_migrate import auto_migrate
-
-        changes = auto_migrate()
-        if changes:
-            from rich.console import Console
-
-            console = Console()
-            for table, cols in changes.items():
-                if cols and cols[0].startswith("[created"):
-                    console.print(f"[dim]Created table: {table}[/dim]")
-                else:
-                    console.print(f"[dim]Added columns to {table}: {', '.join(cols)}[/dim]")
+        from kurt.db import get_database_client
+        from kurt.db.fingerprint import schema_fingerprint, source_key, stamp_matches
+
+        db = get_database_client()
+        key = source_key()
+        if not stamp_matches(db, key):
+            _migrate_schema(db, schema_fingerprint(), key)
     except Exception:
         pass  # Silent fail - don't block CLI
 
-    # Also ensure Dolt observability tables exist if using Dolt
     try:
-        from pathlib import Path
+        project_root = Path.cwd()
+        if (project_root / ".dolt").exists():
+            from kurt.db.dolt import DoltDB
+            from kurt.observability.sweep import maybe_spawn_sweep
+            from kurt.observability.tracking import init_tracking
+
+            init_tracking(DoltDB(project_root))  # Enable global tracking for track_event() calls
+
+            # Mark orphaned "running" workflows as failed (detached, periodic)
+            maybe_spawn_sweep(project_root)
+    except Exception:
+        pass  # Silent fail - don't block CLI
+
+
+def _migrate_schema(db, fingerprint: str, key: str) -> None:
+    """Bring the schema up to ``fingerprint``; record it in the DB and ``key`` in the stamp."""
+    from pathlib import Path
 
-        dolt_path = Path.cwd() / ".dolt"
-        if dolt_path.exists():
+    from rich.console import Console
+
+    from kurt.db.fingerprint import read_db_fingerprint, write_db_fingerprint, write_stamp
+
+    if read_db_fingerprint(db) != fingerprint:
+        from kurt.db.auto_migrate import auto_migrate, check_migrations_needed
+
+        console = Console()
+        engine = db._get_engine()
+        changes = auto_migrate(engine)
+        for table, cols in changes.items():
+            if cols and cols[0].startswith("[created"):
+                console.print(f"[dim]Created table: {table}[/dim]")
+            else:
+                console.print(f"[dim]Added columns to {table}: {', '.join(cols)}[/dim]")
+
+        # Also ensure Dolt observability tables exist if using Dolt
+        if (Path.cwd() / ".dolt").exists():
             from kurt.db.dolt import DoltDB, check_schema_exists, init_observability_schema
-            from kurt.observability.tracking import init_tracking
 
-            db = DoltDB(Path.cwd())
-            init_tracking(db)  # Enable global tracking for track_event() calls
-            schema_status = check_schema_exists(db)
+            dolt_db = DoltDB(Path.cwd())
+            schema_status = check_schema_exists(dolt_db)
 
             # Only initialize if any table is missing
             if not all(schema_status.values()):
                 missing = [t for t, exists in schema_status.items() if not exists]
-                init_observability_schema(db)
-
-                from rich.console import Console
-
-                console = Console()
+                init_observability_schema(dolt_db)
                 for table in missing:
                     console.print(f"[dim]Created Dolt table: {table}[/dim]")
 
-            # Cleanup stale "running" workflows (orphaned processes)
-            from kurt.observability.lifecycle import cleanup_stale_workflows
-
-            stale_count = cleanup_stale_workflows(db, stale_minutes=60)
-            if stale_count > 0:
-                from rich.console import Console
+        # Don't record a fingerprint the schema doesn't match yet; retry next time
+        if check_migrations_needed(engine):
+            return
+        write_db_fingerprint(db, fingerprint)
 
-                console = Console()
-                console.print(f"[dim]Cleaned up {stale_count} stale workflow(s)[/dim]")
-    except Exception:
-        pass  # Silent fail - don't block CLI
+    write_stamp(db, key)
 
 
 class AliasedLazyGroup(click.Group):
@@ -158,6 +183,8 @@ class AliasedLazyGroup(click.Group):
         "help": ("kurt.cli.show", "show_group"),
         # Agent workflows
         "agents": ("kurt.workflows.agents.cli", "agents_group"),
+        "scheduler": ("kurt.workflows.agents.cli", "scheduler_cmd"),
+        "workers": ("kurt.tools.cli", "workers_cmd"),
         # Skill management
         "skill": ("kurt.cli.skill", "skill"),
     },
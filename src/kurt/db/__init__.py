@@ -41,11 +41,13 @@ from kurt.db.database import (
     init_database,
     managed_session,
 )
+from kurt.db.diff import changed_documents, iter_table_changes, table_changes
 
 # Dolt client and schema
 from kurt.db.dolt import (
     # Schema helpers
     OBSERVABILITY_TABLES,
+    AsyncConnectionPool,
     BranchInfo,
     ConnectionPool,
     DoltBranchError,
@@ -115,6 +117,7 @@ __all__ = [
     "DoltTransaction",
     "QueryResult",
     "BranchInfo",
+    "AsyncConnectionPool",
     "ConnectionPool",
     # Dolt exceptions
     "DoltError",
@@ -127,4 +130,8 @@ __all__ = [
     "OBSERVABILITY_TABLES",
     "init_observability_schema",
     "check_schema_exists",
+    # Dolt diffs
+    "table_changes",
+    "iter_table_changes",
+    "changed_documents",
 ]
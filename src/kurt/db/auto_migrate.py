@@ -1,8 +1,8 @@
 """
 Auto-migration for SQLModel schema changes.
 
-Automatically adds missing columns to existing tables on startup.
-Append-only: only adds columns, never deletes or modifies existing ones.
+Automatically adds missing columns and indexes to existing tables on startup.
+Append-only: only adds columns/indexes, never deletes or modifies existing ones.
 
 Usage:
     from kurt.db.auto_migrate import auto_migrate
@@ -37,8 +37,14 @@ def get_all_models() -> list[type[SQLModel]]:
 
     # Document models
     try:
-        from kurt.documents.models import DocumentIdRegistry
+        from kurt.documents.models import (
+            DocumentIdRegistry,
+            DocumentSignature,
+            DocumentSignatureBand,
+        )
         models.append(DocumentIdRegistry)
+        models.append(DocumentSignature)
+        models.append(DocumentSignatureBand)
     except ImportError:
         pass
 
@@ -50,8 +56,15 @@ def get_all_models() -> list[type[SQLModel]]:
         pass
 
     try:
-        from kurt.tools.fetch.models import FetchDocument
+        from kurt.tools.fetch.models import FetchDocument, FetchDocumentChunk
         models.append(FetchDocument)
+        models.append(FetchDocumentChunk)
+    except ImportError:
+        pass
+
+    try:
+        from kurt.tools.batch_embedding.models import EmbeddingCacheEntry
+        models.append(EmbeddingCacheEntry)
     except ImportError:
         pass
 
@@ -118,9 +131,9 @@ def get_column_ddl(column, dialect_name: str = "mysql") -> str:
 
 def migrate_table(engine: "Engine", model: type[SQLModel]) -> list[str]:
     """
-    Migrate a single table - add missing columns.
+    Migrate a single table - add missing columns, then missing indexes.
 
-    Returns list of columns that were added.
+    Returns list of columns that were added (indexes as "[index <name>]").
     """
     table_name = model.__tablename__
     inspector = inspect(engine)
@@ -141,9 +154,6 @@ def migrate_table(engine: "Engine", model: type[SQLModel]) -> list[str]:
     # Find missing columns
     missing = set(model_cols.keys()) - existing_cols
 
-    if not missing:
-        return []
-
     added = []
     dialect_name = engine.dialect.name
 
@@ -162,9 +172,32 @@ def migrate_table(engine: "Engine", model: type[SQLModel]) -> list[str]:
         except Exception as e:
             logger.warning(f"Failed to add column {table_name}.{col_name}: {e}")
 
+    added.extend(f"[index {name}]" for name in migrate_indexes(engine, model))
     return added
 
 
+def _missing_indexes(engine: "Engine", model: type[SQLModel]) -> list:
+    existing = {ix["name"] for ix in inspect(engine).get_indexes(model.__tablename__)}
+    return [ix for ix in model.__table__.indexes if ix.name not in existing]
+
+
+def migrate_indexes(engine: "Engine", model: type[SQLModel]) -> list[str]:
+    """
+    Create indexes declared on the model but missing from its table.
+
+    Returns names of the indexes that were created.
+    """
+    created = []
+    for index in _missing_indexes(engine, model):
+        try:
+            index.create(engine)
+            logger.info(f"Created index: {model.__tablename__}.{index.name}")
+            created.append(index.name)
+        except Exception as e:
+            logger.warning(f"Failed to create index {model.__tablename__}.{index.name}: {e}")
+    return created
+
+
 def auto_migrate(engine: "Engine" = None) -> dict[str, list[str]]:
     """
     Auto-migrate all SQLModel tables.
@@ -206,7 +239,7 @@ def check_migrations_needed(engine: "Engine" = None) -> dict[str, list[str]]:
     Check what migrations would be needed without applying them.
 
     Returns:
-        Dict mapping table names to list of missing columns.
+        Dict mapping table names to list of missing columns (and indexes).
     """
     if engine is None:
         from kurt.db import get_engine
@@ -225,9 +258,10 @@ def check_migrations_needed(engine: "Engine" = None) -> dict[str, list[str]]:
 
         existing_cols = {col["name"] for col in inspector.get_columns(table_name)}
         model_cols = set(col.name for col in model.__table__.columns)
-        missing = model_cols - existing_cols
+        missing = list(model_cols - existing_cols)
+        missing.extend(f"[index {ix.name}]" for ix in _missing_indexes(engine, model))
 
         if missing:
-            missing_by_table[table_name] = list(missing)
+            missing_by_table[table_name] = missing
 
     return missing_by_table
@@ -0,0 +1,235 @@
+"""
+Read-through result cache keyed by Dolt working-set hashes.
+
+Dashboards, the web UI and status views run the same reads over and over
+against data that only changes when a workflow writes. Dolt gives every
+table a value hash (``DOLT_HASHOF_TABLE``) that changes exactly when the
+table's working-set data changes, so a cached result stays valid for as
+long as the hashes of the tables it read are unchanged.
+
+An entry is looked up by a key (SQL + params for query_cached()) and is
+only returned if it was computed against the current hashes of its tables:
+
+- Checked on read: one ``SELECT DOLT_HASHOF_TABLE(...)`` round-trip per
+  lookup replaces the (possibly expensive) query. With ``ttl`` > 0 an entry
+  validated less than ``ttl`` seconds ago is returned without the check.
+- Pushed on write: statements written through DoltDB (execute*, call(),
+  SQLModel sessions, EventTracker batches) drop the entries of the tables
+  they touch in this process, so a ``ttl`` only delays writes made by other
+  processes.
+
+Caches are shared by every DoltDB pointing at the same database in a
+process (see shared_query_cache()), so a write through one instance
+invalidates results cached by another.
+
+Usage:
+    db.enable_query_cache(ttl=1.0)
+    result = db.query_cached("SELECT status, COUNT(*) AS n FROM fetch_documents GROUP BY status")
+    docs = db.cached(("documents", filters), ["map_documents", "fetch_documents"], load_docs)
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterable
+
+# Default memory bound for one cache (approximate bytes of cached results)
+QUERY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Table names following FROM / JOIN / INTO / UPDATE / TABLE in a statement
+_TABLE_RE = re.compile(
+    r"\b(?:FROM|JOIN|INTO|UPDATE|TABLE)\s+`?([A-Za-z_][A-Za-z0-9_]*)`?",
+    re.IGNORECASE,
+)
+
+# Statements that can change data (pushed invalidation)
+_WRITE_RE = re.compile(
+    r"^\s*(?:INSERT|UPDATE|DELETE|REPLACE|CREATE|DROP|ALTER|TRUNCATE|LOAD|RENAME|CALL)\b",
+    re.IGNORECASE,
+)
+
+# Table-valued functions and keywords the table regex can pick up
+_NOT_TABLES = {"dual", "select", "lateral", "exists"}
+
+
+def referenced_tables(sql: str) -> tuple[str, ...]:
+    """Tables a statement reads or writes, in order of first appearance."""
+    seen: dict[str, None] = {}
+    for name in _TABLE_RE.findall(sql):
+        if name.lower() not in _NOT_TABLES:
+            seen.setdefault(name, None)
+    return tuple(seen)
+
+
+def is_write(sql: str) -> bool:
+    """Whether a statement can change data."""
+    return bool(_WRITE_RE.match(sql))
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory used by a cached value (rows of scalars)."""
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + estimate_size(vars(value))
+    return sys.getsizeof(value)
+
+
+def freeze(value: Any) -> Hashable:
+    """Hashable form of query params / cache key parts."""
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, set):
+        return frozenset(freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+@dataclass
+class _Entry:
+    tables: tuple[str, ...]
+    hashes: tuple[str, ...]
+    value: Any
+    size: int
+    checked_at: float
+
+
+class QueryCache:
+    """LRU cache of results, validated against table hashes.
+
+    Args:
+        max_bytes: Approximate memory bound; least recently used entries
+            are evicted beyond it.
+        ttl: Seconds an entry is trusted after its hashes were last
+            checked (0 = check on every lookup).
+
+    Thread Safety:
+        QueryCache is thread-safe.
+    """
+
+    def __init__(self, max_bytes: int = QUERY_CACHE_MAX_BYTES, ttl: float = 0.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_fresh(self, key: Hashable) -> tuple[bool, Any]:
+        """Return ``(True, value)`` if the entry was validated within ``ttl``."""
+        if self.ttl <= 0:
+            return False, None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry.checked_at >= self.ttl:
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry.value
+
+    def get(self, key: Hashable, hashes: tuple[str, ...]) -> tuple[bool, Any]:
+        """Return ``(True, value)`` if the entry was computed against ``hashes``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.hashes != hashes:
+                self.misses += 1
+                return False, None
+            entry.checked_at = time.monotonic()
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry.value
+
+    def put(
+        self, key: Hashable, tables: Iterable[str], hashes: tuple[str, ...], value: Any
+    ) -> None:
+        """Store a value computed against ``hashes`` of ``tables``."""
+        size = estimate_size(value)
+        with self._lock:
+            self._pop(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = _Entry(
+                tables=tuple(t.lower() for t in tables),
+                hashes=hashes,
+                value=value,
+                size=size,
+                checked_at=time.monotonic(),
+            )
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, tables: Iterable[str] | None = None) -> None:
+        """Drop entries that read any of ``tables`` (all entries if None)."""
+        with self._lock:
+            if tables is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            written = {t.lower() for t in tables}
+            stale = [k for k, e in self._entries.items() if written.intersection(e.tables)]
+            for key in stale:
+                self._pop(key)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _pop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+
+_caches: dict[Hashable, QueryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def shared_query_cache(
+    target: Hashable, max_bytes: int = QUERY_CACHE_MAX_BYTES, ttl: float = 0.0
+) -> QueryCache:
+    """The process-wide cache for a database, created on first use."""
+    with _caches_lock:
+        cache = _caches.get(target)
+        if cache is None:
+            cache = _caches[target] = QueryCache(max_bytes=max_bytes, ttl=ttl)
+        return cache
+
+
+def invalidate_shared(target: Hashable, tables: Iterable[str] | None = None) -> None:
+    """Push a write to the database's cache, if one exists."""
+    cache = _caches.get(target)
+    if cache is not None:
+        cache.invalidate(tables)
+
+
+__all__ = [
+    "QUERY_CACHE_MAX_BYTES",
+    "QueryCache",
+    "estimate_size",
+    "freeze",
+    "invalidate_shared",
+    "is_write",
+    "referenced_tables",
+    "shared_query_cache",
+]
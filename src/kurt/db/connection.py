@@ -3,14 +3,18 @@ DoltDB connection management, server lifecycle, and session support.
 
 This module contains the core DoltDB class infrastructure:
 - ConnectionPool for MySQL protocol connections to dolt sql-server
+- AsyncConnectionPool (aiomysql) for the async query API
 - Server lifecycle management (start/stop dolt sql-server)
 - SQLAlchemy engine and session management (sync and async)
 - Repository management (init, exists)
 - Transaction support
-- CLI helpers (for version control operations only)
+- Version control (commit, branches) over SQL with CALL DOLT_*() procedures
+- CLI helpers (init and checkout only)
 
-Server mode is the only supported runtime for SQL operations.
-Dolt CLI is used only for version control operations (branch, commit, push, pull).
+Server mode is the only supported runtime. One dolt sql-server per project
+is started on first use, shared by every process, and stopped when idle
+(see kurt.db.server). The Dolt CLI is only used to initialize a repository
+and to change the server's checked-out branch.
 
 The DoltDB class defined here provides all connection and session
 functionality. Query methods are mixed in from queries.py.
@@ -18,6 +22,7 @@ functionality. Query methods are mixed in from queries.py.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import shutil
@@ -25,13 +30,14 @@ import signal
 import subprocess
 import threading
 import time
-from contextlib import contextmanager
+import weakref
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from queue import Queue
-from typing import TYPE_CHECKING, Any, Generator, Literal, Optional
+from queue import Empty, Full, Queue
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Literal, Optional
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import Session, SQLModel
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -45,6 +51,13 @@ from kurt.db.exceptions import (
     DoltQueryError,
     DoltTransactionError,
 )
+from kurt.db.server import (
+    SERVER_INFO_FILE,
+    read_server_info,
+    server_lock,
+    spawn_idle_watch,
+    stop_server,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,8 +67,29 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 
+# Seconds between background pings of idle pooled connections. A connection
+# idle for longer than this is pinged on checkout instead.
+HEALTH_CHECK_INTERVAL = 30.0
+
+
+def _connect_kwargs(pool: Any) -> dict[str, Any]:
+    return {
+        "host": pool.host,
+        "port": pool.port,
+        "user": pool.user,
+        "password": pool.password,
+        "database": pool.database,
+        "autocommit": True,
+    }
+
+
 class ConnectionPool:
-    """Simple connection pool for MySQL protocol connections to dolt sql-server."""
+    """Simple connection pool for MySQL protocol connections to dolt sql-server.
+
+    Idle connections are pinged by a background thread every
+    ``health_check_interval`` seconds, so a checkout only pings a connection
+    that has been idle longer than that. ``stats()`` reports pool metrics.
+    """
 
     def __init__(
         self,
@@ -65,6 +99,7 @@ class ConnectionPool:
         password: str,
         database: str | None,
         pool_size: int = 5,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL,
     ):
         self.host = host
         self.port = port
@@ -72,91 +107,312 @@ class ConnectionPool:
         self.password = password
         self.database = database
         self.pool_size = pool_size
+        self.health_check_interval = health_check_interval
 
+        # Idle connections with the monotonic time they were last known alive
         self._pool: Queue = Queue(maxsize=pool_size)
         self._lock = threading.Lock()
         self._created = 0
 
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._dropped = 0
+        self._health_checks = 0
+
+        self._stop_health = threading.Event()
+        self._health_thread: threading.Thread | None = None
+
     def _create_connection(self) -> Any:
         """Create a new MySQL connection."""
         try:
             import mysql.connector  # type: ignore
 
-            return mysql.connector.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                autocommit=True,
-            )
+            return mysql.connector.connect(**_connect_kwargs(self))
         except ImportError:
             try:
                 import pymysql  # type: ignore
 
-                return pymysql.connect(
-                    host=self.host,
-                    port=self.port,
-                    user=self.user,
-                    password=self.password,
-                    database=self.database,
-                    autocommit=True,
-                )
+                return pymysql.connect(**_connect_kwargs(self))
             except ImportError as e:
                 raise DoltConnectionError(
                     "Server mode requires mysql-connector-python or pymysql.\n"
                     "Install with: uv pip install mysql-connector-python"
                 ) from e
 
+    def _discard(self, conn: Any) -> None:
+        with self._lock:
+            self._created -= 1
+            self._dropped += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
     def get_connection(self) -> Any:
         """Get a connection from the pool."""
-        try:
-            conn = self._pool.get_nowait()
-            # Test if connection is still alive
+        self._checkouts += 1
+        while True:
+            try:
+                conn, last_ok = self._pool.get_nowait()
+            except Empty:
+                break
+            if time.monotonic() - last_ok < self.health_check_interval:
+                return conn
+            # Idle past the last health check: make sure it's still alive
             try:
                 conn.ping(reconnect=True)
                 return conn
             except Exception:
-                # Connection dead, create new one
-                pass
-        except Exception:
-            pass
+                self._discard(conn)
 
         with self._lock:
             if self._created < self.pool_size:
                 self._created += 1
-                return self._create_connection()
+                create = True
+            else:
+                create = False
+        if create:
+            try:
+                conn = self._create_connection()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+            self._start_health_checks()
+            return conn
 
         # Pool exhausted, wait for one
-        return self._pool.get()
+        started = time.monotonic()
+        conn, _ = self._pool.get()
+        self._waits += 1
+        self._wait_seconds += time.monotonic() - started
+        return conn
 
     def return_connection(self, conn: Any) -> None:
         """Return a connection to the pool."""
         try:
-            self._pool.put_nowait(conn)
-        except Exception:
+            self._pool.put_nowait((conn, time.monotonic()))
+        except Full:
             # Pool full, close connection
+            self._discard(conn)
+
+    def discard_connection(self, conn: Any) -> None:
+        """Close a checked-out connection instead of returning it to the pool."""
+        self._discard(conn)
+
+    def _start_health_checks(self) -> None:
+        with self._lock:
+            if self._health_thread is not None or self.health_check_interval <= 0:
+                return
+            self._health_thread = threading.Thread(
+                target=self._health_loop, name="dolt-pool-health", daemon=True
+            )
+            self._health_thread.start()
+
+    def _health_loop(self) -> None:
+        while not self._stop_health.wait(self.health_check_interval):
+            self.check_health()
+
+    def check_health(self) -> int:
+        """Ping idle connections and drop dead ones. Returns the number dropped."""
+        self._health_checks += 1
+        dropped = 0
+        for _ in range(self._pool.qsize()):
             try:
-                conn.close()
+                conn, _ = self._pool.get_nowait()
+            except Empty:
+                break
+            try:
+                conn.ping(reconnect=True)
             except Exception:
-                pass
+                self._discard(conn)
+                dropped += 1
+                continue
+            self.return_connection(conn)
+        return dropped
+
+    def stats(self) -> dict[str, Any]:
+        """Pool metrics: size, usage, waits on exhaustion, dropped connections."""
+        idle = self._pool.qsize()
+        return {
+            "pool_size": self.pool_size,
+            "created": self._created,
+            "idle": idle,
+            "in_use": self._created - idle,
+            "checkouts": self._checkouts,
+            "waits": self._waits,
+            "wait_ms": round(self._wait_seconds * 1000, 1),
+            "dropped": self._dropped,
+            "health_checks": self._health_checks,
+        }
 
     def close_all(self) -> None:
         """Close all connections in the pool."""
+        self._stop_health.set()
         while not self._pool.empty():
             try:
-                conn = self._pool.get_nowait()
+                conn, _ = self._pool.get_nowait()
                 conn.close()
             except Exception:
                 pass
         self._created = 0
 
 
+class AsyncConnectionPool:
+    """aiomysql connection pool backing the async query API (aquery, aexecute).
+
+    The aiomysql pool is created lazily on first use and is bound to the
+    event loop it was created on. A background task pings idle connections
+    every ``health_check_interval`` seconds and closes dead ones, so
+    checkouts never ping. ``stats()`` reports pool metrics.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        database: str | None,
+        pool_size: int = 5,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.database = database
+        self.pool_size = pool_size
+        self.health_check_interval = health_check_interval
+
+        self._pool: Any = None
+        self._create_lock: asyncio.Lock | None = None
+        self._health_task: asyncio.Task | None = None
+
+        self._checkouts = 0
+        self._waits = 0
+        self._wait_seconds = 0.0
+        self._dropped = 0
+        self._health_checks = 0
+
+    async def _get_pool(self) -> Any:
+        if self._pool is not None:
+            return self._pool
+        if self._create_lock is None:
+            self._create_lock = asyncio.Lock()
+        async with self._create_lock:
+            if self._pool is None:
+                try:
+                    import aiomysql  # type: ignore
+                except ImportError as e:
+                    raise DoltConnectionError(
+                        "The async query API requires aiomysql.\n"
+                        "Install with: uv pip install aiomysql"
+                    ) from e
+
+                self._pool = await aiomysql.create_pool(
+                    host=self.host,
+                    port=self.port,
+                    user=self.user,
+                    password=self.password,
+                    db=self.database,
+                    autocommit=True,
+                    minsize=0,
+                    maxsize=self.pool_size,
+                )
+                if self.health_check_interval > 0:
+                    self._health_task = asyncio.create_task(self._health_loop())
+        return self._pool
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncGenerator[Any, None]:
+        """Check out a connection for the duration of the ``async with`` block."""
+        pool = await self._get_pool()
+        self._checkouts += 1
+        exhausted = pool.freesize == 0 and pool.size >= pool.maxsize
+        started = time.monotonic()
+        conn = await pool.acquire()
+        if exhausted:
+            self._waits += 1
+            self._wait_seconds += time.monotonic() - started
+        try:
+            yield conn
+        finally:
+            pool.release(conn)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_interval)
+            try:
+                await self.check_health()
+            except Exception:
+                logger.debug("Async pool health check failed", exc_info=True)
+
+    async def check_health(self) -> int:
+        """Ping idle connections and close dead ones. Returns the number dropped."""
+        pool = await self._get_pool()
+        self._health_checks += 1
+        dropped = 0
+        # acquire() takes the oldest idle connection and release() puts it
+        # last, so freesize rounds visit each idle connection once
+        for _ in range(pool.freesize):
+            conn = await pool.acquire()
+            try:
+                await conn.ping(reconnect=False)
+            except Exception:
+                conn.close()  # Closed connections are dropped on release
+                dropped += 1
+            finally:
+                pool.release(conn)
+        self._dropped += dropped
+        return dropped
+
+    def stats(self) -> dict[str, Any]:
+        """Pool metrics: size, usage, waits on exhaustion, dropped connections."""
+        size = self._pool.size if self._pool is not None else 0
+        idle = self._pool.freesize if self._pool is not None else 0
+        return {
+            "pool_size": self.pool_size,
+            "created": size,
+            "idle": idle,
+            "in_use": size - idle,
+            "checkouts": self._checkouts,
+            "waits": self._waits,
+            "wait_ms": round(self._wait_seconds * 1000, 1),
+            "dropped": self._dropped,
+            "health_checks": self._health_checks,
+        }
+
+    async def close(self) -> None:
+        """Stop health checks and close all connections."""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+
+
 # =============================================================================
 # Transaction Context
 # =============================================================================
 
 
+def _group_statements(
+    statements: list[tuple[str, list[Any]]],
+) -> list[tuple[str, list[list[Any]]]]:
+    """Group consecutive statements with the same SQL text, keeping order."""
+    groups: list[tuple[str, list[list[Any]]]] = []
+    for sql, params in statements:
+        if groups and groups[-1][0] == sql:
+            groups[-1][1].append(params)
+        else:
+            groups.append((sql, [params]))
+    return groups
+
+
 @dataclass
 class DoltTransaction:
     """Transaction context for batching operations.
@@ -168,10 +424,14 @@ class DoltTransaction:
         # Auto-commits on exit
 
     Supports:
-    - execute(): Run a single statement
+    - execute(): Queue a statement
     - query(): Run a query and return results
     - Automatic commit on successful exit
     - Automatic rollback on exception
+
+    Queued statements run on one connection between BEGIN and COMMIT, so
+    the transaction is atomic. Consecutive statements with the same SQL
+    text are sent as one executemany batch (multi-row VALUES for INSERTs).
     """
 
     _db: Any  # DoltDB instance (avoid circular import)
@@ -192,13 +452,13 @@ class DoltTransaction:
         return self._db.query(sql, params)
 
     def _commit(self) -> None:
-        """Execute all queued statements."""
+        """Execute all queued statements in one database transaction."""
         if self._committed or self._rolled_back:
             return
 
         try:
-            for sql, params in self._statements:
-                self._db.execute(sql, params)
+            if self._statements:
+                self._db.execute_batches(_group_statements(self._statements))
             self._committed = True
         except Exception as e:
             self._rolled_back = True
@@ -266,6 +526,11 @@ class DoltDBConnection:
         # Connection pool (lazy init) - for raw query mode
         self._pool: ConnectionPool | None = None
 
+        # aiomysql pools (lazy init) - for the async query API, one per event loop
+        self._async_pools: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, AsyncConnectionPool
+        ] = weakref.WeakKeyDictionary()
+
         # SQLAlchemy engines (lazy init) - for SQLModel session mode
         self._server_process: Optional[subprocess.Popen] = None
         self._engine: Optional["Engine"] = None
@@ -296,19 +561,10 @@ class DoltDBConnection:
         Returns the port if this project has a saved server info file,
         None otherwise.
         """
-        info_file = self.path / ".dolt" / "kurt-server.json"
-        if not info_file.exists():
-            return None
-
-        try:
-            import json
-
-            info = json.loads(info_file.read_text())
-            # Only use saved port if it's for this project
-            if info.get("path") == str(self.path.resolve()):
-                return info.get("port")
-        except Exception:
-            pass
+        info = read_server_info(self.path)
+        # Only use saved port if it's for this project
+        if info and info.get("path") == str(self.path.resolve()):
+            return info.get("port")
         return None
 
     def _find_free_port(self) -> int:
@@ -343,6 +599,53 @@ class DoltDBConnection:
             )
         return self._pool
 
+    async def _get_async_pool(self) -> AsyncConnectionPool:
+        """Get or create the aiomysql pool for the running event loop.
+
+        aiomysql connections belong to the loop they were opened on, so each
+        loop gets its own pool. The local server is auto-started (in a worker
+        thread) the first time a loop needs a pool.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._async_pools.get(loop)
+        if pool is None:
+            if self._auto_start and self._is_local_server_target():
+                await asyncio.to_thread(self._start_server)
+            pool = AsyncConnectionPool(
+                host=self._host,
+                port=self._port,
+                user=self._user,
+                password=self._password,
+                database=self._database,
+                pool_size=self._pool_size,
+            )
+            self._async_pools[loop] = pool
+        return pool
+
+    def has_async_pool(self) -> bool:
+        """Whether the running event loop has an async pool open."""
+        try:
+            return asyncio.get_running_loop() in self._async_pools
+        except RuntimeError:
+            return False
+
+    async def close_async_pool(self) -> None:
+        """Close the running event loop's async pool and stop its health checks.
+
+        Callers that query from a short-lived loop (``asyncio.run``) close
+        the pool before the loop ends; the next use opens a new one.
+        """
+        pool = self._async_pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.close()
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Metrics of the sync pool and of each event loop's async pool."""
+        return {
+            "sync": self._pool.stats() if self._pool else None,
+            "async": [pool.stats() for pool in self._async_pools.values()],
+        }
+
     # =========================================================================
     # Server Lifecycle Management
     # =========================================================================
@@ -378,7 +681,7 @@ class DoltDBConnection:
         # Can only verify local servers via info file
         if not self._is_local_server_target():
             return False
-        info_file = self.path / ".dolt" / "kurt-server.json"
+        info_file = self.path / ".dolt" / SERVER_INFO_FILE
         if not info_file.exists():
             # No info file - check if the server actually has our database.
             # Without this check, we'd blindly connect to another project's
@@ -425,7 +728,7 @@ class DoltDBConnection:
         if not self._is_local_server_target():
             return
 
-        info_file = self.path / ".dolt" / "kurt-server.json"
+        info_file = self.path / ".dolt" / SERVER_INFO_FILE
         try:
             import json
 
@@ -452,22 +755,9 @@ class DoltDBConnection:
             )
             return
 
-        if self._is_server_running():
-            # Server is running - but is it OUR server or another project's?
-            if self._is_correct_server():
-                logger.debug(
-                    f"Dolt SQL server already running on port {self._port} for this project"
-                )
-                return
-            else:
-                # Wrong server running on our port - find a free port instead
-                old_port = self._port
-                self._port = self._find_free_port()
-                logger.info(
-                    f"Port {old_port} in use by another project. "
-                    f"Using port {self._port} instead."
-                )
-                # Fall through to start server on new port
+        if self._is_server_running() and self._is_correct_server():
+            logger.debug(f"Dolt SQL server already running on port {self._port} for this project")
+            return
 
         if not shutil.which("dolt"):
             raise DoltConnectionError(
@@ -477,36 +767,62 @@ class DoltDBConnection:
         if not self.exists():
             self.init()
 
-        logger.info(f"Starting Dolt SQL server on port {self._port}")
-
-        # Start dolt sql-server in background
-        self._server_process = subprocess.Popen(
-            [
-                "dolt",
-                "sql-server",
-                "--port",
-                str(self._port),
-                "--host",
-                "127.0.0.1",
-            ],
-            cwd=self.path,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,  # Detach from parent
-        )
-
-        # Wait for server to be ready
-        for _ in range(30):  # 3 second timeout
+        # Concurrent commands serialize here so only one of them starts the server
+        with server_lock(self.path):
+            saved_port = self._read_saved_port()
+            if saved_port is not None:
+                self._port = saved_port
+
             if self._is_server_running():
-                logger.info(f"Dolt SQL server ready on port {self._port}")
-                self._write_server_info()  # Record which project started this server
-                return
-            time.sleep(0.1)
+                # Server is running - but is it OUR server or another project's?
+                if self._is_correct_server():
+                    logger.debug(
+                        f"Dolt SQL server already running on port {self._port} for this project"
+                    )
+                    return
+                # Wrong server running on our port - find a free port instead
+                old_port = self._port
+                self._port = self._find_free_port()
+                logger.info(
+                    f"Port {old_port} in use by another project. "
+                    f"Using port {self._port} instead."
+                )
+
+            logger.info(f"Starting Dolt SQL server on port {self._port}")
+
+            # Start dolt sql-server in background
+            self._server_process = subprocess.Popen(
+                [
+                    "dolt",
+                    "sql-server",
+                    "--port",
+                    str(self._port),
+                    "--host",
+                    "127.0.0.1",
+                ],
+                cwd=self.path,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,  # Detach from parent
+            )
+
+            # Wait for server to be ready
+            for _ in range(30):  # 3 second timeout
+                if self._is_server_running():
+                    logger.info(f"Dolt SQL server ready on port {self._port}")
+                    self._write_server_info()  # Record which project started this server
+                    spawn_idle_watch(self.path, self._port, self._server_process.pid, self._user)
+                    return
+                time.sleep(0.1)
 
         raise DoltConnectionError(f"Dolt SQL server failed to start on port {self._port}")
 
     def _stop_server(self) -> None:
-        """Stop the Dolt SQL server if we started it."""
+        """Stop this project's local Dolt SQL server.
+
+        Stops the server recorded in ``.dolt/kurt-server.json``, whichever
+        process started it, and waits until its port is free.
+        """
         if self._server_process:
             try:
                 os.killpg(os.getpgid(self._server_process.pid), signal.SIGTERM)
@@ -515,6 +831,14 @@ class DoltDBConnection:
                 pass
             self._server_process = None
 
+        info = read_server_info(self.path)
+        if info and info.get("pid") and info.get("path") == str(self.path):
+            stop_server(self.path, info["pid"])
+            for _ in range(50):  # 5 second timeout
+                if not self._is_server_running():
+                    break
+                time.sleep(0.1)
+
     # =========================================================================
     # SQLModel Session Support
     # =========================================================================
@@ -535,8 +859,13 @@ class DoltDBConnection:
                 pool_pre_ping=True,
                 pool_recycle=300,
             )
+            # Session writes invalidate cached reads like execute() does
+            event.listen(self._engine, "after_cursor_execute", self._on_engine_execute)
         return self._engine
 
+    def _on_engine_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self._invalidate_written(statement)
+
     def init_database(self) -> None:
         """Initialize the database and create all SQLModel tables."""
         if self._auto_start and self._is_local_server_target():
@@ -609,6 +938,8 @@ class DoltDBConnection:
             await self._async_engine.dispose()
             self._async_engine = None
 
+        await self.close_async_pool()
+
     # =========================================================================
     # Repository Management
     # =========================================================================
@@ -636,15 +967,18 @@ class DoltDBConnection:
         """
         Context manager for transaction-like batch operations.
 
-        Uses MySQL transactions via dolt sql-server.
+        Uses MySQL transactions via dolt sql-server: statements are queued
+        and run on exit on a single connection between BEGIN and COMMIT.
 
         Example:
             with db.transaction() as tx:
                 tx.execute("INSERT INTO users VALUES (?)", [1])
                 tx.execute("INSERT INTO users VALUES (?)", [2])
-            # All statements executed on exit
+            # Both rows inserted by one executemany call on exit
 
-        On exception, transaction is rolled back (statements discarded).
+        On exception, transaction is rolled back (statements discarded). If
+        a statement fails on commit, the statements before it are rolled
+        back as well.
         """
         tx = DoltTransaction(_db=self)
         try:
@@ -662,6 +996,8 @@ class DoltDBConnection:
         """
         Create a Dolt commit (version control, not SQL transaction).
 
+        Stages all tables and commits with ``CALL DOLT_COMMIT('-A', ...)``.
+
         Args:
             message: Commit message
             author: Optional author in "Name <email>" format
@@ -669,21 +1005,12 @@ class DoltDBConnection:
         Returns:
             Commit hash
         """
-        import re
-
-        # Stage all changes
-        self._run_cli(["add", "-A"])
-
-        # Build commit command
-        cmd = ["commit", "-m", message]
+        args = ["-A", "-m", message]
         if author:
-            cmd.extend(["--author", author])
+            args.extend(["--author", author])
 
-        output = self._run_cli(cmd)
-
-        # Extract commit hash from output
-        match = re.search(r"commit\s+([a-f0-9]+)", output.lower())
-        return match.group(1) if match else ""
+        rows = self.call("DOLT_COMMIT", *args)
+        return rows[0].get("hash", "") if rows else ""
 
     # =========================================================================
     # Branch Operations
@@ -700,18 +1027,23 @@ class DoltDBConnection:
         Raises:
             DoltBranchError: If branch creation fails
         """
-        cmd = ["branch", name]
+        args = [name]
         if start_point:
-            cmd.append(start_point)
+            args.append(start_point)
 
         try:
-            self._run_cli(cmd)
-        except subprocess.CalledProcessError as e:
-            raise DoltBranchError(f"Failed to create branch '{name}': {e.stderr}") from e
+            self.call("DOLT_BRANCH", *args)
+        except DoltQueryError as e:
+            raise DoltBranchError(f"Failed to create branch '{name}': {e}") from e
 
     def branch_switch(self, name: str, force: bool = False) -> None:
         """
-        Switch to a different branch.
+        Switch the repository to a different branch.
+
+        ``CALL DOLT_CHECKOUT()`` only switches the calling SQL session, so
+        this checks the branch out on disk instead: the local server is
+        stopped, ``dolt checkout`` runs, and the next query starts the server
+        on the new branch. Connections other processes hold are dropped.
 
         Args:
             name: Branch name to switch to
@@ -725,7 +1057,13 @@ class DoltDBConnection:
             cmd.append("-f")
 
         try:
-            self._run_cli(cmd)
+            if self._is_local_server_target():
+                self.close()
+                with server_lock(self.path):
+                    self._stop_server()
+                    self._run_cli(cmd)
+            else:
+                self._run_cli(cmd)
         except DoltQueryError as e:
             raise DoltBranchError(f"Failed to switch to branch '{name}': {e}") from e
 
@@ -741,40 +1079,22 @@ class DoltDBConnection:
         """
         from kurt.db.exceptions import BranchInfo
 
-        cmd = ["branch", "-v"]
-        if all_branches:
-            cmd.append("-a")
-
-        output = self._run_cli(cmd)
-        branches = []
+        current = self.branch_current()
+        branches = [
+            BranchInfo(name=row["name"], hash=row.get("hash"), is_current=row["name"] == current)
+            for row in self.query("SELECT name, hash FROM dolt_branches ORDER BY name").rows
+        ]
 
-        for line in output.strip().split("\n"):
-            if not line.strip():
-                continue
-
-            is_current = line.startswith("*")
-            line = line.lstrip("* ").strip()
-
-            parts = line.split()
-            if len(parts) >= 2:
-                name = parts[0]
-                hash_val = parts[1] if len(parts) > 1 else None
-
-                # Check for remote prefix
+        if all_branches:
+            for row in self.query("SELECT name, hash FROM dolt_remote_branches ORDER BY name").rows:
+                name = row["name"]
+                if name.startswith("remotes/"):
+                    name = name[8:]  # Remove "remotes/" prefix
                 remote = None
-                if "/" in name and all_branches:
-                    if name.startswith("remotes/"):
-                        name = name[8:]  # Remove "remotes/" prefix
-                    if "/" in name:
-                        remote, name = name.split("/", 1)
-
+                if "/" in name:
+                    remote, name = name.split("/", 1)
                 branches.append(
-                    BranchInfo(
-                        name=name,
-                        hash=hash_val,
-                        is_current=is_current,
-                        remote=remote,
-                    )
+                    BranchInfo(name=name, hash=row.get("hash"), is_current=False, remote=remote)
                 )
 
         return branches
@@ -786,8 +1106,8 @@ class DoltDBConnection:
         Returns:
             Current branch name
         """
-        output = self._run_cli(["branch", "--show-current"])
-        return output.strip()
+        row = self.query_one("SELECT active_branch() AS branch")
+        return (row or {}).get("branch") or ""
 
     def branch_delete(self, name: str, force: bool = False) -> None:
         """
@@ -802,16 +1122,16 @@ class DoltDBConnection:
         """
         flag = "-D" if force else "-d"
         try:
-            self._run_cli(["branch", flag, name])
-        except subprocess.CalledProcessError as e:
-            raise DoltBranchError(f"Failed to delete branch '{name}': {e.stderr}") from e
+            self.call("DOLT_BRANCH", flag, name)
+        except DoltQueryError as e:
+            raise DoltBranchError(f"Failed to delete branch '{name}': {e}") from e
 
     # =========================================================================
     # CLI Helpers
     # =========================================================================
 
     def _run_cli(self, args: list[str], check: bool = True) -> str:
-        """Run a dolt CLI command."""
+        """Run a dolt CLI command (repository init and branch checkout only)."""
         cmd = ["dolt"] + args
         env = os.environ.copy()
         # Skip Dolt registration prompts for local-only use
@@ -0,0 +1,299 @@
+"""
+Row-level diffs between Dolt revisions.
+
+Incremental steps (embedding, near-duplicate detection, LLM extraction)
+only need the rows that changed since they last ran. Dolt keeps every
+version of every row, and the ``DOLT_DIFF(from, to, table)`` table function
+returns the added, modified and removed rows between two revisions straight
+from storage, without reading either table in full:
+
+    rows = table_changes(db, "fetch_documents", since="run:<run_id>")
+    # [{"diff_type": "modified", "document_id": "...", "status": "SUCCESS", ...}]
+
+    docs = changed_documents(db, since="HEAD~1")
+    # {"doc-1": "added", "doc-2": "modified", "doc-3": "removed"}
+
+Revisions are anything Dolt accepts (commit hash, branch, tag, ``HEAD~1``,
+``WORKING``, ``STAGED``) or a run marker:
+
+- ``run:<run_id>``: the commit recorded when that run completed (tagged
+  ``kurt/run/<run_id>`` by record_run_revision(); TOML workflows with a
+  ``changes`` step record one). Runs without a recorded revision fall back
+  to the last commit made before they started, which can return rows the
+  run already saw, never fewer than changed.
+
+Each diff row is flattened to the row's values on the ``to`` side (``from``
+side for removed rows) plus its ``diff_type``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import TYPE_CHECKING, Any, AsyncIterator, Generator
+
+if TYPE_CHECKING:
+    from kurt.db.dolt import DoltDB
+
+DIFF_TYPES = ("added", "modified", "removed")
+
+# Tables whose changes make up a document-level delta (changed_documents())
+DOCUMENT_TABLES = ("map_documents", "fetch_documents")
+
+RUN_REF_PREFIX = "run:"
+
+# Tag of the commit recorded at the end of a run, and its message prefix
+# (followed by the workflow name)
+RUN_TAG_PREFIX = "kurt/run/"
+RUN_TAG_WORKFLOW_PREFIX = "workflow:"
+
+# Rows per chunk for iter_table_changes()
+DIFF_CHUNK_SIZE = 1000
+
+# DOLT_DIFF() columns that describe the diff rather than the row
+_DIFF_META_COLUMNS = {"to_commit", "from_commit", "to_commit_date", "from_commit_date"}
+
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+# =============================================================================
+# Revisions
+# =============================================================================
+
+
+def record_run_revision(db: "DoltDB", run_id: str, workflow: str) -> str:
+    """Commit the working set at the end of a run and tag it ``kurt/run/<run_id>``.
+
+    Returns:
+        The commit hash.
+    """
+    rows = db.call("DOLT_COMMIT", "-A", "--allow-empty", "-m", f"kurt: {workflow} run {run_id}")
+    commit = rows[0]["hash"]
+    db.call(
+        "DOLT_TAG", "-m", f"{RUN_TAG_WORKFLOW_PREFIX}{workflow}", f"{RUN_TAG_PREFIX}{run_id}", commit
+    )
+    return commit
+
+
+def run_revision(db: "DoltDB", run_id: str) -> str:
+    """Commit recorded when workflow run ``run_id`` completed.
+
+    Falls back to the last commit made before the run started when the run
+    recorded no revision.
+
+    Raises:
+        ValueError: If the run doesn't exist or no commit precedes it.
+    """
+    tag = db.query_one(
+        "SELECT tag_hash FROM dolt_tags WHERE tag_name = ?", [f"{RUN_TAG_PREFIX}{run_id}"]
+    )
+    if tag is not None:
+        return tag["tag_hash"]
+
+    run = db.query_one("SELECT started_at FROM workflow_runs WHERE id = ?", [run_id])
+    if run is None:
+        raise ValueError(f"Unknown workflow run: {run_id}")
+
+    commit = db.query_one(
+        "SELECT commit_hash FROM dolt_log WHERE date <= ? ORDER BY date DESC LIMIT 1",
+        [run["started_at"]],
+    )
+    if commit is None:
+        raise ValueError(f"No Dolt commit precedes workflow run {run_id}")
+    return commit["commit_hash"]
+
+
+def last_run_id(db: "DoltDB", workflow: str, status: str = "completed") -> str | None:
+    """Most recent run of ``workflow`` with ``status`` (None if it never ran)."""
+    row = db.query_one(
+        "SELECT id FROM workflow_runs WHERE workflow = ? AND status = ? "
+        "ORDER BY started_at DESC LIMIT 1",
+        [workflow, status],
+    )
+    return row["id"] if row else None
+
+
+def last_run_revision(db: "DoltDB", workflow: str) -> str | None:
+    """Revision of the last completed run of ``workflow`` (None if it never ran)."""
+    tag = db.query_one(
+        "SELECT tag_hash FROM dolt_tags WHERE message = ? ORDER BY date DESC LIMIT 1",
+        [f"{RUN_TAG_WORKFLOW_PREFIX}{workflow}"],
+    )
+    if tag is not None:
+        return tag["tag_hash"]
+    run_id = last_run_id(db, workflow)
+    return run_revision(db, run_id) if run_id else None
+
+
+def first_revision(db: "DoltDB") -> str:
+    """The repository's first commit (diffing from it returns every row)."""
+    row = db.query_one("SELECT commit_hash FROM dolt_log ORDER BY date ASC LIMIT 1")
+    if row is None:
+        raise ValueError("Dolt repository has no commits")
+    return row["commit_hash"]
+
+
+def resolve_revision(db: "DoltDB", ref: str) -> str:
+    """Resolve a run marker (``run:<id>``) to a commit; other refs pass through."""
+    if ref.startswith(RUN_REF_PREFIX):
+        return run_revision(db, ref[len(RUN_REF_PREFIX) :])
+    return ref
+
+
+# =============================================================================
+# Table Diffs
+# =============================================================================
+
+
+def diff_query(
+    table: str,
+    from_ref: str,
+    to_ref: str = "WORKING",
+    diff_types: list[str] | tuple[str, ...] | None = None,
+    columns: list[str] | tuple[str, ...] | None = None,
+) -> tuple[str, list[Any]]:
+    """SQL and params selecting ``DOLT_DIFF`` rows between two revisions.
+
+    Raises:
+        ValueError: On an unknown diff type or an invalid column name.
+    """
+    if columns:
+        for column in columns:
+            if not _IDENTIFIER_RE.match(column):
+                raise ValueError(f"Invalid column name: {column!r}")
+        select = ", ".join(
+            ["diff_type"] + [f"`{side}{c}`" for c in columns for side in ("to_", "from_")]
+        )
+    else:
+        select = "*"
+
+    sql = f"SELECT {select} FROM DOLT_DIFF(?, ?, ?)"
+    params: list[Any] = [from_ref, to_ref, table]
+
+    if diff_types:
+        unknown = set(diff_types) - set(DIFF_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown diff types: {sorted(unknown)} (expected {DIFF_TYPES})")
+        sql += f" WHERE diff_type IN ({', '.join('?' for _ in diff_types)})"
+        params.extend(diff_types)
+
+    return sql, params
+
+
+def diff_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a ``DOLT_DIFF`` row to ``diff_type`` + the row's values."""
+    diff_type = row["diff_type"]
+    side = "from_" if diff_type == "removed" else "to_"
+    flat = {"diff_type": diff_type}
+    for key, value in row.items():
+        if key.startswith(side) and key not in _DIFF_META_COLUMNS:
+            flat[key[len(side) :]] = value
+    return flat
+
+
+def table_changes(
+    db: "DoltDB",
+    table: str,
+    since: str,
+    until: str = "WORKING",
+    diff_types: list[str] | tuple[str, ...] | None = None,
+    columns: list[str] | tuple[str, ...] | None = None,
+) -> list[dict[str, Any]]:
+    """Rows of ``table`` added, modified or removed between two revisions.
+
+    Args:
+        db: DoltDB client.
+        table: Table to diff.
+        since: Revision or run marker to diff from.
+        until: Revision to diff to (default: the working set).
+        diff_types: Only return these kinds of change (default: all).
+        columns: Only return these columns (default: all).
+
+    Returns:
+        One dict per changed row (see diff_row()).
+    """
+    sql, params = diff_query(table, resolve_revision(db, since), until, diff_types, columns)
+    return [diff_row(row) for row in db.query(sql, params).rows]
+
+
+def iter_table_changes(
+    db: "DoltDB",
+    table: str,
+    since: str,
+    until: str = "WORKING",
+    diff_types: list[str] | tuple[str, ...] | None = None,
+    columns: list[str] | tuple[str, ...] | None = None,
+    chunk_size: int = DIFF_CHUNK_SIZE,
+) -> Generator[list[dict[str, Any]], None, None]:
+    """Like table_changes(), read through a server-side cursor in chunks."""
+    sql, params = diff_query(table, resolve_revision(db, since), until, diff_types, columns)
+    for chunk in db.query_chunks(sql, params, chunk_size=chunk_size):
+        yield [diff_row(row) for row in chunk]
+
+
+async def aiter_table_changes(
+    db: "DoltDB",
+    table: str,
+    since: str,
+    until: str = "WORKING",
+    diff_types: list[str] | tuple[str, ...] | None = None,
+    columns: list[str] | tuple[str, ...] | None = None,
+    chunk_size: int = DIFF_CHUNK_SIZE,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Async iter_table_changes(), read through the async query API."""
+    from_ref = await asyncio.to_thread(resolve_revision, db, since)
+    sql, params = diff_query(table, from_ref, until, diff_types, columns)
+    async for chunk in db.aquery_chunks(sql, params, chunk_size=chunk_size):
+        yield [diff_row(row) for row in chunk]
+
+
+def changed_documents(
+    db: "DoltDB",
+    since: str,
+    until: str = "WORKING",
+    diff_types: list[str] | tuple[str, ...] | None = None,
+) -> dict[str, str]:
+    """Documents whose map or fetch rows changed between two revisions.
+
+    A document is "added" or "removed" when its map_documents row was;
+    any other change to either table (a new fetch, re-fetched content, a
+    status update) makes it "modified".
+
+    Returns:
+        Dict mapping document_id to "added", "modified" or "removed".
+    """
+    from_ref = resolve_revision(db, since)
+    changes: dict[str, str] = {}
+
+    for table in DOCUMENT_TABLES:
+        for row in table_changes(db, table, from_ref, until, columns=["document_id"]):
+            doc_id = row["document_id"]
+            if table == "map_documents" and row["diff_type"] != "modified":
+                changes[doc_id] = row["diff_type"]
+            else:
+                changes.setdefault(doc_id, "modified")
+
+    if diff_types:
+        changes = {doc_id: c for doc_id, c in changes.items() if c in diff_types}
+    return changes
+
+
+__all__ = [
+    "DIFF_CHUNK_SIZE",
+    "DIFF_TYPES",
+    "DOCUMENT_TABLES",
+    "RUN_REF_PREFIX",
+    "RUN_TAG_PREFIX",
+    "aiter_table_changes",
+    "changed_documents",
+    "diff_query",
+    "diff_row",
+    "first_revision",
+    "iter_table_changes",
+    "last_run_id",
+    "last_run_revision",
+    "record_run_revision",
+    "resolve_revision",
+    "run_revision",
+    "table_changes",
+]
@@ -2,7 +2,7 @@
 Dolt database client with server mode support.
 
 Unified DoltDB class providing:
-- Git-like version control operations (branching, commits) via Dolt CLI
+- Git-like version control operations (branching, commits) via Dolt stored procedures
 - SQLModel ORM access (sessions, transactions) via dolt sql-server
 - Server lifecycle management (start/stop dolt sql-server)
 - MySQL protocol server mode for all SQL operations
@@ -12,7 +12,8 @@ This module provides:
 
 1. DoltDB class - unified interface for database operations:
    - Server mode (default): Connects via MySQL protocol for concurrent access
-   - Dolt CLI: Used only for version control operations (branch, commit, push, pull)
+   - Version control runs over SQL (CALL DOLT_COMMIT, DOLT_BRANCH, DOLT_MERGE, ...);
+     the Dolt CLI is only used for repository init and branch checkout
 
 2. Schema initialization for workflow observability:
    - workflow_runs: One row per workflow execution
@@ -32,7 +33,7 @@ Usage:
     # Initialize observability schema
     init_observability_schema(db)
 
-    # Branch operations (use Dolt CLI)
+    # Branch operations (CALL DOLT_BRANCH / dolt_branches)
     db.branch_create("feature/experiment")
     db.branch_switch("feature/experiment")
     current = db.branch_current()
@@ -42,6 +43,10 @@ Usage:
         tx.execute("INSERT INTO users (name) VALUES (?)", ["Alice"])
         tx.execute("INSERT INTO users (name) VALUES (?)", ["Bob"])
     # Auto-commits on successful exit, rolls back on exception
+
+    # Async queries (from event-loop code: tools, executors, API routes)
+    result = await db.aquery("SELECT * FROM users WHERE id = ?", [1])
+    await db.aexecute("UPDATE users SET name = ? WHERE id = ?", ["Ann", 1])
 """
 
 from __future__ import annotations
@@ -49,6 +54,7 @@ from __future__ import annotations
 # Re-export all public API from sub-modules for backwards compatibility.
 # All existing imports like `from kurt.db.dolt import DoltDB` continue to work.
 from kurt.db.connection import (
+    AsyncConnectionPool,
     ConnectionPool,
     DoltDBConnection,
     DoltTransaction,
@@ -131,6 +137,7 @@ __all__ = [
     "DoltTransactionError",
     "DoltBranchError",
     # Connection pool
+    "AsyncConnectionPool",
     "ConnectionPool",
     # Schema helpers
     "DoltDBProtocol",
@@ -0,0 +1,216 @@
+"""
+Schema fingerprints: skip startup migration checks when nothing changed.
+
+Every CLI invocation used to run auto_migrate(), which inspects every
+SQLModel table, plus the observability table checks. The schema only
+changes when the models (or Kurt itself) change, so the startup check is
+keyed by two hashes:
+
+- Source key (source_key()): the Kurt version and the contents of the model
+  source files (MODEL_SOURCES). Computing it reads a few files and imports
+  nothing, so it is cheap enough for every CLI call.
+- Fingerprint (schema_fingerprint()): the Kurt version and the metadata of
+  the migrated models. It imports every model module (and, through
+  ``kurt.tools``, their dependencies), so it is only computed when the
+  source key is out of date.
+
+- Local stamp: ``.dolt/kurt-schema.json`` records the source key the
+  database was last migrated for, with the database target and the checked
+  out branch. When it matches, startup neither imports the models nor
+  touches the database.
+- Database copy: the ``kurt_schema`` table holds the fingerprint, so a
+  fresh clone, a switched branch or a remote database (no stamp) is checked
+  with one single-row read instead of full introspection.
+
+Only when both are out of date do the migrations run; afterwards both are
+rewritten.
+
+Usage:
+    key = source_key()
+    if not stamp_matches(db, key):
+        fingerprint = schema_fingerprint()
+        if read_db_fingerprint(db) != fingerprint:
+            auto_migrate()
+            write_db_fingerprint(db, fingerprint)
+        write_stamp(db, key)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sqlmodel import SQLModel
+
+    from kurt.db.dolt import DoltDB
+
+logger = logging.getLogger(__name__)
+
+# Stamp file, relative to the project's .dolt directory
+SCHEMA_STAMP_FILE = "kurt-schema.json"
+
+# Table holding the fingerprint the database was migrated to
+SCHEMA_TABLE = "kurt_schema"
+
+# Files defining the migrated models (and the list of them), relative to the
+# kurt package. Keep in sync with auto_migrate.get_all_models().
+MODEL_SOURCES = (
+    "db/auto_migrate.py",
+    "db/models.py",
+    "documents/models.py",
+    "observability/models.py",
+    "tools/batch_embedding/models.py",
+    "tools/fetch/models.py",
+    "tools/map/models.py",
+)
+
+_SCHEMA_TABLE_DDL = f"""
+    CREATE TABLE IF NOT EXISTS {SCHEMA_TABLE} (
+        name VARCHAR(64) NOT NULL PRIMARY KEY,
+        fingerprint VARCHAR(64) NOT NULL,
+        kurt_version VARCHAR(64),
+        updated_at DATETIME
+    )
+"""
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("kurt-core")
+    except Exception:
+        return "unknown"
+
+
+def _model_spec(model: type["SQLModel"]) -> dict[str, Any]:
+    table = model.__table__
+    return {
+        "table": table.name,
+        "columns": [
+            [col.name, repr(col.type), bool(col.nullable), bool(col.primary_key)]
+            for col in table.columns
+        ],
+        "indexes": sorted(
+            [idx.name, [col.name for col in idx.columns], bool(idx.unique)]
+            for idx in table.indexes
+        ),
+    }
+
+
+def source_key() -> str:
+    """Hash of the Kurt version and the model source files (imports no models)."""
+    package_dir = Path(__file__).resolve().parent.parent
+    digest = hashlib.sha256(_package_version().encode())
+    for name in MODEL_SOURCES:
+        digest.update(name.encode())
+        try:
+            digest.update((package_dir / name).read_bytes())
+        except OSError:
+            digest.update(b"-")
+    return digest.hexdigest()
+
+
+def schema_fingerprint(models: list[type["SQLModel"]] | None = None) -> str:
+    """Hash of the migrated models' metadata and the Kurt version."""
+    if models is None:
+        from kurt.db.auto_migrate import get_all_models
+
+        models = get_all_models()
+
+    specs = sorted((_model_spec(m) for m in models), key=lambda s: s["table"])
+    payload = json.dumps({"version": _package_version(), "models": specs}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# =============================================================================
+# Local Stamp
+# =============================================================================
+
+
+def _stamp_path(db: "DoltDB") -> Path:
+    return Path(db.path) / ".dolt" / SCHEMA_STAMP_FILE
+
+
+def _checked_out_head(db: "DoltDB") -> str | None:
+    """Branch checked out on disk (changes on ``dolt checkout``)."""
+    try:
+        state = json.loads((Path(db.path) / ".dolt" / "repo_state.json").read_text())
+    except (OSError, ValueError):
+        return None
+    return state.get("head")
+
+
+def _stamp_record(db: "DoltDB", key: str) -> dict[str, Any]:
+    return {
+        "source": key,
+        "target": [str(part) for part in db._cache_target()],
+        "head": _checked_out_head(db),
+    }
+
+
+def stamp_matches(db: "DoltDB", key: str) -> bool:
+    """Whether the local stamp says the database was migrated for source ``key``."""
+    try:
+        stamp = json.loads(_stamp_path(db).read_text())
+    except (OSError, ValueError):
+        return False
+    return stamp == _stamp_record(db, key)
+
+
+def write_stamp(db: "DoltDB", key: str) -> None:
+    """Record source ``key`` in the local stamp (local repos only)."""
+    path = _stamp_path(db)
+    if not path.parent.is_dir():
+        return
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(_stamp_record(db, key)))
+        os.replace(tmp, path)
+    except OSError as e:
+        tmp.unlink(missing_ok=True)
+        logger.debug(f"Could not write schema stamp: {e}")
+
+
+# =============================================================================
+# Database Copy
+# =============================================================================
+
+
+def read_db_fingerprint(db: "DoltDB") -> str | None:
+    """Fingerprint the database was last migrated to (None if unknown)."""
+    try:
+        row = db.query_one(
+            f"SELECT fingerprint FROM {SCHEMA_TABLE} WHERE name = ?", ["models"]
+        )
+    except Exception:
+        return None
+    return row["fingerprint"] if row else None
+
+
+def write_db_fingerprint(db: "DoltDB", fingerprint: str) -> None:
+    """Record ``fingerprint`` in the ``kurt_schema`` table."""
+    db.execute(_SCHEMA_TABLE_DDL)
+    db.execute(
+        f"REPLACE INTO {SCHEMA_TABLE} (name, fingerprint, kurt_version, updated_at) "
+        "VALUES (?, ?, ?, UTC_TIMESTAMP())",
+        ["models", fingerprint, _package_version()],
+    )
+
+
+__all__ = [
+    "MODEL_SOURCES",
+    "SCHEMA_STAMP_FILE",
+    "SCHEMA_TABLE",
+    "read_db_fingerprint",
+    "schema_fingerprint",
+    "source_key",
+    "stamp_matches",
+    "write_db_fingerprint",
+    "write_stamp",
+]
@@ -3,7 +3,7 @@
 Merge source branch into target branch, handling both Dolt and Git atomically.
 
 Algorithm:
-1. Check Dolt conflicts first (dolt merge --no-commit)
+1. Check Dolt conflicts first (CALL DOLT_MERGE('--no-commit', ...))
 2. If Dolt conflicts: report and abort
 3. If Dolt clean: commit Dolt merge
 4. Git merge
@@ -232,14 +232,21 @@ def _dolt_merge_no_commit(db: DoltDB, source: str) -> tuple[bool, list[DoltConfl
         Tuple of (success, list_of_conflicts)
     """
     try:
-        output = db._run_cli(["merge", "--no-commit", source])
+        # Keep conflicts in the working set for inspection; autocommit would
+        # otherwise roll the merge back
+        rows = db.call(
+            "DOLT_MERGE",
+            "--no-commit",
+            source,
+            session_vars={"dolt_allow_commit_conflicts": 1},
+        )
 
         # Check for conflicts
-        if "CONFLICT" in output or "conflict" in output.lower():
+        if rows and int(rows[0].get("conflicts") or 0) > 0:
             conflicts = _dolt_get_conflicts(db)
             return False, conflicts
 
-        # Check for "Fast-forward" or successful merge
+        # Fast-forward or clean merge
         return True, []
 
     except Exception as e:
@@ -308,12 +315,8 @@ def _dolt_get_conflicts(db: DoltDB) -> list[DoltConflict]:
 def _dolt_merge_commit(db: DoltDB, message: str) -> str:
     """Commit a Dolt merge and return commit hash."""
     try:
-        db._run_cli(["add", "-A"])
-        output = db._run_cli(["commit", "-m", message, "--allow-empty"])
-
-        # Extract commit hash
-        match = re.search(r"commit\s+([a-f0-9]+)", output.lower())
-        return match.group(1) if match else ""
+        rows = db.call("DOLT_COMMIT", "-A", "-m", message, "--allow-empty")
+        return rows[0].get("hash", "") if rows else ""
     except Exception as e:
         raise MergeError(
             code=MergeErrorCode.DOLT_CONFLICT,
@@ -324,7 +327,7 @@ def _dolt_merge_commit(db: DoltDB, message: str) -> str:
 def _dolt_merge_abort(db: DoltDB) -> bool:
     """Abort an in-progress Dolt merge."""
     try:
-        db._run_cli(["merge", "--abort"])
+        db.call("DOLT_MERGE", "--abort")
         return True
     except Exception:
         return False
@@ -333,7 +336,7 @@ def _dolt_merge_abort(db: DoltDB) -> bool:
 def _dolt_reset_hard(db: DoltDB, ref: str = "HEAD~1") -> bool:
     """Reset Dolt to a previous state."""
     try:
-        db._run_cli(["reset", "--hard", ref])
+        db.call("DOLT_RESET", "--hard", ref)
         return True
     except Exception:
         return False
@@ -212,11 +212,7 @@ def _git_get_commit_count(path: Path, ref1: str, ref2: str) -> int:
 def _dolt_remote_exists(db: DoltDB, remote: str) -> bool:
     """Check if a Dolt remote exists."""
     try:
-        output = db._run_cli(["remote", "-v"])
-        for line in output.strip().split("\n"):
-            if line.strip().startswith(remote):
-                return True
-        return False
+        return bool(db.query("SELECT name FROM dolt_remotes WHERE name = ?", [remote]).rows)
     except Exception:
         return False
 
@@ -224,13 +220,21 @@ def _dolt_remote_exists(db: DoltDB, remote: str) -> bool:
 def _dolt_get_commit_count(db: DoltDB, ref1: str, ref2: str) -> int:
     """Count commits between two refs in Dolt."""
     try:
-        output = db._run_cli(["log", "--oneline", f"{ref1}..{ref2}"])
-        lines = [line for line in output.strip().split("\n") if line.strip()]
-        return len(lines)
+        row = db.query_one("SELECT COUNT(*) AS n FROM dolt_log(?)", [f"{ref1}..{ref2}"])
+        return int(row["n"]) if row else 0
     except Exception:
         return 0
 
 
+def _dolt_head(db: DoltDB, ref: str = "HEAD") -> str:
+    """Commit hash of a Dolt ref ('' if it can't be resolved)."""
+    try:
+        row = db.query_one("SELECT HASHOF(?) AS hash", [ref])
+        return (row or {}).get("hash") or ""
+    except Exception:
+        return ""
+
+
 def _is_network_error(stderr: str) -> bool:
     """Check if error is network-related."""
     network_patterns = [
@@ -375,13 +379,13 @@ def _dolt_pull(db: DoltDB, remote: str) -> int:
     branch = db.branch_current()
 
     # Get current HEAD before pull
-    before = db._run_cli(["log", "-n", "1", "--oneline"]).strip().split()[0]
+    before = _dolt_head(db)
 
     # Pull
-    db._run_cli(["pull", remote, branch])
+    db.call("DOLT_PULL", remote, branch)
 
     # Get HEAD after pull
-    after = db._run_cli(["log", "-n", "1", "--oneline"]).strip().split()[0]
+    after = _dolt_head(db)
 
     # Count commits
     if before == after:
@@ -395,13 +399,10 @@ def _dolt_push(db: DoltDB, remote: str) -> int:
 
     # Check if there are commits to push by comparing local and remote
     try:
-        local_head = db._run_cli(["log", "-n", "1", "--oneline"]).strip().split()[0]
-        remote_head_output = db._run_cli(
-            ["log", f"{remote}/{branch}", "-n", "1", "--oneline"]
-        )
-        remote_head = remote_head_output.strip().split()[0] if remote_head_output.strip() else ""
+        local_head = _dolt_head(db)
+        remote_head = _dolt_head(db, f"{remote}/{branch}")
 
-        if local_head == remote_head:
+        if local_head and local_head == remote_head:
             return 0
 
         commits_to_push = _dolt_get_commit_count(db, f"{remote}/{branch}", "HEAD")
@@ -410,7 +411,7 @@ def _dolt_push(db: DoltDB, remote: str) -> int:
         commits_to_push = 0
 
     # Push
-    db._run_cli(["push", remote, branch])
+    db.call("DOLT_PUSH", remote, branch)
 
     return commits_to_push if commits_to_push > 0 else 1
 
@@ -363,17 +363,22 @@ class TestDoltMergeOperations:
 
     def test_dolt_merge_no_commit_success(self, mock_dolt_db):
         """Test successful Dolt merge --no-commit."""
-        mock_dolt_db._run_cli.return_value = "Fast-forward"
+        mock_dolt_db.call.return_value = [{"hash": "abc123", "fast_forward": 1, "conflicts": 0}]
 
         success, conflicts = _dolt_merge_no_commit(mock_dolt_db, "feature")
 
         assert success is True
         assert conflicts == []
-        mock_dolt_db._run_cli.assert_called_once_with(["merge", "--no-commit", "feature"])
+        mock_dolt_db.call.assert_called_once_with(
+            "DOLT_MERGE",
+            "--no-commit",
+            "feature",
+            session_vars={"dolt_allow_commit_conflicts": 1},
+        )
 
     def test_dolt_merge_no_commit_conflict(self, mock_dolt_db):
         """Test Dolt merge --no-commit with conflicts."""
-        mock_dolt_db._run_cli.return_value = "CONFLICT in table users"
+        mock_dolt_db.call.return_value = [{"hash": "", "fast_forward": 0, "conflicts": 1}]
         mock_dolt_db.query.return_value = []  # Empty conflicts table
 
         success, conflicts = _dolt_merge_no_commit(mock_dolt_db, "feature")
@@ -383,27 +388,27 @@ class TestDoltMergeOperations:
 
     def test_dolt_merge_commit(self, mock_dolt_db):
         """Test Dolt merge commit."""
-        mock_dolt_db._run_cli.side_effect = [
-            "",  # add -A
-            "commit abc123 Message",  # commit
-        ]
+        mock_dolt_db.call.return_value = [{"hash": "abc123"}]
 
         commit_hash = _dolt_merge_commit(mock_dolt_db, "Merge feature")
 
         assert commit_hash == "abc123"
+        mock_dolt_db.call.assert_called_once_with(
+            "DOLT_COMMIT", "-A", "-m", "Merge feature", "--allow-empty"
+        )
 
     def test_dolt_merge_abort(self, mock_dolt_db):
         """Test Dolt merge abort."""
-        mock_dolt_db._run_cli.return_value = ""
+        mock_dolt_db.call.return_value = []
 
         success = _dolt_merge_abort(mock_dolt_db)
 
         assert success is True
-        mock_dolt_db._run_cli.assert_called_once_with(["merge", "--abort"])
+        mock_dolt_db.call.assert_called_once_with("DOLT_MERGE", "--abort")
 
     def test_dolt_merge_abort_failure(self, mock_dolt_db):
         """Test Dolt merge abort when no merge in progress."""
-        mock_dolt_db._run_cli.side_effect = Exception("No merge in progress")
+        mock_dolt_db.call.side_effect = Exception("No merge in progress")
 
         success = _dolt_merge_abort(mock_dolt_db)
 
@@ -411,16 +416,16 @@ class TestDoltMergeOperations:
 
     def test_dolt_reset_hard(self, mock_dolt_db):
         """Test Dolt reset --hard."""
-        mock_dolt_db._run_cli.return_value = ""
+        mock_dolt_db.call.return_value = []
 
         success = _dolt_reset_hard(mock_dolt_db, "HEAD~1")
 
         assert success is True
-        mock_dolt_db._run_cli.assert_called_once_with(["reset", "--hard", "HEAD~1"])
+        mock_dolt_db.call.assert_called_once_with("DOLT_RESET", "--hard", "HEAD~1")
 
     def test_dolt_reset_hard_failure(self, mock_dolt_db):
         """Test Dolt reset --hard failure."""
-        mock_dolt_db._run_cli.side_effect = Exception("Reset failed")
+        mock_dolt_db.call.side_effect = Exception("Reset failed")
 
         success = _dolt_reset_hard(mock_dolt_db, "HEAD~1")
 
@@ -438,10 +443,9 @@ class TestMergeBranch:
     def test_merge_branch_success(self, git_repo_with_feature, mock_dolt_db):
         """Test successful merge of both Dolt and Git."""
         # Setup Dolt mock
-        mock_dolt_db._run_cli.side_effect = [
-            "Fast-forward",  # merge --no-commit
-            "",  # add -A
-            "commit abc123",  # commit
+        mock_dolt_db.call.side_effect = [
+            [{"hash": "", "fast_forward": 1, "conflicts": 0}],  # DOLT_MERGE --no-commit
+            [{"hash": "abc123"}],  # DOLT_COMMIT
         ]
 
         result = merge_branch(
@@ -459,9 +463,9 @@ class TestMergeBranch:
     def test_merge_branch_dolt_conflict(self, git_repo_with_feature, mock_dolt_db):
         """Test merge fails with Dolt conflicts."""
         # Setup Dolt mock to return conflict
-        mock_dolt_db._run_cli.side_effect = [
-            "CONFLICT in table users",  # merge --no-commit
-            "",  # merge --abort
+        mock_dolt_db.call.side_effect = [
+            [{"hash": "", "fast_forward": 0, "conflicts": 1}],  # DOLT_MERGE --no-commit
+            [],  # DOLT_MERGE --abort
         ]
         mock_dolt_db.query.return_value = []
 
@@ -479,11 +483,10 @@ class TestMergeBranch:
     ):
         """Test Git conflict triggers Dolt rollback."""
         # Setup Dolt mock - merge succeeds
-        mock_dolt_db._run_cli.side_effect = [
-            "Fast-forward",  # merge --no-commit
-            "",  # add -A
-            "commit abc123",  # commit
-            "",  # reset --hard (rollback)
+        mock_dolt_db.call.side_effect = [
+            [{"hash": "", "fast_forward": 1, "conflicts": 0}],  # DOLT_MERGE --no-commit
+            [{"hash": "abc123"}],  # DOLT_COMMIT
+            [],  # DOLT_RESET --hard (rollback)
         ]
 
         with pytest.raises(MergeError) as exc_info:
@@ -556,8 +559,8 @@ class TestMergeBranch:
     def test_merge_branch_no_commit_flag(self, git_repo_with_feature, mock_dolt_db):
         """Test merge with --no-commit flag."""
         # Setup Dolt mock
-        mock_dolt_db._run_cli.side_effect = [
-            "Fast-forward",  # merge --no-commit
+        mock_dolt_db.call.side_effect = [
+            [{"hash": "", "fast_forward": 1, "conflicts": 0}],  # DOLT_MERGE --no-commit
         ]
 
         result = merge_branch(
@@ -587,7 +590,7 @@ class TestAbortMerge:
         _git_merge(git_repo_with_conflict, "conflict-feature")
 
         # Setup Dolt mock
-        mock_dolt_db._run_cli.return_value = ""
+        mock_dolt_db.call.return_value = []
 
         success = abort_merge(git_repo_with_conflict, mock_dolt_db)
 
@@ -596,7 +599,7 @@ class TestAbortMerge:
 
     def test_abort_merge_no_merge_in_progress(self, git_repo, mock_dolt_db):
         """Test abort when no merge in progress."""
-        mock_dolt_db._run_cli.side_effect = Exception("No merge in progress")
+        mock_dolt_db.call.side_effect = Exception("No merge in progress")
 
         # Should still succeed (no merge to abort)
         success = abort_merge(git_repo, mock_dolt_db)
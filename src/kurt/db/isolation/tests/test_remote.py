@@ -8,7 +8,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from kurt.db.dolt import DoltDB
+from kurt.db.dolt import DoltDB, QueryResult
 from kurt.db.isolation.remote import (
     DoltResult,
     GitResult,
@@ -16,6 +16,8 @@ from kurt.db.isolation.remote import (
     PushResult,
     RemoteError,
     RemoteErrorCode,
+    _dolt_pull,
+    _dolt_push,
     _dolt_remote_exists,
     _git_current_branch,
     _git_remote_exists,
@@ -182,14 +184,42 @@ class TestDoltRemoteOperations:
 
     def test_dolt_remote_exists_true(self, mock_dolt_db):
         """Test _dolt_remote_exists returns True when remote exists."""
-        mock_dolt_db._run_cli.return_value = "origin\thttps://dolt.example.com/repo"
+        mock_dolt_db.query.return_value = QueryResult(rows=[{"name": "origin"}])
         assert _dolt_remote_exists(mock_dolt_db, "origin") is True
+        mock_dolt_db.query.assert_called_once_with(
+            "SELECT name FROM dolt_remotes WHERE name = ?", ["origin"]
+        )
 
     def test_dolt_remote_exists_false(self, mock_dolt_db):
         """Test _dolt_remote_exists returns False when no remotes."""
-        mock_dolt_db._run_cli.return_value = ""
+        mock_dolt_db.query.return_value = QueryResult(rows=[])
         assert _dolt_remote_exists(mock_dolt_db, "origin") is False
 
+    def test_dolt_pull_counts_new_commits(self, mock_dolt_db):
+        """Test _dolt_pull counts commits between the old and new HEAD."""
+        mock_dolt_db.query_one.side_effect = [
+            {"hash": "aaa"},  # HASHOF('HEAD') before
+            {"hash": "bbb"},  # HASHOF('HEAD') after
+            {"n": 3},  # dolt_log('aaa..bbb')
+        ]
+
+        assert _dolt_pull(mock_dolt_db, "origin") == 3
+        mock_dolt_db.call.assert_called_once_with("DOLT_PULL", "origin", "main")
+        assert mock_dolt_db.query_one.call_args.args[1] == ["aaa..bbb"]
+
+    def test_dolt_pull_up_to_date(self, mock_dolt_db):
+        """Test _dolt_pull returns 0 when HEAD doesn't move."""
+        mock_dolt_db.query_one.return_value = {"hash": "aaa"}
+
+        assert _dolt_pull(mock_dolt_db, "origin") == 0
+
+    def test_dolt_push_skips_when_in_sync(self, mock_dolt_db):
+        """Test _dolt_push skips the push when the remote branch is at HEAD."""
+        mock_dolt_db.query_one.return_value = {"hash": "aaa"}
+
+        assert _dolt_push(mock_dolt_db, "origin") == 0
+        mock_dolt_db.call.assert_not_called()
+
 
 # =============================================================================
 # Unit Tests - Pull
@@ -208,7 +238,7 @@ class TestPull:
 
     def test_pull_dolt_only_no_remote(self, git_repo, mock_dolt_db):
         """Test pull fails when Dolt remote doesn't exist."""
-        mock_dolt_db._run_cli.return_value = ""  # No remotes
+        mock_dolt_db.query.return_value = QueryResult(rows=[])  # No remotes
 
         with pytest.raises(RemoteError) as exc_info:
             pull(git_repo, mock_dolt_db, remote="origin", dolt_only=True)
@@ -259,7 +289,7 @@ class TestPush:
 
     def test_push_dolt_only_no_remote(self, git_repo, mock_dolt_db):
         """Test push fails when Dolt remote doesn't exist."""
-        mock_dolt_db._run_cli.return_value = ""  # No remotes
+        mock_dolt_db.query.return_value = QueryResult(rows=[])  # No remotes
 
         with pytest.raises(RemoteError) as exc_info:
             push(git_repo, mock_dolt_db, remote="origin", dolt_only=True)
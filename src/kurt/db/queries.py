@@ -4,20 +4,39 @@ Dolt database query methods.
 This module contains query execution logic for DoltDB:
 - query() and query_one() for SELECT operations
 - execute() for INSERT/UPDATE/DELETE/DDL operations
+- execute_many() for one statement over many parameter sets (one round-trip
+  batch, atomic)
+- execute_batches() for several statements/batches in one transaction
+- aquery(), aquery_one(), aexecute() and aexecute_many(): async versions
+  for event-loop code, backed by an aiomysql pool
+- query_chunks() and aquery_chunks() for large SELECTs: rows are read
+  through an unbuffered server-side cursor and yielded in chunks
+- call() for Dolt stored procedures (CALL DOLT_COMMIT(...), DOLT_MERGE, ...)
+- query_cached() and cached(): opt-in read-through cache validated against
+  Dolt table hashes (see kurt.db.cache)
 - Query execution via MySQL protocol (dolt sql-server)
 - Subscription (polling-based) for streaming events
 
-Server mode is the only supported runtime for SQL operations.
-The dolt sql-server is auto-started for local targets if not running.
+Server mode is the only supported runtime for SQL operations: every
+statement is a round-trip on a pooled connection to dolt sql-server, which
+is auto-started for local targets if not running. There is no per-statement
+``dolt sql -q`` subprocess.
 """
 
 from __future__ import annotations
 
-import json
 import logging
-import re
-from typing import Any, Generator
-
+from typing import Any, AsyncGenerator, Callable, Generator, Hashable, Iterable, TypeVar
+
+from kurt.db.cache import (
+    QUERY_CACHE_MAX_BYTES,
+    QueryCache,
+    freeze,
+    invalidate_shared,
+    is_write,
+    referenced_tables,
+    shared_query_cache,
+)
 from kurt.db.exceptions import (
     DoltQueryError,
     QueryResult,
@@ -25,20 +44,32 @@ from kurt.db.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Rows per executemany call (keeps multi-row INSERTs under max_allowed_packet)
+EXECUTE_MANY_CHUNK_SIZE = 1000
+
+# Rows per chunk yielded by query_chunks() / aquery_chunks()
+STREAM_CHUNK_SIZE = 1000
+
+T = TypeVar("T")
+
 
 class DoltDBQueries:
     """Mixin providing query methods for DoltDB.
 
     Server mode (dolt sql-server) is the only supported runtime.
-    SQL operations use MySQL protocol via connection pool.
-    Dolt CLI is used only for version control operations (commit, branch, etc).
+    SQL operations, including version control procedures (call()), use the
+    MySQL protocol via connection pool.
 
     This mixin expects the host class to provide:
-    - self.mode: "server" (the only supported mode)
     - self._get_pool(): ConnectionPool instance
-    - self._run_cli(args, check): Run dolt CLI command (for version control only)
+    - self._get_async_pool(): AsyncConnectionPool for the running event loop
+    - self.path, self._host, self._database: identify the database for the
+      shared query cache
+    - self._query_cache: QueryCache once enable_query_cache() was called
     """
 
+    _query_cache: QueryCache | None = None
+
     # =========================================================================
     # Query Execution
     # =========================================================================
@@ -59,10 +90,7 @@ class DoltDBQueries:
             for row in result:
                 print(row["name"])
         """
-        if self.mode == "server":
-            return self._query_server(sql, params)
-        else:
-            return self._query_embedded(sql, params)
+        return self._query_server(sql, params)
 
     def query_one(self, sql: str, params: list[Any] | None = None) -> dict[str, Any] | None:
         """
@@ -78,6 +106,28 @@ class DoltDBQueries:
         result = self.query(sql, params)
         return result.rows[0] if result.rows else None
 
+    def query_chunks(
+        self,
+        sql: str,
+        params: list[Any] | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """
+        Execute a SQL query and yield its rows in chunks.
+
+        Rows are read through an unbuffered cursor, so memory
+        stays bounded by ``chunk_size`` and the first chunk arrives before the
+        server has sent the last row. The pooled connection is held until the
+        generator is exhausted or closed; a generator closed early drops the
+        connection instead of draining the remaining rows.
+
+        Example:
+            for chunk in db.query_chunks("SELECT * FROM map_documents"):
+                for row in chunk:
+                    ...
+        """
+        yield from self._query_chunks_server(sql, params, chunk_size)
+
     def execute(self, sql: str, params: list[Any] | None = None) -> QueryResult:
         """
         Execute a SQL statement (INSERT, UPDATE, DELETE, CREATE, etc.).
@@ -89,123 +139,354 @@ class DoltDBQueries:
         Returns:
             QueryResult with affected_rows count
         """
-        if self.mode == "server":
+        try:
             return self._execute_server(sql, params)
-        else:
-            return self._execute_embedded(sql, params)
+        finally:
+            self._invalidate_written(sql)
+
+    def execute_many(self, sql: str, params_seq: Iterable[list[Any]]) -> QueryResult:
+        """
+        Execute one statement for many parameter sets in a single transaction.
+
+        Uses the driver's executemany, which rewrites ``INSERT ... VALUES``
+        into multi-row inserts. Either all rows are written or none.
+
+        Args:
+            sql: SQL statement (use ? for parameters)
+            params_seq: Parameter lists, one per row
+
+        Returns:
+            QueryResult with the total affected_rows count
+
+        Example:
+            db.execute_many(
+                "INSERT INTO users (id, name) VALUES (?, ?)",
+                [[1, "Alice"], [2, "Bob"]],
+            )
+        """
+        params_list = [list(params) for params in params_seq]
+        if not params_list:
+            return QueryResult(rows=[], affected_rows=0)
+        return self.execute_batches([(sql, params_list)])[0]
+
+    def execute_batches(
+        self, batches: list[tuple[str, list[list[Any]]]]
+    ) -> list[QueryResult]:
+        """
+        Execute ``(sql, [params, ...])`` batches in order, in one transaction.
+
+        Each batch runs as one statement (one parameter list) or one
+        executemany call. Either every batch is applied or none.
+
+        Returns:
+            One QueryResult per batch, with its affected_rows count
+        """
+        try:
+            return self._execute_batches_server(batches)
+        finally:
+            for sql, _ in batches:
+                self._invalidate_written(sql)
 
     # =========================================================================
-    # Parameter Interpolation (Embedded Mode)
+    # Stored Procedures (Version Control)
     # =========================================================================
 
-    def _interpolate_params(self, sql: str, params: list[Any] | None) -> str:
-        """Interpolate parameters into SQL for CLI mode.
+    def call(
+        self,
+        procedure: str,
+        *args: Any,
+        session_vars: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Call a Dolt stored procedure and return its result rows.
+
+        Version control (DOLT_COMMIT, DOLT_BRANCH, DOLT_MERGE, DOLT_RESET,
+        DOLT_PULL, DOLT_PUSH, ...) runs over the pooled connection like any
+        other statement instead of spawning the dolt CLI.
+
+        Args:
+            procedure: Procedure name, e.g. "DOLT_COMMIT"
+            *args: Procedure arguments, e.g. "-Am", "message"
+            session_vars: System variables set on the connection for this
+                call only, e.g. {"dolt_allow_commit_conflicts": 1}
 
-        Note: This is safe for CLI mode since we're passing to dolt sql,
-        not directly to a network database. For production with untrusted
-        input, use server mode with proper parameterization.
+        Returns:
+            Result rows (e.g. [{"hash": "..."}] for DOLT_COMMIT)
+
+        Example:
+            rows = db.call("DOLT_COMMIT", "-Am", "Add users table")
+            commit_hash = rows[0]["hash"]
         """
-        if not params:
-            return sql
-
-        result = sql
-        for param in params:
-            if param is None:
-                value = "NULL"
-            elif isinstance(param, bool):
-                value = "TRUE" if param else "FALSE"
-            elif isinstance(param, (int, float)):
-                value = str(param)
-            elif isinstance(param, bytes):
-                value = f"X'{param.hex()}'"
-            else:
-                # Escape special characters for SQL string literals
-                escaped = str(param)
-                # Escape backslashes first (before adding more)
-                escaped = escaped.replace("\\", "\\\\")
-                # Escape single quotes by doubling them
-                escaped = escaped.replace("'", "''")
-                # Escape newlines and other control characters
-                escaped = escaped.replace("\n", "\\n")
-                escaped = escaped.replace("\r", "\\r")
-                escaped = escaped.replace("\t", "\\t")
-                value = f"'{escaped}'"
-            result = result.replace("?", value, 1)
-
-        return result
+        sql = f"CALL {procedure}({', '.join(['?'] * len(args))})"
+        try:
+            return self._call_server(sql, list(args), session_vars)
+        finally:
+            # Merges, resets, pulls... can change any table
+            self._invalidate_cache()
 
     # =========================================================================
-    # Embedded Mode Implementations
+    # Query Cache
     # =========================================================================
 
-    def _query_embedded(self, sql: str, params: list[Any] | None = None) -> QueryResult:
-        """Execute query using dolt CLI."""
-        interpolated = self._interpolate_params(sql, params)
-        output = self._run_cli(["sql", "-q", interpolated, "-r", "json"])
+    def enable_query_cache(
+        self, max_bytes: int = QUERY_CACHE_MAX_BYTES, ttl: float = 0.0
+    ) -> QueryCache:
+        """
+        Turn on the read-through cache for query_cached() and cached().
+
+        The cache is shared with every DoltDB for the same database in this
+        process. Calling again updates its limits.
+
+        Args:
+            max_bytes: Approximate memory bound (LRU eviction beyond it)
+            ttl: Seconds a result is returned without re-checking table
+                hashes (0 = check on every read). Writes made through DoltDB
+                in this process invalidate immediately either way.
+
+        Returns:
+            The QueryCache (for stats())
+        """
+        cache = shared_query_cache(self._cache_target(), max_bytes=max_bytes, ttl=ttl)
+        cache.max_bytes = max_bytes
+        cache.ttl = ttl
+        self._query_cache = cache
+        return cache
+
+    def cached(
+        self, key: Hashable, tables: Iterable[str], compute: Callable[[], T]
+    ) -> T:
+        """
+        Return ``compute()``'s result, cached until one of ``tables`` changes.
+
+        Without enable_query_cache() this just calls ``compute()``. Cached
+        values are shared between callers: treat them as read-only.
 
+        Args:
+            key: Identifies the result (e.g. an endpoint name and its filters)
+            tables: Every table ``compute()`` reads
+            compute: Produces the value on a miss
+        """
+        cache = self._query_cache
+        if cache is None:
+            return compute()
+
+        key = freeze(key)
+        hit, value = cache.get_fresh(key)
+        if hit:
+            return value
+
+        tables = tuple(tables)
+        hashes = self.table_hashes(tables)
+        if hashes is None:
+            return compute()
+        hit, value = cache.get(key, hashes)
+        if hit:
+            return value
+
+        # Hashes were read before computing: a write in between only makes
+        # the next lookup miss, it can't pin stale data
+        value = compute()
+        cache.put(key, tables, hashes, value)
+        return value
+
+    def query_cached(
+        self,
+        sql: str,
+        params: list[Any] | None = None,
+        tables: Iterable[str] | None = None,
+    ) -> QueryResult:
+        """
+        query() through the result cache.
+
+        Args:
+            sql: SELECT statement
+            params: Optional list of parameters
+            tables: Tables the query reads (default: parsed from FROM/JOIN)
+        """
+        key = ("sql", sql, freeze(params or []))
+        if tables is None:
+            tables = referenced_tables(sql)
+        result = self.cached(key, tables, lambda: self.query(sql, params))
+        return QueryResult(rows=list(result.rows))
+
+    def table_hashes(self, tables: Iterable[str]) -> tuple[str, ...] | None:
+        """
+        Working-set hashes of ``tables`` in one round-trip.
+
+        Falls back to the database hash when no table is given. Returns None
+        if the hashes can't be read (e.g. a table doesn't exist yet).
+        """
+        tables = tuple(tables)
+        if tables:
+            columns = ", ".join(f"DOLT_HASHOF_TABLE(?) AS h{i}" for i in range(len(tables)))
+            params: list[Any] = list(tables)
+        else:
+            columns, params = "DOLT_HASHOF_DB() AS h0", []
         try:
-            if not output.strip():
-                return QueryResult(rows=[])
-
-            data = json.loads(output)
-
-            # Handle different JSON output formats
-            if isinstance(data, list):
-                # Direct array of rows
-                return QueryResult(rows=data)
-            elif isinstance(data, dict):
-                # Wrapped format with "rows" key
-                rows = data.get("rows", [])
-                return QueryResult(rows=rows if rows else [])
-            else:
-                return QueryResult(rows=[])
+            row = self.query_one(f"SELECT {columns}", params) or {}
+        except DoltQueryError:
+            logger.debug("Could not read table hashes for %s", tables, exc_info=True)
+            return None
+        return tuple(str(row.get(f"h{i}")) for i in range(max(len(tables), 1)))
 
-        except json.JSONDecodeError:
-            # Non-JSON output (e.g., DDL statements)
-            logger.debug(f"Non-JSON output: {output[:100]}...")
-            return QueryResult(rows=[])
+    def _cache_target(self) -> Hashable:
+        return (self._host, str(self.path), self._database)
 
-    def _execute_embedded(self, sql: str, params: list[Any] | None = None, max_retries: int = 5) -> QueryResult:
-        """Execute statement using dolt CLI with retry for concurrent access."""
-        import random
-        import time
+    def _invalidate_cache(self, tables: Iterable[str] | None = None) -> None:
+        invalidate_shared(self._cache_target(), tables)
 
-        interpolated = self._interpolate_params(sql, params)
+    def _invalidate_written(self, sql: str) -> None:
+        """Push a write statement's tables to the shared cache."""
+        if is_write(sql):
+            self._invalidate_cache(referenced_tables(sql) or None)
 
-        last_error = None
-        for attempt in range(max_retries):
-            try:
-                output = self._run_cli(["sql", "-q", interpolated])
+    # =========================================================================
+    # Async Query Execution
+    # =========================================================================
+    #
+    # Use these from async code (tools, workflow executors, FastAPI routes):
+    # the sync methods block the event loop for the whole round-trip.
+
+    async def aquery(self, sql: str, params: list[Any] | None = None) -> QueryResult:
+        """
+        Async version of query().
+
+        Example:
+            result = await db.aquery("SELECT * FROM users WHERE id = ?", [1])
+        """
+        import aiomysql  # type: ignore
+
+        pool = await self._get_async_pool()
+        try:
+            async with pool.acquire() as conn, conn.cursor(aiomysql.DictCursor) as cursor:
+                await cursor.execute(sql.replace("?", "%s"), params or [])
+                rows = await cursor.fetchall()
+            return QueryResult(rows=list(rows))
+        except Exception as e:
+            raise DoltQueryError(str(e), query=sql, params=params) from e
+
+    async def aquery_one(
+        self, sql: str, params: list[Any] | None = None
+    ) -> dict[str, Any] | None:
+        """Async version of query_one()."""
+        result = await self.aquery(sql, params)
+        return result.rows[0] if result.rows else None
+
+    async def aquery_chunks(
+        self,
+        sql: str,
+        params: list[Any] | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncGenerator[list[dict[str, Any]], None]:
+        """
+        Async version of query_chunks().
+
+        Example:
+            async for chunk in db.aquery_chunks("SELECT * FROM map_documents"):
+                ...
+        """
+        import aiomysql  # type: ignore
 
-                # Parse affected rows from output if present
+        pool = await self._get_async_pool()
+        async with pool.acquire() as conn:
+            finished = False
+            try:
+                cursor = await conn.cursor(aiomysql.SSDictCursor)
+                try:
+                    await cursor.execute(sql.replace("?", "%s"), params or [])
+                    chunk = await cursor.fetchmany(chunk_size)
+                except Exception as e:
+                    raise DoltQueryError(str(e), query=sql, params=params) from e
+                while chunk:
+                    yield list(chunk)
+                    try:
+                        chunk = await cursor.fetchmany(chunk_size)
+                    except Exception as e:
+                        raise DoltQueryError(str(e), query=sql, params=params) from e
+                await cursor.close()
+                finished = True
+            finally:
+                if not finished:
+                    # Unread rows are still on the wire; the pool drops closed connections
+                    conn.close()
+
+    async def aexecute(self, sql: str, params: list[Any] | None = None) -> QueryResult:
+        """Async version of execute()."""
+        pool = await self._get_async_pool()
+        try:
+            async with pool.acquire() as conn, conn.cursor() as cursor:
+                await cursor.execute(sql.replace("?", "%s"), params or [])
+                return QueryResult(
+                    rows=[], affected_rows=cursor.rowcount, last_insert_id=cursor.lastrowid
+                )
+        except Exception as e:
+            raise DoltQueryError(str(e), query=sql, params=params) from e
+        finally:
+            self._invalidate_written(sql)
+
+    async def aexecute_many(self, sql: str, params_seq: Iterable[list[Any]]) -> QueryResult:
+        """Async version of execute_many(): one transaction, chunked executemany."""
+        params_list = [list(params) for params in params_seq]
+        if not params_list:
+            return QueryResult(rows=[], affected_rows=0)
+        pool = await self._get_async_pool()
+        mysql_sql = sql.replace("?", "%s")
+        async with pool.acquire() as conn:
+            try:
+                await conn.begin()
                 affected = 0
-                if "Query OK" in output:
-                    match = re.search(r"(\d+) rows? affected", output)
-                    if match:
-                        affected = int(match.group(1))
-
-                return QueryResult(rows=[], affected_rows=affected)
-
-            except DoltQueryError as e:
-                error_msg = str(e).lower()
-                # Retry on concurrent access errors
-                if "read only" in error_msg or "database is locked" in error_msg or "manifest" in error_msg:
-                    last_error = e
-                    if attempt < max_retries - 1:
-                        # Exponential backoff with jitter: 0.1s, 0.2s, 0.4s, 0.8s, 1.6s
-                        delay = (0.1 * (2 ** attempt)) + (random.random() * 0.05)
-                        logger.debug(f"Dolt write conflict, retrying in {delay:.2f}s (attempt {attempt + 1}/{max_retries})")
-                        time.sleep(delay)
-                        continue
-                raise  # Non-retryable error
-
-        # All retries exhausted
-        raise last_error or DoltQueryError("Max retries exceeded for Dolt write")
+                async with conn.cursor() as cursor:
+                    for start in range(0, len(params_list), EXECUTE_MANY_CHUNK_SIZE):
+                        await cursor.executemany(
+                            mysql_sql, params_list[start : start + EXECUTE_MANY_CHUNK_SIZE]
+                        )
+                        affected += max(cursor.rowcount, 0)
+                    last_id = cursor.lastrowid
+                await conn.commit()
+            except Exception as e:
+                try:
+                    await conn.rollback()
+                except Exception:
+                    logger.debug("Rollback failed", exc_info=True)
+                raise DoltQueryError(str(e), query=sql) from e
+            finally:
+                self._invalidate_written(sql)
+        return QueryResult(rows=[], affected_rows=affected, last_insert_id=last_id)
 
     # =========================================================================
     # Server Mode Implementations
     # =========================================================================
 
+    def _call_server(
+        self, sql: str, args: list[Any], session_vars: dict[str, Any] | None
+    ) -> list[dict[str, Any]]:
+        """Run a CALL, with ``session_vars`` set on its connection if given."""
+        if not session_vars:
+            return self.query(sql, args).rows
+
+        pool = self._get_pool()
+        conn = pool.get_connection()
+        try:
+            try:
+                cursor = conn.cursor(dictionary=True)
+            except TypeError:
+                import pymysql.cursors
+
+                cursor = conn.cursor(pymysql.cursors.DictCursor)
+            for name, value in session_vars.items():
+                cursor.execute(f"SET @@{name} = %s", [value])
+            cursor.execute(sql.replace("?", "%s"), args)
+            rows = list(cursor.fetchall()) if cursor.description else []
+            for name in session_vars:
+                cursor.execute(f"SET @@{name} = DEFAULT")
+            cursor.close()
+        except Exception as e:
+            # Don't hand out a connection that may still carry the session vars
+            pool.discard_connection(conn)
+            raise DoltQueryError(str(e), query=sql, params=args) from e
+        pool.return_connection(conn)
+        return rows
+
     def _query_server(self, sql: str, params: list[Any] | None = None) -> QueryResult:
         """Execute query using MySQL connection."""
         pool = self._get_pool()
@@ -235,6 +516,48 @@ class DoltDBQueries:
         finally:
             pool.return_connection(conn)
 
+    def _query_chunks_server(
+        self, sql: str, params: list[Any] | None, chunk_size: int
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """Yield query rows in chunks from an unbuffered (server-side) cursor."""
+        pool = self._get_pool()
+        conn = pool.get_connection()
+        mysql_sql = sql.replace("?", "%s")
+
+        def fetch() -> list[dict[str, Any]]:
+            try:
+                return list(cursor.fetchmany(chunk_size))
+            except Exception as e:
+                raise DoltQueryError(str(e), query=sql, params=params) from e
+
+        finished = False
+        try:
+            # mysql.connector: unbuffered dict cursor; pymysql: SSDictCursor
+            try:
+                cursor = conn.cursor(dictionary=True, buffered=False)
+            except TypeError:
+                import pymysql.cursors
+
+                cursor = conn.cursor(pymysql.cursors.SSDictCursor)
+
+            try:
+                cursor.execute(mysql_sql, params or [])
+            except Exception as e:
+                raise DoltQueryError(str(e), query=sql, params=params) from e
+
+            chunk = fetch()
+            while chunk:
+                yield chunk
+                chunk = fetch()
+            cursor.close()
+            finished = True
+        finally:
+            if finished:
+                pool.return_connection(conn)
+            else:
+                # Closing the cursor would read every remaining row first
+                pool.discard_connection(conn)
+
     def _execute_server(self, sql: str, params: list[Any] | None = None) -> QueryResult:
         """Execute statement using MySQL connection."""
         pool = self._get_pool()
@@ -255,6 +578,45 @@ class DoltDBQueries:
         finally:
             pool.return_connection(conn)
 
+    def _execute_batches_server(
+        self, batches: list[tuple[str, list[list[Any]]]]
+    ) -> list[QueryResult]:
+        """Execute batches on one pooled connection between BEGIN and COMMIT."""
+        pool = self._get_pool()
+        conn = pool.get_connection()
+        cursor = conn.cursor()
+        sql = ""
+        try:
+            cursor.execute("START TRANSACTION")
+            results = []
+            for sql, params_list in batches:
+                # Convert SQLite-style ? placeholders to MySQL-style %s
+                mysql_sql = sql.replace("?", "%s")
+                if len(params_list) == 1:
+                    cursor.execute(mysql_sql, params_list[0])
+                    affected = max(cursor.rowcount, 0)
+                else:
+                    affected = 0
+                    for start in range(0, len(params_list), EXECUTE_MANY_CHUNK_SIZE):
+                        cursor.executemany(
+                            mysql_sql, params_list[start : start + EXECUTE_MANY_CHUNK_SIZE]
+                        )
+                        affected += max(cursor.rowcount, 0)
+                results.append(
+                    QueryResult(rows=[], affected_rows=affected, last_insert_id=cursor.lastrowid)
+                )
+            cursor.execute("COMMIT")
+            return results
+        except Exception as e:
+            try:
+                cursor.execute("ROLLBACK")
+            except Exception:
+                logger.debug("Rollback failed", exc_info=True)
+            raise DoltQueryError(str(e), query=sql) from e
+        finally:
+            cursor.close()
+            pool.return_connection(conn)
+
     # =========================================================================
     # Subscription (Polling-based)
     # =========================================================================
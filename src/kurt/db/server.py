@@ -0,0 +1,198 @@
+"""
+Lifecycle helpers for the managed local dolt sql-server.
+
+DoltDB starts one dolt sql-server per project (``_start_server``) and leaves
+it running, so every CLI command costs a socket round-trip instead of a
+process spawn. This module keeps that server well-behaved:
+
+- server_lock(): an exclusive lock on ``.dolt/kurt-server.lock``, held while
+  checking for and starting the server, so concurrent commands never spawn
+  two servers for one project
+- an idle watcher, spawned next to the server, that stops it once no client
+  has been connected for SERVER_IDLE_TIMEOUT seconds:
+
+      python -m kurt.db.server --path <project> --port <port> --pid <server pid>
+
+Set KURT_DOLT_IDLE_TIMEOUT=0 to keep the server running until it is stopped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Server info and lock files, relative to the project's .dolt directory
+SERVER_INFO_FILE = "kurt-server.json"
+SERVER_LOCK_FILE = "kurt-server.lock"
+
+# Seconds without client connections before the managed server is stopped (0 = never)
+SERVER_IDLE_TIMEOUT = int(os.environ.get("KURT_DOLT_IDLE_TIMEOUT", "1800"))
+
+# Seconds between the idle watcher's connection counts
+IDLE_CHECK_INTERVAL = 30.0
+
+
+@contextmanager
+def server_lock(path: Path) -> Generator[None, None, None]:
+    """Hold the project's server lock (blocks until it is free)."""
+    lock_file = Path(path) / ".dolt" / SERVER_LOCK_FILE
+    lock_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_file, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def read_server_info(path: Path) -> dict | None:
+    """The info file written by the process that started the server, if any."""
+    try:
+        return json.loads((Path(path) / ".dolt" / SERVER_INFO_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def stop_server(path: Path, pid: int) -> None:
+    """Stop a server started by DoltDB and remove its info file."""
+    try:
+        # Started with start_new_session=True: the server leads its own group
+        os.killpg(os.getpgid(pid), signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+    info = read_server_info(path)
+    if info is not None and info.get("pid") == pid:
+        try:
+            (Path(path) / ".dolt" / SERVER_INFO_FILE).unlink()
+        except OSError:
+            pass
+
+
+def spawn_idle_watch(path: Path, port: int, pid: int, user: str = "root") -> None:
+    """Start the idle watcher for a freshly started server (detached)."""
+    if SERVER_IDLE_TIMEOUT <= 0:
+        return
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "kurt.db.server",
+            "--path",
+            str(path),
+            "--port",
+            str(port),
+            "--pid",
+            str(pid),
+            "--user",
+            user,
+            "--idle-timeout",
+            str(SERVER_IDLE_TIMEOUT),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def count_clients(port: int, user: str = "root", password: str = "") -> int | None:
+    """Number of client connections on the server, not counting this one.
+
+    Returns None if the server can't be reached.
+    """
+    try:
+        import pymysql
+
+        conn = pymysql.connect(host="127.0.0.1", port=port, user=user, password=password)
+    except Exception:
+        return None
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SHOW PROCESSLIST")
+            return max(len(cur.fetchall()) - 1, 0)
+    except Exception:
+        return None
+    finally:
+        conn.close()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def watch_idle(
+    path: Path,
+    port: int,
+    pid: int,
+    idle_timeout: float,
+    *,
+    user: str = "root",
+    password: str = "",
+    check_interval: float = IDLE_CHECK_INTERVAL,
+) -> None:
+    """Stop the server once it has had no clients for ``idle_timeout`` seconds.
+
+    Returns when the server is stopped or has exited on its own.
+    """
+    idle_since: float | None = None
+    while _pid_alive(pid):
+        time.sleep(check_interval)
+        clients = count_clients(port, user, password)
+        if clients != 0:
+            idle_since = None
+            continue
+
+        now = time.monotonic()
+        if idle_since is None:
+            idle_since = now
+        if now - idle_since < idle_timeout:
+            continue
+
+        # Recount under the lock: a command starting now waits for us and
+        # then starts a fresh server
+        with server_lock(path):
+            if count_clients(port, user, password) == 0:
+                logger.info("Stopping idle dolt sql-server on port %s", port)
+                stop_server(path, pid)
+                return
+        idle_since = None
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Stop an idle Kurt-managed dolt sql-server")
+    parser.add_argument("--path", required=True, type=Path)
+    parser.add_argument("--port", required=True, type=int)
+    parser.add_argument("--pid", required=True, type=int)
+    parser.add_argument("--user", default="root")
+    parser.add_argument("--idle-timeout", type=float, default=SERVER_IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+
+    watch_idle(args.path, args.port, args.pid, args.idle_timeout, user=args.user)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Tests for the read-through query cache."""
+
+from __future__ import annotations
+
+from kurt.db.cache import (
+    QueryCache,
+    estimate_size,
+    freeze,
+    invalidate_shared,
+    is_write,
+    referenced_tables,
+    shared_query_cache,
+)
+
+
+class TestStatementParsing:
+    def test_referenced_tables(self):
+        sql = """
+            SELECT m.id FROM map_documents m
+            LEFT JOIN `fetch_documents` f ON f.document_id = m.document_id
+            WHERE m.id IN (SELECT document_id FROM map_documents)
+        """
+        assert referenced_tables(sql) == ("map_documents", "fetch_documents")
+
+    def test_write_tables(self):
+        assert referenced_tables("INSERT INTO step_events (id) VALUES (?)") == ("step_events",)
+        assert referenced_tables("UPDATE workflow_runs SET status = ?") == ("workflow_runs",)
+
+    def test_is_write(self):
+        assert is_write("  insert into t values (1)")
+        assert is_write("CALL DOLT_MERGE('main')")
+        assert not is_write("SELECT * FROM t")
+
+    def test_freeze(self):
+        assert freeze({"b": [1, 2], "a": None}) == (("a", None), ("b", (1, 2)))
+        hash(freeze(["x", {"y": {1, 2}}]))
+
+
+class TestQueryCache:
+    def test_hit_requires_same_hashes(self):
+        cache = QueryCache()
+        cache.put("k", ["t"], ("h1",), [1])
+
+        assert cache.get("k", ("h1",)) == (True, [1])
+        assert cache.get("k", ("h2",)) == (False, None)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_ttl(self):
+        cache = QueryCache(ttl=60)
+        cache.put("k", ["t"], ("h1",), "v")
+        assert cache.get_fresh("k") == (True, "v")
+
+        assert QueryCache(ttl=0).get_fresh("k") == (False, None)
+
+    def test_lru_eviction_by_size(self):
+        value = ["x" * 100]
+        cache = QueryCache(max_bytes=estimate_size(value) * 2)
+        cache.put("a", ["t"], ("h",), value)
+        cache.put("b", ["t"], ("h",), value)
+        cache.get("a", ("h",))  # a is now most recently used
+        cache.put("c", ["t"], ("h",), value)
+
+        assert cache.get("b", ("h",))[0] is False
+        assert cache.get("a", ("h",))[0] is True
+        assert cache.get("c", ("h",))[0] is True
+        assert cache.stats()["bytes"] <= cache.max_bytes
+
+    def test_oversized_value_not_cached(self):
+        cache = QueryCache(max_bytes=10)
+        cache.put("k", ["t"], ("h",), "x" * 100)
+        assert cache.stats()["entries"] == 0
+
+    def test_invalidate_by_table(self):
+        cache = QueryCache()
+        cache.put("docs", ["map_documents", "fetch_documents"], ("h", "h"), 1)
+        cache.put("runs", ["workflow_runs"], ("h",), 2)
+
+        cache.invalidate(["FETCH_DOCUMENTS"])
+
+        assert cache.get("docs", ("h", "h"))[0] is False
+        assert cache.get("runs", ("h",))[0] is True
+
+        cache.invalidate()
+        assert cache.stats() == {"entries": 0, "bytes": 0, "hits": 1, "misses": 1}
+
+    def test_shared_cache_per_target(self):
+        cache = shared_query_cache(("test-target",))
+        assert shared_query_cache(("test-target",)) is cache
+        cache.put("k", ["t"], ("h",), 1)
+
+        invalidate_shared(("test-target",), ["t"])
+        invalidate_shared(("other-target",), ["t"])  # no cache: no-op
+
+        assert cache.stats()["entries"] == 0
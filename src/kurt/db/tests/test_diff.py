@@ -0,0 +1,174 @@
+"""Tests for Dolt row-level diffs."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from kurt.db.diff import (
+    aiter_table_changes,
+    changed_documents,
+    diff_query,
+    diff_row,
+    iter_table_changes,
+    last_run_revision,
+    record_run_revision,
+    resolve_revision,
+    table_changes,
+)
+from kurt.db.dolt import DoltDB, QueryResult
+
+
+def _diff(diff_type: str, doc_id: str, **values) -> dict:
+    """A DOLT_DIFF row for a table keyed by document_id."""
+    removed = diff_type == "removed"
+    added = diff_type == "added"
+    row = {
+        "diff_type": diff_type,
+        "to_document_id": None if removed else doc_id,
+        "from_document_id": None if added else doc_id,
+        "to_commit": "WORKING",
+        "from_commit": "abc",
+    }
+    for key, value in values.items():
+        row[f"to_{key}"] = None if removed else value
+        row[f"from_{key}"] = None if added else f"old-{value}"
+    return row
+
+
+class TestDiffQuery:
+    def test_all_columns(self):
+        sql, params = diff_query("fetch_documents", "abc")
+        assert sql == "SELECT * FROM DOLT_DIFF(?, ?, ?)"
+        assert params == ["abc", "WORKING", "fetch_documents"]
+
+    def test_columns_and_types(self):
+        sql, params = diff_query(
+            "map_documents", "abc", "HEAD", diff_types=["added"], columns=["document_id"]
+        )
+        assert sql == (
+            "SELECT diff_type, `to_document_id`, `from_document_id` "
+            "FROM DOLT_DIFF(?, ?, ?) WHERE diff_type IN (?)"
+        )
+        assert params == ["abc", "HEAD", "map_documents", "added"]
+
+    def test_rejects_bad_input(self):
+        with pytest.raises(ValueError, match="column"):
+            diff_query("t", "abc", columns=["id; DROP TABLE t"])
+        with pytest.raises(ValueError, match="diff types"):
+            diff_query("t", "abc", diff_types=["changed"])
+
+
+class TestDiffRow:
+    def test_uses_new_values(self):
+        row = diff_row(_diff("modified", "d1", status="SUCCESS"))
+        assert row == {"diff_type": "modified", "document_id": "d1", "status": "SUCCESS"}
+
+    def test_removed_uses_old_values(self):
+        row = diff_row(_diff("removed", "d1", status="SUCCESS"))
+        assert row == {"diff_type": "removed", "document_id": "d1", "status": "old-SUCCESS"}
+
+
+class TestRevisions:
+    def test_plain_ref_passes_through(self):
+        db = MagicMock(spec=DoltDB)
+        assert resolve_revision(db, "HEAD~1") == "HEAD~1"
+        db.query_one.assert_not_called()
+
+    def test_run_marker(self):
+        db = MagicMock(spec=DoltDB)
+        db.query_one.return_value = {"tag_hash": "t1"}
+
+        assert resolve_revision(db, "run:r1") == "t1"
+        assert db.query_one.call_args.args[1] == ["kurt/run/r1"]
+
+    def test_untagged_run_marker(self):
+        db = MagicMock(spec=DoltDB)
+        db.query_one.side_effect = [
+            None,
+            {"started_at": "2026-01-01 00:00:00"},
+            {"commit_hash": "c1"},
+        ]
+
+        assert resolve_revision(db, "run:r1") == "c1"
+        assert db.query_one.call_args_list[1].args[1] == ["r1"]
+        assert db.query_one.call_args_list[2].args[1] == ["2026-01-01 00:00:00"]
+
+    def test_record_run_revision(self):
+        db = MagicMock(spec=DoltDB)
+        db.call.side_effect = [[{"hash": "c9"}], []]
+
+        assert record_run_revision(db, "r1", "nightly") == "c9"
+        commit, tag = db.call.call_args_list
+        assert commit.args[:2] == ("DOLT_COMMIT", "-A")
+        assert tag.args == ("DOLT_TAG", "-m", "workflow:nightly", "kurt/run/r1", "c9")
+
+    def test_last_run_revision(self):
+        db = MagicMock(spec=DoltDB)
+        db.query_one.return_value = {"tag_hash": "t2"}
+
+        assert last_run_revision(db, "nightly") == "t2"
+        assert db.query_one.call_args.args[1] == ["workflow:nightly"]
+
+    def test_last_run_revision_never_ran(self):
+        db = MagicMock(spec=DoltDB)
+        db.query_one.return_value = None
+        assert last_run_revision(db, "nightly") is None
+
+    def test_unknown_run(self):
+        db = MagicMock(spec=DoltDB)
+        db.query_one.return_value = None
+        with pytest.raises(ValueError, match="Unknown workflow run"):
+            resolve_revision(db, "run:missing")
+
+
+class TestTableChanges:
+    def test_flattens_rows(self):
+        db = MagicMock(spec=DoltDB)
+        db.query.return_value = QueryResult(rows=[_diff("added", "d1", status="PENDING")])
+
+        rows = table_changes(db, "fetch_documents", since="abc")
+
+        assert rows == [{"diff_type": "added", "document_id": "d1", "status": "PENDING"}]
+        assert db.query.call_args.args[1][:3] == ["abc", "WORKING", "fetch_documents"]
+
+    def test_iter_in_chunks(self):
+        db = MagicMock(spec=DoltDB)
+        db.query_chunks.return_value = iter([[_diff("added", "d1")], [_diff("removed", "d2")]])
+
+        chunks = list(iter_table_changes(db, "map_documents", since="abc", chunk_size=1))
+
+        assert [[r["document_id"] for r in c] for c in chunks] == [["d1"], ["d2"]]
+        assert db.query_chunks.call_args.kwargs["chunk_size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_aiter_in_chunks(self):
+        async def chunks(sql, params, chunk_size):
+            yield [_diff("added", "d1")]
+            yield [_diff("modified", "d2")]
+
+        db = MagicMock(spec=DoltDB)
+        db.aquery_chunks.side_effect = chunks
+
+        seen = [c async for c in aiter_table_changes(db, "fetch_documents", since="abc")]
+
+        assert [[r["document_id"] for r in c] for c in seen] == [["d1"], ["d2"]]
+
+
+class TestChangedDocuments:
+    def test_merges_map_and_fetch(self):
+        db = MagicMock(spec=DoltDB)
+        diffs = {
+            "map_documents": [_diff("added", "new"), _diff("removed", "gone"), _diff("modified", "m")],
+            "fetch_documents": [_diff("added", "new"), _diff("modified", "refetched")],
+        }
+        db.query.side_effect = lambda sql, params: QueryResult(rows=diffs[params[2]])
+
+        assert changed_documents(db, since="abc") == {
+            "new": "added",
+            "gone": "removed",
+            "m": "modified",
+            "refetched": "modified",
+        }
+        assert changed_documents(db, since="abc", diff_types=["removed"]) == {"gone": "removed"}
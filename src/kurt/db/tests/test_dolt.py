@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from typing import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -140,22 +142,52 @@ class TestDoltTransaction:
         assert result.rows == [{"id": 1}]
 
     def test_commit_executes_all_statements(self):
-        """Test that commit executes all queued statements."""
+        """Test that commit executes all queued statements in one batch call."""
         mock_db = MagicMock()
-        mock_db.execute.return_value = QueryResult(rows=[], affected_rows=1)
         tx = DoltTransaction(_db=mock_db)
 
         tx.execute("INSERT INTO users VALUES (?)", [1])
         tx.execute("INSERT INTO users VALUES (?)", [2])
         tx._commit()
 
-        assert mock_db.execute.call_count == 2
+        mock_db.execute_batches.assert_called_once_with(
+            [("INSERT INTO users VALUES (?)", [[1], [2]])]
+        )
+        mock_db.execute.assert_not_called()
+        assert tx._committed is True
+
+    def test_commit_groups_consecutive_statements(self):
+        """Test that only consecutive runs of the same SQL are grouped."""
+        mock_db = MagicMock()
+        tx = DoltTransaction(_db=mock_db)
+
+        tx.execute("INSERT INTO a VALUES (?)", [1])
+        tx.execute("INSERT INTO a VALUES (?)", [2])
+        tx.execute("DELETE FROM b WHERE id = ?", [3])
+        tx.execute("INSERT INTO a VALUES (?)", [4])
+        tx._commit()
+
+        mock_db.execute_batches.assert_called_once_with(
+            [
+                ("INSERT INTO a VALUES (?)", [[1], [2]]),
+                ("DELETE FROM b WHERE id = ?", [[3]]),
+                ("INSERT INTO a VALUES (?)", [[4]]),
+            ]
+        )
+
+    def test_commit_empty_transaction(self):
+        """Test that an empty transaction does not touch the database."""
+        mock_db = MagicMock()
+        tx = DoltTransaction(_db=mock_db)
+        tx._commit()
+
+        mock_db.execute_batches.assert_not_called()
         assert tx._committed is True
 
     def test_commit_rolls_back_on_error(self):
         """Test that commit marks rollback on error."""
         mock_db = MagicMock()
-        mock_db.execute.side_effect = Exception("DB error")
+        mock_db.execute_batches.side_effect = Exception("DB error")
         tx = DoltTransaction(_db=mock_db)
 
         tx.execute("INSERT INTO users VALUES (?)", [1])
@@ -409,6 +441,451 @@ class TestDoltDBParameterTypes:
         assert result.rows[1]["active"] == 0
 
 
+# =============================================================================
+# Batched Execution Tests
+# =============================================================================
+
+
+class TestExecuteMany:
+    """Tests for execute_many and batched transaction commits (mocked connection)."""
+
+    @pytest.fixture
+    def batch_db(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.rowcount = 2
+        cursor.lastrowid = 7
+        pool = MagicMock()
+        pool.get_connection.return_value = conn
+        with patch.object(db, "_get_pool", return_value=pool):
+            yield db, pool, conn, cursor
+
+    def test_execute_many_uses_one_connection(self, batch_db):
+        db, pool, conn, cursor = batch_db
+
+        result = db.execute_many("INSERT INTO t VALUES (?, ?)", [[1, "a"], [2, "b"]])
+
+        pool.get_connection.assert_called_once()
+        pool.return_connection.assert_called_once_with(conn)
+        cursor.executemany.assert_called_once_with(
+            "INSERT INTO t VALUES (%s, %s)", [[1, "a"], [2, "b"]]
+        )
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert statements == ["START TRANSACTION", "COMMIT"]
+        assert result.affected_rows == 2
+        assert result.last_insert_id == 7
+
+    def test_execute_many_empty(self, batch_db):
+        db, pool, _, _ = batch_db
+
+        assert db.execute_many("INSERT INTO t VALUES (?)", []).affected_rows == 0
+        pool.get_connection.assert_not_called()
+
+    def test_execute_many_chunks(self, batch_db):
+        from kurt.db.queries import EXECUTE_MANY_CHUNK_SIZE
+
+        db, _, _, cursor = batch_db
+        db.execute_many("INSERT INTO t VALUES (?)", [[i] for i in range(EXECUTE_MANY_CHUNK_SIZE + 1)])
+
+        assert cursor.executemany.call_count == 2
+
+    def test_execute_batches_returns_result_per_batch(self, batch_db):
+        db, _, _, cursor = batch_db
+        cursor.rowcount = 3
+
+        results = db.execute_batches(
+            [("DELETE FROM t WHERE id IN (?, ?)", [[1, 2]]), ("INSERT INTO t VALUES (?)", [[1], [2]])]
+        )
+
+        assert [r.affected_rows for r in results] == [3, 3]
+        cursor.executemany.assert_called_once()
+
+    def test_failure_rolls_back(self, batch_db):
+        db, pool, conn, cursor = batch_db
+        cursor.executemany.side_effect = Exception("duplicate key")
+
+        with pytest.raises(DoltQueryError, match="duplicate key"):
+            db.execute_many("INSERT INTO t VALUES (?)", [[1], [1]])
+
+        assert cursor.execute.call_args_list[-1].args == ("ROLLBACK",)
+        pool.return_connection.assert_called_once_with(conn)
+
+    def test_transaction_commit(self, batch_db):
+        db, pool, _, cursor = batch_db
+
+        with db.transaction() as tx:
+            tx.execute("INSERT INTO t VALUES (?)", [1])
+            tx.execute("INSERT INTO t VALUES (?)", [2])
+            tx.execute("UPDATE c SET n = n + ?", [2])
+
+        pool.get_connection.assert_called_once()
+        cursor.executemany.assert_called_once_with("INSERT INTO t VALUES (%s)", [[1], [2]])
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert statements == ["START TRANSACTION", "UPDATE c SET n = n + %s", "COMMIT"]
+
+
+# =============================================================================
+# Async Query API Tests
+# =============================================================================
+
+
+class TestAsyncQueries:
+    """Tests for aquery/aexecute/aexecute_many (mocked aiomysql pool)."""
+
+    @pytest.fixture
+    def async_db(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        cursor = MagicMock()
+        cursor.execute = AsyncMock()
+        cursor.executemany = AsyncMock()
+        cursor.fetchall = AsyncMock(return_value=[{"id": 1}])
+        cursor.rowcount = 2
+        cursor.lastrowid = 9
+
+        @asynccontextmanager
+        async def cursor_cm(*args):
+            yield cursor
+
+        conn = MagicMock()
+        conn.cursor.side_effect = cursor_cm
+        conn.begin = AsyncMock()
+        conn.commit = AsyncMock()
+        conn.rollback = AsyncMock()
+
+        @asynccontextmanager
+        async def acquire():
+            yield conn
+
+        pool = MagicMock()
+        pool.acquire.side_effect = acquire
+        with patch.object(db, "_get_async_pool", AsyncMock(return_value=pool)):
+            yield db, conn, cursor
+
+    @pytest.mark.asyncio
+    async def test_aquery(self, async_db):
+        db, _, cursor = async_db
+
+        result = await db.aquery("SELECT * FROM t WHERE id = ?", [1])
+
+        cursor.execute.assert_awaited_once_with("SELECT * FROM t WHERE id = %s", [1])
+        assert result.rows == [{"id": 1}]
+        assert await db.aquery_one("SELECT 1") == {"id": 1}
+
+    @pytest.mark.asyncio
+    async def test_aexecute(self, async_db):
+        db, _, _ = async_db
+
+        result = await db.aexecute("UPDATE t SET a = ?", [1])
+
+        assert result.affected_rows == 2
+        assert result.last_insert_id == 9
+
+    @pytest.mark.asyncio
+    async def test_aexecute_many_commits(self, async_db):
+        db, conn, cursor = async_db
+
+        result = await db.aexecute_many("INSERT INTO t VALUES (?)", [[1], [2]])
+
+        cursor.executemany.assert_awaited_once_with("INSERT INTO t VALUES (%s)", [[1], [2]])
+        conn.begin.assert_awaited_once()
+        conn.commit.assert_awaited_once()
+        assert result.affected_rows == 2
+
+    @pytest.mark.asyncio
+    async def test_aexecute_many_rolls_back(self, async_db):
+        db, conn, cursor = async_db
+        cursor.executemany.side_effect = Exception("duplicate key")
+
+        with pytest.raises(DoltQueryError, match="duplicate key"):
+            await db.aexecute_many("INSERT INTO t VALUES (?)", [[1], [1]])
+
+        conn.rollback.assert_awaited_once()
+        conn.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_query_error_wrapped(self, async_db):
+        db, _, cursor = async_db
+        cursor.execute.side_effect = Exception("no such table")
+
+        with pytest.raises(DoltQueryError, match="no such table"):
+            await db.aquery("SELECT * FROM missing")
+
+    @pytest.mark.asyncio
+    async def test_async_pool_per_event_loop(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        db._auto_start = False
+
+        pool = await db._get_async_pool()
+
+        assert await db._get_async_pool() is pool
+        assert db.pool_stats()["async"] == [pool.stats()]
+
+    @pytest.mark.asyncio
+    async def test_close_async_pool(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        db._auto_start = False
+        assert not db.has_async_pool()
+
+        pool = await db._get_async_pool()
+        assert db.has_async_pool()
+        with patch.object(pool, "close", AsyncMock()) as mock_close:
+            await db.close_async_pool()
+
+        mock_close.assert_awaited_once()
+        assert not db.has_async_pool()
+        assert await db._get_async_pool() is not pool
+
+
+class TestStreamingQueries:
+    """Tests for query_chunks/aquery_chunks (mocked server-side cursors)."""
+
+    @pytest.fixture
+    def sync_db(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        cursor = MagicMock()
+        cursor.fetchmany.side_effect = [[{"id": 1}, {"id": 2}], [{"id": 3}], []]
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        pool = MagicMock()
+        pool.get_connection.return_value = conn
+        with patch.object(db, "_get_pool", return_value=pool):
+            yield db, pool, conn, cursor
+
+    def test_query_chunks(self, sync_db):
+        db, pool, conn, cursor = sync_db
+
+        chunks = list(db.query_chunks("SELECT id FROM t WHERE a = ?", [1], chunk_size=2))
+
+        assert chunks == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+        conn.cursor.assert_called_once_with(dictionary=True, buffered=False)
+        cursor.execute.assert_called_once_with("SELECT id FROM t WHERE a = %s", [1])
+        cursor.fetchmany.assert_called_with(2)
+        pool.return_connection.assert_called_once_with(conn)
+
+    def test_closed_early_discards_connection(self, sync_db):
+        db, pool, conn, cursor = sync_db
+
+        chunks = db.query_chunks("SELECT id FROM t", chunk_size=2)
+        assert next(chunks) == [{"id": 1}, {"id": 2}]
+        chunks.close()
+
+        cursor.close.assert_not_called()
+        pool.discard_connection.assert_called_once_with(conn)
+        pool.return_connection.assert_not_called()
+
+    def test_query_error_wrapped(self, sync_db):
+        db, pool, conn, cursor = sync_db
+        cursor.execute.side_effect = Exception("no such table")
+
+        with pytest.raises(DoltQueryError, match="no such table"):
+            list(db.query_chunks("SELECT * FROM missing"))
+        pool.discard_connection.assert_called_once_with(conn)
+
+    @pytest.mark.asyncio
+    async def test_aquery_chunks(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        cursor = MagicMock()
+        cursor.execute = AsyncMock()
+        cursor.fetchmany = AsyncMock(side_effect=[[{"id": 1}, {"id": 2}], [{"id": 3}], []])
+        cursor.close = AsyncMock()
+        conn = MagicMock()
+        conn.cursor = AsyncMock(return_value=cursor)
+
+        @asynccontextmanager
+        async def acquire():
+            yield conn
+
+        pool = MagicMock()
+        pool.acquire.side_effect = acquire
+        with patch.object(db, "_get_async_pool", AsyncMock(return_value=pool)):
+            chunks = [c async for c in db.aquery_chunks("SELECT id FROM t", chunk_size=2)]
+
+            assert chunks == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+            cursor.close.assert_awaited_once()
+            conn.close.assert_not_called()
+
+            # Closed early: the connection is closed, not drained
+            cursor.fetchmany.side_effect = [[{"id": 1}], [{"id": 2}]]
+            stream = db.aquery_chunks("SELECT id FROM t", chunk_size=1)
+            assert await stream.__anext__() == [{"id": 1}]
+            await stream.aclose()
+            conn.close.assert_called_once()
+
+
+class TestStoredProcedures:
+    """Tests for call() and the version control methods built on it (mocked)."""
+
+    @pytest.fixture
+    def sync_db(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        cursor = MagicMock()
+        cursor.description = [("hash",), ("fast_forward",), ("conflicts",)]
+        cursor.fetchall.return_value = [{"hash": "abc", "fast_forward": 0, "conflicts": 1}]
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        pool = MagicMock()
+        pool.get_connection.return_value = conn
+        with patch.object(db, "_get_pool", return_value=pool):
+            yield db, pool, conn, cursor
+
+    def test_call_builds_placeholders(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        with patch.object(db, "query", return_value=QueryResult(rows=[{"hash": "abc"}])) as query:
+            rows = db.call("DOLT_COMMIT", "-A", "-m", "msg")
+
+        assert rows == [{"hash": "abc"}]
+        query.assert_called_once_with("CALL DOLT_COMMIT(?, ?, ?)", ["-A", "-m", "msg"])
+
+    def test_call_with_session_vars(self, sync_db):
+        db, pool, conn, cursor = sync_db
+
+        rows = db.call(
+            "DOLT_MERGE", "--no-commit", "feature", session_vars={"dolt_allow_commit_conflicts": 1}
+        )
+
+        assert rows == [{"hash": "abc", "fast_forward": 0, "conflicts": 1}]
+        assert [c.args[0] for c in cursor.execute.call_args_list] == [
+            "SET @@dolt_allow_commit_conflicts = %s",
+            "CALL DOLT_MERGE(%s, %s)",
+            "SET @@dolt_allow_commit_conflicts = DEFAULT",
+        ]
+        pool.return_connection.assert_called_once_with(conn)
+
+    def test_call_error_discards_connection(self, sync_db):
+        db, pool, conn, cursor = sync_db
+        cursor.execute.side_effect = [None, Exception("merge failed")]
+
+        with pytest.raises(DoltQueryError, match="merge failed"):
+            db.call("DOLT_MERGE", "feature", session_vars={"dolt_allow_commit_conflicts": 1})
+
+        pool.discard_connection.assert_called_once_with(conn)
+        pool.return_connection.assert_not_called()
+
+    def test_commit(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        with patch.object(db, "call", return_value=[{"hash": "abc123"}]) as call:
+            assert db.commit("msg", author="A <a@example.com>") == "abc123"
+
+        call.assert_called_once_with(
+            "DOLT_COMMIT", "-A", "-m", "msg", "--author", "A <a@example.com>"
+        )
+
+    def test_branch_create_error(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        with patch.object(db, "call", side_effect=DoltQueryError("already exists")):
+            with pytest.raises(DoltBranchError, match="already exists"):
+                db.branch_create("main")
+
+    def test_branch_list(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        local = QueryResult(rows=[{"name": "feature", "hash": "h1"}, {"name": "main", "hash": "h2"}])
+        remote = QueryResult(rows=[{"name": "remotes/origin/main", "hash": "h3"}])
+
+        with (
+            patch.object(db, "query_one", return_value={"branch": "main"}),
+            patch.object(db, "query", side_effect=[local, remote]),
+        ):
+            branches = db.branch_list(all_branches=True)
+
+        assert [(b.name, b.is_current, b.remote) for b in branches] == [
+            ("feature", False, None),
+            ("main", True, None),
+            ("main", False, "origin"),
+        ]
+
+
+class TestQueryCaching:
+    """Tests for the DoltDB read-through cache (mocked queries)."""
+
+    @pytest.fixture
+    def cached_db(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        cache = db.enable_query_cache()
+        hashes = {"users": "h1"}
+
+        def query(sql, params=None):
+            if "DOLT_HASHOF_TABLE" in sql:
+                return QueryResult(rows=[{f"h{i}": hashes[t] for i, t in enumerate(params)}])
+            return QueryResult(rows=[{"n": 1}])
+
+        with (
+            patch.object(db, "_query_server", side_effect=query) as query_server,
+            patch.object(db, "_execute_server", return_value=QueryResult(rows=[])),
+        ):
+            yield db, cache, hashes, query_server
+        cache.invalidate()
+
+    def _reads(self, query_server):
+        return [c for c in query_server.call_args_list if "DOLT_HASHOF" not in c.args[0]]
+
+    def test_hit_until_table_hash_changes(self, cached_db):
+        db, cache, hashes, query_server = cached_db
+        sql = "SELECT COUNT(*) AS n FROM users WHERE active = ?"
+
+        assert db.query_cached(sql, [1]).rows == [{"n": 1}]
+        assert db.query_cached(sql, [1]).rows == [{"n": 1}]
+        assert len(self._reads(query_server)) == 1
+
+        hashes["users"] = "h2"  # Written by another process
+        db.query_cached(sql, [1])
+        assert len(self._reads(query_server)) == 2
+
+    def test_params_are_part_of_the_key(self, cached_db):
+        db, _, _, query_server = cached_db
+
+        db.query_cached("SELECT * FROM users WHERE id = ?", [1])
+        db.query_cached("SELECT * FROM users WHERE id = ?", [2])
+
+        assert len(self._reads(query_server)) == 2
+
+    def test_execute_pushes_invalidation(self, cached_db, tmp_path: Path):
+        db, cache, _, query_server = cached_db
+        cache.ttl = 60  # Only pushed invalidation can cause a re-read
+        sql = "SELECT * FROM users"
+
+        db.query_cached(sql)
+        db.query_cached(sql)
+        assert len(self._reads(query_server)) == 1
+
+        # A second client for the same database shares the cache
+        DoltDB(tmp_path, mode="server")._invalidate_written("UPDATE users SET active = 0")
+        db.query_cached(sql)
+        assert len(self._reads(query_server)) == 2
+
+        db.execute("INSERT INTO other_table VALUES (1)")
+        db.query_cached(sql)
+        assert len(self._reads(query_server)) == 2
+
+    def test_cached_compute(self, cached_db):
+        db, _, _, _ = cached_db
+        compute = MagicMock(return_value={"count": 3})
+
+        assert db.cached(("count", {"status": "ok"}), ["users"], compute) == {"count": 3}
+        assert db.cached(("count", {"status": "ok"}), ["users"], compute) == {"count": 3}
+        compute.assert_called_once()
+
+    def test_disabled_cache_passes_through(self, tmp_path: Path):
+        db = DoltDB(tmp_path, mode="server")
+        compute = MagicMock(return_value=1)
+
+        db.cached("k", ["users"], compute)
+        db.cached("k", ["users"], compute)
+
+        assert compute.call_count == 2
+
+    def test_unreadable_hash_skips_cache(self, cached_db):
+        db, cache, _, _ = cached_db
+        compute = MagicMock(return_value=1)
+
+        with patch.object(db, "query_one", side_effect=DoltQueryError("no such table")):
+            db.cached("k", ["missing"], compute)
+            db.cached("k", ["missing"], compute)
+
+        assert compute.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+
 # =============================================================================
 # DoltDB Transaction Tests (Server Mode)
 # =============================================================================
@@ -444,28 +921,63 @@ class TestDoltDBTransactionServer:
         result = server_db.query("SELECT * FROM users")
         assert len(result) == 1
 
+    def test_transaction_is_atomic(self, server_db: DoltDB):
+        """Test a failing statement on commit undoes the earlier ones."""
+        server_db.execute("CREATE TABLE users (id INT PRIMARY KEY, name VARCHAR(100))")
+
+        with pytest.raises(DoltTransactionError):
+            with server_db.transaction() as tx:
+                tx.execute("INSERT INTO users VALUES (?, ?)", [1, "Alice"])
+                tx.execute("INSERT INTO users VALUES (?, ?)", [1, "Duplicate"])
+
+        assert len(server_db.query("SELECT * FROM users")) == 0
+
+    def test_execute_many(self, server_db: DoltDB):
+        """Test execute_many inserts every row."""
+        server_db.execute("CREATE TABLE users (id INT PRIMARY KEY, name VARCHAR(100))")
+
+        result = server_db.execute_many(
+            "INSERT INTO users VALUES (?, ?)", [[i, f"user{i}"] for i in range(50)]
+        )
+
+        assert result.affected_rows == 50
+        assert len(server_db.query("SELECT * FROM users")) == 50
+
 
 # =============================================================================
-# DoltDB Branch Tests (CLI-only operations)
+# DoltDB Branch Tests (managed server)
 # =============================================================================
 
 
-class TestDoltDBBranchCLI:
-    """Tests for DoltDB branch operations using CLI only.
+@pytest.fixture
+def managed_db(tmp_dolt_repo: Path) -> Generator[DoltDB, None, None]:
+    """DoltDB that auto-starts (and on teardown stops) its own local server."""
+    db = DoltDB(tmp_dolt_repo)
+    db._port = db._find_free_port()
+    try:
+        yield db
+    finally:
+        db.close()
+        db._stop_server()
+
+
+class TestDoltDBBranch:
+    """Tests for DoltDB branch operations against the auto-started server.
 
-    Note: dolt checkout/switch commands don't work while sql-server is running,
-    so these tests use tmp_dolt_repo directly without starting a server.
+    Branch queries use CALL DOLT_BRANCH() and dolt_branches; branch_switch
+    stops the server around `dolt checkout`, which refuses to run while a
+    sql-server is up.
     """
 
-    def test_branch_current_returns_main(self, tmp_dolt_repo: Path):
+    def test_branch_current_returns_main(self, managed_db: DoltDB):
         """Test branch_current returns main initially."""
-        db = DoltDB(tmp_dolt_repo)
+        db = managed_db
         # Dolt defaults to 'main' branch
         assert db.branch_current() == "main"
 
-    def test_branch_list_includes_main(self, tmp_dolt_repo: Path):
+    def test_branch_list_includes_main(self, managed_db: DoltDB):
         """Test branch_list includes main branch."""
-        db = DoltDB(tmp_dolt_repo)
+        db = managed_db
 
         branches = db.branch_list()
 
@@ -473,9 +985,9 @@ class TestDoltDBBranchCLI:
         names = [b.name for b in branches]
         assert "main" in names
 
-    def test_branch_create_and_list(self, tmp_dolt_repo: Path):
+    def test_branch_create_and_list(self, managed_db: DoltDB):
         """Test creating a branch and listing it."""
-        db = DoltDB(tmp_dolt_repo)
+        db = managed_db
 
         db.branch_create("feature/test")
 
@@ -483,18 +995,18 @@ class TestDoltDBBranchCLI:
         names = [b.name for b in branches]
         assert "feature/test" in names
 
-    def test_branch_switch(self, tmp_dolt_repo: Path):
+    def test_branch_switch(self, managed_db: DoltDB):
         """Test switching branches."""
-        db = DoltDB(tmp_dolt_repo)
+        db = managed_db
 
         db.branch_create("feature/test")
         db.branch_switch("feature/test")
 
         assert db.branch_current() == "feature/test"
 
-    def test_branch_switch_back_to_main(self, tmp_dolt_repo: Path):
+    def test_branch_switch_back_to_main(self, managed_db: DoltDB):
         """Test switching back to main."""
-        db = DoltDB(tmp_dolt_repo)
+        db = managed_db
 
         db.branch_create("feature/test")
         db.branch_switch("feature/test")
@@ -502,9 +1014,9 @@ class TestDoltDBBranchCLI:
 
         assert db.branch_current() == "main"
 
-    def test_branch_delete(self, tmp_dolt_repo: Path):
+    def test_branch_delete(self, managed_db: DoltDB):
         """Test deleting a branch."""
-        db = DoltDB(tmp_dolt_repo)
+        db = managed_db
 
         db.branch_create("feature/to-delete")
         db.branch_delete("feature/to-delete", force=True)
@@ -607,6 +1119,46 @@ class TestConnectionPool:
                 with pytest.raises(DoltConnectionError, match="requires mysql-connector-python"):
                     pool._create_connection()
 
+    def _pool(self, conns, **kwargs):
+        pool = ConnectionPool("localhost", 3306, "root", "", "test", pool_size=2, **kwargs)
+        pool._create_connection = MagicMock(side_effect=conns)
+        pool._start_health_checks = MagicMock()
+        return pool
+
+    def test_checkout_skips_ping_for_fresh_connection(self):
+        conn = MagicMock()
+        pool = self._pool([conn])
+
+        pool.return_connection(pool.get_connection())
+        assert pool.get_connection() is conn
+
+        conn.ping.assert_not_called()
+        assert pool.stats()["checkouts"] == 2
+
+    def test_checkout_pings_stale_connection(self):
+        dead, fresh = MagicMock(), MagicMock()
+        dead.ping.side_effect = Exception("gone")
+        pool = self._pool([dead, fresh], health_check_interval=0)
+
+        pool.return_connection(pool.get_connection())
+
+        assert pool.get_connection() is fresh
+        assert pool.stats()["dropped"] == 1
+
+    def test_check_health_drops_dead_connections(self):
+        alive, dead = MagicMock(), MagicMock()
+        dead.ping.side_effect = Exception("gone")
+        pool = self._pool([alive, dead])
+        a, b = pool.get_connection(), pool.get_connection()
+        pool.return_connection(a)
+        pool.return_connection(b)
+
+        assert pool.check_health() == 1
+        stats = pool.stats()
+        assert stats["idle"] == 1
+        assert stats["created"] == 1
+        assert stats["health_checks"] == 1
+
 
 # =============================================================================
 # DoltDB Context Manager Tests
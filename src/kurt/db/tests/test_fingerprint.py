@@ -0,0 +1,160 @@
+"""Tests for schema fingerprints and the startup stamp."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import Column, Integer, MetaData, String, Table
+
+from kurt.db.dolt import DoltDB
+from kurt.db.fingerprint import (
+    MODEL_SOURCES,
+    SCHEMA_STAMP_FILE,
+    read_db_fingerprint,
+    schema_fingerprint,
+    source_key,
+    stamp_matches,
+    write_db_fingerprint,
+    write_stamp,
+)
+
+
+def _model(*columns: Column) -> SimpleNamespace:
+    """Stand-in for a SQLModel class (only ``__table__`` is fingerprinted)."""
+    return SimpleNamespace(__table__=Table("widgets", MetaData(), *columns))
+
+
+_WIDGET = _model(Column("id", Integer, primary_key=True), Column("name", String, index=True))
+_WIDGET_V2 = _model(
+    Column("id", Integer, primary_key=True),
+    Column("name", String, index=True),
+    Column("size", Integer, nullable=True),
+)
+
+
+def _mock_db(path: Path, branch: str = "main") -> MagicMock:
+    (path / ".dolt").mkdir(exist_ok=True)
+    (path / ".dolt" / "repo_state.json").write_text(json.dumps({"head": f"refs/heads/{branch}"}))
+    db = MagicMock(spec=DoltDB)
+    db.path = path
+    db._cache_target.return_value = ("localhost", str(path), "kurt")
+    return db
+
+
+class TestSchemaFingerprint:
+    def test_stable(self):
+        assert schema_fingerprint([_WIDGET]) == schema_fingerprint([_WIDGET])
+
+    def test_changes_with_models(self):
+        assert schema_fingerprint([_WIDGET]) != schema_fingerprint([_WIDGET_V2])
+
+    def test_all_models(self):
+        assert len(schema_fingerprint()) == 64
+
+
+class TestSourceKey:
+    def test_stable(self):
+        assert source_key() == source_key()
+        assert len(source_key()) == 64
+
+    def test_covers_every_model_module(self):
+        import inspect
+
+        import kurt
+        from kurt.db.auto_migrate import get_all_models
+
+        package_dir = Path(kurt.__file__).resolve().parent
+        for model in get_all_models():
+            path = Path(inspect.getfile(model)).resolve().relative_to(package_dir)
+            assert path.as_posix() in MODEL_SOURCES
+
+    def test_changes_with_version(self):
+        current = source_key()
+        with patch("kurt.db.fingerprint._package_version", return_value="0.0.0-test"):
+            assert source_key() != current
+
+    def test_imports_no_models(self):
+        import os
+        import subprocess
+        import sys
+
+        import kurt
+
+        code = (
+            "import sys; from kurt.db.fingerprint import source_key; source_key(); "
+            "print('kurt.tools' in sys.modules or 'kurt.tools.fetch.models' in sys.modules)"
+        )
+        src_dir = str(Path(kurt.__file__).resolve().parent.parent)
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": src_dir},
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestStamp:
+    def test_round_trip(self, tmp_path: Path):
+        db = _mock_db(tmp_path)
+        assert not stamp_matches(db, "abc")
+
+        write_stamp(db, "abc")
+
+        assert (tmp_path / ".dolt" / SCHEMA_STAMP_FILE).exists()
+        assert stamp_matches(db, "abc")
+        assert not stamp_matches(db, "def")
+
+    def test_branch_switch_invalidates(self, tmp_path: Path):
+        db = _mock_db(tmp_path)
+        write_stamp(db, "abc")
+
+        _mock_db(tmp_path, branch="feature")
+
+        assert not stamp_matches(db, "abc")
+
+    def test_other_target_invalidates(self, tmp_path: Path):
+        db = _mock_db(tmp_path)
+        write_stamp(db, "abc")
+
+        db._cache_target.return_value = ("db.example.com", str(tmp_path), "kurt")
+
+        assert not stamp_matches(db, "abc")
+
+    def test_no_stamp_without_dolt_dir(self, tmp_path: Path):
+        db = MagicMock(spec=DoltDB)
+        db.path = tmp_path
+        db._cache_target.return_value = ("db.example.com", str(tmp_path), "kurt")
+
+        write_stamp(db, "abc")
+
+        assert not stamp_matches(db, "abc")
+
+
+class TestDatabaseCopy:
+    def test_read(self):
+        db = MagicMock(spec=DoltDB)
+        db.query_one.return_value = {"fingerprint": "abc"}
+        assert read_db_fingerprint(db) == "abc"
+
+        db.query_one.return_value = None
+        assert read_db_fingerprint(db) is None
+
+    def test_read_missing_table(self):
+        db = MagicMock(spec=DoltDB)
+        db.query_one.side_effect = Exception("table not found: kurt_schema")
+        assert read_db_fingerprint(db) is None
+
+    def test_write(self):
+        db = MagicMock(spec=DoltDB)
+
+        write_db_fingerprint(db, "abc")
+
+        create, replace = db.execute.call_args_list
+        assert "CREATE TABLE IF NOT EXISTS kurt_schema" in create.args[0]
+        assert replace.args[0].startswith("REPLACE INTO kurt_schema")
+        assert replace.args[1][:2] == ["models", "abc"]
@@ -0,0 +1,91 @@
+"""Tests for the managed dolt sql-server lifecycle helpers."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from kurt.db.server import (
+    SERVER_INFO_FILE,
+    read_server_info,
+    server_lock,
+    stop_server,
+    watch_idle,
+)
+
+
+def _write_info(path: Path, pid: int) -> Path:
+    info_file = path / ".dolt" / SERVER_INFO_FILE
+    info_file.parent.mkdir(parents=True, exist_ok=True)
+    info_file.write_text(json.dumps({"pid": pid, "port": 3306, "path": str(path)}))
+    return info_file
+
+
+class TestServerLock:
+    def test_lock_is_exclusive(self, tmp_path: Path):
+        order: list[str] = []
+
+        def contender():
+            with server_lock(tmp_path):
+                order.append("second")
+
+        with server_lock(tmp_path):
+            thread = threading.Thread(target=contender)
+            thread.start()
+            thread.join(0.1)
+            order.append("first")
+        thread.join(1)
+
+        assert order == ["first", "second"]
+
+
+class TestStopServer:
+    def test_removes_matching_info_file(self, tmp_path: Path):
+        info_file = _write_info(tmp_path, pid=4242)
+
+        with patch("kurt.db.server.os.getpgid", side_effect=ProcessLookupError):
+            stop_server(tmp_path, 4242)
+
+        assert not info_file.exists()
+
+    def test_keeps_info_file_of_other_server(self, tmp_path: Path):
+        _write_info(tmp_path, pid=1111)
+
+        with patch("kurt.db.server.os.getpgid", side_effect=ProcessLookupError):
+            stop_server(tmp_path, 4242)
+
+        assert read_server_info(tmp_path)["pid"] == 1111
+
+
+class TestWatchIdle:
+    def test_stops_server_after_idle_timeout(self, tmp_path: Path):
+        with (
+            patch("kurt.db.server._pid_alive", return_value=True),
+            patch("kurt.db.server.count_clients", side_effect=[1, 0, 0, 0]),
+            patch("kurt.db.server.stop_server") as stop,
+        ):
+            watch_idle(tmp_path, 3306, 4242, idle_timeout=0.01, check_interval=0.01)
+
+        stop.assert_called_once_with(tmp_path, 4242)
+
+    def test_client_during_recount_keeps_server(self, tmp_path: Path):
+        alive = iter([True, False])
+        with (
+            patch("kurt.db.server._pid_alive", side_effect=lambda pid: next(alive)),
+            patch("kurt.db.server.count_clients", side_effect=[0, 1]),
+            patch("kurt.db.server.stop_server") as stop,
+        ):
+            watch_idle(tmp_path, 3306, 4242, idle_timeout=0, check_interval=0)
+
+        stop.assert_not_called()
+
+    def test_returns_when_server_exits(self, tmp_path: Path):
+        with (
+            patch("kurt.db.server._pid_alive", return_value=False),
+            patch("kurt.db.server.stop_server") as stop,
+        ):
+            watch_idle(tmp_path, 3306, 4242, idle_timeout=0)
+
+        stop.assert_not_called()
@@ -113,24 +113,14 @@ def get_dolt_db(
 def _get_dolt_db_via_client(*, init_schema: bool = False) -> "DoltDB":
     """Get DoltDB via get_database_client(), respecting DATABASE_URL.
 
-    This handles server mode (MySQL) and embedded mode, and optionally
-    initializes the observability schema.
+    Optionally initializes the observability schema.
     """
     from kurt.db.database import get_database_client
-    from kurt.db.dolt import init_observability_schema
 
     db = get_database_client()
 
     if init_schema:
-        if db.mode == "embedded":
-            if not db.exists():
-                db.init()
-                init_observability_schema(db)
-            else:
-                _ensure_schema(db)
-        else:
-            # Server mode - check schema exists
-            _ensure_schema(db)
+        _ensure_schema(db)
 
     return db
 
@@ -16,8 +16,10 @@ from kurt.tools.core import (
     add_confirmation_options,
     add_filter_options,
     format_option,
+    format_table_jsonl_option,
     format_table_option,
     print_json,
+    print_jsonl,
 )
 
 console = Console()
@@ -33,6 +35,7 @@ def content_group():
       list     List documents with filters
       get      Get document details
       delete   Delete documents
+      similar  Find similar documents
 
     \b
     Note: Use 'kurt tool map' and 'kurt tool fetch' for content discovery and fetching.
@@ -47,7 +50,13 @@ def content_group():
 
 @content_group.command("list")
 @add_filter_options(source_type=True, offset=True, sort_by=True)
-@format_table_option
+@click.option(
+    "--after",
+    "after",
+    metavar="DOCUMENT_ID",
+    help="Keyset pagination: list documents after this ID (last ID of the previous page)",
+)
+@format_table_jsonl_option
 @track_command
 def list_cmd(
     include_pattern: str | None,
@@ -61,6 +70,7 @@ def list_cmd(
     offset: int | None,
     sort_by: str | None,
     sort_order: str,
+    after: str | None,
     output_format: str,
 ):
     """
@@ -73,8 +83,10 @@ def list_cmd(
         kurt content list --with-status FETCHED     # List fetched documents
         kurt content list --source-type url         # List URL-sourced documents
         kurt content list --limit 10 --offset 5     # Paginate results
+        kurt content list --limit 10 --after <id>   # Next page after the last listed ID
         kurt content list --sort-by created_at      # Sort by creation date
         kurt content list --format json             # JSON output for agents
+        kurt content list --format jsonl            # Stream one JSON line per document
     """
     from kurt.documents import DocumentFilters
     from kurt.tools.fetch.models import FetchStatus
@@ -89,6 +101,7 @@ def list_cmd(
         offset=offset,
         order_by=sort_by,
         order_desc=(sort_order == "desc"),
+        after=after,
     )
 
     # Map CLI status to internal status
@@ -103,6 +116,11 @@ def list_cmd(
         else:
             filters.fetch_status = status_map.get(with_status.upper())
 
+    if output_format == "jsonl":
+        # Rows are written as they are read, so large listings never sit in memory
+        print_jsonl(_doc_to_dict(d) for d in _iter_documents(filters))
+        return
+
     # Query documents (routes to local or cloud)
     docs = _list_documents(filters)
 
@@ -248,6 +266,96 @@ def delete_cmd(
     console.print(f"[green]✓[/green] Deleted {deleted_count} document(s)")
 
 
+@content_group.command("similar")
+@click.argument("identifier", required=False)
+@click.option("--query", "-q", "query_text", help="Find documents similar to this text")
+@click.option("--limit", "-k", "k", type=int, default=10, show_default=True, help="Number of results")
+@click.option(
+    "--method",
+    type=click.Choice(["auto", "exact", "ivf"], case_sensitive=False),
+    default="auto",
+    show_default=True,
+    help="Search method (exact scan or IVF approximate)",
+)
+@click.option("--rebuild", is_flag=True, help="Rebuild the vector index before searching")
+@format_table_option
+@track_command
+def similar_cmd(
+    identifier: str | None,
+    query_text: str | None,
+    k: int,
+    method: str,
+    rebuild: bool,
+    output_format: str,
+):
+    """
+    Find documents similar to a document or a query text.
+
+    Uses document embeddings (fetch with embed enabled) and a local vector
+    index stored in .kurt/vector_index/.
+
+    \b
+    Examples:
+        kurt docs similar abc123                 # Neighbours of a document
+        kurt docs similar -q "pricing pages" -k 5
+        kurt docs similar abc123 --format json
+    """
+    from kurt.documents import DocumentFilters
+    from kurt.tools.vector_search import embed_query, load_document_index, search_similar
+
+    if bool(identifier) == bool(query_text):
+        raise click.UsageError("Provide either a document IDENTIFIER or --query")
+
+    index = load_document_index(rebuild=rebuild)
+    if index is None:
+        if output_format == "json":
+            print_json({"error": "No document embeddings found", "results": []})
+        else:
+            console.print("[yellow]No document embeddings found.[/yellow] Fetch with embeddings enabled first.")
+        return
+
+    try:
+        if identifier:
+            doc = _get_document(identifier)
+            document_id = doc.document_id if doc else identifier
+            hits = search_similar(index, document_id=document_id, k=k, method=method)
+        else:
+            hits = search_similar(index, query_vector=embed_query([query_text])[0], k=k, method=method)
+    except KeyError:
+        if output_format == "json":
+            print_json({"error": "Document has no embedding", "identifier": identifier})
+        else:
+            console.print(f"[red]Document has no embedding:[/red] {identifier}")
+        return
+
+    docs = {d.document_id: d for d in _list_documents(DocumentFilters(ids=[h[0] for h in hits]))} if hits else {}
+
+    if output_format == "json":
+        print_json([
+            {
+                "document_id": doc_id,
+                "score": round(score, 6),
+                "source_url": docs[doc_id].source_url if doc_id in docs else None,
+                "title": docs[doc_id].title if doc_id in docs else None,
+            }
+            for doc_id, score in hits
+        ])
+        return
+
+    if not hits:
+        console.print("[dim]No similar documents found[/dim]")
+        return
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("ID", style="cyan", width=10)
+    table.add_column("Score", justify="right", width=6)
+    table.add_column("URL", style="dim")
+    for doc_id, score in hits:
+        doc = docs.get(doc_id)
+        table.add_row(doc_id[:8], f"{score:.3f}", _truncate(doc.source_url if doc else None, 70))
+    console.print(table)
+
+
 # =============================================================================
 # Helpers
 # =============================================================================
@@ -264,6 +372,17 @@ def _list_documents(filters):
     return DocumentRegistry().list(filters=filters)
 
 
+def _iter_documents(filters):
+    """
+    Iterate documents from database without loading them all.
+
+    Uses DocumentRegistry.iter_list (server-side cursor).
+    """
+    from kurt.documents.registry import DocumentRegistry
+
+    return DocumentRegistry().iter_list(filters=filters)
+
+
 def _get_document(identifier: str):
     """
     Get document by ID from Dolt database.
@@ -329,6 +448,7 @@ def docs_group():
       list     List documents with filters
       get      Get document details
       delete   Delete documents
+      similar  Find similar documents
     """
     pass
 
@@ -336,3 +456,4 @@ def docs_group():
 docs_group.add_command(list_cmd, name="list")
 docs_group.add_command(get_cmd, name="get")
 docs_group.add_command(delete_cmd, name="delete")
+docs_group.add_command(similar_cmd, name="similar")
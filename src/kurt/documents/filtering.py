@@ -3,6 +3,13 @@ Document filtering for lifecycle queries.
 
 Internal API uses clean names (status, include, limit).
 CLI adapter layer (future) will map to kurt-style names (--with-status, --in-cluster).
+
+Filters are applied in SQL so LIMIT, COUNT(*) and indexes stay usable:
+include/exclude globs are translated to LIKE patterns (a literal prefix
+becomes an index range on source_url). Only globs LIKE can't express
+(``[...]`` character classes) fall back to fnmatch after the query; see
+python_glob_patterns(). Pagination can be keyset-based (``after``) instead of
+OFFSET, which stays fast however deep the page is.
 """
 
 from __future__ import annotations
@@ -12,7 +19,8 @@ from datetime import datetime
 from fnmatch import fnmatch
 from typing import TYPE_CHECKING, Optional, Sequence
 
-from sqlalchemy import or_
+from sqlalchemy import and_, func, not_, or_
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql import Select
 from sqlmodel import select
 
@@ -65,6 +73,7 @@ class DocumentFilters:
     # Pagination
     limit: Optional[int] = None
     offset: Optional[int] = None
+    after: Optional[str] = None  # keyset cursor: document_id of the previous page's last row
 
     # Ordering
     order_by: Optional[str] = None  # field name
@@ -116,26 +125,73 @@ def build_map_query(filters: DocumentFilters) -> Select:
     return query
 
 
-def build_joined_query(filters: DocumentFilters) -> Select:
-    """Build query joining map and fetch tables for full lifecycle view."""
-    query = select(MapDocument, FetchDocument).outerjoin(
-        FetchDocument, MapDocument.document_id == FetchDocument.document_id
+def glob_to_like(pattern: str) -> Optional[str]:
+    """Translate an fnmatch glob to a SQL LIKE pattern (escape character ``\\``).
+
+    Returns None for patterns LIKE can't express (``[...]`` character classes).
+    Matching follows the column collation: case-sensitive on Dolt's default
+    utf8mb4_0900_bin.
+    """
+    if "[" in pattern:
+        return None
+    out = []
+    for ch in pattern:
+        if ch == "*":
+            out.append("%")
+        elif ch == "?":
+            out.append("_")
+        elif ch in "%_\\":
+            out.append("\\" + ch)
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def python_glob_patterns(filters: DocumentFilters) -> tuple[Optional[str], Optional[str]]:
+    """The (include, exclude) globs that must be matched in Python, not SQL."""
+    include = filters.include if filters.include and glob_to_like(filters.include) is None else None
+    exclude = filters.exclude if filters.exclude and glob_to_like(filters.exclude) is None else None
+    return include, exclude
+
+
+def _needs_fetch_join(filters: DocumentFilters) -> bool:
+    """Whether any filter reads fetch_documents columns."""
+    return bool(
+        filters.fetch_status
+        or filters.fetch_engine
+        or filters.has_content is not None
+        or filters.min_content_length
+        or filters.not_fetched
+        or filters.has_error is not None
+        or filters.order_by == "content_length"
     )
 
+
+def _apply_joined_filters(query: Select, filters: DocumentFilters) -> Select:
+    """Add the WHERE clauses of a map/fetch lifecycle query."""
     # Map filters
     if filters.ids:
         query = query.where(MapDocument.document_id.in_(filters.ids))
 
     if filters.url_contains:
-        # Support both glob patterns (with *) and plain substring matching
+        # Support both glob patterns (with *) and plain substring matching;
+        # globs with character classes are matched as substrings
         pattern = filters.url_contains
-        if "*" in pattern:
-            # Convert glob pattern to SQL LIKE pattern
-            # * -> % (match any characters)
-            like_pattern = pattern.replace("*", "%")
-            query = query.where(MapDocument.source_url.like(like_pattern))
+        url_like = glob_to_like(pattern) if "*" in pattern else None
+        if url_like is not None:
+            # Anchored glob: a literal prefix can use the source_url index
+            query = query.where(MapDocument.source_url.like(url_like, escape="\\"))
         else:
-            query = query.where(MapDocument.source_url.contains(pattern))
+            query = query.where(MapDocument.source_url.contains(pattern, autoescape=True))
+
+    # Glob filters LIKE can express; the rest are applied post-query
+    include_like = glob_to_like(filters.include) if filters.include else None
+    if include_like is not None:
+        query = query.where(MapDocument.source_url.like(include_like, escape="\\"))
+
+    exclude_like = glob_to_like(filters.exclude) if filters.exclude else None
+    if exclude_like is not None:
+        query = query.where(not_(MapDocument.source_url.like(exclude_like, escape="\\")))
 
     if filters.map_status:
         query = query.where(MapDocument.status == filters.map_status)
@@ -194,6 +250,58 @@ def build_joined_query(filters: DocumentFilters) -> Select:
     if filters.created_before:
         query = query.where(MapDocument.created_at <= filters.created_before)
 
+    return query
+
+
+# Sort keys usable with keyset pagination (map_documents columns)
+_KEYSET_COLUMNS = {"created_at", "source_url"}
+
+
+def _apply_keyset(query: Select, filters: DocumentFilters) -> Select:
+    """Restrict to rows after the ``after`` cursor in the query's sort order."""
+    if not filters.after:
+        return query
+
+    if not filters.order_by:
+        return query.where(MapDocument.document_id > filters.after)
+
+    if filters.order_by not in _KEYSET_COLUMNS:
+        raise ValueError(
+            f"Keyset pagination (after) can't order by {filters.order_by!r}; "
+            f"use one of {sorted(_KEYSET_COLUMNS)}"
+        )
+
+    # Sort value of the cursor row (aliased: must not correlate with the outer query)
+    cursor_doc = aliased(MapDocument)
+    column = getattr(MapDocument, filters.order_by)
+    cursor_value = (
+        select(getattr(cursor_doc, filters.order_by))
+        .where(cursor_doc.document_id == filters.after)
+        .scalar_subquery()
+    )
+    if filters.order_desc:
+        return query.where(
+            or_(
+                column < cursor_value,
+                and_(column == cursor_value, MapDocument.document_id < filters.after),
+            )
+        )
+    return query.where(
+        or_(
+            column > cursor_value,
+            and_(column == cursor_value, MapDocument.document_id > filters.after),
+        )
+    )
+
+
+def build_joined_query(filters: DocumentFilters) -> Select:
+    """Build query joining map and fetch tables for full lifecycle view."""
+    query = select(MapDocument, FetchDocument).outerjoin(
+        FetchDocument, MapDocument.document_id == FetchDocument.document_id
+    )
+    query = _apply_joined_filters(query, filters)
+    query = _apply_keyset(query, filters)
+
     # Ordering
     if filters.order_by:
         # Map field names to actual columns
@@ -204,10 +312,13 @@ def build_joined_query(filters: DocumentFilters) -> Select:
         }
         order_col = order_columns.get(filters.order_by)
         if order_col is not None:
+            # document_id breaks ties so pages never overlap
             if filters.order_desc:
-                query = query.order_by(order_col.desc())
+                query = query.order_by(order_col.desc(), MapDocument.document_id.desc())
             else:
-                query = query.order_by(order_col.asc())
+                query = query.order_by(order_col.asc(), MapDocument.document_id.asc())
+    elif filters.after:
+        query = query.order_by(MapDocument.document_id.asc())
 
     # Pagination
     if filters.offset:
@@ -219,6 +330,20 @@ def build_joined_query(filters: DocumentFilters) -> Select:
     return query
 
 
+def build_count_query(filters: DocumentFilters) -> Select:
+    """Build ``SELECT COUNT(*)`` over the lifecycle view (ignores limit/offset).
+
+    fetch_documents is only joined when a filter needs it.
+    """
+    query = select(func.count()).select_from(MapDocument)
+    if _needs_fetch_join(filters):
+        query = query.outerjoin(
+            FetchDocument, MapDocument.document_id == FetchDocument.document_id
+        )
+    query = _apply_joined_filters(query, filters)
+    return _apply_keyset(query, filters)
+
+
 def apply_glob_filters(
     docs: Sequence["DocumentView"],
     include: Optional[str] = None,
@@ -3,6 +3,8 @@ Document lifecycle models.
 
 Includes:
 - DocumentIdRegistry: Central document ID registry (SQLModel table)
+- DocumentSignature: MinHash signatures and near-duplicate clusters (SQLModel table)
+- DocumentSignatureBand: LSH band hashes of the signatures (SQLModel table)
 - DocumentView: Virtual view aggregated from workflow tables (dataclass, not persisted)
 """
 
@@ -12,7 +14,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import Index
+from sqlalchemy import BigInteger, Column, Index
 from sqlmodel import Field, SQLModel
 
 from kurt.db.models import TenantMixin, TimestampMixin
@@ -46,6 +48,37 @@ class DocumentIdRegistry(TimestampMixin, TenantMixin, SQLModel, table=True):
     source_type: str = Field(default="url", max_length=20)
 
 
+class DocumentSignature(TimestampMixin, TenantMixin, SQLModel, table=True):
+    """MinHash signature and near-duplicate cluster of a fetched document.
+
+    cluster_id is the document_id of the cluster's canonical document
+    (a document that has no near-duplicate is its own cluster).
+    """
+
+    __tablename__ = "document_signatures"
+
+    document_id: str = Field(primary_key=True)
+    signature: bytes  # uint32 MinHash values, packed
+    cluster_id: str = Field(index=True)
+    similarity: float = Field(default=1.0)  # Estimated Jaccard vs canonical
+    content_length: int = Field(default=0)
+
+
+class DocumentSignatureBand(TenantMixin, SQLModel, table=True):
+    """One LSH band hash of a document's MinHash signature.
+
+    Documents sharing a band_hash are near-duplicate candidates, so new
+    documents are matched with an indexed lookup instead of reading every
+    stored signature.
+    """
+
+    __tablename__ = "document_signature_bands"
+
+    document_id: str = Field(primary_key=True)
+    band: int = Field(primary_key=True)
+    band_hash: int = Field(sa_column=Column(BigInteger, nullable=False, index=True))
+
+
 # =============================================================================
 # Virtual View (Dataclass)
 # =============================================================================
@@ -0,0 +1,559 @@
+"""
+Near-duplicate document detection with MinHash + LSH banding.
+
+Exact URL / content_hash dedup misses syndicated posts, paginated archives,
+locale variants and printer-friendly pages. This module estimates the Jaccard
+similarity of word shingles with MinHash signatures, finds candidate pairs
+with LSH banding, verifies them against a threshold and groups documents into
+clusters with a single canonical document each.
+
+Everything is computed in bulk with NumPy; signatures and cluster membership
+are stored in ``document_signatures`` and their LSH band hashes in the indexed
+``document_signature_bands``, so new documents are matched against everything
+fetched before by loading only the documents that share a band with them.
+
+Usage:
+    detector = NearDuplicateDetector(threshold=0.8)
+    clusters = detector.cluster(
+        ids, signatures=detector.signatures(texts), content_lengths=lengths
+    )
+
+    # Fetch-time stage (signatures + clusters persisted)
+    assignments = detect_near_duplicates({"doc1": text1, "doc2": text2})
+    assignments["doc2"].duplicate_of  # -> "doc1" (or None if canonical)
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import zlib
+from dataclasses import dataclass
+from typing import Any, Iterable, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Defaults: 128 permutations in 16 bands of 8 rows. Pairs above ~0.7 Jaccard
+# become LSH candidates with high probability; candidates are then verified
+# against the threshold.
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 16
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_SHINGLE_SIZE = 5
+
+# Buckets larger than this are verified against their first member only
+_MAX_PAIRWISE_BUCKET = 64
+
+# Shingles hashed per block when computing signatures (bounds temp memory)
+_SHINGLE_BLOCK = 4096
+
+# Values per IN (...) list when looking up stored signatures
+_IN_CHUNK = 1000
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_MERSENNE_SHIFT = np.uint64(32) if np is not None else 32
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for near-duplicate detection. Install with: pip install numpy"
+        )
+
+
+@dataclass
+class ClusterAssignment:
+    """
+    Near-duplicate cluster membership of one document.
+
+    Attributes:
+        document_id: Document
+        cluster_id: Canonical document of the cluster
+        similarity: Estimated Jaccard similarity to the canonical document
+    """
+
+    document_id: str
+    cluster_id: str
+    similarity: float = 1.0
+
+    @property
+    def is_canonical(self) -> bool:
+        return self.document_id == self.cluster_id
+
+    @property
+    def duplicate_of(self) -> str | None:
+        """Canonical document_id, or None if this document is canonical."""
+        return None if self.is_canonical else self.cluster_id
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+class NearDuplicateDetector:
+    """
+    MinHash signatures and LSH clustering.
+
+    Args:
+        threshold: Minimum estimated Jaccard similarity for near-duplicates
+        num_perm: MinHash permutations (signature length)
+        bands: LSH bands (num_perm must be divisible by bands)
+        shingle_size: Words per shingle
+        seed: Seed for the hash permutations (must be stable across runs)
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        bands: int = DEFAULT_BANDS,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        seed: int = 1,
+    ):
+        _require_numpy()
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        # Odd multipliers make (a * x + b) mod 2^64 a permutation of uint64
+        self._a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+        self._band_mix = rng.integers(1, 2**63, size=self.rows, dtype=np.uint64) | np.uint64(1)
+        self._band_salt = rng.integers(0, 2**63, size=bands, dtype=np.uint64)
+
+    # ------------------------------------------------------------------
+    # Signatures
+    # ------------------------------------------------------------------
+
+    def shingles(self, text: str) -> Any:
+        """Unique uint64 hashes of the text's word shingles."""
+        words = _WORD_RE.findall(text.lower())
+        if not words:
+            return np.empty(0, dtype=np.uint64)
+
+        word_hashes = np.fromiter(
+            (zlib.crc32(w.encode("utf-8")) for w in words), dtype=np.uint64, count=len(words)
+        )
+        k = min(self.shingle_size, len(words))
+        n = len(words) - k + 1
+        # Polynomial combination of k consecutive word hashes (wraps mod 2^64)
+        with np.errstate(over="ignore"):
+            shingles = np.zeros(n, dtype=np.uint64)
+            for j in range(k):
+                shingles = shingles * np.uint64(1_000_003) + word_hashes[j : j + n]
+        return np.unique(shingles)
+
+    def signature(self, text: str) -> Any | None:
+        """MinHash signature (uint32, length num_perm), or None for empty text."""
+        shingles = self.shingles(text)
+        if shingles.size == 0:
+            return None
+
+        sig = np.full(self.num_perm, np.iinfo(np.uint32).max, dtype=np.uint32)
+        with np.errstate(over="ignore"):
+            for start in range(0, shingles.size, _SHINGLE_BLOCK):
+                block = shingles[start : start + _SHINGLE_BLOCK]
+                hashed = (self._a[:, None] * block[None, :] + self._b[:, None]) >> _MERSENNE_SHIFT
+                np.minimum(sig, hashed.min(axis=1).astype(np.uint32), out=sig)
+        return sig
+
+    def signatures(self, texts: Sequence[str]) -> list[Any | None]:
+        """Signatures for many texts (None for texts without words)."""
+        return [self.signature(t) for t in texts]
+
+    # ------------------------------------------------------------------
+    # LSH + clustering
+    # ------------------------------------------------------------------
+
+    def _band_keys(self, matrix: Any) -> Any:
+        """(n, bands) uint64 key per band."""
+        banded = matrix.astype(np.uint64).reshape(matrix.shape[0], self.bands, self.rows)
+        with np.errstate(over="ignore"):
+            return (banded * self._band_mix).sum(axis=2, dtype=np.uint64)
+
+    def band_hashes(self, matrix: Any) -> Any:
+        """(n, bands) int64 band keys, salted per band so one index covers every band."""
+        return (self._band_keys(matrix) ^ self._band_salt).view(np.int64)
+
+    def candidate_pairs(self, matrix: Any) -> set[tuple[int, int]]:
+        """Row pairs sharing at least one LSH band bucket."""
+        pairs: set[tuple[int, int]] = set()
+        if matrix.shape[0] < 2:
+            return pairs
+
+        keys = self._band_keys(matrix)
+        for band in range(self.bands):
+            column = keys[:, band]
+            order = np.argsort(column, kind="stable")
+            sorted_keys = column[order]
+            # Boundaries of runs of equal keys
+            breaks = np.flatnonzero(np.diff(sorted_keys)) + 1
+            for group in np.split(order, breaks):
+                if group.size < 2:
+                    continue
+                members = sorted(int(i) for i in group)
+                if len(members) <= _MAX_PAIRWISE_BUCKET:
+                    pairs.update(
+                        (members[x], members[y])
+                        for x in range(len(members))
+                        for y in range(x + 1, len(members))
+                    )
+                else:
+                    pairs.update((members[0], m) for m in members[1:])
+        return pairs
+
+    @staticmethod
+    def similarity(a: Any, b: Any) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.mean(a == b))
+
+    def cluster(
+        self,
+        ids: Sequence[str],
+        signatures: Sequence[Any],
+        content_lengths: Sequence[int] | None = None,
+        preferred: Iterable[str] = (),
+        groups: Iterable[Iterable[str]] = (),
+    ) -> dict[str, ClusterAssignment]:
+        """
+        Group documents into near-duplicate clusters.
+
+        The canonical document of a cluster is chosen by, in order: membership
+        in ``preferred`` (e.g. documents that are already canonical), longest
+        content, smallest document_id.
+
+        Args:
+            ids: Document ids
+            signatures: MinHash signatures (same order as ids)
+            content_lengths: Optional content lengths (same order as ids)
+            preferred: Ids to favour as canonical
+            groups: Ids already known to share a cluster (e.g. stored clusters)
+
+        Returns:
+            Dict mapping document_id -> ClusterAssignment
+        """
+        n = len(ids)
+        if n == 0:
+            return {}
+        matrix = np.vstack(signatures).astype(np.uint32)
+        lengths = list(content_lengths) if content_lengths is not None else [0] * n
+        preferred_set = set(preferred)
+
+        uf = _UnionFind(n)
+        index = {doc_id: i for i, doc_id in enumerate(ids)}
+        for group in groups:
+            members = [index[doc_id] for doc_id in group if doc_id in index]
+            for m in members[1:]:
+                uf.union(members[0], m)
+        for a, b in self.candidate_pairs(matrix):
+            if self.similarity(matrix[a], matrix[b]) >= self.threshold:
+                uf.union(a, b)
+
+        components: dict[int, list[int]] = {}
+        for i in range(n):
+            components.setdefault(uf.find(i), []).append(i)
+
+        assignments: dict[str, ClusterAssignment] = {}
+        for members in components.values():
+            canonical = min(
+                members,
+                key=lambda i: (ids[i] not in preferred_set, -lengths[i], ids[i]),
+            )
+            for i in members:
+                assignments[ids[i]] = ClusterAssignment(
+                    document_id=ids[i],
+                    cluster_id=ids[canonical],
+                    similarity=1.0 if i == canonical else self.similarity(matrix[i], matrix[canonical]),
+                )
+        return assignments
+
+
+# ============================================================================
+# Persistence
+# ============================================================================
+
+
+def load_clusters(document_ids: Iterable[str]) -> dict[str, str]:
+    """
+    Look up stored cluster ids.
+
+    Returns:
+        Dict mapping document_id -> cluster_id (documents without a stored
+        signature are omitted)
+    """
+    from sqlmodel import select
+
+    from kurt.db import managed_session
+    from kurt.documents.models import DocumentSignature
+
+    ids = list(dict.fromkeys(document_ids))
+    if not ids:
+        return {}
+    with managed_session() as session:
+        rows = session.exec(
+            select(DocumentSignature.document_id, DocumentSignature.cluster_id).where(
+                DocumentSignature.document_id.in_(ids)  # type: ignore[attr-defined]
+            )
+        ).all()
+    return {doc_id: cluster_id for doc_id, cluster_id in rows}
+
+
+def _chunks(values: Sequence[Any]) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(values), _IN_CHUNK):
+        yield values[start : start + _IN_CHUNK]
+
+
+def _band_rows(
+    detector: NearDuplicateDetector, ids: Sequence[str], signatures: Sequence[Any]
+) -> list[Any]:
+    """DocumentSignatureBand rows for the given signatures."""
+    from kurt.documents.models import DocumentSignatureBand
+
+    hashes = detector.band_hashes(np.vstack(signatures).astype(np.uint32))
+    return [
+        DocumentSignatureBand(document_id=doc_id, band=band, band_hash=int(value))
+        for doc_id, row in zip(ids, hashes)
+        for band, value in enumerate(row)
+    ]
+
+
+def _backfill_bands(session: Any, detector: NearDuplicateDetector) -> None:
+    """Index signatures stored before document_signature_bands existed."""
+    from sqlmodel import select
+
+    from kurt.documents.models import DocumentSignature, DocumentSignatureBand
+
+    if session.exec(select(DocumentSignatureBand.document_id).limit(1)).first() is not None:
+        return
+    last = ""
+    while True:
+        rows = session.exec(
+            select(DocumentSignature)
+            .where(DocumentSignature.document_id > last)
+            .order_by(DocumentSignature.document_id)
+            .limit(_IN_CHUNK)
+        ).all()
+        if not rows:
+            return
+        last = rows[-1].document_id
+        rows = [r for r in rows if len(r.signature or b"") == detector.num_perm * 4]
+        if rows:
+            session.add_all(
+                _band_rows(
+                    detector,
+                    [r.document_id for r in rows],
+                    [np.frombuffer(r.signature, dtype=np.uint32) for r in rows],
+                )
+            )
+            session.flush()
+
+
+def _load_candidates(
+    session: Any, detector: NearDuplicateDetector, hashes: Any, exclude: Iterable[str]
+) -> dict[str, Any]:
+    """
+    Stored signatures sharing a band with ``hashes``, plus the rest of their clusters.
+
+    Returns:
+        Dict mapping document_id -> DocumentSignature
+    """
+    from sqlmodel import select
+
+    from kurt.documents.models import DocumentSignature, DocumentSignatureBand
+
+    exclude = set(exclude)
+    candidate_ids: set[str] = set()
+    for chunk in _chunks(sorted({int(h) for h in hashes.ravel()})):
+        candidate_ids.update(
+            session.exec(
+                select(DocumentSignatureBand.document_id).where(
+                    DocumentSignatureBand.band_hash.in_(chunk)  # type: ignore[union-attr]
+                )
+            ).all()
+        )
+    candidate_ids -= exclude
+
+    stored: dict[str, Any] = {}
+    for chunk in _chunks(sorted(candidate_ids)):
+        for row in session.exec(
+            select(DocumentSignature).where(
+                DocumentSignature.document_id.in_(chunk)  # type: ignore[attr-defined]
+            )
+        ).all():
+            stored[row.document_id] = row
+    # Other members of those clusters, so merged clusters are reassigned whole
+    cluster_ids = sorted({row.cluster_id for row in stored.values()})
+    for chunk in _chunks(cluster_ids):
+        for row in session.exec(
+            select(DocumentSignature).where(
+                DocumentSignature.cluster_id.in_(chunk)  # type: ignore[attr-defined]
+            )
+        ).all():
+            stored.setdefault(row.document_id, row)
+
+    return {
+        doc_id: row
+        for doc_id, row in stored.items()
+        if doc_id not in exclude and len(row.signature or b"") == detector.num_perm * 4
+    }
+
+
+def detect_near_duplicates(
+    documents: dict[str, str],
+    threshold: float = DEFAULT_THRESHOLD,
+    persist: bool = True,
+    detector: NearDuplicateDetector | None = None,
+) -> dict[str, ClusterAssignment]:
+    """
+    Sign documents and cluster them with previously signed documents.
+
+    Only stored documents sharing an LSH band with a new document (and the
+    other members of their clusters) are loaded, via the band_hash index.
+
+    Args:
+        documents: Dict mapping document_id -> content
+        threshold: Minimum estimated Jaccard similarity
+        persist: Store signatures, band hashes and (re)assigned clusters
+        detector: Detector to use (default: standard parameters)
+
+    Returns:
+        Assignments for the given documents (empty documents are omitted)
+    """
+    from sqlmodel import delete
+
+    from kurt.db import managed_session
+    from kurt.documents.models import DocumentSignature, DocumentSignatureBand
+
+    detector = detector or NearDuplicateDetector(threshold=threshold)
+    new_ids: list[str] = []
+    new_sigs: list[Any] = []
+    new_lengths: list[int] = []
+    for doc_id, text in documents.items():
+        sig = detector.signature(text or "")
+        if sig is not None:
+            new_ids.append(doc_id)
+            new_sigs.append(sig)
+            new_lengths.append(len(text))
+    if not new_ids:
+        return {}
+
+    new_bands = _band_rows(detector, new_ids, new_sigs)
+    with managed_session() as session:
+        _backfill_bands(session, detector)
+        stored = _load_candidates(
+            session, detector, np.array([b.band_hash for b in new_bands]), documents
+        )
+
+        ids = new_ids + list(stored)
+        signatures = new_sigs + [
+            np.frombuffer(row.signature, dtype=np.uint32) for row in stored.values()
+        ]
+        lengths = new_lengths + [row.content_length for row in stored.values()]
+        preferred = [row.document_id for row in stored.values() if row.cluster_id == row.document_id]
+        groups: dict[str, list[str]] = {}
+        for row in stored.values():
+            groups.setdefault(row.cluster_id, []).append(row.document_id)
+        assignments = detector.cluster(
+            ids, signatures, lengths, preferred=preferred, groups=groups.values()
+        )
+
+        if persist:
+            for doc_id, sig, length in zip(new_ids, new_sigs, new_lengths):
+                a = assignments[doc_id]
+                session.merge(
+                    DocumentSignature(
+                        document_id=doc_id,
+                        signature=sig.tobytes(),
+                        cluster_id=a.cluster_id,
+                        similarity=a.similarity,
+                        content_length=length,
+                    )
+                )
+            for chunk in _chunks(new_ids):
+                session.exec(
+                    delete(DocumentSignatureBand).where(
+                        DocumentSignatureBand.document_id.in_(chunk)  # type: ignore[attr-defined]
+                    )
+                )
+            session.add_all(new_bands)
+            # Stored documents whose cluster changed (e.g. merged by a new document)
+            for doc_id, row in stored.items():
+                a = assignments[doc_id]
+                if row.cluster_id != a.cluster_id:
+                    row.cluster_id = a.cluster_id
+                    row.similarity = a.similarity
+                    session.add(row)
+
+    return {doc_id: assignments[doc_id] for doc_id in new_ids}
+
+
+def select_canonical_rows(
+    rows: Sequence[dict[str, Any]],
+    clusters: dict[str, str],
+    id_field: str = "document_id",
+) -> tuple[list[int], dict[int, str]]:
+    """
+    Keep one row per near-duplicate cluster.
+
+    The cluster's canonical document is kept if present, otherwise the
+    first row of the cluster.
+
+    Args:
+        rows: Input rows
+        clusters: document_id -> cluster_id (see ``load_clusters``)
+        id_field: Row field holding the document id
+
+    Returns:
+        Tuple of (kept row indices, {skipped row index: kept document_id})
+    """
+    keeper: dict[str, int] = {}
+    for i, row in enumerate(rows):
+        doc_id = row.get(id_field)
+        cluster_id = clusters.get(doc_id) if doc_id else None
+        if cluster_id is None:
+            continue
+        if cluster_id not in keeper or doc_id == cluster_id:
+            keeper[cluster_id] = i
+
+    kept: list[int] = []
+    skipped: dict[int, str] = {}
+    for i, row in enumerate(rows):
+        doc_id = row.get(id_field)
+        cluster_id = clusters.get(doc_id) if doc_id else None
+        if cluster_id is None or keeper[cluster_id] == i:
+            kept.append(i)
+        else:
+            skipped[i] = rows[keeper[cluster_id]][id_field]
+    return kept, skipped
+
+
+__all__ = [
+    "DEFAULT_THRESHOLD",
+    "ClusterAssignment",
+    "NearDuplicateDetector",
+    "detect_near_duplicates",
+    "load_clusters",
+    "select_canonical_rows",
+]
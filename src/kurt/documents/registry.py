@@ -6,7 +6,8 @@ Joins workflow tables to provide DocumentView without persisting a separate tabl
 
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import replace
+from typing import Iterator, Optional
 
 from sqlmodel import Session, delete, select
 
@@ -14,13 +15,18 @@ from kurt.db import managed_session
 from kurt.documents.filtering import (
     DocumentFilters,
     apply_glob_filters,
+    build_count_query,
     build_joined_query,
     build_map_query,
+    python_glob_patterns,
 )
-from kurt.documents.models import DocumentView
-from kurt.tools.fetch.models import FetchDocument
+from kurt.documents.models import DocumentSignature, DocumentSignatureBand, DocumentView
+from kurt.tools.fetch.models import FetchDocument, FetchDocumentChunk
 from kurt.tools.map.models import MapDocument
 
+# Joined rows fetched per round-trip by DocumentRegistry.iter_list()
+LIST_CHUNK_SIZE = 1000
+
 
 class DocumentRegistry:
     """Query documents across their full lifecycle.
@@ -43,30 +49,59 @@ class DocumentRegistry:
         Returns:
             List of DocumentView with data from all workflow stages
         """
-        with managed_session(session) as sess:
-            filters = filters or DocumentFilters()
+        return list(self.iter_list(session, filters))
 
-            # If glob filters are set, don't apply SQL limit - we need to filter first
-            # then apply limit to the filtered results
-            saved_limit = None
-            if (filters.include or filters.exclude) and filters.limit:
-                saved_limit = filters.limit
-                filters.limit = None
+    def iter_list(
+        self,
+        session: Optional[Session] = None,
+        filters: Optional[DocumentFilters] = None,
+        chunk_size: int = LIST_CHUNK_SIZE,
+    ) -> Iterator[DocumentView]:
+        """Iterate documents matching filters without loading them all.
 
-            query = build_joined_query(filters)
-            results = sess.exec(query).all()
+        Joined rows are fetched ``chunk_size`` at a time through a
+        server-side cursor (``yield_per``), so memory stays constant for
+        large result sets. The session stays open until the iterator is
+        exhausted or closed.
 
-            views = [self._to_view(map_doc, fetch_doc) for map_doc, fetch_doc in results]
+        Args:
+            session: Database session (creates one if not provided)
+            filters: Optional filters to apply
+            chunk_size: Rows fetched per round-trip
 
-            # Apply glob filters post-query (fnmatch doesn't translate to SQL)
-            if filters.include or filters.exclude:
-                views = apply_glob_filters(views, filters.include, filters.exclude)
+        Yields:
+            DocumentView with data from all workflow stages
+        """
+        filters = filters or DocumentFilters()
+        include, exclude = python_glob_patterns(filters)
+        has_glob = bool(include or exclude)
 
-            # Apply limit after glob filtering
-            if saved_limit:
-                views = views[:saved_limit]
+        # Globs SQL can't express are matched here, so SQL offset/limit would
+        # count rows the glob drops: apply them to the filtered rows instead
+        offset = filters.offset if has_glob else None
+        limit = filters.limit if has_glob else None
+        if offset or limit:
+            filters = replace(filters, offset=None, limit=None)
 
-            return views
+        with managed_session(session) as sess:
+            query = build_joined_query(filters).execution_options(yield_per=chunk_size)
+            skipped = 0
+            emitted = 0
+            for map_doc, fetch_doc in sess.exec(query):
+                view = self._to_view(map_doc, fetch_doc)
+
+                if has_glob:
+                    if not apply_glob_filters([view], include, exclude):
+                        continue
+                    if offset and skipped < offset:
+                        skipped += 1
+                        continue
+
+                yield view
+                emitted += 1
+                # Apply limit after glob filtering
+                if limit and emitted >= limit:
+                    return
 
     def get(
         self, session: Optional[Session] = None, document_id: str = None
@@ -131,11 +166,19 @@ class DocumentRegistry:
     ) -> int:
         """Count documents matching filters.
 
-        Note: For performance, consider using count() on specific workflow tables
-        if you don't need cross-stage filtering.
+        Runs ``SELECT COUNT(*)`` (fetch_documents is only joined when a filter
+        needs it); limit/offset cap the count like they cap list(). Globs that
+        can't be translated to SQL fall back to counting iter_list().
         """
-        # For now, simple implementation - could optimize with COUNT query
-        return len(self.list(session, filters))
+        filters = filters or DocumentFilters()
+        if any(python_glob_patterns(filters)):
+            return sum(1 for _ in self.iter_list(session, filters))
+
+        with managed_session(session) as sess:
+            total = sess.exec(build_count_query(filters)).one()
+
+        total = max(total - (filters.offset or 0), 0)
+        return min(total, filters.limit) if filters.limit else total
 
     def exists(self, session: Optional[Session] = None, document_id: str = None) -> bool:
         """Check if a document exists in any workflow stage."""
@@ -160,7 +203,18 @@ class DocumentRegistry:
             if not self.exists(sess, document_id):
                 return False
 
-            # Delete from fetch_documents first (may not exist)
+            # Delete signature, chunk vectors and fetch_documents first (may not exist)
+            sess.exec(
+                delete(DocumentSignature).where(DocumentSignature.document_id == document_id)
+            )
+            sess.exec(
+                delete(DocumentSignatureBand).where(
+                    DocumentSignatureBand.document_id == document_id
+                )
+            )
+            sess.exec(
+                delete(FetchDocumentChunk).where(FetchDocumentChunk.document_id == document_id)
+            )
             sess.exec(delete(FetchDocument).where(FetchDocument.document_id == document_id))
 
             # Delete from map_documents (must exist if exists() returned True)
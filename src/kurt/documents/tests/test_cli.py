@@ -159,6 +159,18 @@ class TestE2EWithDocs:
         data = assert_json_output(result)
         assert len(data) == 8  # 8 documents in tmp_project_with_docs
 
+    def test_list_jsonl_streams_one_document_per_line(
+        self, cli_runner: CliRunner, tmp_project_with_docs
+    ):
+        """Test list --format jsonl writes one JSON object per line."""
+        import json
+
+        result = invoke_cli(cli_runner, content_group, ["list", "--format", "jsonl"])
+        assert_cli_success(result)
+        lines = result.output.strip().splitlines()
+        assert len(lines) == 8
+        assert all("document_id" in json.loads(line) for line in lines)
+
     def test_list_filter_by_status(self, cli_runner: CliRunner, tmp_project_with_docs):
         """Test list filters by fetch status."""
 
@@ -0,0 +1,204 @@
+"""Tests for MinHash/LSH near-duplicate detection."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from kurt.documents.models import DocumentSignature, DocumentSignatureBand
+from kurt.documents.near_duplicates import (
+    ClusterAssignment,
+    NearDuplicateDetector,
+    _load_candidates,
+    detect_near_duplicates,
+    select_canonical_rows,
+)
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def signature_db():
+    """In-memory SQLite standing in for the project database."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(
+        engine, tables=[DocumentSignature.__table__, DocumentSignatureBand.__table__]
+    )
+
+    @contextmanager
+    def session_scope():
+        with Session(engine) as session:
+            yield session
+            session.commit()
+
+    with patch("kurt.db.managed_session", session_scope):
+        yield session_scope
+
+
+def _article(prefix: str, n: int = 300) -> str:
+    return " ".join(f"{prefix}{i}" for i in range(n))
+
+
+class TestSignatures:
+    def test_identical_texts_have_identical_signatures(self):
+        detector = NearDuplicateDetector()
+        a, b = detector.signatures([_article("w"), _article("w")])
+        assert a.dtype == np.uint32
+        assert a.shape == (128,)
+        assert np.array_equal(a, b)
+
+    def test_similarity_tracks_overlap(self):
+        detector = NearDuplicateDetector()
+        base = _article("w")
+        near = base + " printer friendly footer"
+        other = _article("x")
+        sig_base, sig_near, sig_other = detector.signatures([base, near, other])
+        assert detector.similarity(sig_base, sig_near) > 0.9
+        assert detector.similarity(sig_base, sig_other) < 0.1
+
+    def test_case_and_punctuation_insensitive(self):
+        detector = NearDuplicateDetector()
+        a = detector.signature("Hello, World! This is the same post.")
+        b = detector.signature("hello world this is the same post")
+        assert np.array_equal(a, b)
+
+    def test_empty_text_has_no_signature(self):
+        detector = NearDuplicateDetector()
+        assert detector.signature("") is None
+        assert detector.signature("  ... !!") is None
+
+    def test_stable_across_instances(self):
+        text = _article("w")
+        assert np.array_equal(
+            NearDuplicateDetector().signature(text), NearDuplicateDetector().signature(text)
+        )
+
+    def test_bands_must_divide_permutations(self):
+        with pytest.raises(ValueError, match="divisible"):
+            NearDuplicateDetector(num_perm=100, bands=16)
+
+
+class TestCluster:
+    def test_groups_near_duplicates(self):
+        detector = NearDuplicateDetector()
+        texts = [_article("w"), _article("w") + " tail", _article("x")]
+        clusters = detector.cluster(
+            ["a", "b", "c"], detector.signatures(texts), [len(t) for t in texts]
+        )
+        # Longest content is canonical
+        assert clusters["a"].cluster_id == "b"
+        assert clusters["b"].is_canonical
+        assert clusters["c"].cluster_id == "c"
+        assert clusters["a"].duplicate_of == "b"
+        assert clusters["c"].duplicate_of is None
+
+    def test_preferred_document_stays_canonical(self):
+        detector = NearDuplicateDetector()
+        texts = [_article("w"), _article("w") + " tail"]
+        clusters = detector.cluster(
+            ["old", "new"],
+            detector.signatures(texts),
+            [len(t) for t in texts],
+            preferred=["old"],
+        )
+        assert clusters["new"].cluster_id == "old"
+
+    def test_threshold(self):
+        base = _article("w", 100)
+        edited = " ".join(f"w{i}" if i % 10 else f"z{i}" for i in range(100))
+        strict = NearDuplicateDetector(threshold=0.99)
+        sigs = strict.signatures([base, edited])
+        assert strict.cluster(["a", "b"], sigs)["b"].is_canonical
+
+    def test_empty(self):
+        assert NearDuplicateDetector().cluster([], []) == {}
+
+    def test_groups_are_kept_together(self):
+        detector = NearDuplicateDetector()
+        texts = [_article("w"), _article("x")]
+        clusters = detector.cluster(["a", "b"], detector.signatures(texts), groups=[["a", "b"]])
+        assert clusters["b"].cluster_id == "a"
+
+
+class TestDetectNearDuplicates:
+    def test_matches_stored_documents(self, signature_db):
+        detect_near_duplicates({"orig": _article("w"), "other": _article("x")})
+        assignments = detect_near_duplicates({"copy": _article("w") + " tail"})
+
+        # The stored document stays canonical
+        assert assignments["copy"].duplicate_of == "orig"
+        with signature_db() as session:
+            bands = session.exec(select(DocumentSignatureBand)).all()
+        assert len(bands) == 3 * 16
+
+    def test_loads_only_candidates(self, signature_db):
+        detect_near_duplicates({f"doc{i}": _article(f"p{i}_") for i in range(5)})
+
+        loaded = []
+
+        def load(*args):
+            loaded.append(_load_candidates(*args))
+            return loaded[-1]
+
+        with patch("kurt.documents.near_duplicates._load_candidates", side_effect=load):
+            detect_near_duplicates({"copy": _article("p3_") + " tail"})
+
+        assert set(loaded[0]) == {"doc3"}
+
+    def test_backfills_band_index(self, signature_db):
+        detector = NearDuplicateDetector()
+        with signature_db() as session:
+            session.add(
+                DocumentSignature(
+                    document_id="legacy",
+                    signature=detector.signature(_article("w")).tobytes(),
+                    cluster_id="legacy",
+                    content_length=10_000,
+                )
+            )
+
+        assignments = detect_near_duplicates({"copy": _article("w")})
+
+        assert assignments["copy"].duplicate_of == "legacy"
+
+    def test_merged_clusters_are_reassigned(self, signature_db):
+        base = _article("w", 200)
+        detect_near_duplicates({"a": base})
+        detect_near_duplicates({"b": base + " " + _article("y", 10)})
+
+        # Bridges nothing new, but a cluster member must not be split off
+        detect_near_duplicates({"c": base + " " + _article("z", 5)})
+        with signature_db() as session:
+            clusters = {r.document_id: r.cluster_id for r in session.exec(select(DocumentSignature))}
+        assert clusters == {"a": "a", "b": "a", "c": "a"}
+
+
+class TestSelectCanonicalRows:
+    def test_keeps_canonical_row(self):
+        rows = [{"document_id": "copy"}, {"document_id": "orig"}, {"document_id": "solo"}]
+        kept, skipped = select_canonical_rows(
+            rows, {"copy": "orig", "orig": "orig", "solo": "solo"}
+        )
+        assert kept == [1, 2]
+        assert skipped == {0: "orig"}
+
+    def test_keeps_first_row_without_canonical(self):
+        rows = [{"document_id": "b"}, {"document_id": "c"}]
+        kept, skipped = select_canonical_rows(rows, {"b": "a", "c": "a"})
+        assert kept == [0]
+        assert skipped == {1: "b"}
+
+    def test_rows_without_cluster_are_kept(self):
+        rows = [{"document_id": "x"}, {"content": "no id"}]
+        assert select_canonical_rows(rows, {}) == ([0, 1], {})
+
+
+def test_assignment_canonical():
+    assert ClusterAssignment("a", "a").duplicate_of is None
+    assert ClusterAssignment("b", "a", 0.9).duplicate_of == "a"
@@ -4,8 +4,11 @@ Tests for DocumentRegistry.
 
 from __future__ import annotations
 
+import pytest
+
 from kurt.db import managed_session
 from kurt.documents import DocumentFilters, DocumentRegistry, DocumentView
+from kurt.documents.filtering import build_joined_query, glob_to_like, python_glob_patterns
 from kurt.tools.fetch.models import FetchStatus
 from kurt.tools.map.models import MapStatus
 
@@ -310,6 +313,135 @@ class TestGlobFiltering:
         for doc in docs:
             assert "/blog/" not in doc.source_url
 
+    def test_character_class_falls_back_to_python(self, tmp_project_with_docs):
+        """Test globs LIKE can't express are matched with fnmatch, limit/offset after."""
+        registry = DocumentRegistry()
+        filters = DocumentFilters(include="*/docs/[ag]*")
+
+        with managed_session() as session:
+            docs = registry.list(session, filters)
+            count = registry.count(session, filters)
+            paged = registry.list(session, DocumentFilters(include="*/docs/[ag]*", offset=1))
+
+        assert sorted(d.source_url for d in docs) == [
+            "https://example.com/docs/api",
+            "https://example.com/docs/guide",
+        ]
+        assert count == 2
+        assert len(paged) == 1
+
+
+class TestGlobTranslation:
+    """Test suite for glob -> LIKE translation (no database)."""
+
+    def test_wildcards(self):
+        assert glob_to_like("https://example.com/docs/*") == "https://example.com/docs/%"
+        assert glob_to_like("*/post-?") == "%/post-_"
+
+    def test_like_metacharacters_are_escaped(self):
+        assert glob_to_like("*/a_b%c") == "%/a\\_b\\%c"
+
+    def test_character_class_not_translated(self):
+        assert glob_to_like("*/[ab]*") is None
+        assert python_glob_patterns(DocumentFilters(include="*/[ab]*", exclude="*/x/*")) == (
+            "*/[ab]*",
+            None,
+        )
+
+    def test_url_contains_escapes_like_metacharacters(self):
+        for url_contains in ("*/my_docs/*", "my_docs"):
+            query = build_joined_query(DocumentFilters(url_contains=url_contains))
+            sql = str(query.compile(compile_kwargs={"literal_binds": True}))
+            assert "ESCAPE" in sql
+            assert "my_docs" not in sql
+
+
+class TestCount:
+    """Test suite for SQL COUNT(*)."""
+
+    def test_count_matches_list(self, tmp_project_with_docs):
+        """Test count agrees with list for SQL-side filters."""
+        registry = DocumentRegistry()
+
+        with managed_session() as session:
+            for filters in (
+                DocumentFilters(fetch_status=FetchStatus.SUCCESS),
+                DocumentFilters(include="*/docs/*", exclude="*/docs/api"),
+                DocumentFilters(not_fetched=True),
+            ):
+                assert registry.count(session, filters) == len(registry.list(session, filters))
+
+    def test_count_respects_limit_and_offset(self, tmp_project_with_docs):
+        registry = DocumentRegistry()
+
+        with managed_session() as session:
+            assert registry.count(session, DocumentFilters(limit=3)) == 3
+            assert registry.count(session, DocumentFilters(offset=6, limit=5)) == 2
+
+
+class TestKeysetPagination:
+    """Test suite for keyset (after) pagination."""
+
+    def _pages(self, registry, session, **kwargs):
+        seen, after = [], None
+        while True:
+            page = registry.list(session, DocumentFilters(after=after, limit=3, **kwargs))
+            if not page:
+                return seen
+            seen.extend(d.document_id for d in page)
+            after = page[-1].document_id
+
+    def test_pages_by_document_id(self, tmp_project_with_docs):
+        registry = DocumentRegistry()
+
+        with managed_session() as session:
+            ids = self._pages(registry, session)
+
+        assert ids == sorted(ids)
+        assert len(ids) == 8
+
+    def test_pages_by_sort_column(self, tmp_project_with_docs):
+        registry = DocumentRegistry()
+
+        with managed_session() as session:
+            ids = self._pages(registry, session, order_by="source_url", order_desc=True)
+            full = registry.list(session, DocumentFilters(order_by="source_url", order_desc=True))
+
+        assert ids == [d.document_id for d in full]
+
+    def test_unsupported_sort_column(self, tmp_project_with_docs):
+        registry = DocumentRegistry()
+
+        with managed_session() as session, pytest.raises(ValueError, match="Keyset"):
+            registry.list(session, DocumentFilters(order_by="content_length", after="doc-1"))
+
+
+class TestIterList:
+    """Test suite for streaming iteration."""
+
+    def test_iter_list_matches_list(self, tmp_project_with_docs):
+        """Test iter_list yields the same documents as list, across chunks."""
+        registry = DocumentRegistry()
+
+        with managed_session() as session:
+            streamed = [d.document_id for d in registry.iter_list(session, chunk_size=3)]
+            listed = [d.document_id for d in registry.list(session)]
+
+        assert streamed == listed
+        assert len(streamed) == 8
+
+    def test_iter_list_glob_with_limit(self, tmp_project_with_docs):
+        """Test glob filtering and limit apply while streaming, without mutating filters."""
+        registry = DocumentRegistry()
+        filters = DocumentFilters(include="*/docs/*", limit=2)
+
+        with managed_session() as session:
+            docs = list(registry.iter_list(session, filters, chunk_size=1))
+
+        assert len(docs) == 2
+        assert all("/docs/" in d.source_url for d in docs)
+        assert filters.limit == 2
+
 
 class TestConvenienceMethods:
     """Test suite for convenience methods."""
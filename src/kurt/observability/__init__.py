@@ -1,11 +1,13 @@
 """Kurt observability module - tracking and monitoring for workflows.
 
 This module provides:
-- Event tracking for workflow steps (track_event)
+- Event tracking for workflow steps (track_event, async atrack_event)
 - EventTracker class for batched event insertion
 - WorkflowLifecycle class for workflow run lifecycle management
 - Real-time event streaming (stream_events, format_event)
+- Change notifications for followers of a run (notify_run, RunWatcher)
 - Live status queries (get_live_status)
+- Run profiling and Chrome trace export (get_run_profile, to_chrome_trace)
 
 Usage:
     from kurt.observability import track_event, EventTracker
@@ -44,18 +46,26 @@ Usage:
 """
 
 from .lifecycle import WorkflowLifecycle
+from .notify import RunWatcher, notify_run
+from .profile import RunProfile, get_run_profile, to_chrome_trace
 from .status import get_live_status, get_step_events_for_workflow, get_step_logs_for_workflow
 from .streaming import TERMINAL_STATUSES, format_event, stream_events
-from .tracking import EventTracker, track_event
+from .tracking import EventTracker, atrack_event, track_event
 
 __all__ = [
     "track_event",
+    "atrack_event",
     "EventTracker",
     "WorkflowLifecycle",
     "stream_events",
     "format_event",
+    "notify_run",
+    "RunWatcher",
     "TERMINAL_STATUSES",
     "get_live_status",
     "get_step_logs_for_workflow",
     "get_step_events_for_workflow",
+    "RunProfile",
+    "get_run_profile",
+    "to_chrome_trace",
 ]
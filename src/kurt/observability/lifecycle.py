@@ -46,6 +46,7 @@ from datetime import datetime, timezone
 from typing import Any, Literal
 
 from kurt.db.dolt import DoltDB, DoltQueryError
+from kurt.observability.notify import notify_run
 from kurt.observability.tracking import EventTracker, track_event
 
 logger = logging.getLogger(__name__)
@@ -320,6 +321,7 @@ class WorkflowLifecycle:
         try:
             self._db.execute(sql, params)
             logger.info(f"Updated workflow run {run_id}: status={status}")
+            notify_run(run_id)
 
             # Emit event if enabled
             if self._emit_events:
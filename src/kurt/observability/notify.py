@@ -0,0 +1,214 @@
+"""Change notifications for workflow runs.
+
+Followers of a run (StatusStreamer, the web UI's SSE streams) used to poll
+step_events on a timer, so every viewer added a query every 500ms and a new
+event took up to one interval to show up. Writers now announce that a
+run changed, and followers only query the database when told to:
+
+    notify_run(run_id)          called after step_events / workflow_runs writes
+
+    watcher = RunWatcher(run_id)
+    while ...:
+        watcher.wait(timeout=0.5)   # returns early on notify_run()
+        ...fetch new rows by cursor...
+
+A notification carries no data; the database stays the source of truth and
+followers still read by cursor, so nothing is lost if a signal is missed.
+
+Two channels carry the signal:
+
+- In-process: an EventBus with a per-run generation counter and a
+  threading.Condition, for followers in the same process as the writer.
+- Cross-process: one small file per run under ``.kurt/events/``. Writers
+  append a byte; watchers stat the file every CHANNEL_POLL_INTERVAL, which
+  is a local syscall and never touches the database.
+
+Writers that can't reach either channel (another machine sharing a Dolt
+server, or no ``.kurt`` directory) are still picked up by the followers'
+fallback poll, which is the ``timeout`` passed to RunWatcher.wait().
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Notification files, relative to the project root
+EVENTS_DIR = Path(".kurt") / "events"
+
+# Seconds between stats of a run's notification file while waiting
+CHANNEL_POLL_INTERVAL = 0.05
+
+# Notification files are truncated once they grow past this many bytes
+MAX_CHANNEL_FILE_SIZE = 4096
+
+# Notification files untouched for this many seconds are removed
+PRUNE_AFTER = 24 * 3600
+
+
+class EventBus:
+    """In-process change signal, one generation counter per run.
+
+    Thread Safety:
+        EventBus is thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._generations: dict[str, int] = {}
+
+    def publish(self, run_id: str) -> None:
+        """Signal that ``run_id`` changed and wake its waiters."""
+        with self._cond:
+            self._generations[run_id] = self._generations.get(run_id, 0) + 1
+            self._cond.notify_all()
+
+    def generation(self, run_id: str) -> int:
+        """Number of changes published for ``run_id`` so far."""
+        with self._cond:
+            return self._generations.get(run_id, 0)
+
+    def wait(self, run_id: str, generation: int, timeout: float) -> int:
+        """Block until ``run_id`` moves past ``generation`` or ``timeout`` expires.
+
+        Returns:
+            The run's current generation.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._generations.get(run_id, 0) == generation:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._generations.get(run_id, 0)
+
+
+_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Get the process-wide EventBus."""
+    return _bus
+
+
+def _channel_dir(project_root: Path | None = None) -> Path | None:
+    """The notification directory, or None outside an initialized project."""
+    root = project_root if project_root is not None else Path.cwd()
+    if not (root / ".kurt").is_dir():
+        return None
+    return root / EVENTS_DIR
+
+
+def _prune(channel_dir: Path) -> None:
+    cutoff = time.time() - PRUNE_AFTER
+    try:
+        with os.scandir(channel_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+    except OSError:
+        pass
+
+
+def notify_run(run_id: str, *, project_root: Path | None = None) -> None:
+    """Announce that a run's events or status changed.
+
+    Best effort: failures are logged at debug level and never raised, so a
+    notification problem can't fail the write it follows.
+    """
+    if not run_id:
+        return
+    _bus.publish(run_id)
+
+    channel_dir = _channel_dir(project_root)
+    if channel_dir is None:
+        return
+    path = channel_dir / run_id
+    try:
+        if not path.exists():
+            channel_dir.mkdir(parents=True, exist_ok=True)
+            _prune(channel_dir)
+        with open(path, "ab") as f:
+            f.write(b".")
+            if f.tell() > MAX_CHANNEL_FILE_SIZE:
+                f.truncate(0)
+    except OSError:
+        logger.debug("Could not write change notification for %s", run_id, exc_info=True)
+
+
+class RunWatcher:
+    """Waits for change notifications on one run.
+
+    Args:
+        run_id: Workflow run ID to watch.
+        project_root: Project whose ``.kurt/events`` to watch (default: cwd).
+        bus: In-process bus (default: the process-wide one).
+
+    Thread Safety:
+        RunWatcher is NOT thread-safe. Create one per follower.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        *,
+        project_root: Path | None = None,
+        bus: EventBus | None = None,
+    ):
+        self.run_id = run_id
+        self._bus = bus or _bus
+        channel_dir = _channel_dir(project_root)
+        self._path = channel_dir / run_id if channel_dir is not None else None
+        self._generation = self._bus.generation(run_id)
+        self._signature = self._file_signature()
+
+    def _file_signature(self) -> tuple[int, int] | None:
+        if self._path is None:
+            return None
+        try:
+            st = self._path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def changed(self) -> bool:
+        """Non-blocking check: has the run changed since the last check?"""
+        changed = False
+        generation = self._bus.generation(self.run_id)
+        if generation != self._generation:
+            self._generation = generation
+            changed = True
+        signature = self._file_signature()
+        if signature != self._signature:
+            self._signature = signature
+            changed = True
+        return changed
+
+    def wait(self, timeout: float) -> bool:
+        """Block until the run changes or ``timeout`` seconds pass.
+
+        Returns:
+            True if a change was signalled, False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while not self.changed():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._bus.wait(self.run_id, self._generation, min(remaining, CHANNEL_POLL_INTERVAL))
+        return True
+
+
+__all__ = [
+    "EVENTS_DIR",
+    "EventBus",
+    "RunWatcher",
+    "get_event_bus",
+    "notify_run",
+]
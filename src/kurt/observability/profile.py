@@ -0,0 +1,427 @@
+"""Workflow run profiling from step_logs and step_events.
+
+Builds a timeline of a finished (or running) workflow run to show where
+time went:
+
+- per-step wall time and time spent queued (ready but waiting for a slot)
+- per-substep wall time (e.g. fetch batches, LLM calls)
+- achieved concurrency (peak and average steps running at once)
+- the realised critical path: the chain of steps that actually gated the
+  end of the run, following each step back to the dependency that
+  finished last before it started
+
+Event timestamps are stored with one-second resolution; step durations use
+the ``duration_ms`` the executors record on completion events when present.
+
+Usage:
+    from kurt.observability.profile import get_run_profile, to_chrome_trace
+
+    profile = get_run_profile(db, "abc-123")
+    print(profile.critical_path)
+    Path("trace.json").write_text(json.dumps(to_chrome_trace(profile)))
+    # Open trace.json in chrome://tracing or https://ui.perfetto.dev
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from kurt.observability.status import (
+    _get_step_logs,
+    _get_workflow_run,
+    _parse_datetime,
+    _parse_json_field,
+)
+
+if TYPE_CHECKING:
+    from kurt.db.dolt import DoltDB
+
+logger = logging.getLogger(__name__)
+
+_TERMINAL_STATUSES = ("completed", "failed", "canceled")
+
+
+@dataclass
+class SubstepProfile:
+    """Wall time of one substep of a step (first to last event)."""
+
+    name: str
+    start_ms: int
+    duration_ms: int
+    events: int
+    total: int | None = None
+
+
+@dataclass
+class StepProfile:
+    """Timeline entry for one step, relative to the run start."""
+
+    step_id: str
+    tool: str | None
+    status: str
+    start_ms: int
+    duration_ms: int
+    queued_ms: int
+    depends_on: list[str] | None = None
+    substeps: list[SubstepProfile] = field(default_factory=list)
+
+    @property
+    def end_ms(self) -> int:
+        return self.start_ms + self.duration_ms
+
+
+@dataclass
+class RunProfile:
+    """Timeline and summary of one workflow run."""
+
+    run_id: str
+    workflow: str
+    status: str
+    started_at: str | None
+    wall_ms: int
+    steps: list[StepProfile]
+    critical_path: list[str]
+    critical_path_ms: int
+    peak_concurrency: int
+    avg_concurrency: float
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        for step, step_data in zip(self.steps, data["steps"]):
+            step_data["end_ms"] = step.end_ms
+            step_data["on_critical_path"] = step.step_id in self.critical_path
+        return data
+
+
+def _get_all_events(db: "DoltDB", run_id: str) -> list[dict[str, Any]]:
+    """Get every event of a run in insertion order."""
+    try:
+        result = db.query(
+            """
+            SELECT step_id, substep, status, current, total, metadata_json, created_at
+            FROM step_events
+            WHERE run_id = ?
+            ORDER BY id ASC
+            """,
+            [run_id],
+        )
+        return result.rows
+    except Exception as e:
+        logger.warning(f"Failed to query step events: {e}")
+        return []
+
+
+def get_run_profile(db: "DoltDB", workflow_id: str) -> RunProfile | None:
+    """Profile a workflow run.
+
+    Args:
+        db: DoltDB instance.
+        workflow_id: Full or partial workflow UUID.
+
+    Returns:
+        RunProfile, or None if the run does not exist.
+    """
+    run = _get_workflow_run(db, workflow_id)
+    if run is None:
+        return None
+    return build_profile(run, _get_step_logs(db, run["id"]), _get_all_events(db, run["id"]))
+
+
+def build_profile(
+    run: dict[str, Any],
+    step_logs: list[dict[str, Any]],
+    events: list[dict[str, Any]],
+) -> RunProfile:
+    """Build a RunProfile from workflow_runs, step_logs and step_events rows."""
+    spans: dict[str, dict[str, Any]] = {}
+
+    def span(step_id: str) -> dict[str, Any]:
+        return spans.setdefault(
+            step_id,
+            {
+                "start": None,
+                "end": None,
+                "last": None,
+                "status": None,
+                "tool": None,
+                "depends_on": None,
+                "queued_ms": None,
+                "duration_ms": None,
+                "substeps": {},
+            },
+        )
+
+    for log in step_logs:
+        entry = span(log["step_id"])
+        entry["start"] = _parse_datetime(log.get("started_at"))
+        entry["end"] = _parse_datetime(log.get("completed_at"))
+        entry["status"] = log.get("status")
+        entry["tool"] = log.get("tool")
+
+    started: set[str] = set()
+    for event in events:
+        step_id = event.get("step_id")
+        at = _parse_datetime(event.get("created_at"))
+        if not step_id or step_id == "workflow" or at is None:
+            continue
+        entry = span(step_id)
+        entry["last"] = at
+        metadata = _parse_json_field(event.get("metadata_json")) or {}
+        status = event.get("status")
+
+        if event.get("substep"):
+            sub = entry["substeps"].setdefault(
+                event["substep"], {"first": at, "last": at, "events": 0, "total": None}
+            )
+            sub["last"] = at
+            sub["events"] += 1
+            if event.get("total") is not None:
+                sub["total"] = event["total"]
+            continue
+
+        if status == "running":
+            if step_id not in started:
+                entry["start"] = at
+                started.add(step_id)
+            entry["tool"] = metadata.get("tool", entry["tool"])
+            if "depends_on" in metadata:
+                entry["depends_on"] = list(metadata["depends_on"])
+            if "queued_ms" in metadata:
+                entry["queued_ms"] = int(metadata["queued_ms"])
+        elif status in _TERMINAL_STATUSES:
+            entry["end"] = at
+            entry["status"] = status
+            if metadata.get("duration_ms") is not None:
+                entry["duration_ms"] = int(metadata["duration_ms"])
+
+    run_start = _parse_datetime(run.get("started_at"))
+    starts = [s["start"] for s in spans.values() if s["start"] is not None]
+    if run_start is None or (starts and min(starts) < run_start):
+        run_start = min(starts) if starts else datetime.utcnow()
+
+    def offset(at: datetime) -> int:
+        return max(0, int((at - run_start).total_seconds() * 1000))
+
+    steps: list[StepProfile] = []
+    for step_id, entry in spans.items():
+        start = entry["start"] or entry["last"]
+        if start is None:
+            continue
+        if entry["duration_ms"] is not None:
+            duration_ms = entry["duration_ms"]
+        else:
+            end = entry["end"] or entry["last"] or start
+            duration_ms = max(0, int((end - start).total_seconds() * 1000))
+
+        substeps = [
+            SubstepProfile(
+                name=name,
+                start_ms=offset(sub["first"]),
+                duration_ms=int((sub["last"] - sub["first"]).total_seconds() * 1000),
+                events=sub["events"],
+                total=sub["total"],
+            )
+            for name, sub in entry["substeps"].items()
+        ]
+        steps.append(
+            StepProfile(
+                step_id=step_id,
+                tool=entry["tool"],
+                status=entry["status"] or "running",
+                start_ms=offset(start),
+                duration_ms=duration_ms,
+                queued_ms=entry["queued_ms"] or 0,
+                depends_on=entry["depends_on"],
+                substeps=substeps,
+            )
+        )
+    steps.sort(key=lambda s: (s.start_ms, s.step_id))
+
+    # Derive queue time from dependencies when the executor did not record it
+    by_id = {s.step_id: s for s in steps}
+    for step in steps:
+        if not step.queued_ms and step.depends_on:
+            dep_ends = [by_id[d].end_ms for d in step.depends_on if d in by_id]
+            if dep_ends:
+                step.queued_ms = max(0, step.start_ms - max(dep_ends))
+
+    run_end = _parse_datetime(run.get("completed_at"))
+    wall_ms = max([s.end_ms for s in steps] + [offset(run_end) if run_end else 0])
+    critical_path = _critical_path(steps)
+    peak, busy_ms = _concurrency(steps)
+
+    return RunProfile(
+        run_id=run["id"],
+        workflow=run.get("workflow", "unknown"),
+        status=run.get("status", "unknown"),
+        started_at=run_start.isoformat(),
+        wall_ms=wall_ms,
+        steps=steps,
+        critical_path=critical_path,
+        critical_path_ms=sum(by_id[s].duration_ms + by_id[s].queued_ms for s in critical_path),
+        peak_concurrency=peak,
+        avg_concurrency=round(busy_ms / wall_ms, 2) if wall_ms else 0.0,
+    )
+
+
+def _critical_path(steps: list[StepProfile]) -> list[str]:
+    """Walk back from the last step to finish through the latest-finishing dependency.
+
+    Steps without recorded dependencies fall back to the latest step that
+    finished before they started.
+    """
+    if not steps:
+        return []
+    by_id = {s.step_id: s for s in steps}
+    current = max(steps, key=lambda s: (s.end_ms, s.start_ms))
+    path = [current.step_id]
+    seen = {current.step_id}
+    while True:
+        if current.depends_on is not None:
+            candidates = [by_id[d] for d in current.depends_on if d in by_id]
+        else:
+            # Timestamps are whole seconds: allow a step ending in the same second
+            candidates = [
+                s
+                for s in steps
+                if s.step_id not in seen
+                and s.end_ms <= current.start_ms + 999
+                and s.start_ms <= current.start_ms
+                and s is not current
+            ]
+        candidates = [s for s in candidates if s.step_id not in seen]
+        if not candidates:
+            break
+        current = max(candidates, key=lambda s: (s.end_ms, s.start_ms))
+        path.append(current.step_id)
+        seen.add(current.step_id)
+    return list(reversed(path))
+
+
+def _concurrency(steps: list[StepProfile]) -> tuple[int, int]:
+    """Peak number of steps running at once, and total step-busy milliseconds."""
+    edges = []
+    for step in steps:
+        edges.append((step.start_ms, 1))
+        edges.append((step.end_ms, -1))
+    # At equal times, ends come first so back-to-back steps do not overlap
+    edges.sort(key=lambda e: (e[0], e[1]))
+    peak = running = 0
+    for _, delta in edges:
+        running += delta
+        peak = max(peak, running)
+    return peak, sum(s.duration_ms for s in steps)
+
+
+def _assign_lanes(steps: list[StepProfile]) -> dict[str, int]:
+    """Put overlapping steps on separate trace rows (first free lane)."""
+    lane_ends: list[int] = []
+    lanes = {}
+    for step in sorted(steps, key=lambda s: (s.start_ms - s.queued_ms, s.start_ms)):
+        begin = step.start_ms - step.queued_ms
+        for lane, end in enumerate(lane_ends):
+            if end <= begin:
+                break
+        else:
+            lane = len(lane_ends)
+            lane_ends.append(0)
+        lane_ends[lane] = step.end_ms
+        lanes[step.step_id] = lane
+    return lanes
+
+
+def to_chrome_trace(profile: RunProfile) -> dict[str, Any]:
+    """Export a profile in the Chrome trace event format.
+
+    Load the result in chrome://tracing or https://ui.perfetto.dev. Each
+    step is a complete ("X") event; queue time and substeps are separate
+    events on the same row.
+    """
+    lanes = _assign_lanes(profile.steps)
+    events: list[dict[str, Any]] = [
+        {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": profile.workflow}},
+    ]
+    for lane in sorted(set(lanes.values())):
+        events.append(
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": lane,
+                "args": {"name": f"slot {lane + 1}"},
+            }
+        )
+
+    critical = set(profile.critical_path)
+    for step in profile.steps:
+        tid = lanes[step.step_id]
+        if step.queued_ms:
+            events.append(
+                {
+                    "name": f"{step.step_id} (queued)",
+                    "cat": "queue",
+                    "ph": "X",
+                    "ts": (step.start_ms - step.queued_ms) * 1000,
+                    "dur": step.queued_ms * 1000,
+                    "pid": 1,
+                    "tid": tid,
+                }
+            )
+        events.append(
+            {
+                "name": step.step_id,
+                "cat": "step,critical" if step.step_id in critical else "step",
+                "ph": "X",
+                "ts": step.start_ms * 1000,
+                "dur": step.duration_ms * 1000,
+                "pid": 1,
+                "tid": tid,
+                "args": {
+                    "tool": step.tool,
+                    "status": step.status,
+                    "queued_ms": step.queued_ms,
+                    "depends_on": step.depends_on,
+                    "on_critical_path": step.step_id in critical,
+                },
+            }
+        )
+        for sub in step.substeps:
+            events.append(
+                {
+                    "name": f"{step.step_id}:{sub.name}",
+                    "cat": "substep",
+                    "ph": "X",
+                    "ts": sub.start_ms * 1000,
+                    "dur": sub.duration_ms * 1000,
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"events": sub.events, "total": sub.total},
+                }
+            )
+
+    return {
+        "traceEvents": events,
+        "displayTimeUnit": "ms",
+        "otherData": {
+            "run_id": profile.run_id,
+            "workflow": profile.workflow,
+            "status": profile.status,
+            "wall_ms": profile.wall_ms,
+            "critical_path": profile.critical_path,
+            "peak_concurrency": profile.peak_concurrency,
+            "avg_concurrency": profile.avg_concurrency,
+        },
+    }
+
+
+__all__ = [
+    "RunProfile",
+    "StepProfile",
+    "SubstepProfile",
+    "build_profile",
+    "get_run_profile",
+    "to_chrome_trace",
+]
@@ -1,7 +1,9 @@
 """Status streaming for workflow observability.
 
 This module provides real-time event streaming from the step_events table
-using a cursor-based polling approach with monotonic IDs.
+using cursor-based reads with monotonic IDs. Reads are triggered by change
+notifications (see kurt.observability.notify); polling is only the fallback
+for writers that can't send them.
 
 Usage:
     from kurt.observability import stream_events, format_event, StatusStreamer
@@ -26,6 +28,10 @@ Cursor Strategy:
     - No gaps: cursor ensures all events seen
     - No duplicates: cursor > last_seen_id
 
+Wake-ups:
+    - notify_run() from the writer wakes the streamer within ~50ms
+    - Without a notification, it re-reads every poll_ms (fallback)
+
 Terminal States:
     Streaming stops when workflow_runs.status is one of:
     - completed
@@ -37,17 +43,19 @@ from __future__ import annotations
 
 import json
 import logging
-import time
 from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Iterator
 
+from kurt.observability.notify import RunWatcher
+
 if TYPE_CHECKING:
     from kurt.db.dolt import DoltDB
 
 logger = logging.getLogger(__name__)
 
-# Default polling interval in milliseconds
+# Default fallback polling interval in milliseconds, used when no change
+# notification arrives
 DEFAULT_POLL_MS = 500
 
 # Batch limit per poll
@@ -194,9 +202,10 @@ def format_event(event: StepEvent, *, json_output: bool = False) -> str:
 
 
 class StatusStreamer:
-    """Real-time event streamer with polling-based subscription.
+    """Real-time event streamer driven by change notifications.
 
-    Uses cursor-based polling to stream events from step_events table.
+    Reads step_events by cursor whenever the run's writer calls notify_run(),
+    falling back to polling every ``poll_ms`` when no notification arrives.
     Automatically stops when workflow reaches a terminal state.
 
     Thread Safety:
@@ -219,7 +228,7 @@ class StatusStreamer:
 
         Args:
             db: DoltDB instance for querying.
-            poll_ms: Polling interval in milliseconds (default: 500).
+            poll_ms: Fallback polling interval in milliseconds (default: 500).
             batch_limit: Maximum events per poll (default: 100).
         """
         self._db = db
@@ -293,6 +302,7 @@ class StatusStreamer:
                 print(format_event(event))
         """
         cursor = since_id
+        watcher = RunWatcher(run_id)
 
         while True:
             # Fetch new events
@@ -311,9 +321,9 @@ class StatusStreamer:
                     yield event
                 break
 
-            # No new events - wait before next poll
+            # No new events - wait for a change notification (or the fallback poll)
             if not events:
-                time.sleep(self._poll_sec)
+                watcher.wait(self._poll_sec)
 
 
 def stream_events(
@@ -330,7 +340,7 @@ def stream_events(
         db: DoltDB instance for querying.
         run_id: Workflow run ID to stream.
         since_id: Start cursor (default: 0, from beginning).
-        poll_ms: Polling interval in milliseconds (default: 500).
+        poll_ms: Fallback polling interval in milliseconds (default: 500).
 
     Yields:
         StepEvent objects as they are available.
@@ -0,0 +1,102 @@
+"""Periodic sweep of stale workflow runs.
+
+Runs whose process died (crash, kill, closed terminal) stay in 'running'
+forever unless something marks them failed. The CLI used to do that with
+cleanup_stale_workflows() on every invocation, which cost a database
+round-trip before any command could start. The sweep now runs at most once
+every STALE_SWEEP_INTERVAL seconds per project, in a detached process:
+
+    python -m kurt.observability.sweep --path <project>
+
+The mtime of ``.dolt/kurt-stale-sweep`` records the last sweep; the CLI
+touches it before spawning, so concurrent commands don't sweep twice.
+
+Set KURT_STALE_SWEEP_INTERVAL=0 to disable the sweep.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Sweep marker, relative to the project's .dolt directory
+STALE_SWEEP_FILE = "kurt-stale-sweep"
+
+# Seconds between sweeps (0 disables)
+STALE_SWEEP_INTERVAL = int(os.environ.get("KURT_STALE_SWEEP_INTERVAL", "600"))
+
+# Runs in 'running' for longer than this are considered orphaned
+STALE_WORKFLOW_MINUTES = 60
+
+
+def sweep_due(path: Path, interval: float = STALE_SWEEP_INTERVAL) -> bool:
+    """Whether the project hasn't been swept within ``interval`` seconds."""
+    if interval <= 0:
+        return False
+    try:
+        last = (Path(path) / ".dolt" / STALE_SWEEP_FILE).stat().st_mtime
+    except FileNotFoundError:
+        return True
+    except OSError:
+        return False
+    return time.time() - last >= interval
+
+
+def maybe_spawn_sweep(path: Path, interval: float = STALE_SWEEP_INTERVAL) -> bool:
+    """Start a detached sweep if one is due.
+
+    Returns:
+        True if a sweep was started.
+    """
+    if not sweep_due(path, interval):
+        return False
+    try:
+        (Path(path) / ".dolt" / STALE_SWEEP_FILE).touch()
+        subprocess.Popen(
+            [sys.executable, "-m", "kurt.observability.sweep", "--path", str(path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        logger.debug(f"Could not start stale workflow sweep: {e}")
+        return False
+    return True
+
+
+def run_sweep(path: Path, stale_minutes: int = STALE_WORKFLOW_MINUTES) -> int:
+    """Mark the project's stale 'running' workflows as failed.
+
+    Returns:
+        Number of workflows marked as failed.
+    """
+    from kurt.db.dolt import DoltDB
+    from kurt.observability.lifecycle import cleanup_stale_workflows
+
+    db = DoltDB(Path(path))
+    try:
+        return cleanup_stale_workflows(db, stale_minutes=stale_minutes)
+    finally:
+        db.close()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Mark orphaned Kurt workflow runs as failed")
+    parser.add_argument("--path", required=True, type=Path)
+    parser.add_argument("--stale-minutes", type=int, default=STALE_WORKFLOW_MINUTES)
+    args = parser.parse_args(argv)
+
+    count = run_sweep(args.path, args.stale_minutes)
+    if count:
+        logger.info(f"Marked {count} stale workflow(s) as failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Tests for change notifications."""
+
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+from kurt.db.dolt import QueryResult
+from kurt.observability.notify import EVENTS_DIR, EventBus, RunWatcher, notify_run
+from kurt.observability.streaming import StatusStreamer
+from kurt.observability.tracking import track_event
+
+
+class TestEventBus:
+    def test_wait_returns_on_publish(self):
+        bus = EventBus()
+        threading.Timer(0.05, bus.publish, args=("run-1",)).start()
+
+        start = time.monotonic()
+        assert bus.wait("run-1", 0, timeout=5) == 1
+        assert time.monotonic() - start < 1
+
+    def test_wait_times_out(self):
+        bus = EventBus()
+        bus.publish("other")
+        assert bus.wait("run-1", 0, timeout=0.01) == 0
+
+
+class TestRunWatcher:
+    def test_in_process_notification(self, tmp_path):
+        bus = EventBus()
+        watcher = RunWatcher("run-1", project_root=tmp_path, bus=bus)
+
+        assert watcher.changed() is False
+        bus.publish("run-1")
+        assert watcher.changed() is True
+        assert watcher.changed() is False
+
+    def test_file_channel(self, tmp_path):
+        (tmp_path / ".kurt").mkdir()
+        # Separate bus stands in for a watcher in another process
+        watcher = RunWatcher("run-1", project_root=tmp_path, bus=EventBus())
+
+        notify_run("run-1", project_root=tmp_path)
+
+        assert (tmp_path / EVENTS_DIR / "run-1").exists()
+        assert watcher.wait(timeout=1) is True
+
+    def test_no_channel_outside_project(self, tmp_path):
+        notify_run("run-1", project_root=tmp_path)
+        assert not (tmp_path / EVENTS_DIR).exists()
+
+    def test_wait_times_out(self, tmp_path):
+        watcher = RunWatcher("run-1", project_root=tmp_path, bus=EventBus())
+        assert watcher.wait(timeout=0.01) is False
+
+
+class TestPublishers:
+    def test_track_event_notifies(self):
+        db = MagicMock()
+        db.execute.return_value = QueryResult(rows=[], last_insert_id=1)
+        watcher = RunWatcher("run-notify")
+
+        track_event("run-notify", "map", db=db)
+
+        assert watcher.changed() is True
+
+
+class TestStreamerWakeUp:
+    def test_notification_wakes_streamer(self):
+        row = {"id": 1, "run_id": "run-wake", "step_id": "map", "status": "completed"}
+        db = MagicMock()
+        db.query.side_effect = [QueryResult(rows=[]), QueryResult(rows=[row]), QueryResult(rows=[])]
+        db.query_one.side_effect = [{"status": "running"}, {"status": "completed"}]
+        threading.Timer(0.05, notify_run, args=("run-wake",)).start()
+
+        start = time.monotonic()
+        # Fallback poll is far longer than the test; only the notification ends the wait
+        events = list(StatusStreamer(db, poll_ms=10_000).stream("run-wake"))
+
+        assert [e.id for e in events] == [1]
+        assert time.monotonic() - start < 5
@@ -0,0 +1,154 @@
+"""Tests for kurt.observability.profile module."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from kurt.observability.profile import build_profile, get_run_profile, to_chrome_trace
+
+T0 = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _at(seconds: int) -> str:
+    return (T0 + timedelta(seconds=seconds)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _event(step_id, status, seconds, substep=None, **metadata):
+    return {
+        "step_id": step_id,
+        "substep": substep,
+        "status": status,
+        "current": None,
+        "total": None,
+        "metadata_json": json.dumps(metadata) if metadata else None,
+        "created_at": _at(seconds),
+    }
+
+
+RUN = {
+    "id": "run-1",
+    "workflow": "pipeline",
+    "status": "completed",
+    "started_at": _at(0),
+    "completed_at": _at(6),
+}
+
+# fetch -> (map_a, map_b) -> join; map_b waited 1s for a free slot
+EVENTS = [
+    _event("workflow", "running", 0),
+    _event("fetch", "running", 0, tool="fetch", depends_on=[], queued_ms=0),
+    _event("fetch", "progress", 0, substep="fetch_urls"),
+    _event("fetch", "progress", 1, substep="fetch_urls"),
+    _event("fetch", "completed", 2, duration_ms=2000),
+    _event("map_a", "running", 2, tool="map", depends_on=["fetch"], queued_ms=0),
+    _event("map_b", "running", 3, tool="map", depends_on=["fetch"], queued_ms=1000),
+    _event("map_b", "completed", 4, duration_ms=1000),
+    _event("map_a", "completed", 5, duration_ms=3000),
+    _event("join", "running", 5, tool="sql", depends_on=["map_a", "map_b"], queued_ms=0),
+    _event("join", "completed", 6, duration_ms=1000),
+    _event("workflow", "completed", 6),
+]
+
+
+class TestBuildProfile:
+    def test_step_timeline(self):
+        profile = build_profile(RUN, [], EVENTS)
+
+        steps = {s.step_id: s for s in profile.steps}
+        assert [s.step_id for s in profile.steps] == ["fetch", "map_a", "map_b", "join"]
+        assert steps["map_b"].start_ms == 3000
+        assert steps["map_b"].queued_ms == 1000
+        assert steps["map_a"].duration_ms == 3000
+        assert steps["join"].tool == "sql"
+        assert profile.wall_ms == 6000
+
+    def test_substeps(self):
+        profile = build_profile(RUN, [], EVENTS)
+
+        (substep,) = profile.steps[0].substeps
+        assert substep.name == "fetch_urls"
+        assert substep.duration_ms == 1000
+        assert substep.events == 2
+
+    def test_critical_path_follows_latest_dependency(self):
+        profile = build_profile(RUN, [], EVENTS)
+
+        assert profile.critical_path == ["fetch", "map_a", "join"]
+        assert profile.critical_path_ms == 6000
+
+    def test_concurrency(self):
+        profile = build_profile(RUN, [], EVENTS)
+
+        assert profile.peak_concurrency == 2
+        assert profile.avg_concurrency == round(7000 / 6000, 2)
+
+    def test_falls_back_to_step_logs(self):
+        step_logs = [
+            {"step_id": "a", "tool": "fetch", "status": "completed",
+             "started_at": _at(0), "completed_at": _at(2)},
+            {"step_id": "b", "tool": "map", "status": "completed",
+             "started_at": _at(2), "completed_at": _at(5)},
+        ]
+        profile = build_profile(RUN, step_logs, [])
+
+        assert [(s.step_id, s.start_ms, s.duration_ms) for s in profile.steps] == [
+            ("a", 0, 2000),
+            ("b", 2000, 3000),
+        ]
+        # No recorded dependencies: the path follows the step that ended before b started
+        assert profile.critical_path == ["a", "b"]
+        assert profile.peak_concurrency == 1
+
+    def test_to_dict_marks_critical_steps(self):
+        data = build_profile(RUN, [], EVENTS).to_dict()
+
+        by_id = {s["step_id"]: s for s in data["steps"]}
+        assert by_id["map_a"]["on_critical_path"] is True
+        assert by_id["map_b"]["on_critical_path"] is False
+        assert by_id["join"]["end_ms"] == 6000
+
+
+class TestChromeTrace:
+    def test_events(self):
+        trace = to_chrome_trace(build_profile(RUN, [], EVENTS))
+
+        complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        step = next(e for e in complete if e["name"] == "map_a")
+        assert step["ts"] == 2_000_000
+        assert step["dur"] == 3_000_000
+        assert "critical" in step["cat"]
+
+        queue = next(e for e in complete if e["cat"] == "queue")
+        assert queue["name"] == "map_b (queued)"
+        assert queue["ts"] == 2_000_000
+
+        # Overlapping steps are on different rows
+        map_b = next(e for e in complete if e["name"] == "map_b")
+        assert map_b["tid"] != step["tid"]
+        assert trace["otherData"]["critical_path"] == ["fetch", "map_a", "join"]
+
+    def test_json_serializable(self):
+        json.dumps(to_chrome_trace(build_profile(RUN, [], EVENTS)))
+
+
+class TestGetRunProfile:
+    def test_not_found(self):
+        db = MagicMock()
+        db.query.return_value = MagicMock(rows=[])
+
+        assert get_run_profile(db, "missing") is None
+
+    def test_queries_run(self):
+        db = MagicMock()
+        db.query.side_effect = [
+            MagicMock(rows=[RUN]),
+            MagicMock(rows=[]),
+            MagicMock(rows=EVENTS),
+        ]
+
+        profile = get_run_profile(db, "run-1")
+
+        assert profile.run_id == "run-1"
+        assert profile.critical_path == ["fetch", "map_a", "join"]
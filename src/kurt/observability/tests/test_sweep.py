@@ -0,0 +1,49 @@
+"""Tests for the periodic stale workflow sweep."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from kurt.observability.sweep import STALE_SWEEP_FILE, maybe_spawn_sweep, sweep_due
+
+
+def _marker(path: Path) -> Path:
+    (path / ".dolt").mkdir(exist_ok=True)
+    return path / ".dolt" / STALE_SWEEP_FILE
+
+
+class TestSweepDue:
+    def test_due_without_marker(self, tmp_path: Path):
+        _marker(tmp_path)
+        assert sweep_due(tmp_path, interval=600)
+
+    def test_not_due_after_recent_sweep(self, tmp_path: Path):
+        _marker(tmp_path).touch()
+        assert not sweep_due(tmp_path, interval=600)
+
+    def test_due_after_interval(self, tmp_path: Path):
+        marker = _marker(tmp_path)
+        marker.touch()
+        old = time.time() - 601
+        os.utime(marker, (old, old))
+        assert sweep_due(tmp_path, interval=600)
+
+    def test_disabled(self, tmp_path: Path):
+        _marker(tmp_path)
+        assert not sweep_due(tmp_path, interval=0)
+
+
+class TestMaybeSpawnSweep:
+    def test_spawns_once_per_interval(self, tmp_path: Path):
+        marker = _marker(tmp_path)
+
+        with patch("kurt.observability.sweep.subprocess.Popen") as popen:
+            assert maybe_spawn_sweep(tmp_path, interval=600)
+            assert not maybe_spawn_sweep(tmp_path, interval=600)
+
+        popen.assert_called_once()
+        assert popen.call_args.args[0][1:3] == ["-m", "kurt.observability.sweep"]
+        assert marker.exists()
@@ -49,6 +49,7 @@ from queue import Empty, Queue
 from typing import Any, Literal
 
 from kurt.db.dolt import DoltDB, DoltQueryError
+from kurt.observability.notify import notify_run
 
 logger = logging.getLogger(__name__)
 
@@ -137,7 +138,8 @@ def track_event(
     """Track a workflow step event.
 
     Inserts a single event into step_events table and returns the
-    generated event ID for cursor-based streaming.
+    generated event ID for cursor-based streaming. Followers of the run
+    are woken through notify_run().
 
     Args:
         run_id: Workflow run ID (foreign key to workflow_runs).
@@ -168,6 +170,65 @@ def track_event(
             message="Fetched page 5",
         )
     """
+    target_db, sql, params = _prepare_event(
+        run_id, step_id, substep, status, current, total, message, metadata, db
+    )
+    if target_db is None:
+        return None
+
+    try:
+        result = target_db.execute(sql, params)
+        notify_run(run_id)
+        return result.last_insert_id
+    except DoltQueryError as e:
+        logger.error(f"Failed to track event: {e}")
+        raise
+
+
+async def atrack_event(
+    run_id: str,
+    step_id: str,
+    substep: str | None = None,
+    status: EventStatus = "progress",
+    current: int | None = None,
+    total: int | None = None,
+    message: str | None = None,
+    metadata: dict[str, Any] | None = None,
+    *,
+    db: DoltDB | None = None,
+) -> int | None:
+    """Async version of track_event() for code running on an event loop.
+
+    Inserts through DoltDB.aexecute(), so the insert doesn't block the loop.
+    Takes the same arguments and raises the same errors as track_event().
+    """
+    target_db, sql, params = _prepare_event(
+        run_id, step_id, substep, status, current, total, message, metadata, db
+    )
+    if target_db is None:
+        return None
+
+    try:
+        result = await target_db.aexecute(sql, params)
+        notify_run(run_id)
+        return result.last_insert_id
+    except DoltQueryError as e:
+        logger.error(f"Failed to track event: {e}")
+        raise
+
+
+def _prepare_event(
+    run_id: str,
+    step_id: str,
+    substep: str | None,
+    status: str,
+    current: int | None,
+    total: int | None,
+    message: str | None,
+    metadata: dict[str, Any] | None,
+    db: DoltDB | None,
+) -> tuple[DoltDB | None, str, list[Any]]:
+    """Validate an event and build its INSERT. The DB is None if tracking is off."""
     if not run_id:
         raise ValueError("run_id is required")
     if not step_id:
@@ -176,7 +237,6 @@ def track_event(
     target_db = db or get_tracking_db()
     if target_db is None:
         logger.warning("Tracking DB not initialized, event not stored")
-        return None
 
     metadata_json = json.dumps(metadata) if metadata else None
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
@@ -186,13 +246,7 @@ def track_event(
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
     """
     params = [run_id, step_id, substep, status, current, total, message, metadata_json, now]
-
-    try:
-        result = target_db.execute(sql, params)
-        return result.last_insert_id
-    except DoltQueryError as e:
-        logger.error(f"Failed to track event: {e}")
-        raise
+    return target_db, sql, params
 
 
 def write_event(
@@ -498,7 +552,8 @@ class EventTracker:
     def _flush_batch(self, batch: list[_BatchEvent]) -> None:
         """Insert a batch of events into the database.
 
-        Uses a single multi-row INSERT for efficiency.
+        Uses a single multi-row INSERT for efficiency, then wakes
+        followers of each run in the batch.
 
         Args:
             batch: List of events to insert.
@@ -543,6 +598,9 @@ class EventTracker:
                 logger.error(f"Retry failed, dropping batch: {retry_e}")
                 raise
 
+        for run_id in dict.fromkeys(event.run_id for event in batch):
+            notify_run(run_id)
+
 
 # Global tracker instance for convenience
 _global_tracker: EventTracker | None = None
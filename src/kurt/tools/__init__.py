@@ -9,9 +9,11 @@ Tool names map to step types in workflow TOML:
 - step.type='fetch' -> FetchTool
 - step.type='write-db' -> WriteTool
 - step.type='sql' -> SQLTool
+- step.type='changes' -> ChangesTool
 - step.type='batch-embedding' -> BatchEmbeddingTool
 - step.type='batch-llm' -> BatchLLMTool
 - step.type='agent' -> AgentTool
+- step.type='similar' -> VectorSearchTool
 
 Example usage:
     from kurt.tools import Tool, ToolContext, ToolResult, register_tool, execute_tool
@@ -58,6 +60,7 @@ from .batch_llm import (
     BatchLLMParams,
     BatchLLMTool,
 )
+from .changes import ChangesInput, ChangesOutput, ChangesTool
 from .core import (
     # Registry
     TOOLS,
@@ -126,6 +129,12 @@ FetchConfig = FetchToolConfig
 from .research import CitationOutput, ResearchInput, ResearchOutput, ResearchTool  # noqa: E402
 from .signals import SignalInput, SignalOutput, SignalsTool  # noqa: E402
 from .sql import SQLConfig, SQLInput, SQLOutput, SQLTool  # noqa: E402
+from .vector_search import (  # noqa: E402
+    VectorSearchConfig,
+    VectorSearchOutput,
+    VectorSearchParams,
+    VectorSearchTool,
+)
 from .write_db import WriteConfig, WriteInput, WriteOutput, WriteParams, WriteTool  # noqa: E402
 
 __all__ = [
@@ -184,6 +193,10 @@ __all__ = [
     "SQLInput",
     "SQLOutput",
     "SQLConfig",
+    # Changes tool
+    "ChangesTool",
+    "ChangesInput",
+    "ChangesOutput",
     # Batch embedding tool
     "BatchEmbeddingTool",
     "BatchEmbeddingInput",
@@ -232,4 +245,9 @@ __all__ = [
     "SignalsTool",
     "SignalInput",
     "SignalOutput",
+    # Vector search tool
+    "VectorSearchTool",
+    "VectorSearchConfig",
+    "VectorSearchOutput",
+    "VectorSearchParams",
 ]
@@ -318,6 +318,7 @@ class AgentTool(Tool[AgentParams, AgentOutput]):
     description = "Execute Claude Code CLI agent with configurable tools and guardrails"
     InputModel = AgentParams
     OutputModel = AgentOutput
+    cacheable = False  # Agent runs are not reproducible
 
     async def run(
         self,
@@ -136,6 +136,7 @@ class AnalyticsTool(Tool[AnalyticsInput, AnalyticsOutput]):
     description = "Sync page-level analytics from PostHog, GA4, or Plausible"
     InputModel = AnalyticsInput
     OutputModel = AnalyticsOutput
+    cacheable = False  # Reads live analytics platforms
 
     async def run(
         self,
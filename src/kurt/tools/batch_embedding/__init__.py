@@ -17,7 +17,25 @@ from pydantic import BaseModel, Field
 
 from ..core.base import ProgressCallback, Tool, ToolContext, ToolResult
 from ..core.registry import register_tool
+from .cache import EmbeddingCache, EmbeddingCacheStats, cache_db, dedupe_texts, hash_text
+from .chunking import (
+    DEFAULT_CHUNK_TOKENS,
+    PROVIDER_MAX_BATCH_TOKENS,
+    PROVIDER_MAX_INPUT_TOKENS,
+    TextChunk,
+    pool_embeddings,
+    split_markdown,
+    token_batches,
+    truncate_to_tokens,
+)
 from .schema import BatchEmbeddingResult
+from .vectors import (
+    bytes_to_embedding,
+    bytes_to_matrix,
+    embedding_to_bytes,
+    group_by_dimension,
+    matrix_to_bytes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +114,25 @@ class BatchEmbeddingConfig(BaseModel):
         le=100000,
         description="Maximum characters per text (truncated if exceeded)",
     )
+    cache: bool = Field(
+        default=True,
+        description="Reuse embeddings of identical texts from earlier runs (content-hash cache)",
+    )
+    max_batch_tokens: int | None = Field(
+        default=None,
+        ge=1,
+        description="Token budget per API request (default: provider limit)",
+    )
+    chunk: bool = Field(
+        default=False,
+        description="Split long markdown on headings, embed chunks and pool them per text",
+    )
+    chunk_tokens: int = Field(
+        default=DEFAULT_CHUNK_TOKENS,
+        ge=32,
+        le=8191,
+        description="Maximum tokens per chunk in chunk mode",
+    )
 
 
 class BatchEmbeddingOutput(BaseModel):
@@ -108,6 +145,14 @@ class BatchEmbeddingOutput(BaseModel):
         description="Embedding status",
     )
     error: str | None = Field(default=None, description="Error message if failed")
+    cached: bool = Field(
+        default=False,
+        description="True if the embedding was reused (duplicate or cache hit)",
+    )
+    chunks: list[dict[str, Any]] | None = Field(
+        default=None,
+        description="Chunk mode: per-chunk index, heading, text, tokens and embedding",
+    )
 
 
 class BatchEmbeddingParams(BaseModel):
@@ -165,6 +210,25 @@ class BatchEmbeddingParams(BaseModel):
         le=100000,
         description="Maximum characters per text",
     )
+    cache: bool = Field(
+        default=True,
+        description="Reuse embeddings of identical texts from earlier runs",
+    )
+    max_batch_tokens: int | None = Field(
+        default=None,
+        ge=1,
+        description="Token budget per API request",
+    )
+    chunk: bool = Field(
+        default=False,
+        description="Embed heading-based chunks and pool them per text",
+    )
+    chunk_tokens: int = Field(
+        default=DEFAULT_CHUNK_TOKENS,
+        ge=32,
+        le=8191,
+        description="Maximum tokens per chunk in chunk mode",
+    )
 
     def get_inputs(self) -> list[dict[str, Any]]:
         """Get the input list from either input_data or inputs field."""
@@ -183,32 +247,13 @@ class BatchEmbeddingParams(BaseModel):
             batch_size=self.batch_size,
             concurrency=self.concurrency,
             max_chars=self.max_chars,
+            cache=self.cache,
+            max_batch_tokens=self.max_batch_tokens,
+            chunk=self.chunk,
+            chunk_tokens=self.chunk_tokens,
         )
 
 
-# ============================================================================
-# Embedding Utilities
-# ============================================================================
-
-
-def embedding_to_bytes(embedding: list[float]) -> bytes:
-    """Convert embedding vector to bytes for database storage."""
-    try:
-        import numpy as np
-    except ImportError as e:
-        raise ImportError(
-            "numpy is required for embeddings. Install with: pip install numpy"
-        ) from e
-    return np.array(embedding, dtype=np.float32).tobytes()
-
-
-def bytes_to_embedding(embedding_bytes: bytes) -> list[float]:
-    """Convert stored bytes back to embedding vector."""
-    import struct
-
-    return list(struct.unpack(f"{len(embedding_bytes) // 4}f", embedding_bytes))
-
-
 # ============================================================================
 # Provider Functions
 # ============================================================================
@@ -331,6 +376,13 @@ async def _embed_with_voyage(
     return [item["embedding"] for item in response.data]
 
 
+def _cache_model_name(provider: str, model: str) -> str:
+    """Model name as sent to LiteLLM, used as the embedding cache key."""
+    if provider == "openai" or model.startswith(f"{provider}/"):
+        return model
+    return f"{provider}/{model}"
+
+
 # Provider dispatcher
 _EMBED_PROVIDERS = {
     "openai": _embed_with_openai,
@@ -475,6 +527,7 @@ class BatchEmbeddingTool(Tool[BatchEmbeddingParams, BatchEmbeddingOutput]):
     description = "Generate vector embeddings for text content"
     InputModel = BatchEmbeddingParams
     OutputModel = BatchEmbeddingOutput
+    stream_input = True
 
     async def run(
         self,
@@ -503,22 +556,32 @@ class BatchEmbeddingTool(Tool[BatchEmbeddingParams, BatchEmbeddingOutput]):
             )
 
         # Extract text from input rows
+        # In chunk mode one row contributes one text per chunk
         texts: list[str] = []
         text_indices: list[int] = []
         skipped_indices: list[int] = []
+        row_chunks: dict[int, list[TextChunk]] = {}
+        max_input_tokens = PROVIDER_MAX_INPUT_TOKENS.get(config.provider, 512)
 
         for i, row in enumerate(inputs):
             text = row.get(config.text_field, "")
-            if not text or not isinstance(text, str):
+            chunks = split_markdown(text, min(config.chunk_tokens, max_input_tokens)) if (
+                config.chunk and text and isinstance(text, str)
+            ) else None
+            if not text or not isinstance(text, str) or chunks == []:
                 # Skip empty or non-string texts
                 skipped_indices.append(i)
                 logger.debug(f"Skipping row {i}: empty or invalid text field '{config.text_field}'")
+            elif chunks is not None:
+                row_chunks[i] = chunks
+                texts.extend(chunk.text for chunk in chunks)
+                text_indices.extend(i for _ in chunks)
             else:
                 # Truncate if needed
                 if len(text) > config.max_chars:
                     text = text[: config.max_chars]
                     logger.debug(f"Truncated text at row {i} to {config.max_chars} chars")
-                texts.append(text)
+                texts.append(truncate_to_tokens(text, max_input_tokens))
                 text_indices.append(i)
 
         total_texts = len(texts)
@@ -536,16 +599,46 @@ class BatchEmbeddingTool(Tool[BatchEmbeddingParams, BatchEmbeddingOutput]):
             message=f"Generating embeddings for {total_texts} text(s) with {config.provider}",
         )
 
+        # Deduplicate texts, then serve what we can from the embedding cache.
+        # Only the remaining unique texts are sent to the provider.
+        unique_texts, inverse = dedupe_texts(texts)
+        unique_vectors: dict[int, bytes] = {}
+        unique_errors: dict[int, str] = {}
+
+        cache_model = _cache_model_name(config.provider, config.model)
+        cache = EmbeddingCache(db=cache_db(context.db)) if config.cache else None
+        unique_hashes = [hash_text(t) for t in unique_texts]
+        hit_positions: set[int] = set()
+
+        if cache is not None:
+            hits = cache.get_many(cache_model, unique_hashes)
+            for u, text_hash in enumerate(unique_hashes):
+                if text_hash in hits:
+                    unique_vectors[u] = hits[text_hash]
+                    hit_positions.add(u)
+            cache.stats.record(
+                cache_model,
+                texts,
+                unique_texts,
+                [unique_texts[u] for u in sorted(hit_positions)],
+            )
+
+        pending = [u for u in range(len(unique_texts)) if u not in hit_positions]
+
         # Adjust batch size to provider maximum
         max_batch = PROVIDER_MAX_BATCH_SIZES.get(config.provider, 100)
         batch_size = min(config.batch_size, max_batch)
 
-        # Create batches
+        # Create batches (of unique-text positions) under the request token budget
         batches: list[tuple[list[str], list[int]]] = []
-        for i in range(0, total_texts, batch_size):
-            batch_texts = texts[i : i + batch_size]
-            batch_indices = text_indices[i : i + batch_size]
-            batches.append((batch_texts, batch_indices))
+        for batch in token_batches(
+            [unique_texts[u] for u in pending],
+            max_tokens=config.max_batch_tokens or PROVIDER_MAX_BATCH_TOKENS.get(config.provider, 100_000),
+            max_items=batch_size,
+        ):
+            batch_positions = [pending[j] for j in batch]
+            batch_texts = [unique_texts[u] for u in batch_positions]
+            batches.append((batch_texts, batch_positions))
 
         # Get API key from context settings
         api_key = context.settings.get(f"{config.provider}_api_key")
@@ -553,10 +646,11 @@ class BatchEmbeddingTool(Tool[BatchEmbeddingParams, BatchEmbeddingOutput]):
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(config.concurrency)
 
-        # Process batches
-        embeddings_map: dict[int, bytes] = {}
-        errors_map: dict[int, str] = {}
-        embedded_count = 0
+        # Texts (including duplicates) covered by each unique position
+        copies = [0] * len(unique_texts)
+        for u in inverse:
+            copies[u] += 1
+        embedded_count = sum(copies[u] for u in hit_positions)
 
         async def process_batch(
             batch_texts: list[str],
@@ -597,16 +691,16 @@ class BatchEmbeddingTool(Tool[BatchEmbeddingParams, BatchEmbeddingOutput]):
         batch_results = await asyncio.gather(*tasks)
 
         # Process results
+        new_entries: dict[str, bytes] = {}
         for batch_result in batch_results:
-            batch_result["batch_idx"]
-
             if batch_result["status"] == "success":
                 embeddings = batch_result["embeddings"]
                 indices = batch_result["indices"]
 
-                for idx, embedding in zip(indices, embeddings):
-                    embeddings_map[idx] = embedding_to_bytes(embedding)
-                    embedded_count += 1
+                for u, vector in zip(indices, matrix_to_bytes(embeddings)):
+                    unique_vectors[u] = vector
+                    new_entries[unique_hashes[u]] = vector
+                    embedded_count += copies[u]
 
                 self.emit_progress(
                     on_progress,
@@ -618,8 +712,69 @@ class BatchEmbeddingTool(Tool[BatchEmbeddingParams, BatchEmbeddingOutput]):
                 )
             else:
                 # Batch failed - mark all indices as errors
-                for idx in batch_result["indices"]:
-                    errors_map[idx] = batch_result["error"]
+                for u in batch_result["indices"]:
+                    unique_errors[u] = batch_result["error"]
+
+        if cache is not None and new_entries:
+            cache.put_many(cache_model, new_entries)
+
+        # Fan unique results back out to texts, then texts to input rows
+        text_reused: list[bool] = []
+        first_seen: set[int] = set()
+        for u in inverse:
+            text_reused.append(u in hit_positions or u in first_seen)
+            first_seen.add(u)
+
+        row_positions: dict[int, list[int]] = {}
+        for pos, idx in enumerate(text_indices):
+            row_positions.setdefault(idx, []).append(pos)
+
+        embeddings_map: dict[int, bytes] = {}
+        errors_map: dict[int, str] = {}
+        chunks_map: dict[int, list[dict[str, Any]]] = {}
+        reused: set[int] = set()
+        for idx, positions in row_positions.items():
+            failed = [unique_errors[inverse[p]] for p in positions if inverse[p] in unique_errors]
+            if failed:
+                errors_map[idx] = failed[0]
+                continue
+            vectors = [unique_vectors.get(inverse[p]) for p in positions]
+            if any(v is None for v in vectors):
+                continue
+            if idx in row_chunks:
+                chunks = row_chunks[idx]
+                matrix, _ = bytes_to_matrix(vectors, strict=True)
+                pooled = pool_embeddings(matrix, weights=[c.tokens for c in chunks])
+                embeddings_map[idx] = embedding_to_bytes(pooled)
+                chunks_map[idx] = [
+                    {
+                        "index": c.index,
+                        "heading": c.heading,
+                        "text": c.text,
+                        "tokens": c.tokens,
+                        "embedding": v,
+                    }
+                    for c, v in zip(chunks, vectors)
+                ]
+            else:
+                embeddings_map[idx] = vectors[0]
+            if all(text_reused[p] for p in positions):
+                reused.add(idx)
+
+        if cache is not None:
+            cache_metadata = cache.stats.to_dict()
+        else:
+            cache_metadata = {
+                "requested": total_texts,
+                "unique": len(unique_texts),
+                "deduplicated": total_texts - len(unique_texts),
+            }
+        reuse_note = ""
+        if reused:
+            reuse_note = f" ({len(reused)} reused"
+            if cache is not None and cache.stats.cost_avoided:
+                reuse_note += f", ~${cache.stats.cost_avoided:.4f} avoided"
+            reuse_note += ")"
 
         self.emit_progress(
             on_progress,
@@ -627,22 +782,23 @@ class BatchEmbeddingTool(Tool[BatchEmbeddingParams, BatchEmbeddingOutput]):
             status="completed",
             current=embedded_count,
             total=total_texts,
-            message=f"Generated {embedded_count} embeddings",
+            message=f"Generated {embedded_count} embeddings{reuse_note}",
+            metadata=cache_metadata,
         )
 
         # Build output data
+        skipped = set(skipped_indices)
         output_data: list[dict[str, Any]] = []
 
         for i, row in enumerate(inputs):
-            text = row.get(config.text_field, "")
-
-            if i in skipped_indices:
+            if i in skipped:
                 # Skipped (empty text)
                 output_data.append({
                     **row,
                     "embedding": None,
                     "status": "skipped",
                     "error": f"Empty or invalid text field '{config.text_field}'",
+                    "cached": False,
                 })
             elif i in errors_map:
                 # Error during embedding
@@ -651,14 +807,17 @@ class BatchEmbeddingTool(Tool[BatchEmbeddingParams, BatchEmbeddingOutput]):
                     "embedding": None,
                     "status": "error",
                     "error": errors_map[i],
+                    "cached": False,
                 })
             elif i in embeddings_map:
-                # Successfully embedded
+                # Successfully embedded (or reused)
                 output_data.append({
                     **row,
                     "embedding": embeddings_map[i],
                     "status": "success",
                     "error": None,
+                    "cached": i in reused,
+                    **({"chunks": chunks_map[i]} if i in chunks_map else {}),
                 })
             else:
                 # Should not happen, but handle gracefully
@@ -667,6 +826,7 @@ class BatchEmbeddingTool(Tool[BatchEmbeddingParams, BatchEmbeddingOutput]):
                     "embedding": None,
                     "status": "error",
                     "error": "Unknown error",
+                    "cached": False,
                 })
 
         # Build result
@@ -703,8 +863,13 @@ class BatchEmbeddingTool(Tool[BatchEmbeddingParams, BatchEmbeddingOutput]):
 # Public API
 # ============================================================================
 
-from .models import BatchEmbeddingRecord, BatchEmbeddingStatus  # noqa: E402
+from .models import (  # noqa: E402
+    BatchEmbeddingRecord,
+    BatchEmbeddingStatus,
+    EmbeddingCacheEntry,
+)
 from .utils import (  # noqa: E402
+    generate_chunked_embeddings,
     generate_document_embedding,
     generate_embeddings,
 )
@@ -715,6 +880,10 @@ __all__ = [
     # Database models
     "BatchEmbeddingRecord",
     "BatchEmbeddingStatus",
+    "EmbeddingCacheEntry",
+    # Embedding cache
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
     # Pydantic models
     "BatchEmbeddingConfig",
     "BatchEmbeddingInput",
@@ -725,11 +894,20 @@ __all__ = [
     # Utilities
     "embedding_to_bytes",
     "bytes_to_embedding",
+    "matrix_to_bytes",
+    "bytes_to_matrix",
+    "group_by_dimension",
     "generate_embeddings",
     "generate_document_embedding",
+    "generate_chunked_embeddings",
+    "split_markdown",
+    "token_batches",
+    "pool_embeddings",
     # Constants
     "PROVIDER_MAX_BATCH_SIZES",
     "PROVIDER_DEFAULT_MODELS",
+    "PROVIDER_MAX_BATCH_TOKENS",
+    "PROVIDER_MAX_INPUT_TOKENS",
     # Internal (for testing)
     "_is_retryable_error",
     "_embed_with_retry",
@@ -0,0 +1,315 @@
+"""Content-hash keyed embedding cache.
+
+Embeddings are keyed by ``(sha256(text), model)``. Identical texts are sent to
+the provider once per batch (deduplication) and once across runs (cache), so
+re-fetching a mostly unchanged site costs almost nothing in embeddings.
+
+Two layers:
+- In-memory LRU (per process)
+- Persistent ``embedding_cache`` table (when a database client is available)
+
+The persistent layer is best-effort: any database error disables it for the
+lifetime of the cache instance and the run continues with the memory layer.
+
+Usage:
+    cache = EmbeddingCache(db=context.db)
+    hits = cache.get_many("text-embedding-3-small", [hash_text(t) for t in texts])
+    ...
+    cache.put_many("text-embedding-3-small", {text_hash: vector_bytes})
+    print(cache.stats.to_dict())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Table name for persisted cache entries (see models.EmbeddingCacheEntry)
+EMBEDDING_CACHE_TABLE = "embedding_cache"
+
+# Max hashes per SELECT ... IN (...) / rows per multi-row INSERT
+CACHE_QUERY_CHUNK_SIZE = 500
+
+# Rough chars-per-token ratio used to estimate tokens avoided on cache hits
+CHARS_PER_TOKEN = 4
+
+
+def hash_text(text: str) -> str:
+    """Return the SHA256 hex digest used as the cache key for a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def dedupe_texts(texts: list[str]) -> tuple[list[str], list[int]]:
+    """
+    Deduplicate texts while preserving first-seen order.
+
+    Args:
+        texts: Texts to deduplicate
+
+    Returns:
+        Tuple of (unique_texts, inverse) where ``texts[i] == unique_texts[inverse[i]]``
+
+    Example:
+        >>> dedupe_texts(["a", "b", "a"])
+        (['a', 'b'], [0, 1, 0])
+    """
+    positions: dict[str, int] = {}
+    unique: list[str] = []
+    inverse: list[int] = []
+    for text in texts:
+        pos = positions.get(text)
+        if pos is None:
+            pos = len(unique)
+            positions[text] = pos
+            unique.append(text)
+        inverse.append(pos)
+    return unique, inverse
+
+
+def estimate_tokens(texts: list[str]) -> int:
+    """Estimate token count for texts (chars / 4)."""
+    return sum(max(1, len(t) // CHARS_PER_TOKEN) for t in texts)
+
+
+def estimate_embedding_cost(model: str, tokens: int) -> float:
+    """
+    Estimate the provider cost of embedding ``tokens`` tokens with ``model``.
+
+    Uses LiteLLM's pricing table. Returns 0.0 if litellm is not installed or
+    the model has no known price.
+    """
+    if tokens <= 0:
+        return 0.0
+    try:
+        import litellm
+
+        prompt_cost, _ = litellm.cost_per_token(model=model, prompt_tokens=tokens)
+        return float(prompt_cost)
+    except Exception:
+        return 0.0
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """
+    Counters for a cached embedding run.
+
+    Attributes:
+        requested: Texts requested (including duplicates)
+        unique: Distinct texts after deduplication
+        hits: Distinct texts served from the cache
+        misses: Distinct texts sent to the provider
+        tokens_avoided: Estimated tokens not sent (duplicates + cache hits)
+        cost_avoided: Estimated USD not spent (duplicates + cache hits)
+    """
+
+    requested: int = 0
+    unique: int = 0
+    hits: int = 0
+    misses: int = 0
+    tokens_avoided: int = 0
+    cost_avoided: float = 0.0
+
+    @property
+    def deduplicated(self) -> int:
+        """Number of duplicate texts collapsed before lookup."""
+        return self.requested - self.unique
+
+    def record(
+        self,
+        model: str,
+        texts: list[str],
+        unique_texts: list[str],
+        hit_texts: list[str],
+    ) -> None:
+        """Record one lookup round and the tokens/cost it avoided."""
+        self.requested += len(texts)
+        self.unique += len(unique_texts)
+        self.hits += len(hit_texts)
+        self.misses += len(unique_texts) - len(hit_texts)
+
+        avoided = estimate_tokens(texts) - estimate_tokens(unique_texts) + estimate_tokens(hit_texts)
+        if avoided > 0:
+            self.tokens_avoided += avoided
+            self.cost_avoided += estimate_embedding_cost(model, avoided)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for progress metadata and logging."""
+        return {
+            "requested": self.requested,
+            "unique": self.unique,
+            "deduplicated": self.deduplicated,
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "tokens_avoided": self.tokens_avoided,
+            "cost_avoided": round(self.cost_avoided, 6),
+        }
+
+
+class EmbeddingCache:
+    """
+    Two-level (memory + database) cache of embedding vectors.
+
+    Values are float32 bytes exactly as stored in ``embedding`` columns.
+    Entries whose byte length does not match their recorded dimension are
+    ignored on read.
+
+    Args:
+        db: Optional DoltDB client (``query``/``execute``). Memory-only if None.
+        max_entries: Maximum entries kept in the in-memory LRU layer.
+    """
+
+    def __init__(self, db: Any | None = None, max_entries: int = 50_000):
+        self.db = db
+        self.max_entries = max_entries
+        self.stats = EmbeddingCacheStats()
+        self._memory: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+
+    # ------------------------------------------------------------------
+    # Memory layer
+    # ------------------------------------------------------------------
+
+    def _remember(self, model: str, text_hash: str, vector: bytes) -> None:
+        key = (model, text_hash)
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Persistent layer
+    # ------------------------------------------------------------------
+
+    def _disable_db(self, error: Exception) -> None:
+        logger.info(f"Embedding cache is memory-only for this run: {error}")
+        self.db = None
+
+    def _load(self, model: str, text_hashes: list[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        if self.db is None or not text_hashes:
+            return found
+
+        try:
+            for i in range(0, len(text_hashes), CACHE_QUERY_CHUNK_SIZE):
+                chunk = text_hashes[i : i + CACHE_QUERY_CHUNK_SIZE]
+                placeholders = ", ".join("?" for _ in chunk)
+                result = self.db.query(
+                    f"SELECT text_hash, dimension, embedding FROM {EMBEDDING_CACHE_TABLE} "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *chunk],
+                )
+                for row in result.rows:
+                    vector = row.get("embedding")
+                    if isinstance(vector, (bytes, bytearray)) and len(vector) == 4 * int(
+                        row.get("dimension") or 0
+                    ):
+                        found[row["text_hash"]] = bytes(vector)
+        except Exception as e:
+            self._disable_db(e)
+        return found
+
+    def _store(self, model: str, entries: dict[str, bytes]) -> None:
+        if self.db is None or not entries:
+            return
+
+        now = datetime.utcnow()
+        items = list(entries.items())
+        try:
+            for i in range(0, len(items), CACHE_QUERY_CHUNK_SIZE):
+                chunk = items[i : i + CACHE_QUERY_CHUNK_SIZE]
+                values_sql = ", ".join("(?, ?, ?, ?, ?)" for _ in chunk)
+                params: list[Any] = []
+                for text_hash, vector in chunk:
+                    params.extend([text_hash, model, len(vector) // 4, vector, now])
+                self.db.execute(
+                    f"INSERT INTO {EMBEDDING_CACHE_TABLE} "
+                    f"(text_hash, model, dimension, embedding, created_at) VALUES {values_sql} "
+                    f"ON DUPLICATE KEY UPDATE dimension = VALUES(dimension), "
+                    f"embedding = VALUES(embedding)",
+                    params,
+                )
+        except Exception as e:
+            self._disable_db(e)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get_many(self, model: str, text_hashes: list[str]) -> dict[str, bytes]:
+        """
+        Look up cached vectors.
+
+        Args:
+            model: Embedding model name (part of the cache key)
+            text_hashes: Content hashes from ``hash_text``
+
+        Returns:
+            Dict mapping text_hash -> float32 bytes for every hit
+        """
+        found: dict[str, bytes] = {}
+        missing: list[str] = []
+        for text_hash in text_hashes:
+            vector = self._memory.get((model, text_hash))
+            if vector is None:
+                missing.append(text_hash)
+            else:
+                self._memory.move_to_end((model, text_hash))
+                found[text_hash] = vector
+
+        loaded = self._load(model, missing)
+        for text_hash, vector in loaded.items():
+            self._remember(model, text_hash, vector)
+        found.update(loaded)
+        return found
+
+    def put_many(self, model: str, entries: dict[str, bytes]) -> None:
+        """
+        Store vectors in both layers.
+
+        Args:
+            model: Embedding model name
+            entries: Dict mapping text_hash -> float32 bytes
+        """
+        for text_hash, vector in entries.items():
+            self._remember(model, text_hash, vector)
+        self._store(model, entries)
+
+    def clear_memory(self) -> None:
+        """Drop the in-memory layer (persistent entries are kept)."""
+        self._memory.clear()
+
+
+def cache_db(db: Any | None) -> Any | None:
+    """
+    Database client for the persistent cache layer (None = memory only).
+
+    Background and worker runs build their tool context without a database
+    (``init_db=False``); the project database is opened here instead.
+    """
+    if db is not None:
+        return db
+    try:
+        from kurt.db import get_database_client
+
+        return get_database_client()
+    except Exception as e:
+        logger.info(f"Embedding cache is memory-only (no project database: {e})")
+        return None
+
+
+__all__ = [
+    "EMBEDDING_CACHE_TABLE",
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
+    "cache_db",
+    "dedupe_texts",
+    "estimate_embedding_cost",
+    "estimate_tokens",
+    "hash_text",
+]
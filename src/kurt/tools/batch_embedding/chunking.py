@@ -0,0 +1,279 @@
+"""
+Token-aware batching and markdown chunking for embeddings.
+
+Providers limit both the tokens per input and the tokens per request.
+``token_batches`` packs texts greedily (in order) so no request exceeds
+either limit, and ``split_markdown`` cuts long documents on heading
+boundaries into chunks that each fit the per-input limit.
+
+Token counts use tiktoken's ``cl100k_base`` encoding when available and fall
+back to a chars/4 estimate otherwise.
+
+Usage:
+    for batch in token_batches(texts, max_tokens=300_000, max_items=2048):
+        embed([texts[i] for i in batch])
+
+    chunks = split_markdown(document, max_tokens=512)
+    vector = pool_embeddings(chunk_vectors, weights=[c.tokens for c in chunks])
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from .cache import CHARS_PER_TOKEN
+
+# Maximum tokens in one embedding request, per provider
+PROVIDER_MAX_BATCH_TOKENS = {
+    "openai": 300_000,
+    "cohere": 96 * 512,
+    "voyage": 120_000,
+}
+
+# Maximum tokens per input text, per provider
+PROVIDER_MAX_INPUT_TOKENS = {
+    "openai": 8191,
+    "cohere": 512,
+    "voyage": 4000,
+}
+
+# Default chunk size for chunked-document mode
+DEFAULT_CHUNK_TOKENS = 512
+
+_HEADING_RE = re.compile(r"^#{1,6}\s+\S", re.MULTILINE)
+
+
+# ============================================================================
+# Token counting
+# ============================================================================
+
+
+@functools.lru_cache(maxsize=1)
+def _encoder() -> Any | None:
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Count tokens in a text (tiktoken cl100k, or chars/4 if unavailable)."""
+    if not text:
+        return 0
+    encoder = _encoder()
+    if encoder is None:
+        return max(1, len(text) // CHARS_PER_TOKEN)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def provider_for_model(model: str) -> str:
+    """Infer the provider from a LiteLLM model name (``cohere/...`` etc.)."""
+    prefix = model.split("/", 1)[0] if "/" in model else ""
+    return prefix if prefix in PROVIDER_MAX_BATCH_TOKENS else "openai"
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate a text to at most ``max_tokens`` tokens."""
+    encoder = _encoder()
+    if encoder is None:
+        return text[: max_tokens * CHARS_PER_TOKEN]
+    tokens = encoder.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
+
+# ============================================================================
+# Batching
+# ============================================================================
+
+
+def token_batches(
+    texts: Sequence[str],
+    max_tokens: int,
+    max_items: int | None = None,
+    token_counts: Sequence[int] | None = None,
+) -> list[list[int]]:
+    """
+    Pack texts into batches under a per-request token budget.
+
+    Texts keep their order. A single text larger than the budget gets a
+    batch of its own (callers should truncate or chunk it first).
+
+    Args:
+        texts: Texts to batch
+        max_tokens: Maximum total tokens per batch
+        max_items: Maximum texts per batch (provider item limit)
+        token_counts: Precomputed token counts (computed if omitted)
+
+    Returns:
+        List of batches, each a list of indices into ``texts``
+    """
+    counts = list(token_counts) if token_counts is not None else [count_tokens(t) for t in texts]
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+
+    for i, tokens in enumerate(counts):
+        full = max_items is not None and len(current) >= max_items
+        if current and (full or current_tokens + tokens > max_tokens):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+# ============================================================================
+# Markdown chunking
+# ============================================================================
+
+
+@dataclass
+class TextChunk:
+    """
+    A chunk of a document.
+
+    Attributes:
+        index: Position of the chunk in the document
+        text: Chunk text
+        heading: Nearest markdown heading above the chunk (None before the first)
+        tokens: Token count
+    """
+
+    index: int
+    text: str
+    heading: str | None
+    tokens: int
+
+
+def _sections(markdown: str) -> list[tuple[str | None, str]]:
+    """Split markdown into (heading, section_text) on heading lines."""
+    starts = [m.start() for m in _HEADING_RE.finditer(markdown)]
+    if not starts or starts[0] != 0:
+        starts = [0, *starts]
+    sections = []
+    for start, end in zip(starts, [*starts[1:], len(markdown)]):
+        text = markdown[start:end].strip()
+        if not text:
+            continue
+        first_line = text.split("\n", 1)[0]
+        heading = first_line.lstrip("#").strip() if _HEADING_RE.match(first_line) else None
+        sections.append((heading, text))
+    return sections
+
+
+def _split_oversized(text: str, max_tokens: int) -> list[str]:
+    """Split one section on paragraphs, then hard-truncate leftovers."""
+    pieces: list[str] = []
+    current = ""
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        candidate = f"{current}\n\n{paragraph}" if current else paragraph
+        if count_tokens(candidate) <= max_tokens:
+            current = candidate
+            continue
+        if current:
+            pieces.append(current)
+        # A single paragraph over budget is cut into budget-sized windows
+        while count_tokens(paragraph) > max_tokens:
+            head = truncate_to_tokens(paragraph, max_tokens)
+            pieces.append(head)
+            paragraph = paragraph[len(head) :].strip()
+        current = paragraph
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_markdown(markdown: str, max_tokens: int = DEFAULT_CHUNK_TOKENS) -> list[TextChunk]:
+    """
+    Split markdown into chunks of at most ``max_tokens`` tokens.
+
+    Sections are cut on heading lines; adjacent small sections are merged
+    up to the budget, and sections over budget are split on paragraphs.
+
+    Args:
+        markdown: Document content
+        max_tokens: Maximum tokens per chunk
+
+    Returns:
+        Chunks in document order (empty list for empty input)
+    """
+    chunks: list[TextChunk] = []
+    pending_text = ""
+    pending_heading: str | None = None
+
+    def flush() -> None:
+        nonlocal pending_text
+        if pending_text:
+            chunks.append(
+                TextChunk(len(chunks), pending_text, pending_heading, count_tokens(pending_text))
+            )
+            pending_text = ""
+
+    for heading, section in _sections(markdown):
+        if count_tokens(section) > max_tokens:
+            flush()
+            for piece in _split_oversized(section, max_tokens):
+                chunks.append(TextChunk(len(chunks), piece, heading, count_tokens(piece)))
+            continue
+
+        candidate = f"{pending_text}\n\n{section}" if pending_text else section
+        if pending_text and count_tokens(candidate) > max_tokens:
+            flush()
+            candidate = section
+        if not pending_text:
+            pending_heading = heading
+        pending_text = candidate
+
+    flush()
+    return chunks
+
+
+def pool_embeddings(vectors: Any, weights: Sequence[float] | None = None) -> list[float]:
+    """
+    Pool chunk vectors into one document vector.
+
+    Weighted mean of L2-normalized chunk vectors, re-normalized to unit length.
+
+    Args:
+        vectors: (n, d) array-like of chunk embeddings
+        weights: Optional per-chunk weights (e.g. token counts)
+
+    Returns:
+        Pooled vector
+    """
+    from .vectors import _require_numpy, np
+
+    _require_numpy()
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    pooled = np.average(matrix / norms, axis=0, weights=weights)
+    norm = np.linalg.norm(pooled)
+    return (pooled / norm if norm else pooled).astype(np.float32).tolist()
+
+
+__all__ = [
+    "DEFAULT_CHUNK_TOKENS",
+    "PROVIDER_MAX_BATCH_TOKENS",
+    "PROVIDER_MAX_INPUT_TOKENS",
+    "TextChunk",
+    "count_tokens",
+    "pool_embeddings",
+    "provider_for_model",
+    "split_markdown",
+    "token_batches",
+    "truncate_to_tokens",
+]
@@ -7,6 +7,7 @@ Config values can be set in kurt.config with BATCH_EMBEDDING.* prefix:
     BATCH_EMBEDDING.MODEL=text-embedding-3-small
     BATCH_EMBEDDING.BATCH_SIZE=100
     BATCH_EMBEDDING.MAX_CHARS=8000
+    BATCH_EMBEDDING.CACHE=true
 
 Usage:
     # Load from config file
@@ -62,3 +63,24 @@ class BatchEmbeddingToolConfig(StepConfig):
         le=100000,
         description="Maximum characters per text (truncated if exceeded)",
     )
+    cache: bool = ConfigParam(
+        default=True,
+        description="Reuse embeddings of identical texts from earlier runs",
+    )
+    max_batch_tokens: int | None = ConfigParam(
+        default=None,
+        ge=1,
+        description="Token budget per API request (None = provider limit)",
+    )
+
+    # Chunked-document mode
+    chunk: bool = ConfigParam(
+        default=False,
+        description="Split long markdown on headings and pool chunk embeddings",
+    )
+    chunk_tokens: int = ConfigParam(
+        default=512,
+        ge=32,
+        le=8191,
+        description="Maximum tokens per chunk",
+    )
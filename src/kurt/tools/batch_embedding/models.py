@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from enum import Enum
 from typing import Optional
 
@@ -41,3 +42,19 @@ class BatchEmbeddingRecord(EmbeddingMixin, TimestampMixin, TenantMixin, SQLModel
 
     # Error tracking
     error: Optional[str] = Field(default=None)
+
+
+class EmbeddingCacheEntry(SQLModel, table=True):
+    """Content-hash keyed embedding cache (see cache.EmbeddingCache).
+
+    One row per (text_hash, model). The vector is stored as float32 bytes,
+    the same layout as EmbeddingMixin.embedding.
+    """
+
+    __tablename__ = "embedding_cache"
+
+    text_hash: str = Field(primary_key=True, max_length=64)  # SHA256 of embedded text
+    model: str = Field(primary_key=True, max_length=255)
+    dimension: int = Field(default=0)
+    embedding: bytes
+    created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,194 @@
+"""
+Unit tests for token-aware batching and chunked-document embedding.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from kurt.tools.batch_embedding import (
+    BatchEmbeddingParams,
+    BatchEmbeddingTool,
+    bytes_to_embedding,
+    generate_chunked_embeddings,
+    generate_embeddings,
+    pool_embeddings,
+    split_markdown,
+    token_batches,
+)
+from kurt.tools.batch_embedding.chunking import count_tokens, provider_for_model
+from kurt.tools.core import ToolContext
+
+DOC = """Intro paragraph.
+
+# Install
+
+Run pip install.
+
+## Configure
+
+Edit the config file.
+
+# Usage
+
+Call the API.
+"""
+
+
+def _fake_embedding_response(texts):
+    return SimpleNamespace(
+        data=[{"embedding": [float(len(t)), 1.0]} for t in texts],
+        usage=None,
+    )
+
+
+# ============================================================================
+# Batching
+# ============================================================================
+
+
+class TestTokenBatches:
+    """Test greedy token-budget packing."""
+
+    def test_packs_under_budget(self):
+        batches = token_batches(["a"] * 5, max_tokens=10, token_counts=[4, 4, 4, 4, 4])
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    def test_item_limit(self):
+        batches = token_batches(["a"] * 5, max_tokens=100, max_items=2, token_counts=[1] * 5)
+        assert batches == [[0, 1], [2, 3], [4]]
+
+    def test_oversized_text_gets_own_batch(self):
+        batches = token_batches(["a"] * 3, max_tokens=10, token_counts=[3, 50, 3])
+        assert batches == [[0], [1], [2]]
+
+    def test_empty(self):
+        assert token_batches([], max_tokens=10) == []
+
+    def test_provider_for_model(self):
+        assert provider_for_model("text-embedding-3-small") == "openai"
+        assert provider_for_model("cohere/embed-english-v3.0") == "cohere"
+        assert provider_for_model("voyage/voyage-2") == "voyage"
+
+
+# ============================================================================
+# Chunking
+# ============================================================================
+
+
+class TestSplitMarkdown:
+    """Test heading-based chunking."""
+
+    def test_splits_on_headings(self):
+        chunks = split_markdown(DOC, max_tokens=8)
+        assert [c.heading for c in chunks] == [None, "Install", "Configure", "Usage"]
+        assert chunks[1].text.startswith("# Install")
+        assert [c.index for c in chunks] == [0, 1, 2, 3]
+
+    def test_merges_small_sections(self):
+        chunks = split_markdown(DOC, max_tokens=1000)
+        assert len(chunks) == 1
+        assert "Call the API." in chunks[0].text
+
+    def test_oversized_section_split_on_paragraphs(self):
+        section = "# Big\n\n" + "\n\n".join(f"Paragraph number {i} with words." for i in range(20))
+        chunks = split_markdown(section, max_tokens=20)
+
+        assert len(chunks) > 1
+        assert all(c.tokens <= 20 for c in chunks)
+        assert all(c.heading == "Big" for c in chunks)
+
+    def test_empty(self):
+        assert split_markdown("  \n ") == []
+
+    def test_token_count(self):
+        chunk = split_markdown("hello world")[0]
+        assert chunk.tokens == count_tokens("hello world")
+
+
+class TestPoolEmbeddings:
+    """Test pooled document vectors."""
+
+    def test_unit_length_mean(self):
+        pooled = pool_embeddings([[2.0, 0.0], [0.0, 3.0]])
+        assert pooled == pytest.approx([2**-0.5, 2**-0.5])
+
+    def test_weights(self):
+        pooled = np.array(pool_embeddings([[1.0, 0.0], [0.0, 1.0]], weights=[3, 1]))
+        assert pooled[0] > pooled[1]
+        assert np.linalg.norm(pooled) == pytest.approx(1.0)
+
+
+# ============================================================================
+# generate_embeddings / generate_chunked_embeddings
+# ============================================================================
+
+
+class TestTokenAwareGenerate:
+    """Test token-budgeted requests in generate_embeddings."""
+
+    def test_requests_split_by_token_budget(self):
+        texts = ["alpha " * 50, "beta " * 50, "gamma " * 50]
+        with patch("kurt.tools.batch_embedding.utils.litellm") as mock_litellm:
+            mock_litellm.embedding.side_effect = lambda **kw: _fake_embedding_response(kw["input"])
+            result = generate_embeddings(texts, model="m", max_batch_tokens=120, concurrency=2)
+
+        assert mock_litellm.embedding.call_count == 3
+        assert result == [[float(len(t)), 1.0] for t in texts]
+
+    def test_chunked_documents(self):
+        with patch("kurt.tools.batch_embedding.utils.litellm") as mock_litellm:
+            mock_litellm.embedding.side_effect = lambda **kw: _fake_embedding_response(kw["input"])
+            with patch(
+                "kurt.config.resolve_model_settings",
+                return_value=SimpleNamespace(model="m", api_base=None, api_key=None),
+            ):
+                results = generate_chunked_embeddings([DOC, ""], max_tokens=8)
+
+        pooled, chunks = results[0]
+        assert len(chunks) == 4
+        assert [c["heading"] for c in chunks] == [None, "Install", "Configure", "Usage"]
+        assert np.linalg.norm(pooled) == pytest.approx(1.0)
+        assert len(bytes_to_embedding(chunks[0]["embedding"])) == 2
+        assert results[1] == (None, [])
+
+
+# ============================================================================
+# BatchEmbeddingTool
+# ============================================================================
+
+
+class TestBatchEmbeddingToolChunks:
+    """Test token batching and chunk mode in BatchEmbeddingTool."""
+
+    @pytest.mark.asyncio
+    async def test_token_budget_splits_batches(self):
+        params = BatchEmbeddingParams(
+            inputs=[{"content": "word " * 40} for _ in range(3)] + [{"content": "other " * 40}],
+            max_batch_tokens=50,
+        )
+        with patch("kurt.tools.batch_embedding._embed_with_retry") as mock_embed:
+            mock_embed.side_effect = lambda texts, **kw: ([[1.0, 0.0]] * len(texts), 5)
+            result = await BatchEmbeddingTool().run(params, ToolContext())
+
+        assert mock_embed.call_count == 2  # duplicates collapsed, one text per batch
+        assert all(d["status"] == "success" for d in result.data)
+
+    @pytest.mark.asyncio
+    async def test_chunk_mode(self):
+        params = BatchEmbeddingParams(inputs=[{"content": DOC}], chunk=True, chunk_tokens=32)
+        with patch("kurt.tools.batch_embedding._embed_with_retry") as mock_embed:
+            mock_embed.side_effect = lambda texts, **kw: (
+                [[float(i + 1), 1.0] for i in range(len(texts))],
+                5,
+            )
+            result = await BatchEmbeddingTool().run(params, ToolContext())
+
+        row = result.data[0]
+        assert row["status"] == "success"
+        assert len(row["chunks"]) == len(split_markdown(DOC, 32))
+        assert np.linalg.norm(bytes_to_embedding(row["embedding"])) == pytest.approx(1.0)
@@ -0,0 +1,260 @@
+"""
+Unit tests for the embedding cache and deduplication layer.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from kurt.db.exceptions import QueryResult
+from kurt.tools.batch_embedding import (
+    BatchEmbeddingParams,
+    BatchEmbeddingTool,
+    EmbeddingCache,
+    embedding_to_bytes,
+    generate_embeddings,
+)
+from kurt.tools.batch_embedding.cache import cache_db, dedupe_texts, hash_text
+from kurt.tools.core import ToolContext
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+class FakeCacheDB:
+    """Minimal DoltDB stand-in backed by a dict keyed by (text_hash, model)."""
+
+    def __init__(self):
+        self.rows: dict[tuple[str, str], dict] = {}
+        self.queries = 0
+
+    def query(self, sql, params=None):
+        self.queries += 1
+        model, *hashes = params
+        return QueryResult(
+            rows=[self.rows[(h, model)] for h in hashes if (h, model) in self.rows]
+        )
+
+    def execute(self, sql, params=None):
+        for i in range(0, len(params), 5):
+            text_hash, model, dimension, embedding, _ = params[i : i + 5]
+            self.rows[(text_hash, model)] = {
+                "text_hash": text_hash,
+                "dimension": dimension,
+                "embedding": embedding,
+            }
+        return QueryResult(rows=[], affected_rows=len(params) // 5)
+
+
+class BrokenDB:
+    """Database client that always fails."""
+
+    def query(self, sql, params=None):
+        raise RuntimeError("connection refused")
+
+    def execute(self, sql, params=None):
+        raise RuntimeError("connection refused")
+
+
+def _fake_embedding_response(texts):
+    return SimpleNamespace(
+        data=[{"embedding": [float(len(t)), 1.0]} for t in texts],
+        usage=None,
+    )
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+
+class TestDedupe:
+    """Test text deduplication helpers."""
+
+    def test_preserves_first_seen_order(self):
+        unique, inverse = dedupe_texts(["b", "a", "b", "c", "a"])
+        assert unique == ["b", "a", "c"]
+        assert inverse == [0, 1, 0, 2, 1]
+
+    def test_inverse_reconstructs_input(self):
+        texts = ["x", "y", "x", "x"]
+        unique, inverse = dedupe_texts(texts)
+        assert [unique[i] for i in inverse] == texts
+
+    def test_hash_is_stable(self):
+        assert hash_text("hello") == hash_text("hello")
+        assert hash_text("hello") != hash_text("hello ")
+        assert len(hash_text("hello")) == 64
+
+
+# ============================================================================
+# EmbeddingCache
+# ============================================================================
+
+
+class TestEmbeddingCache:
+    """Test the two-level embedding cache."""
+
+    def test_memory_only_roundtrip(self):
+        cache = EmbeddingCache()
+        vector = embedding_to_bytes([0.1, 0.2])
+        cache.put_many("m", {"h1": vector})
+
+        assert cache.get_many("m", ["h1", "h2"]) == {"h1": vector}
+        assert cache.get_many("other-model", ["h1"]) == {}
+
+    def test_persists_across_instances(self):
+        db = FakeCacheDB()
+        vector = embedding_to_bytes([0.5, 0.25, 0.125])
+        EmbeddingCache(db=db).put_many("m", {"h1": vector})
+
+        fresh = EmbeddingCache(db=db)
+        assert fresh.get_many("m", ["h1"]) == {"h1": vector}
+        assert db.rows[("h1", "m")]["dimension"] == 3
+
+    def test_memory_hit_skips_database(self):
+        db = FakeCacheDB()
+        cache = EmbeddingCache(db=db)
+        cache.put_many("m", {"h1": embedding_to_bytes([1.0])})
+
+        cache.get_many("m", ["h1"])
+        assert db.queries == 0
+
+    def test_dimension_mismatch_ignored(self):
+        db = FakeCacheDB()
+        db.rows[("h1", "m")] = {"text_hash": "h1", "dimension": 4, "embedding": b"\x00" * 8}
+
+        assert EmbeddingCache(db=db).get_many("m", ["h1"]) == {}
+
+    def test_lru_bound(self):
+        cache = EmbeddingCache(max_entries=2)
+        for i in range(3):
+            cache.put_many("m", {f"h{i}": embedding_to_bytes([float(i)])})
+
+        assert set(cache.get_many("m", ["h0", "h1", "h2"])) == {"h1", "h2"}
+
+    def test_database_errors_fall_back_to_memory(self):
+        cache = EmbeddingCache(db=BrokenDB())
+        vector = embedding_to_bytes([1.0])
+
+        assert cache.get_many("m", ["h1"]) == {}
+        assert cache.db is None
+
+        cache.put_many("m", {"h1": vector})
+        assert cache.get_many("m", ["h1"]) == {"h1": vector}
+
+
+# ============================================================================
+# generate_embeddings
+# ============================================================================
+
+
+class TestGenerateEmbeddingsCache:
+    """Test dedup and cache handling in generate_embeddings."""
+
+    def test_duplicates_embedded_once(self):
+        with patch("kurt.tools.batch_embedding.utils.litellm") as mock_litellm:
+            mock_litellm.embedding.side_effect = lambda **kw: _fake_embedding_response(kw["input"])
+            result = generate_embeddings(["aa", "b", "aa"], model="m")
+
+        assert mock_litellm.embedding.call_args.kwargs["input"] == ["aa", "b"]
+        assert result == [[2.0, 1.0], [1.0, 1.0], [2.0, 1.0]]
+
+    def test_cache_hits_not_sent(self):
+        cache = EmbeddingCache()
+        with patch("kurt.tools.batch_embedding.utils.litellm") as mock_litellm:
+            mock_litellm.embedding.side_effect = lambda **kw: _fake_embedding_response(kw["input"])
+            generate_embeddings(["aa", "b"], model="m", cache=cache)
+            mock_litellm.embedding.reset_mock()
+
+            result = generate_embeddings(["b", "ccc", "aa"], model="m", cache=cache)
+
+        assert mock_litellm.embedding.call_args.kwargs["input"] == ["ccc"]
+        assert result == [[1.0, 1.0], [3.0, 1.0], [2.0, 1.0]]
+        assert cache.stats.hits == 2
+        assert cache.stats.tokens_avoided > 0
+
+    def test_all_hits_skip_provider(self):
+        cache = EmbeddingCache()
+        cache.put_many("m", {hash_text("aa"): embedding_to_bytes([2.0, 1.0])})
+        with patch("kurt.tools.batch_embedding.utils.litellm") as mock_litellm:
+            result = generate_embeddings(["aa", "aa"], model="m", cache=cache)
+
+        mock_litellm.embedding.assert_not_called()
+        assert result == [[2.0, 1.0], [2.0, 1.0]]
+        assert cache.stats.deduplicated == 1
+
+
+# ============================================================================
+# BatchEmbeddingTool
+# ============================================================================
+
+
+class TestBatchEmbeddingToolCache:
+    """Test dedup and cache handling in BatchEmbeddingTool."""
+
+    @pytest.mark.asyncio
+    async def test_duplicates_fanned_out(self):
+        params = BatchEmbeddingParams(
+            inputs=[{"content": "same"}, {"content": "other"}, {"content": "same"}],
+        )
+        with patch("kurt.tools.batch_embedding._embed_with_retry") as mock_embed:
+            mock_embed.return_value = ([[1.0, 0.0], [0.0, 1.0]], 5)
+            result = await BatchEmbeddingTool().run(params, ToolContext())
+
+        assert mock_embed.call_args.kwargs["texts"] == ["same", "other"]
+        assert result.data[0]["embedding"] == result.data[2]["embedding"]
+        assert [d["cached"] for d in result.data] == [False, False, True]
+
+    @pytest.mark.asyncio
+    async def test_persistent_cache_reused_across_runs(self):
+        context = ToolContext(db=FakeCacheDB())
+        params = BatchEmbeddingParams(inputs=[{"content": "hello"}, {"content": "world"}])
+
+        with patch("kurt.tools.batch_embedding._embed_with_retry") as mock_embed:
+            mock_embed.return_value = ([[1.0, 0.0], [0.0, 1.0]], 5)
+            first = await BatchEmbeddingTool().run(params, context)
+            mock_embed.reset_mock()
+            second = await BatchEmbeddingTool().run(params, context)
+
+        mock_embed.assert_not_called()
+        assert [d["embedding"] for d in second.data] == [d["embedding"] for d in first.data]
+        assert all(d["cached"] for d in second.data)
+
+    @pytest.mark.asyncio
+    async def test_opens_project_db_without_context_db(self):
+        """Background runs (no context.db) still use the persistent cache."""
+        db = FakeCacheDB()
+        params = BatchEmbeddingParams(inputs=[{"content": "hello"}])
+
+        with (
+            patch("kurt.db.get_database_client", return_value=db),
+            patch("kurt.tools.batch_embedding._embed_with_retry") as mock_embed,
+        ):
+            mock_embed.return_value = ([[1.0, 0.0]], 5)
+            await BatchEmbeddingTool().run(params, ToolContext())
+
+        assert len(db.rows) == 1
+
+    def test_memory_only_without_project_db(self, caplog):
+        caplog.set_level("INFO", logger="kurt.tools.batch_embedding.cache")
+        with patch("kurt.db.get_database_client", side_effect=RuntimeError("no project")):
+            assert cache_db(None) is None
+        assert "memory-only" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self):
+        context = ToolContext(db=FakeCacheDB())
+        params = BatchEmbeddingParams(inputs=[{"content": "hello"}], cache=False)
+
+        with patch("kurt.tools.batch_embedding._embed_with_retry") as mock_embed:
+            mock_embed.return_value = ([[1.0, 0.0]], 5)
+            await BatchEmbeddingTool().run(params, context)
+            await BatchEmbeddingTool().run(params, context)
+
+        assert mock_embed.call_count == 2
+        assert context.db.rows == {}
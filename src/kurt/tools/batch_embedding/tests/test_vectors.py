@@ -0,0 +1,95 @@
+"""
+Unit tests for bulk embedding (de)serialization.
+"""
+
+from __future__ import annotations
+
+import struct
+
+import numpy as np
+import pytest
+
+from kurt.tools.batch_embedding import (
+    bytes_to_embedding,
+    bytes_to_matrix,
+    embedding_to_bytes,
+    group_by_dimension,
+    matrix_to_bytes,
+)
+
+
+def _blob(values: list[float]) -> bytes:
+    return struct.pack(f"{len(values)}f", *values)
+
+
+class TestSingleVector:
+    """Test single-vector helpers."""
+
+    def test_roundtrip(self):
+        assert bytes_to_embedding(embedding_to_bytes([0.5, -1.0, 2.0])) == [0.5, -1.0, 2.0]
+
+    def test_matches_struct_layout(self):
+        assert embedding_to_bytes([1.0, 2.0]) == _blob([1.0, 2.0])
+        assert bytes_to_embedding(_blob([3.0, 4.0])) == [3.0, 4.0]
+
+    def test_misaligned_bytes(self):
+        with pytest.raises(ValueError, match="multiple of 4"):
+            bytes_to_embedding(b"\x00" * 5)
+
+
+class TestMatrix:
+    """Test bulk matrix loading and serialization."""
+
+    def test_matrix_to_bytes_rows(self):
+        blobs = matrix_to_bytes(np.array([[1, 2], [3, 4]], dtype=np.float64))
+        assert blobs == [_blob([1.0, 2.0]), _blob([3.0, 4.0])]
+        assert matrix_to_bytes([]) == []
+
+    def test_bytes_to_matrix_roundtrip(self):
+        matrix = np.random.default_rng(0).standard_normal((50, 8)).astype(np.float32)
+        loaded, kept = bytes_to_matrix(matrix_to_bytes(matrix))
+
+        assert kept == list(range(50))
+        assert loaded.dtype == np.float32
+        np.testing.assert_array_equal(loaded, matrix)
+
+    def test_skips_empty_and_mismatched(self):
+        blobs = [_blob([1, 2]), None, _blob([3, 4]), _blob([1, 2, 3]), b"", b"\x00" * 3]
+        matrix, kept = bytes_to_matrix(blobs)
+
+        assert kept == [0, 2]
+        assert matrix.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_explicit_dimension(self):
+        matrix, kept = bytes_to_matrix([_blob([1, 2]), _blob([1, 2, 3])], dimension=3)
+        assert kept == [1]
+        assert matrix.shape == (1, 3)
+
+    def test_strict_rejects_mismatch(self):
+        with pytest.raises(ValueError, match="dimension 2"):
+            bytes_to_matrix([_blob([1, 2]), _blob([1, 2]), _blob([1, 2, 3])], strict=True)
+
+    def test_empty_input(self):
+        matrix, kept = bytes_to_matrix([None, b""])
+        assert kept == []
+        assert matrix.shape[0] == 0
+
+
+class TestGroupByDimension:
+    """Test mixed-model grouping."""
+
+    def test_groups(self):
+        groups = group_by_dimension(
+            ["a", "b", "c", "d"],
+            [_blob([1, 2]), _blob([1, 2, 3]), None, _blob([5, 6])],
+        )
+
+        assert set(groups) == {2, 3}
+        ids, matrix = groups[2]
+        assert ids == ["a", "d"]
+        assert matrix.tolist() == [[1.0, 2.0], [5.0, 6.0]]
+        assert groups[3][0] == ["b"]
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValueError):
+            group_by_dimension(["a"], [])
@@ -7,9 +7,24 @@ These can be used directly without running a full workflow.
 from __future__ import annotations
 
 import logging
-import struct
 import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from .chunking import (
+    DEFAULT_CHUNK_TOKENS,
+    PROVIDER_MAX_BATCH_TOKENS,
+    PROVIDER_MAX_INPUT_TOKENS,
+    pool_embeddings,
+    provider_for_model,
+    split_markdown,
+    token_batches,
+    truncate_to_tokens,
+)
+from .vectors import bytes_to_embedding, embedding_to_bytes, matrix_to_bytes
+
+if TYPE_CHECKING:
+    from .cache import EmbeddingCache
 
 logger = logging.getLogger(__name__)
 
@@ -20,22 +35,6 @@ except ImportError:
     litellm = None  # type: ignore
 
 
-def embedding_to_bytes(embedding: list[float]) -> bytes:
-    """Convert embedding vector to bytes for database storage."""
-    try:
-        import numpy as np
-    except ImportError as e:
-        raise ImportError(
-            "numpy is required for embeddings. Install with: pip install numpy"
-        ) from e
-    return np.array(embedding, dtype=np.float32).tobytes()
-
-
-def bytes_to_embedding(embedding_bytes: bytes) -> list[float]:
-    """Convert stored bytes back to embedding vector."""
-    return list(struct.unpack(f"{len(embedding_bytes)//4}f", embedding_bytes))
-
-
 def _extract_usage_tokens(response: Any) -> tuple[int, int]:
     """Extract token usage from litellm response."""
     usage = getattr(response, "usage", None)
@@ -92,10 +91,22 @@ def generate_embeddings(
     module_name: str | None = None,
     step_name: str | None = None,
     record_trace: bool = False,  # Disabled by default - no tracing dependency
+    cache: EmbeddingCache | None = None,
+    max_batch_tokens: int | None = None,
+    concurrency: int = 1,
 ) -> list[list[float]]:
     """
     Generate embeddings for a list of texts using LiteLLM.
 
+    Duplicate texts are embedded once and fanned back out. When a cache is
+    given, texts already embedded with the same model are served from it and
+    only the remainder is sent to the provider (hits and cost avoided are
+    accumulated in ``cache.stats``).
+
+    Texts are truncated to the provider's per-input token limit and packed
+    into requests under its per-request token budget; with ``concurrency`` > 1
+    the requests run in parallel threads.
+
     Model resolution (hierarchical):
         1. Explicit model parameter
         2. MODULE.STEP.EMBEDDING_MODEL
@@ -110,9 +121,12 @@ def generate_embeddings(
         module_name: Module name for config resolution
         step_name: Step name for config resolution
         record_trace: Whether to record the embedding call (requires tracing setup)
+        cache: Optional EmbeddingCache for cross-run reuse
+        max_batch_tokens: Per-request token budget (default: provider limit)
+        concurrency: Maximum parallel requests
 
     Returns:
-        List of embedding vectors
+        List of embedding vectors (same order and length as texts)
     """
     # Only resolve config if model not provided
     if model is None:
@@ -129,25 +143,77 @@ def generate_embeddings(
         if api_key is None:
             api_key = settings.api_key
 
-    start = time.time()
+    from .cache import dedupe_texts, hash_text
+
+    unique_texts, inverse = dedupe_texts(texts)
+    vectors: list[list[float] | None] = [None] * len(unique_texts)
+
+    hashes: list[str] = []
+    hit_texts: list[str] = []
+    if cache is not None:
+        hashes = [hash_text(t) for t in unique_texts]
+        hits = cache.get_many(model, hashes)
+        for i, text_hash in enumerate(hashes):
+            if text_hash in hits:
+                vectors[i] = bytes_to_embedding(hits[text_hash])
+                hit_texts.append(unique_texts[i])
+        cache.stats.record(model, texts, unique_texts, hit_texts)
+
+    missing = [i for i, v in enumerate(vectors) if v is None]
+    if missing:
+        start = time.time()
+
+        if litellm is None:
+            raise ImportError(
+                "litellm is required for embeddings. Install with: pip install litellm"
+            )
 
-    if litellm is None:
-        raise ImportError(
-            "litellm is required for embeddings. Install with: pip install litellm"
-        )
+        from . import PROVIDER_MAX_BATCH_SIZES
 
-    kwargs = {"model": model, "input": texts}
-    if api_base:
-        kwargs["api_base"] = api_base
-    if api_key:
-        kwargs["api_key"] = api_key
+        # Pack missing texts into requests under the provider's token limits
+        provider = provider_for_model(model)
+        max_input = PROVIDER_MAX_INPUT_TOKENS[provider]
+        inputs = [truncate_to_tokens(unique_texts[i], max_input) for i in missing]
+        batches = token_batches(
+            inputs,
+            max_tokens=max_batch_tokens or PROVIDER_MAX_BATCH_TOKENS[provider],
+            max_items=PROVIDER_MAX_BATCH_SIZES.get(provider),
+        )
 
-    response = litellm.embedding(**kwargs)
-    duration_ms = int((time.time() - start) * 1000)
+        def embed_batch(batch: list[int]) -> list[list[float]]:
+            kwargs = {"model": model, "input": [inputs[j] for j in batch]}
+            if api_base:
+                kwargs["api_base"] = api_base
+            if api_key:
+                kwargs["api_key"] = api_key
+            response = litellm.embedding(**kwargs)
+            return [item["embedding"] for item in response.data]
+
+        if len(batches) > 1 and concurrency > 1:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(batches))) as pool:
+                batch_vectors = list(pool.map(embed_batch, batches))
+        else:
+            batch_vectors = [embed_batch(batch) for batch in batches]
+        duration_ms = int((time.time() - start) * 1000)
+
+        for batch, embedded in zip(batches, batch_vectors):
+            for j, vector in zip(batch, embedded):
+                vectors[missing[j]] = vector
+        logger.debug(f"Generated {len(missing)} embeddings in {duration_ms}ms (model={model})")
+
+        if cache is not None:
+            cache.put_many(
+                model,
+                {hashes[i]: embedding_to_bytes(vectors[i]) for i in missing},
+            )
 
-    result = [item["embedding"] for item in response.data]
-    logger.debug(f"Generated {len(texts)} embeddings in {duration_ms}ms (model={model})")
+    if len(unique_texts) < len(texts) or hit_texts:
+        logger.debug(
+            f"Embedding reuse: {len(texts) - len(unique_texts)} duplicate(s), "
+            f"{len(hit_texts)} cache hit(s) of {len(texts)} text(s)"
+        )
 
+    result = [vectors[i] for i in inverse]
     return result
 
 
@@ -178,9 +244,76 @@ def generate_document_embedding(
     return embedding_to_bytes(embeddings[0])
 
 
+def generate_chunked_embeddings(
+    documents: list[str],
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    module_name: str | None = None,
+    step_name: str | None = None,
+    cache: EmbeddingCache | None = None,
+    concurrency: int = 4,
+) -> list[tuple[list[float] | None, list[dict[str, Any]]]]:
+    """
+    Embed long documents as heading-based chunks.
+
+    Every document is split with ``split_markdown``; all chunks are embedded
+    together (deduplicated, cached, token-batched, ``concurrency`` parallel
+    requests) and pooled back into one vector per document.
+
+    Args:
+        documents: Markdown documents
+        max_tokens: Maximum tokens per chunk
+        module_name: Module name for config resolution
+        step_name: Step name for config resolution
+        cache: Optional EmbeddingCache for cross-run reuse
+        concurrency: Maximum parallel embedding requests
+
+    Returns:
+        Per document: (pooled_vector, chunks). Chunks are dicts with index,
+        heading, tokens, content_hash and embedding (bytes). Documents with
+        no content get (None, []).
+    """
+    from .cache import hash_text
+
+    doc_chunks = [split_markdown(doc, max_tokens) for doc in documents]
+    texts = [chunk.text for chunks in doc_chunks for chunk in chunks]
+    vectors = generate_embeddings(
+        texts,
+        module_name=module_name,
+        step_name=step_name,
+        cache=cache,
+        concurrency=concurrency,
+    ) if texts else []
+    blobs = matrix_to_bytes(vectors) if vectors else []
+
+    results: list[tuple[list[float] | None, list[dict[str, Any]]]] = []
+    offset = 0
+    for chunks in doc_chunks:
+        if not chunks:
+            results.append((None, []))
+            continue
+        chunk_vectors = vectors[offset : offset + len(chunks)]
+        pooled = pool_embeddings(chunk_vectors, weights=[c.tokens for c in chunks])
+        results.append((
+            pooled,
+            [
+                {
+                    "index": chunk.index,
+                    "heading": chunk.heading,
+                    "tokens": chunk.tokens,
+                    "content_hash": hash_text(chunk.text),
+                    "embedding": blob,
+                }
+                for chunk, blob in zip(chunks, blobs[offset : offset + len(chunks)])
+            ],
+        ))
+        offset += len(chunks)
+    return results
+
+
 __all__ = [
     "embedding_to_bytes",
     "bytes_to_embedding",
     "generate_embeddings",
     "generate_document_embedding",
+    "generate_chunked_embeddings",
 ]
@@ -0,0 +1,176 @@
+"""
+Embedding (de)serialization.
+
+Embeddings are stored as packed float32 bytes (``EmbeddingMixin.embedding``).
+Single-vector helpers convert one value at a time; the bulk helpers move a
+whole column in one shot:
+
+- ``bytes_to_matrix``: N blobs -> one (n, d) float32 array (one join, one
+  ``np.frombuffer``; no per-row list or array allocations)
+- ``matrix_to_bytes``: (n, d) array -> N blobs (one cast, one ``tobytes``)
+- ``group_by_dimension``: split a column holding vectors from several
+  models (different dimensions) into one matrix per dimension
+
+Usage:
+    matrix, kept = bytes_to_matrix([row.embedding for row in rows])
+    ids = [rows[i].document_id for i in kept]
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+from typing import Any, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Bytes per stored component (float32)
+BYTES_PER_FLOAT = 4
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for embeddings. Install with: pip install numpy"
+        )
+
+
+def embedding_dimension(embedding_bytes: bytes | None) -> int | None:
+    """Return the dimension of a stored embedding, or None if empty/invalid."""
+    if not embedding_bytes or len(embedding_bytes) % BYTES_PER_FLOAT:
+        return None
+    return len(embedding_bytes) // BYTES_PER_FLOAT
+
+
+def embedding_to_bytes(embedding: Sequence[float] | Any) -> bytes:
+    """Convert embedding vector to bytes for database storage."""
+    _require_numpy()
+    return np.asarray(embedding, dtype=np.float32).tobytes()
+
+
+def bytes_to_embedding(embedding_bytes: bytes) -> list[float]:
+    """Convert stored bytes back to embedding vector."""
+    _require_numpy()
+    if len(embedding_bytes) % BYTES_PER_FLOAT:
+        raise ValueError(
+            f"Embedding byte length {len(embedding_bytes)} is not a multiple of {BYTES_PER_FLOAT}"
+        )
+    return np.frombuffer(embedding_bytes, dtype=np.float32).tolist()
+
+
+def matrix_to_bytes(matrix: Any) -> list[bytes]:
+    """
+    Convert an (n, d) matrix to a list of per-row float32 blobs.
+
+    The matrix is cast and serialized once; rows are slices of that buffer.
+    """
+    _require_numpy()
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if matrix.size == 0:
+        return []
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D matrix, got shape {matrix.shape}")
+    buffer = matrix.tobytes()
+    step = matrix.shape[1] * BYTES_PER_FLOAT
+    return [buffer[i : i + step] for i in range(0, len(buffer), step)]
+
+
+def bytes_to_matrix(
+    embeddings: Sequence[bytes | None],
+    dimension: int | None = None,
+    strict: bool = False,
+) -> tuple[Any, list[int]]:
+    """
+    Load stored embeddings into one (n, d) float32 matrix.
+
+    Rows that are empty, not float32-aligned, or of another dimension are
+    skipped (their positions are missing from the returned index list).
+
+    Args:
+        embeddings: Stored embedding blobs (None allowed)
+        dimension: Expected dimension. Defaults to the most common one.
+        strict: Raise instead of skipping rows of a different dimension
+
+    Returns:
+        Tuple of (matrix, kept) where ``matrix[j]`` is ``embeddings[kept[j]]``.
+        The matrix is a read-only view over a single buffer.
+
+    Raises:
+        ValueError: In strict mode, if any non-empty row has the wrong size
+    """
+    _require_numpy()
+    dims = [embedding_dimension(e) for e in embeddings]
+
+    if dimension is None:
+        counts = Counter(d for d in dims if d)
+        if not counts:
+            return np.empty((0, 0), dtype=np.float32), []
+        dimension = counts.most_common(1)[0][0]
+
+    kept = [i for i, d in enumerate(dims) if d == dimension]
+    mismatched = sum(1 for e in embeddings if e) - len(kept)
+    if mismatched:
+        if strict:
+            raise ValueError(
+                f"{mismatched} embedding(s) do not match dimension {dimension}"
+            )
+        logger.warning(
+            f"Skipped {mismatched} embedding(s) whose dimension differs from {dimension}"
+        )
+
+    if not kept:
+        return np.empty((0, dimension), dtype=np.float32), []
+
+    buffer = b"".join(embeddings[i] for i in kept)  # type: ignore[misc]
+    matrix = np.frombuffer(buffer, dtype=np.float32).reshape(len(kept), dimension)
+    return matrix, kept
+
+
+def group_by_dimension(
+    ids: Sequence[str],
+    embeddings: Sequence[bytes | None],
+) -> dict[int, tuple[list[str], Any]]:
+    """
+    Split a mixed-model embedding column into one matrix per dimension.
+
+    Args:
+        ids: Row identifiers (same length as embeddings)
+        embeddings: Stored embedding blobs
+
+    Returns:
+        Dict mapping dimension -> (ids, (n, d) matrix)
+    """
+    _require_numpy()
+    if len(ids) != len(embeddings):
+        raise ValueError(f"Got {len(ids)} ids for {len(embeddings)} embeddings")
+
+    positions: dict[int, list[int]] = {}
+    for i, e in enumerate(embeddings):
+        d = embedding_dimension(e)
+        if d:
+            positions.setdefault(d, []).append(i)
+
+    groups: dict[int, tuple[list[str], Any]] = {}
+    for d, rows in positions.items():
+        buffer = b"".join(embeddings[i] for i in rows)  # type: ignore[misc]
+        matrix = np.frombuffer(buffer, dtype=np.float32).reshape(len(rows), d)
+        groups[d] = ([ids[i] for i in rows], matrix)
+    return groups
+
+
+__all__ = [
+    "BYTES_PER_FLOAT",
+    "bytes_to_embedding",
+    "bytes_to_matrix",
+    "embedding_dimension",
+    "embedding_to_bytes",
+    "group_by_dimension",
+    "matrix_to_bytes",
+]
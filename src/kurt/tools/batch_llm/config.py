@@ -76,3 +76,9 @@ class BatchLLMToolConfig(StepConfig):
         le=128000,
         description="Maximum tokens in response",
     )
+
+    # Deduplication
+    skip_near_duplicates: bool = ConfigParam(
+        default=False,
+        description="Process one row per near-duplicate document cluster",
+    )
@@ -641,6 +641,43 @@ class TestBatchLLMTool:
 # ============================================================================
 
 
+class TestSkipNearDuplicates:
+    """Test skip_near_duplicates row selection."""
+
+    @pytest.mark.asyncio
+    async def test_skips_non_canonical_rows(self):
+        """Only one row per near-duplicate cluster reaches the LLM."""
+        calls: list[str] = []
+
+        async def mock_call(prompt, *args, **kwargs):
+            calls.append(prompt)
+            return "ok", 1, 1, 0.0
+
+        inputs = [
+            BatchLLMInput(row={"document_id": "copy", "content": "a"}),
+            BatchLLMInput(row={"document_id": "orig", "content": "b"}),
+            BatchLLMInput(row={"document_id": "other", "content": "c"}),
+            BatchLLMInput(row={"content": "no id"}),
+        ]
+        clusters = {"copy": "orig", "orig": "orig", "other": "other"}
+
+        with (
+            patch("kurt.tools.batch_llm.tool.call_openai", mock_call),
+            patch("kurt.documents.near_duplicates.load_clusters", return_value=clusters),
+            patch.dict("os.environ", {"OPENAI_API_KEY": "test-key"}),
+        ):
+            params = BatchLLMParams(
+                inputs=inputs,
+                config=BatchLLMConfig(prompt_template="{content}", skip_near_duplicates=True),
+            )
+            result = await BatchLLMTool().run(params, ToolContext())
+
+        assert sorted(calls) == ["b", "c", "no id"]
+        assert [r["_status"] for r in result.data] == ["skipped", "success", "success", "success"]
+        assert result.data[0]["_duplicate_of"] == "orig"
+        assert result.errors == []
+
+
 class TestErrorHandling:
     """Test error handling scenarios."""
 
@@ -109,6 +109,10 @@ class BatchLLMConfig(BaseModel):
         le=128000,
         description="Maximum tokens in response",
     )
+    skip_near_duplicates: bool = Field(
+        default=False,
+        description="Process one row per near-duplicate document cluster (rows keyed by document_id)",
+    )
 
 
 class BatchLLMParams(BaseModel):
@@ -186,6 +190,10 @@ class BatchLLMParams(BaseModel):
         le=128000,
         description="Maximum tokens in response",
     )
+    skip_near_duplicates: bool = Field(
+        default=False,
+        description="Process one row per near-duplicate document cluster (rows keyed by document_id)",
+    )
 
     def get_inputs(self) -> list[BatchLLMInput]:
         """Get the input list from either input_data or inputs field."""
@@ -215,6 +223,7 @@ class BatchLLMParams(BaseModel):
             max_retries=self.max_retries,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
+            skip_near_duplicates=self.skip_near_duplicates,
         )
 
 
@@ -229,9 +238,9 @@ class BatchLLMOutput(BaseModel):
         ...,
         description="LLM output (dict if schema, str if not)",
     )
-    status: Literal["success", "error"] = Field(
+    status: Literal["success", "error", "skipped"] = Field(
         default="success",
-        description="Processing status",
+        description="Processing status (skipped = near-duplicate of another row)",
     )
     error: str | None = Field(
         default=None,
@@ -810,6 +819,28 @@ class BatchLLMProcessor:
         return self.config.prompt_template.format(**row)
 
 
+def _near_duplicate_rows(rows: list[dict[str, Any]]) -> dict[int, str]:
+    """
+    Find rows whose document is a near-duplicate of another row's document.
+
+    Returns:
+        Dict mapping skipped row index -> document_id of the row kept instead
+        (empty if rows have no document_id or clusters are unavailable)
+    """
+    from kurt.documents.near_duplicates import load_clusters, select_canonical_rows
+
+    ids = [row["document_id"] for row in rows if row.get("document_id")]
+    if not ids:
+        return {}
+    try:
+        clusters = load_clusters(ids)
+    except Exception as e:
+        logger.warning(f"Near-duplicate clusters unavailable, processing all rows: {e}")
+        return {}
+    _, skipped = select_canonical_rows(rows, clusters)
+    return skipped
+
+
 # ============================================================================
 # BatchLLMTool Implementation
 # ============================================================================
@@ -823,6 +854,10 @@ class BatchLLMTool(Tool[BatchLLMParams, BatchLLMOutput]):
     Substeps:
     - batch_llm: Process rows through LLM (progress: rows completed)
 
+    With skip_near_duplicates, rows whose document_id belongs to a
+    near-duplicate cluster that already has a row in the batch are not sent to
+    the LLM; they are returned with ``_status="skipped"`` and ``_duplicate_of``.
+
     Features:
     - Prompt template with {field} substitution
     - Structured output via Pydantic models
@@ -835,6 +870,7 @@ class BatchLLMTool(Tool[BatchLLMParams, BatchLLMOutput]):
     description = "Process rows through LLM with configurable prompts and structured output"
     InputModel = BatchLLMParams
     OutputModel = BatchLLMOutput
+    stream_input = True
 
     async def run(
         self,
@@ -894,7 +930,26 @@ class BatchLLMTool(Tool[BatchLLMParams, BatchLLMOutput]):
             emit_fn=self.emit_progress,
         )
 
-        results = await processor.process_batch(inputs)
+        skipped: dict[int, str] = {}
+        if config.skip_near_duplicates:
+            skipped = _near_duplicate_rows([inp.row for inp in inputs])
+
+        if skipped:
+            kept = [i for i in range(total) if i not in skipped]
+            processed = iter(await processor.process_batch([inputs[i] for i in kept]))
+            results = [
+                {
+                    "row": inputs[i].row,
+                    "llm_output": "",
+                    "status": "skipped",
+                    "duplicate_of": skipped[i],
+                }
+                if i in skipped
+                else next(processed)
+                for i in range(total)
+            ]
+        else:
+            results = await processor.process_batch(inputs)
 
         # Build output data - merge row with llm_output
         output_data = []
@@ -905,6 +960,14 @@ class BatchLLMTool(Tool[BatchLLMParams, BatchLLMOutput]):
         total_cost = 0.0
 
         for i, result in enumerate(results):
+            if result["status"] == "skipped":
+                output_data.append({
+                    **result["row"],
+                    "_status": "skipped",
+                    "_duplicate_of": result["duplicate_of"],
+                })
+                continue
+
             # Merge row with llm_output for flat structure
             merged = dict(result["row"])
             llm_output = result.get("llm_output", "")
@@ -940,7 +1003,10 @@ class BatchLLMTool(Tool[BatchLLMParams, BatchLLMOutput]):
             status="completed",
             current=total,
             total=total,
-            message=f"Processed {success_count} successful, {error_count} errors",
+            message=(
+                f"Processed {success_count} successful, {error_count} errors"
+                + (f", {len(skipped)} near-duplicates skipped" if skipped else "")
+            ),
             metadata={
                 "tokens_in": total_tokens_in,
                 "tokens_out": total_tokens_out,
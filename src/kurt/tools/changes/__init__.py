@@ -0,0 +1,240 @@
+"""
+Changes tool: a workflow source step emitting rows changed since a revision.
+
+Reads ``DOLT_DIFF`` between a starting point and the working set (see
+kurt.db.diff), so downstream embedding, near-dup and LLM steps only process
+the delta instead of whole tables:
+
+    [steps.delta]
+    type = "changes"
+    table = "fetch_documents"
+    since_workflow = "nightly-enrich"   # last completed run of this workflow
+
+    [steps.embed]
+    type = "embed"
+    depends_on = ["delta"]
+
+The starting point is ``since`` (a Dolt revision or ``run:<run_id>``) or
+``since_workflow`` (the revision recorded by the last completed run of that
+workflow; every row is emitted on its first run). Workflows containing a
+``changes`` step commit and tag their writes when they complete, so the next
+run diffs from there.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+from kurt.db.diff import aiter_table_changes, first_revision, last_run_revision
+
+from ..core.base import ProgressCallback, Tool, ToolContext, ToolResult
+from ..core.registry import register_tool
+
+logger = logging.getLogger(__name__)
+
+DiffType = Literal["added", "modified", "removed"]
+
+
+# ============================================================================
+# Input/Output Models
+# ============================================================================
+
+
+class ChangesInput(BaseModel):
+    """
+    Input for the changes tool.
+
+    Like the SQL tool this generates data; input rows are not used.
+    """
+
+    input_data: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Input data from upstream steps (unused)",
+    )
+    table: str = Field(
+        default="fetch_documents",
+        description="Table to diff (e.g. map_documents, fetch_documents)",
+    )
+    since: str | None = Field(
+        default=None,
+        description="Dolt revision or run:<run_id> to diff from",
+    )
+    since_workflow: str | None = Field(
+        default=None,
+        description="Diff from the last completed run of this workflow",
+    )
+    until: str = Field(
+        default="WORKING",
+        description="Dolt revision to diff to (default: working set)",
+    )
+    diff_types: list[DiffType] = Field(
+        default_factory=lambda: ["added", "modified"],
+        description="Kinds of change to emit",
+    )
+    columns: list[str] | None = Field(
+        default=None,
+        description="Columns to emit (default: all)",
+    )
+
+    @model_validator(mode="after")
+    def validate_since(self) -> ChangesInput:
+        """Require exactly one starting point."""
+        if (self.since is None) == (self.since_workflow is None):
+            raise ValueError("Provide exactly one of 'since' or 'since_workflow'")
+        return self
+
+
+class ChangesOutput(BaseModel):
+    """
+    One changed row.
+
+    Carries ``diff_type`` plus the row's columns (values before removal for
+    removed rows).
+    """
+
+    diff_type: DiffType = Field(description="added, modified or removed")
+
+
+# ============================================================================
+# ChangesTool Implementation
+# ============================================================================
+
+
+@register_tool
+class ChangesTool(Tool[ChangesInput, ChangesOutput]):
+    """
+    Tool emitting the rows of a table changed since a revision or run.
+
+    Example:
+        params = {"table": "fetch_documents", "since": "run:abc123"}
+        result = await execute_tool("changes", params, context)
+    """
+
+    name = "changes"
+    description = "Emit rows added, modified or removed since a Dolt revision or workflow run"
+    InputModel = ChangesInput
+    OutputModel = ChangesOutput
+    cacheable = False  # Reads live database state
+
+    async def run(
+        self,
+        params: ChangesInput,
+        context: ToolContext,
+        on_progress: ProgressCallback | None = None,
+    ) -> ToolResult:
+        """
+        Diff the table and return the changed rows.
+
+        Collects run_stream(); steps that stream read the chunks directly.
+
+        Args:
+            params: Validated input parameters
+            context: Execution context with db client
+            on_progress: Optional progress callback
+
+        Returns:
+            ToolResult with one dict per changed row
+        """
+        rows: list[dict[str, Any]] = []
+        result = ToolResult(success=True)
+        async for partial in self.run_stream(params, context, on_progress):
+            rows.extend(partial.data)
+            result = partial
+        result.data = rows
+        return result
+
+    async def run_stream(
+        self,
+        params: ChangesInput,
+        context: ToolContext,
+        on_progress: ProgressCallback | None = None,
+    ) -> AsyncIterator[ToolResult]:
+        """
+        Diff the table, yielding changed rows in chunks as they are read.
+
+        Each partial result carries up to ``DIFF_CHUNK_SIZE`` rows; the last
+        one also carries the diff_table substep (and the error, if the diff
+        failed part-way through).
+        """
+        result = ToolResult(success=True)
+        if context.db is None:
+            result.add_error(
+                error_type="database_error",
+                message="No database connection in context",
+            )
+            result.success = False
+            yield result
+            return
+
+        self.emit_progress(
+            on_progress,
+            substep="diff_table",
+            status="running",
+            message=f"Diffing {params.table}",
+        )
+
+        start_time = time.time()
+        total = 0
+        try:
+            since = await asyncio.to_thread(_resolve_since, context.db, params)
+            async for chunk in aiter_table_changes(
+                context.db,
+                params.table,
+                since,
+                params.until,
+                diff_types=params.diff_types,
+                columns=params.columns,
+            ):
+                total += len(chunk)
+                self.emit_progress(
+                    on_progress,
+                    substep="diff_table",
+                    status="progress",
+                    current=total,
+                    message=f"Read {total} changed rows",
+                )
+                yield ToolResult(success=True, data=chunk)
+        except Exception as e:
+            result.add_error(error_type="diff_error", message=str(e))
+            result.success = False
+            self.emit_progress(on_progress, substep="diff_table", status="failed", message=str(e))
+            result.add_substep(name="diff_table", status="failed", current=total)
+            yield result
+            return
+
+        elapsed_ms = int((time.time() - start_time) * 1000)
+        self.emit_progress(
+            on_progress,
+            substep="diff_table",
+            status="completed",
+            current=total,
+            total=total,
+            message=f"{total} changed rows in {params.table} ({elapsed_ms}ms)",
+        )
+        result.add_substep(
+            name="diff_table",
+            status="completed",
+            current=total,
+            total=total,
+        )
+        yield result
+
+
+def _resolve_since(db: Any, params: ChangesInput) -> str:
+    """Starting revision for the diff (runs in a worker thread)."""
+    if params.since is not None:
+        return params.since
+    revision = last_run_revision(db, params.since_workflow)
+    return revision if revision is not None else first_revision(db)
+
+
+__all__ = [
+    "ChangesInput",
+    "ChangesOutput",
+    "ChangesTool",
+]
@@ -0,0 +1,30 @@
+"""
+Changes tool configuration.
+
+Config values can be set in kurt.config with CHANGES.* prefix:
+
+    CHANGES.TABLE=fetch_documents
+
+Usage:
+    # Load from config file
+    config = ChangesToolConfig.from_config("changes")
+
+    # Or instantiate directly
+    config = ChangesToolConfig(table="map_documents")
+"""
+
+from __future__ import annotations
+
+from kurt.config import ConfigParam, StepConfig
+
+
+class ChangesToolConfig(StepConfig):
+    """Configuration for the changes tool.
+
+    Loaded from kurt.config with CHANGES.* prefix.
+    """
+
+    table: str = ConfigParam(
+        default="fetch_documents",
+        description="Table to diff",
+    )
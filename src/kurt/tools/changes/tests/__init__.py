@@ -0,0 +1 @@
+"""Tests for changes tool."""
@@ -0,0 +1,116 @@
+"""
+Unit tests for ChangesTool.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from kurt.db.dolt import DoltDB
+from kurt.tools.changes import ChangesInput, ChangesTool
+from kurt.tools.core import ToolContext
+
+
+def _mock_db(last_run: str | None = "run-1", tagged: bool = True, chunks: int = 1) -> MagicMock:
+    db = MagicMock(spec=DoltDB)
+
+    def query_one(sql, params=None):
+        if "FROM dolt_tags" in sql:
+            return {"tag_hash": "run-tag"} if tagged and last_run else None
+        if "FROM workflow_runs WHERE workflow" in sql:
+            return {"id": last_run} if last_run else None
+        if "FROM workflow_runs WHERE id" in sql:
+            return {"started_at": "2026-01-01 00:00:00"}
+        if "ORDER BY date ASC" in sql:
+            return {"commit_hash": "init"}
+        return {"commit_hash": "before-run"}
+
+    async def aquery_chunks(sql, params=None, chunk_size=1000):
+        for i in range(chunks):
+            yield [{"diff_type": "modified", "to_document_id": f"d{i + 1}", "from_document_id": "x"}]
+
+    db.query_one.side_effect = query_one
+    db.aquery_chunks.side_effect = aquery_chunks
+    return db
+
+
+class TestChangesInput:
+    def test_requires_one_starting_point(self):
+        with pytest.raises(ValidationError):
+            ChangesInput()
+        with pytest.raises(ValidationError):
+            ChangesInput(since="HEAD", since_workflow="nightly")
+
+    def test_defaults(self):
+        params = ChangesInput(since="HEAD")
+        assert params.table == "fetch_documents"
+        assert params.until == "WORKING"
+        assert params.diff_types == ["added", "modified"]
+
+
+class TestChangesTool:
+    @pytest.mark.asyncio
+    async def test_since_revision(self):
+        db = _mock_db()
+        result = await ChangesTool().run(ChangesInput(since="HEAD~1"), ToolContext(db=db))
+
+        assert result.success
+        assert result.data == [{"diff_type": "modified", "document_id": "d1"}]
+        assert result.substeps[0].current == 1
+        sql, params = db.aquery_chunks.call_args.args
+        assert "DOLT_DIFF" in sql
+        assert params == ["HEAD~1", "WORKING", "fetch_documents", "added", "modified"]
+
+    @pytest.mark.asyncio
+    async def test_since_last_workflow_run(self):
+        db = _mock_db(last_run="run-1")
+        result = await ChangesTool().run(
+            ChangesInput(since_workflow="nightly", table="map_documents"), ToolContext(db=db)
+        )
+
+        assert result.success
+        assert db.aquery_chunks.call_args.args[1][:3] == ["run-tag", "WORKING", "map_documents"]
+
+    @pytest.mark.asyncio
+    async def test_since_untagged_workflow_run(self):
+        db = _mock_db(last_run="run-1", tagged=False)
+        await ChangesTool().run(ChangesInput(since_workflow="nightly"), ToolContext(db=db))
+
+        assert db.aquery_chunks.call_args.args[1][0] == "before-run"
+
+    @pytest.mark.asyncio
+    async def test_first_run_diffs_from_first_commit(self):
+        db = _mock_db(last_run=None)
+        await ChangesTool().run(ChangesInput(since_workflow="nightly"), ToolContext(db=db))
+
+        assert db.aquery_chunks.call_args.args[1][0] == "init"
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_chunks(self):
+        db = _mock_db(chunks=3)
+        partials = [
+            p async for p in ChangesTool().run_stream(ChangesInput(since="HEAD"), ToolContext(db=db))
+        ]
+
+        assert [len(p.data) for p in partials] == [1, 1, 1, 0]
+        assert partials[-1].substeps[0].total == 3
+
+    @pytest.mark.asyncio
+    async def test_diff_error(self):
+        db = _mock_db()
+        db.aquery_chunks.side_effect = Exception("table not found: nope")
+        result = await ChangesTool().run(
+            ChangesInput(since="HEAD", table="nope"), ToolContext(db=db)
+        )
+
+        assert not result.success
+        assert result.errors[0].error_type == "diff_error"
+
+    @pytest.mark.asyncio
+    async def test_no_db(self):
+        result = await ChangesTool().run(ChangesInput(since="HEAD"), ToolContext())
+        assert not result.success
+        assert result.errors[0].error_type == "database_error"
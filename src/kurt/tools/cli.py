@@ -56,3 +56,70 @@ tools_group.add_command(new_provider_cmd, "new-provider")
 
 # Alias for main CLI registration
 tools_cli = tools_group
+
+
+@click.command("workers")
+@click.option(
+    "--workers",
+    "-n",
+    "count",
+    default=2,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help="Number of worker processes",
+)
+@click.option("--status", is_flag=True, help="Show the running pool and queue, then exit")
+def workers_cmd(count: int, status: bool):
+    """
+    Run a warm worker pool for background runs (long-running service).
+
+    While the pool is running, background tool runs (--background) and
+    background agent workflow runs are queued to its pre-started workers
+    instead of each starting a new Python process. Without a pool, runs
+    spawn a process as before.
+
+    \b
+    Examples:
+        kurt workers
+        kurt workers -n 4
+        kurt workers --status
+    """
+    import signal
+    import threading
+
+    from rich.console import Console
+
+    from kurt.tools.core.worker_pool import JobQueue, WorkerPool
+
+    console = Console()
+    queue = JobQueue()
+
+    if status:
+        info = queue.pool_info()
+        if info is None:
+            console.print("[yellow]No worker pool running[/yellow]")
+        else:
+            console.print(
+                f"[green]Worker pool running[/green] (pid {info['pid']}, "
+                f"{len(info.get('workers', []))} worker(s))"
+            )
+        console.print(f"  Pending jobs: {len(queue.pending())}")
+        return
+
+    pool = WorkerPool(workers=count, queue=queue)
+    try:
+        pool.start()
+    except RuntimeError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise click.Abort()
+
+    console.print(
+        f"[bold]Kurt worker pool[/bold] [dim]({count} worker(s), queue: {queue.root})[/dim]"
+    )
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        pool.serve_forever(stop=stop)
+    except KeyboardInterrupt:
+        pool.shutdown()
+    console.print("[dim]Worker pool stopped[/dim]")
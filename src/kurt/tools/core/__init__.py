@@ -37,6 +37,7 @@ from .cli_options import (
     fetch_engine_option,
     file_extension_option,
     format_option,
+    format_table_jsonl_option,
     format_table_option,
     has_content_option,
     ids_option,
@@ -45,6 +46,7 @@ from .cli_options import (
     limit_option,
     min_content_length_option,
     print_json,
+    print_jsonl,
     priority_option,
     source_type_option,
     url_contains_option,
@@ -99,6 +101,7 @@ from .registry import (
     TOOLS,
     clear_registry,
     execute_tool,
+    execute_tool_stream,
     get_tool,
     get_tool_info,
     list_tools,
@@ -113,6 +116,13 @@ from .runner import (
     spawn_background_run,
 )
 
+# Record streams
+from .streaming import (
+    RecordStream,
+    merge_streams,
+    rechunk,
+)
+
 # Utilities
 from .utils import (
     canonicalize_url,
@@ -153,7 +163,12 @@ __all__ = [
     "list_tools",
     "get_tool_info",
     "execute_tool",
+    "execute_tool_stream",
     "clear_registry",
+    # Record streams
+    "RecordStream",
+    "merge_streams",
+    "rechunk",
     # Context loading
     "Settings",
     "LLMSettings",
@@ -189,6 +204,7 @@ __all__ = [
     "fetch_engine_option",
     "file_extension_option",
     "format_option",
+    "format_table_jsonl_option",
     "format_table_option",
     "has_content_option",
     "ids_option",
@@ -197,6 +213,7 @@ __all__ = [
     "limit_option",
     "min_content_length_option",
     "print_json",
+    "print_jsonl",
     "priority_option",
     "source_type_option",
     "url_contains_option",
@@ -13,7 +13,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Generic, TypeVar
 
 from pydantic import BaseModel
 
@@ -260,6 +260,14 @@ class Tool(ABC, Generic[InputT, OutputT]):
     - InputModel: Pydantic model for input validation
     - OutputModel: Pydantic model for output schema
     - run(): Async execution method
+    - run_stream(): Optional incremental variant yielding partial results
+    - stream_input: True if input rows are processed independently, so the
+      tool can be run on one chunk of upstream records at a time
+    - version: Bump when the tool's output changes for the same input
+      (invalidates cached workflow step outputs)
+    - cacheable: False if the output depends on state outside the step's
+      config and input (database reads) or the tool exists for its side
+      effects (writes); such steps are never served from the step cache
 
     Example:
         class MapTool(Tool[MapInput, MapOutput]):
@@ -283,6 +291,9 @@ class Tool(ABC, Generic[InputT, OutputT]):
     InputModel: type[InputT]
     OutputModel: type[OutputT]
     default_provider: str | None = None  # Default provider name for this tool
+    stream_input: bool = False  # Rows are independent (safe to run per input chunk)
+    version: str = "1"  # Output version for workflow step caching
+    cacheable: bool = True  # Output is a function of config + input records
 
     @abstractmethod
     async def run(
@@ -311,6 +322,22 @@ class Tool(ABC, Generic[InputT, OutputT]):
         """
         pass
 
+    async def run_stream(
+        self,
+        params: InputT,
+        context: ToolContext,
+        on_progress: ProgressCallback | None = None,
+    ) -> AsyncIterator[ToolResult]:
+        """
+        Execute the tool, yielding partial results as records become available.
+
+        Each yielded ToolResult carries only the records produced since the
+        previous one. The default runs ``run()`` and yields its result once;
+        tools that discover records incrementally override this so
+        downstream streaming steps can start early.
+        """
+        yield await self.run(params, context, on_progress)
+
     def emit_progress(
         self,
         on_progress: ProgressCallback | None,
@@ -8,7 +8,7 @@ This module provides:
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import Any, Iterable
 
 import click
 
@@ -132,6 +132,14 @@ format_table_option = click.option(
     help="Output format (json for AI agents, table for humans)",
 )
 
+format_table_jsonl_option = click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["json", "jsonl", "table"], case_sensitive=False),
+    default="table",
+    help="Output format (json for AI agents, jsonl to stream one record per line, table for humans)",
+)
+
 # =============================================================================
 # Safety/Confirmation Options
 # =============================================================================
@@ -293,6 +301,22 @@ def print_json(data: Any, envelope: bool = False) -> None:
         print(json.dumps(data, indent=2, default=str))
 
 
+def print_jsonl(records: Iterable[Any]) -> int:
+    """Print one compact JSON object per line, flushing as records arrive.
+
+    Consumes ``records`` lazily, so large result sets stream with constant
+    memory.
+
+    Returns:
+        Number of records printed
+    """
+    count = 0
+    for record in records:
+        print(json.dumps(record, default=str), flush=True)
+        count += 1
+    return count
+
+
 # =============================================================================
 # Robot Mode Re-exports
 # =============================================================================
@@ -317,6 +341,7 @@ try:
         "exclude_option",
         # Output options
         "format_option",
+        "format_table_jsonl_option",
         "format_table_option",
         # Confirmation options
         "dry_run_option",
@@ -331,6 +356,7 @@ try:
         "add_confirmation_options",
         # Output formatting
         "print_json",
+        "print_jsonl",
         # Robot mode
         "OutputContext",
         "robot_success",
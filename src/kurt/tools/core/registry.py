@@ -6,12 +6,13 @@ Provides:
 - register_tool(): Decorator for registering tools
 - get_tool(): Lookup tool by name
 - execute_tool(): Execute a tool with validation and error handling
+- execute_tool_stream(): Same, yielding partial results as they are produced
 """
 
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, AsyncIterator
 
 from pydantic import ValidationError
 
@@ -252,6 +253,62 @@ async def execute_tool(
     return result
 
 
+async def execute_tool_stream(
+    name: str,
+    params: dict[str, Any],
+    context: ToolContext | None = None,
+    on_progress: ProgressCallback | None = None,
+) -> AsyncIterator[ToolResult]:
+    """
+    Execute a tool by name, yielding partial results (see Tool.run_stream).
+
+    Validation and error wrapping match execute_tool(). Each partial result
+    gets timing metadata measured from the start of execution.
+
+    Raises:
+        ToolNotFoundError: If tool name is not registered
+        ToolInputError: If params fail Pydantic validation
+        ToolExecutionError: If tool execution fails
+    """
+    tool_class = get_tool(name)
+
+    try:
+        validated_params = tool_class.InputModel.model_validate(params)
+    except ValidationError as e:
+        raise ToolInputError(
+            tool_name=name,
+            message=str(e),
+            validation_errors=e.errors(),
+        ) from e
+
+    if context is None:
+        context = ToolContext()
+
+    tool = tool_class()
+    started_at = datetime.now(timezone.utc)
+    stream = tool.run_stream(validated_params, context, on_progress)
+
+    while True:
+        try:
+            result = await stream.__anext__()
+        except StopAsyncIteration:
+            return
+        except Exception as e:
+            if isinstance(e, (ToolExecutionError,)):
+                raise
+            raise ToolExecutionError(
+                tool_name=name,
+                message=str(e),
+                cause=e,
+            ) from e
+
+        if result.metadata is None:
+            result.metadata = ToolResultMetadata.from_timestamps(
+                started_at, datetime.now(timezone.utc)
+            )
+        yield result
+
+
 def clear_registry() -> None:
     """
     Clear all registered tools.
@@ -91,9 +91,11 @@ def run_tool_with_tracking(
     metadata: dict[str, Any] | None = None,
     cli_command: str | None = None,
     priority: int | None = None,
+    db: DoltDB | None = None,
 ) -> tuple[str, dict[str, Any]]:
     project_dir = _get_project_root(project_root)
-    db = _get_dolt_db(project_dir)
+    if db is None:
+        db = _get_dolt_db(project_dir)
     lifecycle = WorkflowLifecycle(db)
 
     run_metadata = dict(metadata or {})
@@ -203,7 +205,11 @@ def create_pending_run(
 
 
 def run_tool_from_file(payload_path: str) -> None:
-    payload = json.loads(Path(payload_path).read_text())
+    run_tool_from_payload(json.loads(Path(payload_path).read_text()))
+
+
+def run_tool_from_payload(payload: dict[str, Any], db: DoltDB | None = None) -> None:
+    """Run a background tool payload (from a payload file or the job queue)."""
     run_id = payload.get("run_id")
     tool_name = payload["tool"]
     params = payload.get("params", {})
@@ -220,6 +226,7 @@ def run_tool_from_file(payload_path: str) -> None:
         metadata=metadata,
         cli_command=cli_command,
         priority=priority,
+        db=db,
     )
 
 
@@ -243,6 +250,12 @@ def spawn_background_run(
         "priority": priority,
     }
 
+    # Hand the run to the warm worker pool when one is running
+    from kurt.tools.core.worker_pool import submit_job
+
+    if submit_job("tool", payload, project_root=project_root):
+        return
+
     payload_file = tempfile.NamedTemporaryFile("w", delete=False, suffix=".json")
     with payload_file as handle:
         json.dump(payload, handle)
@@ -0,0 +1,163 @@
+"""
+Record streams for incremental tool output.
+
+A RecordStream is a bounded async channel of record chunks between a
+producing step and one consuming step. ``put`` waits while the buffer is
+full, so a fast producer is held back by a slow consumer (backpressure) and
+at most ``max_chunks`` chunks are in flight per edge.
+
+Usage:
+    stream = RecordStream(max_chunks=4)
+
+    # Producer
+    await stream.put(records)
+    await stream.close()
+
+    # Consumer
+    async for chunk in stream:
+        ...
+
+    # Several producers into one consumer, re-chunked
+    async for chunk in rechunk(merge_streams(streams), size=100):
+        ...
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Sequence
+
+# Default chunks buffered per stream before the producer waits
+DEFAULT_STREAM_BUFFER = 4
+
+# Default records per chunk handed to a streaming consumer
+DEFAULT_STREAM_CHUNK_SIZE = 100
+
+_END = object()
+
+
+class RecordStream:
+    """
+    Bounded async channel of record chunks.
+
+    Args:
+        max_chunks: Chunks buffered before ``put`` waits
+    """
+
+    def __init__(self, max_chunks: int = DEFAULT_STREAM_BUFFER):
+        self._queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=max_chunks)
+        self._closed = False
+        self._detached = False
+        self.records_put = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def put(self, records: list[dict[str, Any]]) -> bool:
+        """
+        Send a chunk, waiting while the buffer is full.
+
+        Returns:
+            False if the consumer has detached (the chunk is dropped)
+        """
+        if self._closed:
+            raise RuntimeError("put() on a closed RecordStream")
+        if self._detached:
+            return False
+        if records:
+            await self._queue.put(list(records))
+            self.records_put += len(records)
+        return True
+
+    async def close(self) -> None:
+        """Signal end of stream (idempotent)."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self._detached:
+            await self._queue.put(_END)
+
+    def detach(self) -> None:
+        """
+        Stop consuming: drop buffered chunks and make further puts no-ops.
+
+        Called by a consumer that exits early so producers never block on it.
+        """
+        self._detached = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def __aiter__(self) -> AsyncIterator[list[dict[str, Any]]]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[list[dict[str, Any]]]:
+        while True:
+            item = await self._queue.get()
+            if item is _END:
+                return
+            yield item
+
+
+async def merge_streams(
+    streams: Sequence[RecordStream],
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Yield chunks from several streams as they arrive.
+
+    Chunks of one stream keep their order; chunks of different streams are
+    interleaved in arrival order. Reading all streams concurrently means no
+    producer waits on another producer's consumer.
+    """
+    if len(streams) == 1:
+        async for chunk in streams[0]:
+            yield chunk
+        return
+
+    merged: asyncio.Queue[Any] = asyncio.Queue(maxsize=max(1, len(streams)))
+
+    async def pump(stream: RecordStream) -> None:
+        try:
+            async for chunk in stream:
+                await merged.put(chunk)
+        finally:
+            await merged.put(_END)
+
+    pumps = [asyncio.create_task(pump(s)) for s in streams]
+    try:
+        remaining = len(pumps)
+        while remaining:
+            item = await merged.get()
+            if item is _END:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        for task in pumps:
+            task.cancel()
+        for stream in streams:
+            stream.detach()
+
+
+async def rechunk(
+    chunks: AsyncIterator[list[dict[str, Any]]],
+    size: int = DEFAULT_STREAM_CHUNK_SIZE,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Re-slice an async iterator of chunks into chunks of ``size`` records."""
+    buffer: list[dict[str, Any]] = []
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        while len(buffer) >= size:
+            yield buffer[:size]
+            buffer = buffer[size:]
+    if buffer:
+        yield buffer
+
+
+__all__ = [
+    "DEFAULT_STREAM_BUFFER",
+    "DEFAULT_STREAM_CHUNK_SIZE",
+    "RecordStream",
+    "merge_streams",
+    "rechunk",
+]
@@ -0,0 +1,96 @@
+"""Tests for record streams."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from kurt.tools.core.streaming import RecordStream, merge_streams, rechunk
+
+
+def _rows(*ids: int) -> list[dict]:
+    return [{"id": i} for i in ids]
+
+
+async def _collect(chunks) -> list[list[dict]]:
+    return [chunk async for chunk in chunks]
+
+
+class TestRecordStream:
+    @pytest.mark.asyncio
+    async def test_round_trip(self):
+        stream = RecordStream()
+        await stream.put(_rows(1, 2))
+        await stream.put([])  # empty chunks are not sent
+        await stream.put(_rows(3))
+        await stream.close()
+
+        assert await _collect(stream) == [_rows(1, 2), _rows(3)]
+        assert stream.records_put == 3
+
+    @pytest.mark.asyncio
+    async def test_put_waits_when_full(self):
+        stream = RecordStream(max_chunks=1)
+        await stream.put(_rows(1))
+
+        blocked = asyncio.create_task(stream.put(_rows(2)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        iterator = stream.__aiter__()
+        assert await iterator.__anext__() == _rows(1)
+        await asyncio.wait_for(blocked, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_detach_unblocks_producer(self):
+        stream = RecordStream(max_chunks=1)
+        await stream.put(_rows(1))
+        blocked = asyncio.create_task(stream.put(_rows(2)))
+        await asyncio.sleep(0.01)
+
+        stream.detach()
+        await asyncio.wait_for(blocked, timeout=1)
+        assert await stream.put(_rows(3)) is False
+        await stream.close()
+
+    @pytest.mark.asyncio
+    async def test_put_after_close_raises(self):
+        stream = RecordStream()
+        await stream.close()
+        await stream.close()  # idempotent
+        with pytest.raises(RuntimeError):
+            await stream.put(_rows(1))
+
+
+class TestMergeAndRechunk:
+    @pytest.mark.asyncio
+    async def test_merge_keeps_per_stream_order(self):
+        a, b = RecordStream(), RecordStream()
+
+        async def produce(stream, ids):
+            for i in ids:
+                await stream.put(_rows(i))
+                await asyncio.sleep(0)
+            await stream.close()
+
+        producers = [
+            asyncio.create_task(produce(a, [1, 2, 3])),
+            asyncio.create_task(produce(b, [10, 20])),
+        ]
+        records = [r["id"] for chunk in await _collect(merge_streams([a, b])) for r in chunk]
+        await asyncio.gather(*producers)
+
+        assert sorted(records) == [1, 2, 3, 10, 20]
+        assert [i for i in records if i < 10] == [1, 2, 3]
+        assert [i for i in records if i >= 10] == [10, 20]
+
+    @pytest.mark.asyncio
+    async def test_rechunk(self):
+        stream = RecordStream(max_chunks=10)
+        for ids in [(1, 2, 3), (4,), (5, 6, 7, 8)]:
+            await stream.put(_rows(*ids))
+        await stream.close()
+
+        chunks = await _collect(rechunk(merge_streams([stream]), size=3))
+        assert [[r["id"] for r in c] for c in chunks] == [[1, 2, 3], [4, 5, 6], [7, 8]]
@@ -0,0 +1,248 @@
+"""Tests for the warm worker pool job queue."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kurt.tools.core.worker_pool import (
+    MAX_JOB_ATTEMPTS,
+    QUEUE_DIR,
+    JobQueue,
+    WorkerPool,
+    run_job,
+    spawn_job,
+    submit_job,
+)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(tmp_path / QUEUE_DIR)
+
+
+def _alive(queue: JobQueue) -> None:
+    queue.write_heartbeat({"pid": os.getpid(), "workers": []})
+
+
+class TestJobQueue:
+    def test_claim_oldest_first(self, queue):
+        queue.submit("tool", {"run_id": "a"})
+        queue.submit("tool", {"run_id": "b"})
+
+        path, job = queue.claim("w0")
+        assert job == {"kind": "tool", "payload": {"run_id": "a"}, "env": None, "attempts": 0}
+        assert path.parent == queue.claimed_dir
+        assert queue.claim("w1")[1]["payload"]["run_id"] == "b"
+        assert queue.claim("w0") is None
+
+    def test_complete_removes_job(self, queue):
+        queue.submit("workflow", {"run_id": "a"})
+        path, _ = queue.claim("w0")
+        queue.complete(path)
+        assert not path.exists()
+        assert queue.pending() == []
+
+    def test_requeue_claimed(self, queue):
+        queue.submit("tool", {"run_id": "a"})
+        queue.claim("w0")
+
+        assert queue.requeue_claimed() == 1
+        _, job = queue.claim("w1")
+        assert job["payload"]["run_id"] == "a"
+        assert job["attempts"] == 1
+
+    def test_requeue_one_worker(self, queue):
+        queue.submit("tool", {"run_id": "a"})
+        queue.submit("tool", {"run_id": "b"})
+        queue.claim("w0")
+        queue.claim("w1")
+
+        assert queue.requeue_claimed("w1") == 1
+        assert [p.name for p in queue.claimed_dir.iterdir()][0].endswith(".w0.json")
+        assert queue.claim("w2")[1]["payload"]["run_id"] == "b"
+
+    def test_requeue_drops_after_max_attempts(self, queue):
+        queue.submit("tool", {"run_id": "a"})
+        for _ in range(MAX_JOB_ATTEMPTS - 1):
+            queue.claim("w0")
+            assert queue.requeue_claimed() == 1
+        queue.claim("w0")
+
+        assert queue.requeue_claimed() == 0
+        assert queue.pending() == []
+        assert list(queue.claimed_dir.iterdir()) == []
+
+    def test_job_files_are_private(self, queue):
+        path = queue.submit("tool", {"run_id": "a"}, env={"KURT_PARENT_WORKFLOW_ID": "p"})
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_unknown_kind(self, queue):
+        with pytest.raises(ValueError, match="Unknown job kind"):
+            queue.submit("shell", {})
+
+    def test_pool_info(self, queue):
+        assert queue.pool_info() is None
+        _alive(queue)
+        assert queue.pool_info()["pid"] == os.getpid()
+
+        stale = json.loads(queue.pool_file.read_text())
+        stale["heartbeat"] = time.time() - 3600
+        queue.pool_file.write_text(json.dumps(stale))
+        assert queue.pool_info() is None
+
+
+class TestSubmitJob:
+    def test_no_pool_returns_false(self, tmp_path):
+        assert submit_job("tool", {"run_id": "a"}, project_root=str(tmp_path)) is False
+        assert not (tmp_path / QUEUE_DIR / "pending").exists()
+
+    def test_queues_when_pool_alive(self, tmp_path):
+        queue = JobQueue(tmp_path / QUEUE_DIR)
+        _alive(queue)
+
+        with patch.dict(os.environ, {"KURT_PARENT_WORKFLOW_ID": "parent", "OPENAI_API_KEY": "sk"}):
+            assert submit_job("tool", {"run_id": "a"}, project_root=str(tmp_path)) is True
+        assert len(queue.pending()) == 1
+        env = queue.claim("w0")[1]["env"]
+        assert env["KURT_PARENT_WORKFLOW_ID"] == "parent"
+        # Secrets come from the worker's environment, not the queue file
+        assert "OPENAI_API_KEY" not in env
+
+    def test_withdraws_job_when_pool_stops_meanwhile(self, tmp_path):
+        queue = JobQueue(tmp_path / QUEUE_DIR)
+        _alive(queue)
+        checks = iter([{"pid": os.getpid()}, None])
+
+        with patch.object(JobQueue, "pool_info", side_effect=lambda: next(checks)):
+            assert submit_job("tool", {"run_id": "a"}, project_root=str(tmp_path)) is False
+        assert queue.pending() == []
+
+    def test_keeps_job_claimed_before_pool_stopped(self, tmp_path):
+        queue = JobQueue(tmp_path / QUEUE_DIR)
+        checks = iter([{"pid": os.getpid()}, None])
+
+        def pool_info():
+            # Shutdown hand-off claims the job before the second check
+            info = next(checks)
+            if info is None:
+                queue.claim("shutdown")
+            return info
+
+        with patch.object(JobQueue, "pool_info", side_effect=pool_info):
+            assert submit_job("tool", {"run_id": "a"}, project_root=str(tmp_path)) is True
+
+    def test_spawn_background_run_uses_pool(self, tmp_path):
+        from kurt.tools.core.runner import spawn_background_run
+
+        queue = JobQueue(tmp_path / QUEUE_DIR)
+        _alive(queue)
+
+        with patch("kurt.tools.core.runner.subprocess.Popen") as mock_popen:
+            spawn_background_run("fetch", {"url": "x"}, run_id="r1", project_root=str(tmp_path))
+
+        mock_popen.assert_not_called()
+        _, job = queue.claim("w0")
+        assert job["kind"] == "tool"
+        assert job["payload"]["run_id"] == "r1"
+        assert job["payload"]["params"] == {"url": "x"}
+
+    def test_spawn_background_run_falls_back(self, tmp_path):
+        from kurt.tools.core.runner import spawn_background_run
+
+        with patch("kurt.tools.core.runner.subprocess.Popen") as mock_popen:
+            spawn_background_run("fetch", {}, run_id="r1", project_root=str(tmp_path))
+
+        mock_popen.assert_called_once()
+
+
+class TestRunJob:
+    def test_dispatches_tool(self):
+        with patch("kurt.tools.core.runner.run_tool_from_payload") as mock_run:
+            run_job({"kind": "tool", "payload": {"tool": "fetch"}}, db="db")
+        mock_run.assert_called_once_with({"tool": "fetch"}, db="db")
+
+    def test_dispatches_workflow(self):
+        with patch("kurt.workflows.agents.executor.run_payload") as mock_run:
+            run_job({"kind": "workflow", "payload": {"run_id": "r1"}})
+        mock_run.assert_called_once_with({"run_id": "r1"}, db=None)
+
+    def test_unknown_kind(self):
+        with pytest.raises(ValueError):
+            run_job({"kind": "shell"})
+
+    def test_applies_job_env(self):
+        seen = {}
+
+        def run(payload, db=None):
+            seen.update(os.environ)
+
+        env = {"KURT_PARENT_STEP_NAME": "agent_execution"}
+        worker_env = {"KURT_PARENT_WORKFLOW_ID": "stale", "OPENAI_API_KEY": "worker-key"}
+        with (
+            patch.dict(os.environ, worker_env),
+            patch("kurt.tools.core.runner.run_tool_from_payload", side_effect=run),
+        ):
+            run_job({"kind": "tool", "payload": {}, "env": env})
+            assert os.environ["KURT_PARENT_WORKFLOW_ID"] == "stale"
+
+        assert seen["KURT_PARENT_STEP_NAME"] == "agent_execution"
+        assert seen["OPENAI_API_KEY"] == "worker-key"
+        # The worker's own KURT_* variables do not leak into the job
+        assert "KURT_PARENT_WORKFLOW_ID" not in seen
+        assert "KURT_PARENT_STEP_NAME" not in os.environ
+
+    def test_spawn_job(self):
+        job = {"kind": "workflow", "payload": {"project_root": "/p"}, "env": {"KURT_X": "v"}}
+        with (
+            patch.dict(os.environ, {"OPENAI_API_KEY": "k"}),
+            patch("kurt.tools.core.worker_pool.subprocess.Popen") as mock_popen,
+        ):
+            spawn_job(job)
+
+        cmd = mock_popen.call_args.args[0]
+        assert cmd[1:3] == ["-m", "kurt.workflows.agents.executor"]
+        env = mock_popen.call_args.kwargs["env"]
+        assert env["KURT_X"] == "v"
+        assert env["OPENAI_API_KEY"] == "k"
+        assert mock_popen.call_args.kwargs["cwd"] == "/p"
+
+
+class TestWorkerPool:
+    def test_shutdown_hands_off_pending_jobs(self, queue):
+        queue.submit("tool", {"run_id": "a"})
+        queue.submit("tool", {"run_id": "b"})
+        queue.claim("w0")  # Claimed by a worker that didn't finish it
+
+        pool = WorkerPool(workers=0, queue=queue)
+        with patch("kurt.tools.core.worker_pool.spawn_job") as mock_spawn:
+            pool.shutdown(timeout=0)
+
+        assert [c.args[0]["payload"]["run_id"] for c in mock_spawn.call_args_list] == ["a", "b"]
+        assert queue.pending() == []
+        assert list(queue.claimed_dir.iterdir()) == []
+
+    def test_dead_worker_jobs_requeued(self, queue):
+        queue.submit("tool", {"run_id": "a"})
+        queue.claim("w0")
+
+        pool = WorkerPool(workers=1, queue=queue)
+        dead = MagicMock()
+        dead.is_alive.return_value = False
+        pool._processes = [dead]
+        stop = MagicMock()
+        stop.is_set.side_effect = [False, True]
+
+        with (
+            patch.object(pool, "_spawn", return_value=MagicMock()) as mock_spawn,
+            patch.object(pool, "_heartbeat"),
+            patch.object(pool, "shutdown"),
+        ):
+            pool.serve_forever(stop)
+
+        mock_spawn.assert_called_once_with(0)
+        assert queue.claim("w1")[1]["payload"]["run_id"] == "a"
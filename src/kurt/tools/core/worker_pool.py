@@ -0,0 +1,456 @@
+"""
+Warm worker pool for background tool and workflow runs.
+
+Without a pool, every background run (``spawn_background_run``, agent
+``run_definition(background=True)``) starts a fresh ``python -m`` process and
+pays for interpreter start-up, heavy imports and DB connection setup before
+doing any work. ``kurt workers`` starts N worker processes that do that once
+and then pull runs from a file-backed job queue in the project:
+
+    .kurt/queue/pool.json        daemon PID, worker PIDs, heartbeat
+    .kurt/queue/pending/*.json   submitted jobs, oldest first
+    .kurt/queue/claimed/*.json   jobs a worker is running
+
+Submitting writes one file and returns; an idle worker picks it up within
+POLL_INTERVAL. A worker claims a job by renaming it into ``claimed/`` (atomic,
+so each job runs once). When no pool is running (no fresh heartbeat),
+submit_job() returns False and callers fall back to spawning a process.
+
+A job carries the submitter's ``KURT_*`` variables (``KURT_PARENT_*``, run
+settings) and those in JOB_ENV_ALLOWLIST; everything else, API keys included,
+comes from the worker's own environment, so secrets are never written to the
+queue. Jobs claimed by a worker that dies go back to pending (up to
+MAX_JOB_ATTEMPTS times), and jobs still pending when the pool shuts down are
+handed to spawned processes. A submitter that finds the pool gone right after
+queueing takes its job back and spawns a process instead.
+
+Usage:
+    if not submit_job("tool", payload):
+        ...  # spawn a subprocess as before
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Queue directory, relative to the project root
+QUEUE_DIR = Path(".kurt") / "queue"
+
+# Seconds between heartbeats of the pool daemon
+HEARTBEAT_INTERVAL = 2.0
+
+# A pool whose heartbeat is older than this is considered gone
+HEARTBEAT_STALE_AFTER = 10.0
+
+# Seconds an idle worker waits before looking for new jobs
+POLL_INTERVAL = 0.05
+
+# Job kinds and the module that runs each one's payload file in a process
+JOB_KINDS = ("tool", "workflow")
+_JOB_MODULES = {
+    "tool": "kurt.tools.core.runner",
+    "workflow": "kurt.workflows.agents.executor",
+}
+
+# Times a job is started before a worker dying on it drops it
+MAX_JOB_ATTEMPTS = 3
+
+# Variables besides KURT_* that a job takes from its submitter
+JOB_ENV_ALLOWLIST = ("PYTHONPATH", "DO_NOT_TRACK")
+
+
+def job_env(environ: dict[str, str] | None = None) -> dict[str, str]:
+    """The part of ``environ`` (default: os.environ) that is stored with a job."""
+    environ = os.environ if environ is None else environ
+    return {
+        key: value
+        for key, value in environ.items()
+        if key.startswith("KURT_") or key in JOB_ENV_ALLOWLIST
+    }
+
+
+def _merged_env(env: dict[str, str] | None) -> dict[str, str]:
+    """This process's environment with a job's variables in place of its own."""
+    merged = {key: value for key, value in os.environ.items() if key not in job_env()}
+    merged.update(env or {})
+    return merged
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobQueue:
+    """
+    File-backed queue of background run payloads.
+
+    Args:
+        root: Queue directory (default: ``<project>/.kurt/queue``)
+    """
+
+    def __init__(self, root: Path | str | None = None):
+        if root is None:
+            from kurt.config import get_project_root
+
+            root = get_project_root() / QUEUE_DIR
+        self.root = Path(root)
+        self.pending_dir = self.root / "pending"
+        self.claimed_dir = self.root / "claimed"
+        self.pool_file = self.root / "pool.json"
+
+    def submit(self, kind: str, payload: dict[str, Any], env: dict[str, str] | None = None) -> Path:
+        """Add a job to the queue. Returns the job file.
+
+        Args:
+            kind: One of JOB_KINDS
+            payload: Run payload
+            env: Variables to run the job with, see job_env() (default: the worker's)
+        """
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        self.pending_dir.mkdir(parents=True, exist_ok=True)
+        name = f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.json"
+        path = self.pending_dir / name
+        self._write_job(path, {"kind": kind, "payload": payload, "env": env, "attempts": 0})
+        return path
+
+    def withdraw(self, path: Path) -> bool:
+        """Remove a pending job. False if a worker already claimed it."""
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _write_job(self, path: Path, job: dict[str, Any]) -> None:
+        """Atomically write a job file readable only by its owner."""
+        tmp = self.root / f".{path.name}.tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as handle:
+            json.dump(job, handle, default=str)
+        tmp.replace(path)
+
+    def pending(self) -> list[Path]:
+        """Pending job files, oldest first."""
+        try:
+            names = sorted(e.name for e in os.scandir(self.pending_dir) if e.name.endswith(".json"))
+        except FileNotFoundError:
+            return []
+        return [self.pending_dir / name for name in names]
+
+    def claim(self, worker_id: str) -> tuple[Path, dict[str, Any]] | None:
+        """Take the oldest pending job, or None if the queue is empty."""
+        self.claimed_dir.mkdir(parents=True, exist_ok=True)
+        for path in self.pending():
+            claimed = self.claimed_dir / f"{path.stem}.{worker_id}.json"
+            try:
+                path.rename(claimed)
+            except FileNotFoundError:
+                continue  # Another worker got it first
+            try:
+                return claimed, json.loads(claimed.read_text())
+            except (OSError, ValueError):
+                logger.warning("Dropping unreadable job %s", path.name)
+                claimed.unlink(missing_ok=True)
+        return None
+
+    def complete(self, claimed: Path) -> None:
+        """Remove a finished job."""
+        claimed.unlink(missing_ok=True)
+
+    def requeue_claimed(self, worker_id: str | None = None) -> int:
+        """Move jobs left claimed by dead workers back to pending.
+
+        Args:
+            worker_id: Only requeue this worker's jobs (default: all)
+
+        A job that has already been started MAX_JOB_ATTEMPTS times is dropped
+        instead, so one that kills its worker can't restart workers forever.
+        """
+        if not self.claimed_dir.exists():
+            return 0
+        self.pending_dir.mkdir(parents=True, exist_ok=True)
+        pattern = f"*.{worker_id}.json" if worker_id else "*.json"
+        count = 0
+        for path in self.claimed_dir.glob(pattern):
+            job_name = path.name.split(".", 1)[0] + ".json"
+            try:
+                job = json.loads(path.read_text())
+            except (OSError, ValueError):
+                logger.warning("Dropping unreadable job %s", job_name)
+                path.unlink(missing_ok=True)
+                continue
+            job["attempts"] = job.get("attempts", 0) + 1
+            if job["attempts"] >= MAX_JOB_ATTEMPTS:
+                logger.error(
+                    "Dropping %s job %s after %d attempts",
+                    job.get("kind"),
+                    job_name,
+                    job["attempts"],
+                )
+            else:
+                self._write_job(self.pending_dir / job_name, job)
+                count += 1
+            path.unlink(missing_ok=True)
+        return count
+
+    # -- Pool heartbeat ----------------------------------------------------
+
+    def write_heartbeat(self, info: dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / ".pool.json.tmp"
+        tmp.write_text(json.dumps({**info, "heartbeat": time.time()}))
+        tmp.replace(self.pool_file)
+
+    def clear_heartbeat(self) -> None:
+        self.pool_file.unlink(missing_ok=True)
+
+    def pool_info(self) -> dict[str, Any] | None:
+        """The running pool's pool.json, or None if no pool is alive."""
+        try:
+            info = json.loads(self.pool_file.read_text())
+        except (OSError, ValueError):
+            return None
+        if time.time() - info.get("heartbeat", 0) > HEARTBEAT_STALE_AFTER:
+            return None
+        if not _pid_alive(int(info.get("pid", 0))):
+            return None
+        return info
+
+
+def submit_job(kind: str, payload: dict[str, Any], project_root: str | None = None) -> bool:
+    """
+    Queue a background run if a worker pool is running.
+
+    Returns:
+        True if queued, False if the caller should spawn a process instead
+    """
+    try:
+        from kurt.config import get_project_root
+
+        queue = JobQueue(get_project_root(project_root) / QUEUE_DIR)
+        if queue.pool_info() is None:
+            return False
+        path = queue.submit(kind, payload, env=job_env())
+        # The pool may have shut down (and handed off its pending jobs) in between
+        if queue.pool_info() is None and queue.withdraw(path):
+            return False
+    except Exception:
+        logger.debug("Could not queue %s job, spawning a process instead", kind, exc_info=True)
+        return False
+    return True
+
+
+@contextmanager
+def _job_env(env: dict[str, str] | None) -> Iterator[None]:
+    """Run with a job's variables applied, restoring the worker's afterwards."""
+    if env is None:
+        yield
+        return
+    saved = dict(os.environ)
+    merged = _merged_env(env)
+    os.environ.clear()
+    os.environ.update(merged)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+def run_job(job: dict[str, Any], db: Any = None) -> None:
+    """Run one queued job in the current process, with the job's environment."""
+    kind = job.get("kind")
+    payload = job.get("payload") or {}
+    with _job_env(job.get("env")):
+        if kind == "tool":
+            from kurt.tools.core.runner import run_tool_from_payload
+
+            run_tool_from_payload(payload, db=db)
+        elif kind == "workflow":
+            from kurt.workflows.agents.executor import run_payload
+
+            run_payload(payload, db=db)
+        else:
+            raise ValueError(f"Unknown job kind: {kind}")
+
+
+def spawn_job(job: dict[str, Any]) -> None:
+    """Run a queued job in a new process, as callers do when no pool is running."""
+    kind = job.get("kind")
+    if kind not in _JOB_MODULES:
+        raise ValueError(f"Unknown job kind: {kind}")
+    payload = job.get("payload") or {}
+
+    payload_file = tempfile.NamedTemporaryFile("w", delete=False, suffix=".json")
+    with payload_file as handle:
+        json.dump(payload, handle, default=str)
+
+    subprocess.Popen(
+        [sys.executable, "-m", _JOB_MODULES[kind], "--payload", payload_file.name],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=payload.get("project_root") or None,
+        env=_merged_env(job.get("env")) if job.get("env") is not None else None,
+        start_new_session=True,
+    )
+
+
+def _warm_up() -> Any:
+    """Import tool and workflow modules and open the DB once per worker."""
+    import kurt.tools  # noqa: F401  (registers tools, imports their dependencies)
+    import kurt.workflows.agents.executor  # noqa: F401
+    from kurt.tools.core.runner import _get_dolt_db
+
+    try:
+        return _get_dolt_db()
+    except Exception:
+        logger.warning("Worker could not open the database; runs will open their own")
+        return None
+
+
+def _worker_main(root: str, worker_id: str, stop: Any) -> None:
+    """Worker process: warm up, then run queued jobs until ``stop`` is set."""
+    db = _warm_up()
+    queue = JobQueue(root)
+    while not stop.is_set():
+        claimed = queue.claim(worker_id)
+        if claimed is None:
+            stop.wait(POLL_INTERVAL)
+            continue
+        path, job = claimed
+        try:
+            run_job(job, db=db)
+        except Exception:
+            logger.exception("Queued %s job failed", job.get("kind"))
+        finally:
+            queue.complete(path)
+
+
+class WorkerPool:
+    """
+    Daemon that keeps ``workers`` warm worker processes running.
+
+    Dead workers are restarted and the jobs they had claimed re-queued; jobs
+    still pending at shutdown are handed to spawned processes.
+
+    Args:
+        workers: Number of worker processes
+        queue: Job queue to serve (default: the project's queue)
+    """
+
+    def __init__(self, workers: int = 2, queue: JobQueue | None = None):
+        self.workers = workers
+        self.queue = queue or JobQueue()
+        self._ctx = multiprocessing.get_context("spawn")
+        self._stop = self._ctx.Event()
+        self._processes: list[Any] = []
+
+    def _spawn(self, index: int) -> Any:
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(str(self.queue.root), f"w{index}", self._stop),
+            name=f"kurt-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        return process
+
+    def start(self) -> None:
+        """Re-queue orphaned jobs and start the workers."""
+        existing = self.queue.pool_info()
+        if existing is not None and existing.get("pid") != os.getpid():
+            raise RuntimeError(f"A worker pool is already running (pid {existing['pid']})")
+        requeued = self.queue.requeue_claimed()
+        if requeued:
+            logger.info("Re-queued %d interrupted job(s)", requeued)
+        self._processes = [self._spawn(i) for i in range(self.workers)]
+        self._heartbeat()
+
+    def _heartbeat(self) -> None:
+        self.queue.write_heartbeat(
+            {"pid": os.getpid(), "workers": [p.pid for p in self._processes]}
+        )
+
+    def serve_forever(self, stop: threading.Event | None = None) -> None:
+        """Heartbeat and restart dead workers until ``stop`` is set."""
+        stop = stop or threading.Event()
+        try:
+            while not stop.is_set():
+                for i, process in enumerate(self._processes):
+                    if not process.is_alive():
+                        logger.warning("Worker %s exited, restarting", process.name)
+                        requeued = self.queue.requeue_claimed(f"w{i}")
+                        if requeued:
+                            logger.info("Re-queued %d job(s) from %s", requeued, process.name)
+                        self._processes[i] = self._spawn(i)
+                self._heartbeat()
+                stop.wait(HEARTBEAT_INTERVAL)
+        finally:
+            self.shutdown()
+
+    def shutdown(self, timeout: float = 30.0) -> None:
+        """Stop taking jobs; let running jobs finish for up to ``timeout`` seconds.
+
+        Jobs still pending afterwards (and those of workers that had to be
+        terminated) are started as separate processes rather than waiting for
+        the next pool.
+        """
+        self.queue.clear_heartbeat()
+        self._stop.set()
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._processes = []
+        self.queue.requeue_claimed()
+        self._hand_off_pending()
+
+    def _hand_off_pending(self) -> None:
+        """Spawn a process for each pending job."""
+        count = 0
+        while (claimed := self.queue.claim("shutdown")) is not None:
+            path, job = claimed
+            try:
+                spawn_job(job)
+                count += 1
+            except Exception:
+                logger.exception("Could not start queued %s job", job.get("kind"))
+            finally:
+                self.queue.complete(path)
+        if count:
+            logger.info("Started %d pending job(s) as separate processes", count)
+
+
+__all__ = [
+    "QUEUE_DIR",
+    "JobQueue",
+    "WorkerPool",
+    "job_env",
+    "run_job",
+    "spawn_job",
+    "submit_job",
+]
@@ -19,6 +19,7 @@ from .models import (
     BatchFetcher,
     BatchFetchResult,
     FetchDocument,
+    FetchDocumentChunk,
     FetchResult,
     FetchStatus,
 )
@@ -45,6 +46,7 @@ __all__ = [
     "FetchToolConfig",
     # Database models
     "FetchDocument",
+    "FetchDocumentChunk",
     "FetchResult",
     "FetchStatus",
     "BatchFetcher",
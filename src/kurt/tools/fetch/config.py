@@ -59,6 +59,34 @@ class FetchConfig(StepConfig):
         le=500,
         description="Batch size for embedding generation",
     )
+    embedding_cache: bool = ConfigParam(
+        default=True,
+        description="Reuse embeddings of unchanged content from earlier runs",
+    )
+    embedding_mode: str = ConfigParam(
+        default="truncate",
+        description="Embedding mode: truncate (first embedding_max_chars) or chunked (pooled heading chunks)",
+    )
+    embedding_chunk_tokens: int = ConfigParam(
+        default=512,
+        ge=32,
+        le=8191,
+        description="Maximum tokens per chunk in chunked embedding mode",
+    )
+    near_duplicates: bool = ConfigParam(
+        default=True,
+        description="Compute near-duplicate clusters for fetched content",
+    )
+    near_duplicate_threshold: float = ConfigParam(
+        default=0.8,
+        ge=0.5,
+        le=1.0,
+        description="Minimum estimated Jaccard similarity for near-duplicates",
+    )
+    skip_near_duplicates: bool = ConfigParam(
+        default=False,
+        description="Process only the canonical document of each near-duplicate cluster",
+    )
 
     # Runtime flags (CLI only, not loaded from config file)
     dry_run: bool = False  # Preview mode - don't persist changes
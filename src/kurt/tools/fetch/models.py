@@ -3,7 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Optional, Protocol
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field, SQLModel
 
 from kurt.db.models import EmbeddingMixin, TenantMixin, TimestampMixin
@@ -49,6 +49,7 @@ class FetchDocument(EmbeddingMixin, TimestampMixin, TenantMixin, SQLModel, table
     """Persisted fetch results for documents."""
 
     __tablename__ = "fetch_documents"
+    __table_args__ = (Index("idx_fetch_documents_status", "status"),)
 
     document_id: str = Field(primary_key=True)
 
@@ -75,6 +76,22 @@ class FetchDocument(EmbeddingMixin, TimestampMixin, TenantMixin, SQLModel, table
     metadata_json: Optional[dict] = Field(sa_column=Column(JSON), default=None)
 
 
+class FetchDocumentChunk(EmbeddingMixin, TimestampMixin, TenantMixin, SQLModel, table=True):
+    """Per-chunk embeddings for documents fetched with embedding_mode=chunked.
+
+    The pooled document vector is stored in fetch_documents.embedding.
+    """
+
+    __tablename__ = "fetch_document_chunks"
+
+    document_id: str = Field(primary_key=True)
+    chunk_index: int = Field(primary_key=True)
+
+    heading: Optional[str] = Field(default=None)
+    token_count: int = Field(default=0)
+    content_hash: Optional[str] = Field(default=None)
+
+
 class Profile(TimestampMixin, TenantMixin, SQLModel, table=True):
     """Social media profile metadata."""
 
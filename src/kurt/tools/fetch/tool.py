@@ -139,6 +139,34 @@ class FetchToolConfig(BaseModel):
         le=500,
         description="Batch size for embedding generation",
     )
+    embedding_cache: bool = Field(
+        default=True,
+        description="Reuse embeddings of unchanged content from earlier runs",
+    )
+    embedding_mode: Literal["truncate", "chunked"] = Field(
+        default="truncate",
+        description="truncate: embed the first embedding_max_chars; chunked: embed heading-based chunks and pool them",
+    )
+    embedding_chunk_tokens: int = Field(
+        default=512,
+        ge=32,
+        le=8191,
+        description="Maximum tokens per chunk in chunked embedding mode",
+    )
+    near_duplicates: bool = Field(
+        default=True,
+        description="Compute MinHash signatures and near-duplicate clusters for fetched content",
+    )
+    near_duplicate_threshold: float = Field(
+        default=0.8,
+        ge=0.5,
+        le=1.0,
+        description="Minimum estimated Jaccard similarity for near-duplicates",
+    )
+    skip_near_duplicates: bool = Field(
+        default=False,
+        description="Process only the canonical document of each near-duplicate cluster",
+    )
     content_dir: str | None = Field(
         default=None,
         description="Directory to save content (relative to project root)",
@@ -166,6 +194,10 @@ class FetchOutput(BaseModel):
     error: str | None = Field(default=None, description="Error message if failed")
     bytes_fetched: int = Field(default=0, description="Size of fetched content")
     latency_ms: int = Field(default=0, description="Time taken to fetch in ms")
+    duplicate_of: str | None = Field(
+        default=None,
+        description="Canonical document of this document's near-duplicate cluster",
+    )
 
 
 class FetchParams(BaseModel):
@@ -262,6 +294,34 @@ class FetchParams(BaseModel):
         le=500,
         description="Batch size for embedding generation",
     )
+    embedding_cache: bool = Field(
+        default=True,
+        description="Reuse embeddings of unchanged content from earlier runs",
+    )
+    embedding_mode: Literal["truncate", "chunked"] = Field(
+        default="truncate",
+        description="truncate: embed the first embedding_max_chars; chunked: embed heading-based chunks and pool them",
+    )
+    embedding_chunk_tokens: int = Field(
+        default=512,
+        ge=32,
+        le=8191,
+        description="Maximum tokens per chunk in chunked embedding mode",
+    )
+    near_duplicates: bool = Field(
+        default=True,
+        description="Compute MinHash signatures and near-duplicate clusters for fetched content",
+    )
+    near_duplicate_threshold: float = Field(
+        default=0.8,
+        ge=0.5,
+        le=1.0,
+        description="Minimum estimated Jaccard similarity for near-duplicates",
+    )
+    skip_near_duplicates: bool = Field(
+        default=False,
+        description="Process only the canonical document of each near-duplicate cluster",
+    )
     content_dir: str | None = Field(
         default=None,
         description="Directory to save content (relative to project root)",
@@ -296,6 +356,12 @@ class FetchParams(BaseModel):
             embed=self.embed,
             embedding_max_chars=self.embedding_max_chars,
             embedding_batch_size=self.embedding_batch_size,
+            embedding_cache=self.embedding_cache,
+            embedding_mode=self.embedding_mode,
+            embedding_chunk_tokens=self.embedding_chunk_tokens,
+            near_duplicates=self.near_duplicates,
+            near_duplicate_threshold=self.near_duplicate_threshold,
+            skip_near_duplicates=self.skip_near_duplicates,
             content_dir=self.content_dir,
             dry_run=self.dry_run,
         )
@@ -699,6 +765,7 @@ class FetchTool(Tool[FetchParams, FetchOutput]):
     Substeps:
     - fetch_urls: HTTP fetch with retry (progress: urls fetched)
     - save_content: Write content to disk (progress: files saved)
+    - detect_near_duplicates: MinHash clustering, if near_duplicates=true
     - generate_embeddings: If embed=true (progress: embeddings generated)
 
     Engines:
@@ -714,6 +781,8 @@ class FetchTool(Tool[FetchParams, FetchOutput]):
     default_provider = "trafilatura"
     InputModel = FetchParams
     OutputModel = FetchOutput
+    stream_input = True
+    cacheable = False  # Reads the network and persists documents
 
     async def run(
         self,
@@ -761,9 +830,28 @@ class FetchTool(Tool[FetchParams, FetchOutput]):
         web_inputs: list[FetchInput] = []
         web_indices: list[int] = []
 
+        # Known non-canonical near-duplicates are not re-fetched
+        known_duplicates: dict[str, str] = {}
+        if config.skip_near_duplicates:
+            known_duplicates = self._known_near_duplicates(
+                [i.document_id for i in inputs if i.document_id]
+            )
+
         for idx, input_item in enumerate(inputs):
             source_type = (input_item.source_type or "url").lower()
-            if source_type == "file":
+            if input_item.document_id in known_duplicates:
+                fetch_results[idx] = {
+                    "url": input_item.url,
+                    "content": None,
+                    "metadata": None,
+                    "content_hash": "",
+                    "status": FetchStatus.SKIPPED.value,
+                    "error": None,
+                    "bytes_fetched": 0,
+                    "latency_ms": 0,
+                    "duplicate_of": known_duplicates[input_item.document_id],
+                }
+            elif source_type == "file":
                 fetch_results[idx] = await self._fetch_file_input(input_item)
             elif source_type == "cms":
                 fetch_results[idx] = await self._fetch_cms_input(input_item)
@@ -920,7 +1008,56 @@ class FetchTool(Tool[FetchParams, FetchOutput]):
         )
 
         # ----------------------------------------------------------------
-        # Substep 3: generate_embeddings (if enabled or auto-detected)
+        # Substep 3: detect_near_duplicates
+        # ----------------------------------------------------------------
+        duplicate_count = 0
+        if config.near_duplicates and embedding_content:
+            self.emit_progress(
+                on_progress,
+                substep="detect_near_duplicates",
+                status="running",
+                current=0,
+                total=len(embedding_content),
+                message=f"Signing {len(embedding_content)} document(s)",
+            )
+            try:
+                from kurt.documents.near_duplicates import detect_near_duplicates
+
+                assignments = detect_near_duplicates(
+                    {doc_id: content for _, doc_id, content in embedding_content},
+                    threshold=config.near_duplicate_threshold,
+                    persist=not config.dry_run,
+                )
+                for idx, doc_id, _ in embedding_content:
+                    assignment = assignments.get(doc_id)
+                    if assignment is not None and assignment.duplicate_of:
+                        results[idx]["duplicate_of"] = assignment.duplicate_of
+                        duplicate_count += 1
+                if config.skip_near_duplicates:
+                    embedding_content = [
+                        item for item in embedding_content
+                        if not results[item[0]].get("duplicate_of")
+                    ]
+                self.emit_progress(
+                    on_progress,
+                    substep="detect_near_duplicates",
+                    status="completed",
+                    current=len(assignments),
+                    total=len(assignments),
+                    message=f"Found {duplicate_count} near-duplicate(s)",
+                )
+            except Exception as e:
+                # Detection is an optimization; fetch results stand without it
+                logger.warning(f"Near-duplicate detection failed: {e}")
+                self.emit_progress(
+                    on_progress,
+                    substep="detect_near_duplicates",
+                    status="failed",
+                    message=str(e),
+                )
+
+        # ----------------------------------------------------------------
+        # Substep 4: generate_embeddings (if enabled or auto-detected)
         # ----------------------------------------------------------------
         # Auto-detect embedding capability if embed is None
         should_embed = config.embed
@@ -940,23 +1077,51 @@ class FetchTool(Tool[FetchParams, FetchOutput]):
                 message=f"Generating embeddings for {len(embedding_content)} document(s)",
             )
 
+            cache = None
             try:
-                from kurt.tools.batch_embedding import embedding_to_bytes, generate_embeddings
-
-                # Prepare texts for embedding (truncate to max chars from config)
-                max_chars = config.embedding_max_chars
-                texts = [content[:max_chars] for _, _, content in embedding_content]
-
-                # Generate embeddings in a single batch
-                embeddings = generate_embeddings(
-                    texts,
-                    module_name="FETCH",
-                    step_name="generate_embeddings",
+                from kurt.tools.batch_embedding import (
+                    generate_chunked_embeddings,
+                    generate_embeddings,
+                    matrix_to_bytes,
                 )
+                from kurt.tools.batch_embedding.cache import EmbeddingCache
+
+                # Unchanged content is served from the embedding cache
+                if config.embedding_cache:
+                    cache = EmbeddingCache(db=self._embedding_cache_db(context, config))
+
+                if config.embedding_mode == "chunked":
+                    # Embed every heading-based chunk; the document vector is the pooled mean
+                    chunked = generate_chunked_embeddings(
+                        [content for _, _, content in embedding_content],
+                        max_tokens=config.embedding_chunk_tokens,
+                        module_name="FETCH",
+                        step_name="generate_embeddings",
+                        cache=cache,
+                        concurrency=config.concurrency,
+                    )
+                    for (idx, _, _), (_, chunks) in zip(embedding_content, chunked):
+                        results[idx]["chunks"] = chunks
+                    # Whitespace-only documents have no chunks and no vector
+                    embedding_content = [
+                        item for item, (pooled, _) in zip(embedding_content, chunked) if pooled
+                    ]
+                    embeddings = [pooled for pooled, _ in chunked if pooled]
+                else:
+                    # Prepare texts for embedding (truncate to max chars from config)
+                    max_chars = config.embedding_max_chars
+                    texts = [content[:max_chars] for _, _, content in embedding_content]
+
+                    embeddings = generate_embeddings(
+                        texts,
+                        module_name="FETCH",
+                        step_name="generate_embeddings",
+                        cache=cache,
+                    )
 
                 # Store embeddings in results
-                for (idx, doc_id, _), emb in zip(embedding_content, embeddings):
-                    results[idx]["embedding"] = embedding_to_bytes(emb)
+                for (idx, doc_id, _), emb in zip(embedding_content, matrix_to_bytes(embeddings)):
+                    results[idx]["embedding"] = emb
                     embedded_count += 1
 
                     self.emit_progress(
@@ -968,13 +1133,20 @@ class FetchTool(Tool[FetchParams, FetchOutput]):
                         message=f"Embedded {embedded_count}/{len(embedding_content)}",
                     )
 
+                message = f"Generated {embedded_count} embedding(s)"
+                if cache is not None and cache.stats.hits:
+                    message += f" ({cache.stats.hits} cached"
+                    if cache.stats.cost_avoided:
+                        message += f", ~${cache.stats.cost_avoided:.4f} avoided"
+                    message += ")"
                 self.emit_progress(
                     on_progress,
                     substep="generate_embeddings",
                     status="completed",
                     current=embedded_count,
                     total=len(embedding_content),
-                    message=f"Generated {embedded_count} embedding(s)",
+                    message=message,
+                    metadata=cache.stats.to_dict() if cache is not None else None,
                 )
 
             except ImportError as e:
@@ -1012,7 +1184,11 @@ class FetchTool(Tool[FetchParams, FetchOutput]):
             from kurt.tools.fetch.utils import persist_fetch_documents
 
             try:
-                persist_fetch_documents(results, fetch_engine=config.engine)
+                # Skipped known duplicates keep their previous fetch record
+                persist_fetch_documents(
+                    [r for r in results if r.get("document_id") not in known_duplicates],
+                    fetch_engine=config.engine,
+                )
             except Exception as exc:
                 result = ToolResult(success=False, data=[])
                 result.add_error(
@@ -1032,6 +1208,7 @@ class FetchTool(Tool[FetchParams, FetchOutput]):
                 "error": r.get("error"),
                 "bytes_fetched": r.get("bytes_fetched", 0),
                 "latency_ms": r.get("latency_ms", 0),
+                "duplicate_of": r.get("duplicate_of"),
             }
             for r in results
         ]
@@ -1055,6 +1232,14 @@ class FetchTool(Tool[FetchParams, FetchOutput]):
             total=save_count,
         )
 
+        if config.near_duplicates:
+            result.add_substep(
+                name="detect_near_duplicates",
+                status="completed",
+                current=duplicate_count,
+                total=save_count,
+            )
+
         if should_embed:
             result.add_substep(
                 name="generate_embeddings",
@@ -1075,6 +1260,29 @@ class FetchTool(Tool[FetchParams, FetchOutput]):
 
         return result
 
+    @staticmethod
+    def _known_near_duplicates(document_ids: list[str]) -> dict[str, str]:
+        """Map stored non-canonical documents to their canonical document."""
+        if not document_ids:
+            return {}
+        try:
+            from kurt.documents.near_duplicates import load_clusters
+
+            clusters = load_clusters(document_ids)
+        except Exception as e:
+            logger.debug(f"Near-duplicate clusters unavailable: {e}")
+            return {}
+        return {doc_id: cid for doc_id, cid in clusters.items() if cid != doc_id}
+
+    @staticmethod
+    def _embedding_cache_db(context: ToolContext, config: FetchToolConfig) -> Any | None:
+        """Database client for the persistent embedding cache (None = memory only)."""
+        if context.db is None and config.dry_run:
+            return None
+        from kurt.tools.batch_embedding.cache import cache_db
+
+        return cache_db(context.db)
+
     async def _fetch_file_input(self, input_item: FetchInput) -> dict[str, Any]:
         from kurt.tools.fetch.file import fetch_from_file
 
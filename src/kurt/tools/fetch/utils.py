@@ -247,11 +247,14 @@ def persist_fetch_documents(
     Returns:
         Dict with counts: {"inserted": N}
     """
+    from sqlmodel import delete
+
     from kurt.db import managed_session
 
-    from .models import FetchDocument
+    from .models import FetchDocument, FetchDocumentChunk
 
     inserted = 0
+    embeddings: dict[str, bytes] = {}
     with managed_session() as session:
         for row in rows:
             document_id = row.get("document_id")
@@ -286,10 +289,42 @@ def persist_fetch_documents(
                 public_url=row.get("public_url"),
                 error=row.get("error"),
                 metadata_json=metadata,
+                embedding=row.get("embedding"),
             )
             session.merge(doc)  # Upsert
             inserted += 1
 
+            # Chunked embedding mode: replace the document's chunk vectors
+            if "chunks" in row:
+                session.exec(
+                    delete(FetchDocumentChunk).where(
+                        FetchDocumentChunk.document_id == document_id
+                    )
+                )
+                for chunk in row["chunks"]:
+                    session.add(
+                        FetchDocumentChunk(
+                            document_id=document_id,
+                            chunk_index=chunk["index"],
+                            heading=chunk.get("heading"),
+                            token_count=chunk.get("tokens", 0),
+                            content_hash=chunk.get("content_hash"),
+                            embedding=chunk.get("embedding"),
+                        )
+                    )
+            if row.get("embedding"):
+                embeddings[document_id] = row["embedding"]
+
+    # Keep an existing on-disk vector index in sync (best-effort: a stale
+    # index is rebuilt on the next similarity search anyway)
+    if embeddings:
+        try:
+            from kurt.tools.vector_search.store import update_document_index
+
+            update_document_index(embeddings)
+        except Exception as e:
+            logger.debug(f"Vector index update skipped: {e}")
+
     return {"inserted": inserted}
 
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import JSON, Column, UniqueConstraint
+from sqlalchemy import JSON, Column, Index, UniqueConstraint
 from sqlmodel import Field, SQLModel
 
 from kurt.db.models import TenantMixin, TimestampMixin
@@ -46,4 +46,6 @@ class MapDocument(TimestampMixin, TenantMixin, SQLModel, table=True):
 
     __table_args__ = (
         UniqueConstraint("source_url", "doc_type", name="unique_source_doctype"),
+        # Status listings sorted/paged by creation time
+        Index("idx_map_documents_status_created", "status", "created_at"),
     )
@@ -1092,3 +1092,58 @@ class TestMapToolEngineOverride:
         )
         # discovery_method should remain as set
         assert params.discovery_method == "sitemap"
+
+
+class TestMapToolRunStream:
+    """Test crawl streaming in MapTool.run_stream()."""
+
+    @staticmethod
+    def _context() -> ToolContext:
+        mock_http = AsyncMock()
+        mock_http.get = AsyncMock(return_value=Mock(status_code=404, text=""))
+        return ToolContext(http=mock_http)
+
+    @pytest.mark.asyncio
+    async def test_yields_crawl_chunks(self):
+        """Crawled pages are yielded every MAP_STREAM_CHUNK_SIZE pages."""
+
+        async def crawl(http, url, **kwargs):
+            for i in range(3):
+                yield {"url": f"{url}/p{i}", "source_type": "page", "depth": 1}
+
+        params = MapInput(
+            source="url", url="https://example.com", discovery_method="crawl", dry_run=True
+        )
+        with (
+            patch("kurt.tools.map.tool.iter_crawl", side_effect=crawl),
+            patch("kurt.tools.map.tool.MAP_STREAM_CHUNK_SIZE", 2),
+        ):
+            partials = [p async for p in MapTool().run_stream(params, self._context())]
+
+        assert [len(p.data) for p in partials] == [2, 1]
+        assert partials[-1].substeps[0].total == 3
+
+    @pytest.mark.asyncio
+    async def test_single_page_fallback_respects_robots(self):
+        """The start URL isn't emitted when robots.txt disallows it."""
+
+        async def crawl(http, url, **kwargs):
+            return
+            yield
+
+        params = MapInput(
+            source="url",
+            url="https://example.com/private",
+            discovery_method="crawl",
+            dry_run=True,
+        )
+        with (
+            patch("kurt.tools.map.tool.iter_crawl", side_effect=crawl),
+            patch(
+                "kurt.tools.map.tool.check_robots_txt",
+                AsyncMock(return_value={"/private"}),
+            ),
+        ):
+            partials = [p async for p in MapTool().run_stream(params, self._context())]
+
+        assert [p.data for p in partials] == [[]]
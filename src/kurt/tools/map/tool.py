@@ -10,9 +10,10 @@ import hashlib
 import logging
 import re
 import xml.etree.ElementTree as ET
+from contextlib import asynccontextmanager
 from fnmatch import fnmatch
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, AsyncIterator, Literal
 from urllib.parse import parse_qsl, urlencode, urljoin, urlparse
 
 from pydantic import BaseModel, Field, model_validator
@@ -26,6 +27,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Pages per partial result when streaming a crawl (MapTool.run_stream)
+MAP_STREAM_CHUNK_SIZE = 25
+
 # ============================================================================
 # URL Normalization
 # ============================================================================
@@ -529,7 +533,7 @@ async def discover_from_sitemap(
     return filtered_items, None
 
 
-async def discover_from_crawl(
+async def iter_crawl(
     http: AsyncClient,
     start_url: str,
     *,
@@ -542,9 +546,9 @@ async def discover_from_crawl(
     allow_external: bool = False,
     on_progress: ProgressCallback | None = None,
     emit_fn: Any = None,
-) -> list[dict[str, Any]]:
+) -> AsyncIterator[dict[str, Any]]:
     """
-    Discover URLs by recursive crawling.
+    Discover URLs by recursive crawling, yielding each page as it is found.
 
     Args:
         http: HTTP client
@@ -559,8 +563,8 @@ async def discover_from_crawl(
         on_progress: Progress callback
         emit_fn: Function to emit progress events
 
-    Returns:
-        List of discovered items
+    Yields:
+        Discovered items (breadth-first order)
     """
     from html.parser import HTMLParser
 
@@ -579,11 +583,11 @@ async def discover_from_crawl(
     base_domain = parsed_start.netloc
 
     seen: set[str] = set()
-    items: list[dict[str, Any]] = []
+    found = 0
     queue: list[tuple[str, int, str]] = [(normalize_url(start_url), 0, start_url)]
     seen.add(normalize_url(start_url))
 
-    while queue and len(items) < max_pages:
+    while queue and found < max_pages:
         current_url, depth, discovered_from = queue.pop(0)
 
         # Check robots.txt
@@ -596,7 +600,7 @@ async def discover_from_crawl(
                 on_progress,
                 substep="map_url",
                 status="progress",
-                current=len(items),
+                current=found,
                 total=max_pages,
                 message=f"Crawling: {current_url}",
             )
@@ -607,14 +611,13 @@ async def discover_from_crawl(
                 continue
 
             # Add to discovered items
-            items.append(
-                {
-                    "url": current_url,
-                    "source_type": "page",
-                    "discovered_from": discovered_from,
-                    "depth": depth,
-                }
-            )
+            found += 1
+            yield {
+                "url": current_url,
+                "source_type": "page",
+                "discovered_from": discovered_from,
+                "depth": depth,
+            }
 
             # Don't crawl deeper if at max depth
             if depth >= max_depth:
@@ -665,7 +668,45 @@ async def discover_from_crawl(
         except Exception:
             continue
 
-    return items
+
+async def discover_from_crawl(
+    http: AsyncClient,
+    start_url: str,
+    *,
+    max_depth: int,
+    max_pages: int,
+    timeout: float,
+    include_patterns: list[str],
+    exclude_patterns: list[str],
+    disallowed_paths: set[str],
+    allow_external: bool = False,
+    on_progress: ProgressCallback | None = None,
+    emit_fn: Any = None,
+) -> list[dict[str, Any]]:
+    """
+    Discover URLs by recursive crawling.
+
+    Collects ``iter_crawl`` into a list; see it for the arguments.
+
+    Returns:
+        List of discovered items
+    """
+    return [
+        item
+        async for item in iter_crawl(
+            http,
+            start_url,
+            max_depth=max_depth,
+            max_pages=max_pages,
+            timeout=timeout,
+            include_patterns=include_patterns,
+            exclude_patterns=exclude_patterns,
+            disallowed_paths=disallowed_paths,
+            allow_external=allow_external,
+            on_progress=on_progress,
+            emit_fn=emit_fn,
+        )
+    ]
 
 
 async def discover_from_folder(
@@ -817,6 +858,7 @@ class MapTool(Tool[MapInput, MapOutput]):
     default_provider = "sitemap"
     InputModel = MapInput
     OutputModel = MapOutput
+    cacheable = False  # Reads the network and persists documents
 
     async def run(
         self,
@@ -839,18 +881,7 @@ class MapTool(Tool[MapInput, MapOutput]):
         items: list[dict[str, Any]] = []
         error: str | None = None
 
-        # Apply engine override from provider resolution.
-        # When the executor resolves a provider (e.g., "sitemap", "rss", "crawl"),
-        # it injects it as `engine`. Map this to discovery_method so the tool
-        # actually uses the resolved provider.
-        valid_methods = {"sitemap", "crawl", "rss", "folder", "cms"}
-        if params.engine and params.engine in valid_methods:
-            params.discovery_method = params.engine  # type: ignore[assignment]
-            logger.debug(
-                "Engine '%s' overriding discovery_method to '%s'",
-                params.engine,
-                params.discovery_method,
-            )
+        self._apply_engine(params)
 
         # Dispatch based on source type
         if params.source == "url":
@@ -867,13 +898,6 @@ class MapTool(Tool[MapInput, MapOutput]):
             )
             result.success = False
 
-        from kurt.tools.map.utils import (
-            build_rows,
-            get_source_type,
-            persist_map_documents,
-            serialize_rows,
-        )
-
         discovery_method = params.discovery_method
         discovery_url = ""
         if params.source == "url":
@@ -892,14 +916,195 @@ class MapTool(Tool[MapInput, MapOutput]):
             if params.cms_platform:
                 discovery_url = f"{params.cms_platform}/{params.cms_instance or 'default'}"
 
-        source_type = get_source_type(discovery_method)
+        count = self._add_rows(result, items, params, discovery_method, discovery_url)
+
+        # Record substep summary
+        substep_name = f"map_{params.source}"
+        result.add_substep(
+            name=substep_name,
+            status="completed" if result.success else "failed",
+            current=count,
+            total=count,
+        )
+
+        return result
+
+    async def run_stream(
+        self,
+        params: MapInput,
+        context: ToolContext,
+        on_progress: ProgressCallback | None = None,
+    ) -> AsyncIterator[ToolResult]:
+        """
+        Map sources, yielding rows while a crawl is still running.
+
+        Crawl discovery (``discovery_method="crawl"``) persists and yields
+        every ``MAP_STREAM_CHUNK_SIZE`` pages; other discovery methods finish
+        quickly and yield a single result from ``run()``. Both paths share
+        the robots.txt check, crawl options and single-page fallback.
+        """
+        self._apply_engine(params)
+        if params.source != "url" or params.discovery_method != "crawl":
+            yield await self.run(params, context, on_progress)
+            return
+
+        discovery_url = params.url or ""
+        async with self._http_client(params, context) as http:
+            disallowed = await self._check_robots(http, params, on_progress)
+
+            self.emit_progress(
+                on_progress,
+                substep="map_url",
+                status="running",
+                message="Crawling website",
+            )
+            total = 0
+            chunk: list[dict[str, Any]] = []
+            async for item in iter_crawl(
+                http, params.url, **self._crawl_options(params, disallowed, on_progress)
+            ):
+                chunk.append(item)
+                if len(chunk) >= MAP_STREAM_CHUNK_SIZE:
+                    result = ToolResult(success=True)
+                    total += self._add_rows(result, chunk, params, "crawl", discovery_url)
+                    yield result
+                    chunk = []
+
+            if not chunk and not total:
+                chunk = self._robots_allowed(self._single_page(params), params, disallowed)
+
+            result = ToolResult(success=True)
+            total += self._add_rows(result, chunk, params, "crawl", discovery_url)
+            self.emit_progress(
+                on_progress,
+                substep="map_url",
+                status="completed",
+                current=total,
+                total=total,
+            )
+            result.add_substep(name="map_url", status="completed", current=total, total=total)
+            yield result
+
+    # ------------------------------------------------------------------
+    # Helpers shared by run() and run_stream()
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _apply_engine(params: MapInput) -> None:
+        """Use the resolved provider as the discovery method.
+
+        When the executor resolves a provider (e.g., "sitemap", "rss",
+        "crawl"), it injects it as ``engine``.
+        """
+        valid_methods = {"sitemap", "crawl", "rss", "folder", "cms"}
+        if params.engine and params.engine in valid_methods:
+            params.discovery_method = params.engine  # type: ignore[assignment]
+            logger.debug(
+                "Engine '%s' overriding discovery_method to '%s'",
+                params.engine,
+                params.discovery_method,
+            )
+
+    @staticmethod
+    @asynccontextmanager
+    async def _http_client(
+        params: MapInput, context: ToolContext
+    ) -> AsyncIterator[AsyncClient]:
+        """The context's HTTP client, or a new one closed on exit."""
+        if context.http is not None:
+            yield context.http
+            return
+
+        import httpx
+
+        async with httpx.AsyncClient(follow_redirects=True, timeout=params.timeout) as http:
+            yield http
+
+    async def _check_robots(
+        self,
+        http: AsyncClient,
+        params: MapInput,
+        on_progress: ProgressCallback | None,
+    ) -> set[str]:
+        """Paths disallowed by robots.txt (empty unless respect_robots)."""
+        if not params.respect_robots:
+            return set()
+        self.emit_progress(
+            on_progress,
+            substep="map_url",
+            status="running",
+            message="Checking robots.txt",
+        )
+        return await check_robots_txt(http, params.url, params.timeout)
+
+    def _crawl_options(
+        self,
+        params: MapInput,
+        disallowed: set[str],
+        on_progress: ProgressCallback | None,
+    ) -> dict[str, Any]:
+        """Keyword arguments of iter_crawl / discover_from_crawl."""
+        return {
+            "max_depth": params.depth,
+            "max_pages": params.max_pages,
+            "timeout": params.timeout,
+            "include_patterns": params.include_patterns,
+            "exclude_patterns": params.exclude_patterns,
+            "disallowed_paths": disallowed,
+            "allow_external": params.allow_external,
+            "on_progress": on_progress,
+            "emit_fn": self.emit_progress,
+        }
+
+    @staticmethod
+    def _single_page(params: MapInput) -> list[dict[str, Any]]:
+        """The start URL itself, when discovery found nothing."""
+        return [
+            {
+                "url": normalize_url(params.url),
+                "source_type": "page",
+                "discovered_from": params.url,
+                "depth": 0,
+            }
+        ]
+
+    @staticmethod
+    def _robots_allowed(
+        items: list[dict[str, Any]], params: MapInput, disallowed: set[str]
+    ) -> list[dict[str, Any]]:
+        """Drop items blocked by robots.txt."""
+        if not params.respect_robots or not disallowed:
+            return items
+        allowed = []
+        for item in items:
+            if is_blocked_by_robots(item["url"], disallowed):
+                logger.debug("Blocked by robots.txt: %s", item["url"])
+            else:
+                allowed.append(item)
+        return allowed
+
+    @staticmethod
+    def _add_rows(
+        result: ToolResult,
+        items: list[dict[str, Any]],
+        params: MapInput,
+        discovery_method: str,
+        discovery_url: str,
+    ) -> int:
+        """Build, persist (unless dry_run) and append map rows. Returns the row count."""
+        from kurt.tools.map.utils import (
+            build_rows,
+            get_source_type,
+            persist_map_documents,
+            serialize_rows,
+        )
+
         rows = build_rows(
             items,
             discovery_method=discovery_method,
             discovery_url=discovery_url,
-            source_type=source_type,
+            source_type=get_source_type(discovery_method),
         )
-
         if not params.dry_run and rows:
             try:
                 persist_map_documents(rows)
@@ -909,19 +1114,8 @@ class MapTool(Tool[MapInput, MapOutput]):
                     message=str(exc),
                 )
                 result.success = False
-
         result.data.extend(serialize_rows(rows))
-
-        # Record substep summary
-        substep_name = f"map_{params.source}"
-        result.add_substep(
-            name=substep_name,
-            status="completed" if result.success else "failed",
-            current=len(rows),
-            total=len(rows),
-        )
-
-        return result
+        return len(rows)
 
     async def _map_url(
         self,
@@ -930,29 +1124,8 @@ class MapTool(Tool[MapInput, MapOutput]):
         on_progress: ProgressCallback | None,
     ) -> tuple[list[dict[str, Any]], str | None]:
         """Map URLs from a web source."""
-        import httpx
-
-        # Create HTTP client if not in context
-        http = context.http
-        own_client = False
-        if http is None:
-            http = httpx.AsyncClient(
-                follow_redirects=True,
-                timeout=params.timeout,
-            )
-            own_client = True
-
-        try:
-            # Check robots.txt
-            disallowed: set[str] = set()
-            if params.respect_robots:
-                self.emit_progress(
-                    on_progress,
-                    substep="map_url",
-                    status="running",
-                    message="Checking robots.txt",
-                )
-                disallowed = await check_robots_txt(http, params.url, params.timeout)
+        async with self._http_client(params, context) as http:
+            disallowed = await self._check_robots(http, params, on_progress)
 
             items: list[dict[str, Any]] = []
 
@@ -1051,17 +1224,7 @@ class MapTool(Tool[MapInput, MapOutput]):
                     message="Crawling website",
                 )
                 items = await discover_from_crawl(
-                    http,
-                    params.url,
-                    max_depth=params.depth,
-                    max_pages=params.max_pages,
-                    timeout=params.timeout,
-                    include_patterns=params.include_patterns,
-                    exclude_patterns=params.exclude_patterns,
-                    disallowed_paths=disallowed,
-                    allow_external=params.allow_external,
-                    on_progress=on_progress,
-                    emit_fn=self.emit_progress,
+                    http, params.url, **self._crawl_options(params, disallowed, on_progress)
                 )
 
                 self.emit_progress(
@@ -1075,30 +1238,9 @@ class MapTool(Tool[MapInput, MapOutput]):
             # Single page fallback when no items found
             # (crawl returned nothing, or auto mode with depth=0 and no sitemap)
             if not items:
-                items = [
-                    {
-                        "url": normalize_url(params.url),
-                        "source_type": "page",
-                        "discovered_from": params.url,
-                        "depth": 0,
-                    }
-                ]
-
-            # Filter out robots-blocked URLs
-            if params.respect_robots and disallowed:
-                filtered_items = []
-                for item in items:
-                    if is_blocked_by_robots(item["url"], disallowed):
-                        logger.debug("Blocked by robots.txt: %s", item["url"])
-                    else:
-                        filtered_items.append(item)
-                items = filtered_items
-
-            return items, None
-
-        finally:
-            if own_client:
-                await http.aclose()
+                items = self._single_page(params)
+
+            return self._robots_allowed(items, params, disallowed), None
 
     async def _map_folder(
         self,
@@ -1189,6 +1331,7 @@ __all__ = [
     # Discovery functions
     "discover_from_sitemap",
     "discover_from_crawl",
+    "iter_crawl",
     "discover_from_folder",
     "discover_from_cms",
 ]
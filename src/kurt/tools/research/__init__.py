@@ -113,6 +113,7 @@ class ResearchTool(Tool[ResearchInput, ResearchOutput]):
     description = "Execute research queries via Perplexity API with citations"
     InputModel = ResearchInput
     OutputModel = ResearchOutput
+    cacheable = False  # Results depend on a live search API
 
     async def run(
         self,
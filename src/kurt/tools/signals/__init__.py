@@ -141,6 +141,7 @@ class SignalsTool(Tool[SignalInput, SignalOutput]):
     description = "Fetch signals from Reddit, HackerNews, or RSS feeds"
     InputModel = SignalInput
     OutputModel = SignalOutput
+    cacheable = False  # Reads live feeds and persists signals
 
     async def run(
         self,
@@ -3,6 +3,10 @@ SQL tool for executing read-only queries against DoltDB.
 
 Provides parameterized query support to prevent SQL injection.
 Only SELECT queries are allowed - use WriteTool for mutations.
+
+When a step has streaming dependents, SQLTool.run_stream reads the result
+through a server-side cursor (DoltDB.aquery_chunks) and yields it in chunks
+of SQL_STREAM_CHUNK_SIZE rows, so large exports never sit in memory whole.
 """
 
 from __future__ import annotations
@@ -10,7 +14,7 @@ from __future__ import annotations
 import logging
 import re
 import time
-from typing import Any
+from typing import Any, AsyncIterator
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -19,6 +23,9 @@ from ..core.registry import register_tool
 
 logger = logging.getLogger(__name__)
 
+# Rows per partial result when streaming a query (SQLTool.run_stream)
+SQL_STREAM_CHUNK_SIZE = 1000
+
 
 # ============================================================================
 # Input/Output Models
@@ -238,6 +245,7 @@ class SQLTool(Tool[SQLInput, SQLOutput]):
     description = "Execute read-only SQL queries against DoltDB"
     InputModel = SQLInput
     OutputModel = SQLOutput
+    cacheable = False  # Reads live database state
 
     async def run(
         self,
@@ -258,25 +266,7 @@ class SQLTool(Tool[SQLInput, SQLOutput]):
         """
         result = ToolResult(success=True)
         config = params.get_config()
-
-        # Validate database connection
-        if context.db is None:
-            result.add_error(
-                error_type="database_error",
-                message="No database connection in context",
-            )
-            result.success = False
-            return result
-
-        # Validate parameters are provided
-        missing_params = validate_params(config.query, config.params)
-        if missing_params:
-            for param_name in missing_params:
-                result.add_error(
-                    error_type="parameter_error",
-                    message=f"Parameter :{param_name} not provided",
-                )
-            result.success = False
+        if not self._validate(config, context, result):
             return result
 
         # Emit progress
@@ -295,7 +285,7 @@ class SQLTool(Tool[SQLInput, SQLOutput]):
         # Execute query with timeout
         start_time = time.time()
         try:
-            query_result = context.db.query(query_with_placeholders, param_values)
+            query_result = await context.db.aquery(query_with_placeholders, param_values)
             elapsed_ms = int((time.time() - start_time) * 1000)
 
             # Check timeout (even though query completed)
@@ -331,49 +321,155 @@ class SQLTool(Tool[SQLInput, SQLOutput]):
 
         except Exception as e:
             elapsed_ms = int((time.time() - start_time) * 1000)
-            error_message = str(e)
-
-            # Categorize error
-            if "timeout" in error_message.lower():
-                error_type = "timeout_error"
-                message = f"Query timeout after {elapsed_ms}ms"
-            elif "no such table" in error_message.lower() or "table" in error_message.lower() and "not found" in error_message.lower():
-                # Extract table name if possible
-                error_type = "table_not_found"
-                message = error_message
-            elif "syntax" in error_message.lower():
-                error_type = "syntax_error"
-                message = error_message
-            else:
-                error_type = "query_error"
-                message = error_message
+            self._fail(result, e, elapsed_ms, on_progress)
+
+        return result
+
+    async def run_stream(
+        self,
+        params: SQLInput,
+        context: ToolContext,
+        on_progress: ProgressCallback | None = None,
+    ) -> AsyncIterator[ToolResult]:
+        """
+        Execute SQL query, yielding rows in chunks as they are read.
+
+        Each partial result carries up to ``SQL_STREAM_CHUNK_SIZE`` rows; the
+        last one also carries the execute_query substep (and the error, if
+        the query failed part-way through).
+        """
+        result = ToolResult(success=True)
+        config = params.get_config()
+        if not self._validate(config, context, result):
+            yield result
+            return
+
+        self.emit_progress(
+            on_progress,
+            substep="execute_query",
+            status="running",
+            message="Executing SQL query",
+        )
+        query_with_placeholders, param_values = bind_params_positional(
+            config.query, config.params
+        )
+
+        start_time = time.time()
+        total = 0
+        try:
+            async for chunk in context.db.aquery_chunks(
+                query_with_placeholders, param_values, chunk_size=SQL_STREAM_CHUNK_SIZE
+            ):
+                elapsed_ms = int((time.time() - start_time) * 1000)
+                if elapsed_ms > config.timeout_ms:
+                    raise TimeoutError(f"Query timeout after {elapsed_ms}ms")
+                total += len(chunk)
+                self.emit_progress(
+                    on_progress,
+                    substep="execute_query",
+                    status="progress",
+                    current=total,
+                    message=f"Read {total} rows",
+                )
+                yield ToolResult(success=True, data=list(chunk))
+        except Exception as e:
+            elapsed_ms = int((time.time() - start_time) * 1000)
+            self._fail(result, e, elapsed_ms, on_progress, current=total)
+            yield result
+            return
+
+        elapsed_ms = int((time.time() - start_time) * 1000)
+        self.emit_progress(
+            on_progress,
+            substep="execute_query",
+            status="completed",
+            current=total,
+            total=total,
+            message=f"Query returned {total} rows in {elapsed_ms}ms",
+        )
+        result.add_substep(
+            name="execute_query",
+            status="completed",
+            current=total,
+            total=total,
+        )
+        yield result
 
+    def _validate(self, config: SQLConfig, context: ToolContext, result: ToolResult) -> bool:
+        """Check the database connection and parameters, recording errors on ``result``."""
+        # Validate database connection
+        if context.db is None:
             result.add_error(
-                error_type=error_type,
-                message=message,
+                error_type="database_error",
+                message="No database connection in context",
             )
             result.success = False
+            return False
 
-            # Emit failure
-            self.emit_progress(
-                on_progress,
-                substep="execute_query",
-                status="failed",
-                message=message,
-            )
+        # Validate parameters are provided
+        missing_params = validate_params(config.query, config.params)
+        if missing_params:
+            for param_name in missing_params:
+                result.add_error(
+                    error_type="parameter_error",
+                    message=f"Parameter :{param_name} not provided",
+                )
+            result.success = False
+            return False
 
-            # Add substep summary
-            result.add_substep(
-                name="execute_query",
-                status="failed",
-                current=0,
-                total=0,
-            )
+        return True
 
-        return result
+    def _fail(
+        self,
+        result: ToolResult,
+        error: Exception,
+        elapsed_ms: int,
+        on_progress: ProgressCallback | None,
+        current: int = 0,
+    ) -> None:
+        """Record a query failure on ``result`` and emit the failed event."""
+        error_message = str(error)
+
+        # Categorize error
+        if "timeout" in error_message.lower():
+            error_type = "timeout_error"
+            message = f"Query timeout after {elapsed_ms}ms"
+        elif "no such table" in error_message.lower() or "table" in error_message.lower() and "not found" in error_message.lower():
+            # Extract table name if possible
+            error_type = "table_not_found"
+            message = error_message
+        elif "syntax" in error_message.lower():
+            error_type = "syntax_error"
+            message = error_message
+        else:
+            error_type = "query_error"
+            message = error_message
+
+        result.add_error(
+            error_type=error_type,
+            message=message,
+        )
+        result.success = False
+
+        # Emit failure
+        self.emit_progress(
+            on_progress,
+            substep="execute_query",
+            status="failed",
+            message=message,
+        )
+
+        # Add substep summary
+        result.add_substep(
+            name="execute_query",
+            status="failed",
+            current=current,
+            total=current,
+        )
 
 
 __all__ = [
+    "SQL_STREAM_CHUNK_SIZE",
     "SQLConfig",
     "SQLInput",
     "SQLOutput",
@@ -4,7 +4,7 @@ Unit tests for SQLTool.
 
 from __future__ import annotations
 
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from pydantic import ValidationError
@@ -35,13 +35,19 @@ def clean_registry():
     TOOLS.update(saved_tools)
 
 
+def _with_aquery(db: Mock) -> Mock:
+    """Route the async query API to the mocked sync query()."""
+    db.aquery = AsyncMock(side_effect=lambda sql, params=None: db.query(sql, params))
+    return db
+
+
 @pytest.fixture
 def mock_db():
     """Create a mock DoltDB client."""
     db = Mock()
     # Default: return empty results
     db.query.return_value = Mock(rows=[])
-    return db
+    return _with_aquery(db)
 
 
 @pytest.fixture
@@ -58,7 +64,7 @@ def mock_db_with_data():
         return result
 
     db.query.side_effect = query_handler
-    return db
+    return _with_aquery(db)
 
 
 # ============================================================================
@@ -505,6 +511,63 @@ class TestSQLToolSubsteps:
         assert result.substeps[0].status == "failed"
 
 
+# ============================================================================
+# Streaming Tests
+# ============================================================================
+
+
+def _with_chunks(db: Mock, chunks: list[list[dict]], error: Exception | None = None) -> Mock:
+    """Give the mocked DB an aquery_chunks() yielding ``chunks``, then raising ``error``."""
+
+    async def aquery_chunks(sql, params=None, chunk_size=1000):
+        for chunk in chunks:
+            yield chunk
+        if error is not None:
+            raise error
+
+    db.aquery_chunks = Mock(side_effect=aquery_chunks)
+    return db
+
+
+class TestSQLToolStreaming:
+    """Test SQLTool.run_stream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_chunks(self):
+        db = _with_chunks(Mock(), [[{"id": 1}, {"id": 2}], [{"id": 3}]])
+        params = SQLInput(config=SQLConfig(query="SELECT id FROM t WHERE a = :a", params={"a": 1}))
+
+        results = [r async for r in SQLTool().run_stream(params, ToolContext(db=db))]
+
+        assert [r.data for r in results] == [[{"id": 1}, {"id": 2}], [{"id": 3}], []]
+        assert db.aquery_chunks.call_args.args == ("SELECT id FROM t WHERE a = ?", [1])
+        assert results[-1].substeps[0].status == "completed"
+        assert results[-1].substeps[0].current == 3
+
+    @pytest.mark.asyncio
+    async def test_error_after_partial_rows(self):
+        db = _with_chunks(Mock(), [[{"id": 1}]], error=Exception("connection lost"))
+        params = SQLInput(config=SQLConfig(query="SELECT id FROM t"))
+
+        results = [r async for r in SQLTool().run_stream(params, ToolContext(db=db))]
+
+        assert results[0].data == [{"id": 1}]
+        assert results[-1].success is False
+        assert results[-1].errors[0].error_type == "query_error"
+        assert results[-1].substeps[0].current == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_params(self):
+        db = _with_chunks(Mock(), [])
+        params = SQLInput(config=SQLConfig(query="SELECT id FROM t WHERE a = :a"))
+
+        results = [r async for r in SQLTool().run_stream(params, ToolContext(db=db))]
+
+        assert len(results) == 1
+        assert results[0].success is False
+        db.aquery_chunks.assert_not_called()
+
+
 # ============================================================================
 # SQL Injection Prevention Tests
 # ============================================================================
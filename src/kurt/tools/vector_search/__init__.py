@@ -0,0 +1,335 @@
+"""
+VectorSearchTool - Nearest-neighbour search over document embeddings.
+
+Finds the documents most similar to a query text or to an existing document,
+using the on-disk vector index built from ``fetch_documents.embedding``
+(exact cosine scan for small corpora, IVF buckets for large ones).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from ..core.base import ProgressCallback, Tool, ToolContext, ToolResult
+from ..core.registry import register_tool
+from .index import IVF_MIN_VECTORS, VectorIndex
+from .store import get_index_dir, load_document_index, update_document_index
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Pydantic Models
+# ============================================================================
+
+
+class VectorSearchConfig(BaseModel):
+    """Configuration for the vector search tool."""
+
+    k: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Number of similar documents per query",
+    )
+    method: Literal["auto", "exact", "ivf"] = Field(
+        default="auto",
+        description="Search method: exact scan, IVF buckets, or auto by corpus size",
+    )
+    nprobe: int = Field(
+        default=8,
+        ge=1,
+        le=1024,
+        description="IVF buckets scanned per query (higher = better recall, slower)",
+    )
+    query_field: str = Field(
+        default="query",
+        description="Field name in input containing query text",
+    )
+    document_id_field: str = Field(
+        default="document_id",
+        description="Field name in input containing a document to find neighbours of",
+    )
+    rebuild: bool = Field(
+        default=False,
+        description="Rebuild the index from the database before searching",
+    )
+
+
+class VectorSearchOutput(BaseModel):
+    """Output for a single search hit."""
+
+    query: str | None = Field(default=None, description="Query text (text queries)")
+    source_id: str | None = Field(default=None, description="Query document (document queries)")
+    document_id: str = Field(..., description="Matching document ID")
+    score: float = Field(..., description="Cosine similarity")
+    rank: int = Field(..., description="1-based rank within the query")
+
+
+class VectorSearchParams(BaseModel):
+    """Combined parameters for the vector search tool.
+
+    Accepts two input styles:
+    1. Executor style (flat): input_data + k, method, etc. at top level
+    2. Direct API style (nested): inputs + config=VectorSearchConfig(...)
+
+    Each input row is either a text query (``query_field``) or a document
+    (``document_id_field``). A single ``query`` can also be given directly.
+    """
+
+    input_data: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Input rows with query text or document_id (from upstream steps)",
+    )
+    inputs: list[dict[str, Any]] = Field(
+        default_factory=list,
+        description="Input rows (alternative to input_data)",
+    )
+    query: str | None = Field(default=None, description="Single query text")
+    config: VectorSearchConfig | None = Field(
+        default=None,
+        description="Vector search configuration (alternative to flat fields)",
+    )
+
+    # Flat config fields for executor compatibility
+    k: int = Field(default=10, ge=1, le=1000, description="Results per query")
+    method: Literal["auto", "exact", "ivf"] = Field(default="auto", description="Search method")
+    nprobe: int = Field(default=8, ge=1, le=1024, description="IVF buckets scanned per query")
+    query_field: str = Field(default="query", description="Field containing query text")
+    document_id_field: str = Field(default="document_id", description="Field containing document ID")
+    rebuild: bool = Field(default=False, description="Rebuild the index before searching")
+
+    def get_inputs(self) -> list[dict[str, Any]]:
+        """Get the input list from input_data, inputs, or the single query."""
+        if self.input_data:
+            return self.input_data
+        if self.inputs:
+            return self.inputs
+        if self.query:
+            return [{self.get_config().query_field: self.query}]
+        return []
+
+    def get_config(self) -> VectorSearchConfig:
+        """Get config from nested config field or flat fields."""
+        if self.config is not None:
+            return self.config
+        return VectorSearchConfig(
+            k=self.k,
+            method=self.method,
+            nprobe=self.nprobe,
+            query_field=self.query_field,
+            document_id_field=self.document_id_field,
+            rebuild=self.rebuild,
+        )
+
+
+# ============================================================================
+# Search helpers
+# ============================================================================
+
+
+def embed_query(texts: list[str]) -> list[list[float]]:
+    """Embed query texts with the same model fetch uses for documents."""
+    from kurt.tools.batch_embedding import generate_embeddings
+
+    return generate_embeddings(texts, module_name="FETCH", step_name="generate_embeddings")
+
+
+def search_similar(
+    index: VectorIndex,
+    *,
+    query_vector: Any | None = None,
+    document_id: str | None = None,
+    k: int = 10,
+    method: Literal["auto", "exact", "ivf"] = "auto",
+    nprobe: int = 8,
+) -> list[tuple[str, float]]:
+    """
+    Search by vector or by an indexed document (which is excluded from its own results).
+
+    Raises:
+        KeyError: If document_id has no embedding in the index
+    """
+    if document_id is not None:
+        query_vector = index.get(document_id)
+        if query_vector is None:
+            raise KeyError(document_id)
+        return index.search(query_vector, k=k, method=method, nprobe=nprobe, exclude=[document_id])
+    return index.search(query_vector, k=k, method=method, nprobe=nprobe)
+
+
+# ============================================================================
+# VectorSearchTool
+# ============================================================================
+
+
+@register_tool
+class VectorSearchTool(Tool[VectorSearchParams, VectorSearchOutput]):
+    """
+    Find similar documents by embedding.
+
+    Substeps:
+    - load_index: Load (or rebuild) the vector index
+    - search: Run queries (progress: queries completed)
+    """
+
+    name = "vector-search"
+    description = "Find documents similar to a query text or document"
+    InputModel = VectorSearchParams
+    OutputModel = VectorSearchOutput
+    stream_input = True
+    cacheable = False  # Reads live database state
+
+    async def run(
+        self,
+        params: VectorSearchParams,
+        context: ToolContext,
+        on_progress: ProgressCallback | None = None,
+    ) -> ToolResult:
+        """
+        Execute the vector search tool.
+
+        Args:
+            params: Search parameters (inputs and config)
+            context: Execution context
+            on_progress: Optional progress callback
+
+        Returns:
+            ToolResult with one row per hit
+        """
+        config = params.get_config()
+        inputs = params.get_inputs()
+
+        if not inputs:
+            return ToolResult(success=True, data=[])
+
+        # ----------------------------------------------------------------
+        # Substep: load_index
+        # ----------------------------------------------------------------
+        self.emit_progress(
+            on_progress,
+            substep="load_index",
+            status="running",
+            message="Loading vector index",
+        )
+        index = load_document_index(
+            project_root=context.settings.get("project_root"),
+            rebuild=config.rebuild,
+        )
+        if index is None:
+            result = ToolResult(success=False, data=[])
+            result.add_error(
+                error_type="no_embeddings",
+                message="No document embeddings found. Fetch with embed=true first.",
+            )
+            return result
+        self.emit_progress(
+            on_progress,
+            substep="load_index",
+            status="completed",
+            current=len(index),
+            total=len(index),
+            message=f"Loaded {len(index)} vector(s) (dim={index.dimension})",
+        )
+
+        # ----------------------------------------------------------------
+        # Substep: search
+        # ----------------------------------------------------------------
+        text_rows = [
+            i for i, row in enumerate(inputs)
+            if not row.get(config.document_id_field) and row.get(config.query_field)
+        ]
+        query_vectors: dict[int, list[float]] = {}
+        if text_rows:
+            vectors = embed_query([str(inputs[i][config.query_field]) for i in text_rows])
+            query_vectors = dict(zip(text_rows, vectors))
+
+        self.emit_progress(
+            on_progress,
+            substep="search",
+            status="running",
+            current=0,
+            total=len(inputs),
+            message=f"Searching {len(inputs)} quer{'y' if len(inputs) == 1 else 'ies'}",
+        )
+
+        output_data: list[dict[str, Any]] = []
+        result = ToolResult(success=True, data=output_data)
+        for i, row in enumerate(inputs):
+            source_id = row.get(config.document_id_field) or None
+            query = None if source_id else row.get(config.query_field)
+            try:
+                if source_id:
+                    hits = search_similar(
+                        index, document_id=source_id,
+                        k=config.k, method=config.method, nprobe=config.nprobe,
+                    )
+                elif i in query_vectors:
+                    hits = search_similar(
+                        index, query_vector=query_vectors[i],
+                        k=config.k, method=config.method, nprobe=config.nprobe,
+                    )
+                else:
+                    result.add_error(
+                        error_type="invalid_input",
+                        message=f"Row {i} has no '{config.query_field}' or '{config.document_id_field}'",
+                        row_idx=i,
+                    )
+                    continue
+            except KeyError:
+                result.add_error(
+                    error_type="not_indexed",
+                    message=f"Document has no embedding: {source_id}",
+                    row_idx=i,
+                )
+                continue
+            except ValueError as e:
+                result.add_error(error_type="search_failed", message=str(e), row_idx=i)
+                continue
+
+            for rank, (doc_id, score) in enumerate(hits, start=1):
+                output_data.append({
+                    "query": query,
+                    "source_id": source_id,
+                    "document_id": doc_id,
+                    "score": score,
+                    "rank": rank,
+                })
+
+            self.emit_progress(
+                on_progress,
+                substep="search",
+                status="progress",
+                current=i + 1,
+                total=len(inputs),
+            )
+
+        self.emit_progress(
+            on_progress,
+            substep="search",
+            status="completed",
+            current=len(inputs),
+            total=len(inputs),
+            message=f"Found {len(output_data)} match(es)",
+        )
+
+        result.success = len(result.errors) < len(inputs)
+        return result
+
+
+__all__ = [
+    "IVF_MIN_VECTORS",
+    "VectorIndex",
+    "VectorSearchConfig",
+    "VectorSearchOutput",
+    "VectorSearchParams",
+    "VectorSearchTool",
+    "embed_query",
+    "get_index_dir",
+    "load_document_index",
+    "search_similar",
+    "update_document_index",
+]
@@ -0,0 +1,434 @@
+"""
+In-memory / memory-mapped vector index with exact and IVF cosine search.
+
+Pure NumPy. Vectors are L2-normalized on insert so cosine similarity is a
+single matrix-vector product over one contiguous float32 matrix.
+
+Search methods:
+- exact: brute-force scan of the whole matrix (always correct)
+- ivf:   inverted-file index - vectors are bucketed by their nearest k-means
+         centroid and only the ``nprobe`` closest buckets are scanned
+- auto:  ivf once the index is trained and large enough, exact otherwise
+
+On-disk layout (see save/load):
+    <dir>/meta.json        dimension, model, ids, IVF training size
+    <dir>/vectors.npy      (n, d) float32, loaded with mmap_mode="r"
+    <dir>/centroids.npy    (n_lists, d) float32 (IVF only)
+    <dir>/assignments.npy  (n,) int32 bucket per row (IVF only)
+
+Files are written to temp files and renamed into place, so a reader that
+has vectors.npy memory-mapped keeps its (old) file intact.
+
+Usage:
+    index = VectorIndex(dimension=1536)
+    index.add(["doc1", "doc2"], matrix)
+    index.train_ivf()
+    hits = index.search(query_vector, k=10)  # [("doc2", 0.91), ...]
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Literal
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+SearchMethod = Literal["auto", "exact", "ivf"]
+
+# Below this many vectors "auto" always uses exact search
+IVF_MIN_VECTORS = 20_000
+
+# Retrain IVF centroids once the index has grown by this factor since training
+IVF_RETRAIN_GROWTH = 2.0
+
+# Maximum vectors sampled for k-means training
+IVF_TRAIN_SAMPLE = 50_000
+
+# Rows per block when assigning vectors to centroids (bounds temp memory)
+_ASSIGN_BLOCK = 8192
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for vector search. Install with: pip install numpy"
+        )
+
+
+def _normalize(matrix: Any) -> Any:
+    """Return a float32 copy of matrix with unit-length rows (zero rows stay zero)."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _write_atomic(path: Path, write: Any) -> None:
+    """Call ``write(file)`` on a temp file next to ``path``, then rename it over ``path``."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _top_k(scores: Any, k: int) -> Any:
+    """Indices of the k largest scores, sorted descending."""
+    k = min(k, scores.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < scores.shape[0]:
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(scores.shape[0])
+    return idx[np.argsort(-scores[idx], kind="stable")]
+
+
+class VectorIndex:
+    """
+    Cosine-similarity index over a contiguous float32 matrix.
+
+    Rows are addressed by string ids (document_id). ``add`` upserts: an id
+    that already exists has its vector replaced in place.
+
+    Args:
+        dimension: Vector dimension
+        model: Optional embedding model name (informational, saved in meta.json)
+    """
+
+    def __init__(self, dimension: int, model: str | None = None):
+        _require_numpy()
+        self.dimension = dimension
+        self.model = model
+        self.ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._vectors = np.empty((0, dimension), dtype=np.float32)
+
+        # IVF state (None until train_ivf)
+        self._centroids: Any | None = None
+        self._assignments: Any | None = None
+        self._trained_size = 0
+
+    # ------------------------------------------------------------------
+    # Properties
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._positions
+
+    @property
+    def vectors(self) -> Any:
+        """The (n, d) normalized float32 matrix (read-only view)."""
+        view = self._vectors.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether IVF centroids are available."""
+        return self._centroids is not None
+
+    def get(self, item_id: str) -> Any | None:
+        """Return the normalized vector for an id, or None."""
+        pos = self._positions.get(item_id)
+        return None if pos is None else self._vectors[pos]
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def _writable(self) -> None:
+        # Vectors loaded with mmap_mode="r" are copied into memory on first write
+        if not self._vectors.flags.writeable:
+            self._vectors = np.array(self._vectors, dtype=np.float32)
+        if self._assignments is not None and not self._assignments.flags.writeable:
+            self._assignments = np.array(self._assignments, dtype=np.int32)
+
+    def add(self, ids: Iterable[str], vectors: Any) -> int:
+        """
+        Insert or replace vectors.
+
+        Args:
+            ids: Row ids (same length as vectors)
+            vectors: (n, d) array-like
+
+        Returns:
+            Number of new rows appended (replacements are not counted)
+
+        Raises:
+            ValueError: On dimension or length mismatch
+        """
+        ids = list(ids)
+        matrix = _normalize(vectors) if len(ids) else np.empty((0, self.dimension), np.float32)
+        if matrix.shape[0] != len(ids):
+            raise ValueError(f"Got {len(ids)} ids for {matrix.shape[0]} vectors")
+        if len(ids) and matrix.shape[1] != self.dimension:
+            raise ValueError(
+                f"Vector dimension {matrix.shape[1]} does not match index dimension "
+                f"{self.dimension}"
+            )
+        if not ids:
+            return 0
+
+        self._writable()
+
+        # Last write wins for ids repeated within the same call
+        latest: dict[str, int] = {item_id: i for i, item_id in enumerate(ids)}
+        replace = [(self._positions[i], r) for i, r in latest.items() if i in self._positions]
+        append = [(i, r) for i, r in latest.items() if i not in self._positions]
+
+        for pos, row in replace:
+            self._vectors[pos] = matrix[row]
+
+        if append:
+            start = len(self.ids)
+            rows = [r for _, r in append]
+            self._vectors = np.concatenate([self._vectors, matrix[rows]], axis=0)
+            for offset, (item_id, _) in enumerate(append):
+                self.ids.append(item_id)
+                self._positions[item_id] = start + offset
+
+        if self._centroids is not None:
+            self._assignments = self._assignments if self._assignments is not None else (
+                np.empty(0, dtype=np.int32)
+            )
+            if append:
+                self._assignments = np.concatenate(
+                    [self._assignments, np.full(len(append), -1, dtype=np.int32)]
+                )
+            touched = np.array(
+                [p for p, _ in replace] + [self._positions[i] for i, _ in append],
+                dtype=np.int64,
+            )
+            self._assignments[touched] = self._assign(self._vectors[touched])
+            if len(self) >= self._trained_size * IVF_RETRAIN_GROWTH:
+                logger.debug(f"Vector index grew to {len(self)} rows, retraining IVF")
+                self.train_ivf()
+
+        return len(append)
+
+    def remove(self, ids: Iterable[str]) -> int:
+        """
+        Remove rows by id (missing ids are ignored).
+
+        Returns:
+            Number of rows removed
+        """
+        positions = sorted(
+            {self._positions[i] for i in ids if i in self._positions}, reverse=True
+        )
+        if not positions:
+            return 0
+
+        keep = np.ones(len(self.ids), dtype=bool)
+        keep[positions] = False
+        self._vectors = np.ascontiguousarray(self._vectors[keep])
+        if self._assignments is not None:
+            self._assignments = np.ascontiguousarray(self._assignments[keep])
+        self.ids = [i for i, k in zip(self.ids, keep) if k]
+        self._positions = {item_id: pos for pos, item_id in enumerate(self.ids)}
+        return len(positions)
+
+    # ------------------------------------------------------------------
+    # IVF
+    # ------------------------------------------------------------------
+
+    def _assign(self, matrix: Any) -> Any:
+        """Nearest-centroid bucket for each row of a normalized matrix."""
+        out = np.empty(matrix.shape[0], dtype=np.int32)
+        for start in range(0, matrix.shape[0], _ASSIGN_BLOCK):
+            block = matrix[start : start + _ASSIGN_BLOCK]
+            out[start : start + block.shape[0]] = np.argmax(block @ self._centroids.T, axis=1)
+        return out
+
+    def train_ivf(
+        self,
+        n_lists: int | None = None,
+        iterations: int = 10,
+        seed: int = 0,
+    ) -> None:
+        """
+        Train IVF buckets with spherical k-means.
+
+        Args:
+            n_lists: Number of buckets (default: ~sqrt(n), at least 1)
+            iterations: k-means iterations
+            seed: RNG seed (training is deterministic for a given seed)
+        """
+        n = len(self)
+        if n == 0:
+            self._centroids = None
+            self._assignments = None
+            self._trained_size = 0
+            return
+
+        n_lists = max(1, min(n_lists or int(math.sqrt(n)), n))
+        rng = np.random.default_rng(seed)
+
+        sample_idx = np.arange(n)
+        if n > IVF_TRAIN_SAMPLE:
+            sample_idx = np.sort(rng.choice(n, IVF_TRAIN_SAMPLE, replace=False))
+        sample = np.asarray(self._vectors[sample_idx])
+
+        centroids = sample[rng.choice(sample.shape[0], n_lists, replace=False)].copy()
+        for _ in range(iterations):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=n_lists)
+            empty = counts == 0
+            # Re-seed empty buckets from random sample rows
+            if empty.any():
+                sums[empty] = sample[rng.choice(sample.shape[0], int(empty.sum()))]
+            centroids = _normalize(sums)
+
+        self._centroids = centroids
+        self._assignments = self._assign(self._vectors)
+        self._trained_size = n
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: Any,
+        k: int = 10,
+        method: SearchMethod = "auto",
+        nprobe: int = 8,
+        exclude: Iterable[str] | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Top-k cosine similarity search.
+
+        Args:
+            query: Query vector (d,)
+            k: Number of results
+            method: "exact", "ivf" or "auto"
+            nprobe: IVF buckets to scan (ignored for exact)
+            exclude: Ids to drop from the results (e.g. the query document)
+
+        Returns:
+            List of (id, cosine_similarity) sorted by similarity descending
+        """
+        if len(self) == 0 or k <= 0:
+            return []
+
+        q = _normalize(query)[0]
+        if q.shape[0] != self.dimension:
+            raise ValueError(
+                f"Query dimension {q.shape[0]} does not match index dimension {self.dimension}"
+            )
+
+        excluded = {self._positions[i] for i in (exclude or ()) if i in self._positions}
+
+        if method == "auto":
+            method = "ivf" if self.is_trained and len(self) >= IVF_MIN_VECTORS else "exact"
+        if method == "ivf" and not self.is_trained:
+            self.train_ivf()
+
+        if method == "ivf":
+            probes = _top_k(self._centroids @ q, max(1, nprobe))
+            candidates = np.flatnonzero(np.isin(self._assignments, probes))
+        else:
+            candidates = None
+
+        if candidates is None:
+            scores = self._vectors @ q
+            positions = np.arange(len(self))
+        else:
+            scores = self._vectors[candidates] @ q
+            positions = candidates
+
+        if excluded:
+            mask = ~np.isin(positions, list(excluded))
+            scores, positions = scores[mask], positions[mask]
+
+        order = _top_k(scores, k)
+        return [(self.ids[int(positions[i])], float(scores[i])) for i in order]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, directory: str | Path) -> None:
+        """Write the index to a directory (see module docstring for layout)."""
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        vectors = np.ascontiguousarray(self._vectors)
+        _write_atomic(directory / "vectors.npy", lambda f: np.save(f, vectors))
+        if self.is_trained:
+            _write_atomic(directory / "centroids.npy", lambda f: np.save(f, self._centroids))
+            _write_atomic(directory / "assignments.npy", lambda f: np.save(f, self._assignments))
+        else:
+            for name in ("centroids.npy", "assignments.npy"):
+                (directory / name).unlink(missing_ok=True)
+
+        meta = {
+            "dimension": self.dimension,
+            "model": self.model,
+            "ids": self.ids,
+            "trained_size": self._trained_size,
+        }
+        _write_atomic(directory / "meta.json", lambda f: f.write(json.dumps(meta).encode()))
+
+    @classmethod
+    def load(cls, directory: str | Path, mmap: bool = True) -> "VectorIndex":
+        """
+        Load an index written by ``save``.
+
+        Args:
+            directory: Index directory
+            mmap: Memory-map vectors instead of reading them into memory.
+                  The map is copied on the first write.
+
+        Raises:
+            FileNotFoundError: If the directory has no index
+        """
+        _require_numpy()
+        directory = Path(directory)
+        meta = json.loads((directory / "meta.json").read_text())
+        mmap_mode = "r" if mmap else None
+
+        index = cls(dimension=int(meta["dimension"]), model=meta.get("model"))
+        vectors = np.load(directory / "vectors.npy", mmap_mode=mmap_mode)
+        ids = list(meta["ids"])
+        if vectors.shape != (len(ids), index.dimension):
+            raise ValueError(f"Corrupt vector index at {directory}: shape {vectors.shape}")
+
+        index._vectors = vectors
+        index.ids = ids
+        index._positions = {item_id: pos for pos, item_id in enumerate(ids)}
+
+        centroids_path = directory / "centroids.npy"
+        if centroids_path.exists():
+            index._centroids = np.load(centroids_path)
+            index._assignments = np.load(directory / "assignments.npy", mmap_mode=mmap_mode)
+            index._trained_size = int(meta.get("trained_size") or len(ids))
+        return index
+
+
+__all__ = [
+    "IVF_MIN_VECTORS",
+    "SearchMethod",
+    "VectorIndex",
+]
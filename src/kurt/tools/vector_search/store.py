@@ -0,0 +1,199 @@
+"""
+On-disk vector index for fetched documents.
+
+The index mirrors ``fetch_documents.embedding`` and lives under
+``<project>/.kurt/vector_index/``. It is memory-mapped on load, kept in sync
+incrementally when fetch persists new embeddings, and rebuilt from the
+database when it is missing or stale (row count differs from the table).
+Readers hold a shared lock on ``<index dir>/index.lock`` and writers an
+exclusive one, so concurrent fetch batches do not lose each other's updates
+and a reader never sees vectors.npy and meta.json from different saves.
+
+Usage:
+    index = load_document_index()           # load or (re)build
+    hits = index.search(query_vector, k=10)
+
+    update_document_index({"doc1": vector_bytes})  # after persisting embeddings
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator
+
+from kurt.tools.batch_embedding.vectors import bytes_to_matrix
+
+from .index import VectorIndex, np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Index directory, relative to the project root
+VECTOR_INDEX_DIR = ".kurt/vector_index"
+
+# Lock file inside the index directory
+INDEX_LOCK_FILE = "index.lock"
+
+
+def get_index_dir(project_root: str | Path | None = None) -> Path:
+    """Return the document vector index directory for a project."""
+    from kurt.config import get_project_root
+
+    return get_project_root(project_root) / VECTOR_INDEX_DIR
+
+
+@contextmanager
+def index_lock(index_dir: Path, exclusive: bool = True) -> Generator[None, None, None]:
+    """Hold the index lock (blocks until it is free)."""
+    index_dir.mkdir(parents=True, exist_ok=True)
+    with open(index_dir / INDEX_LOCK_FILE, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def load_document_embeddings() -> dict[str, bytes]:
+    """
+    Load all non-null document embeddings from ``fetch_documents``.
+
+    Returns:
+        Dict mapping document_id -> float32 bytes
+    """
+    from sqlmodel import select
+
+    from kurt.db import managed_session
+    from kurt.tools.fetch.models import FetchDocument
+
+    with managed_session() as session:
+        rows = session.exec(
+            select(FetchDocument.document_id, FetchDocument.embedding).where(
+                FetchDocument.embedding.is_not(None)  # type: ignore[union-attr]
+            )
+        ).all()
+    return {doc_id: bytes(vector) for doc_id, vector in rows if vector}
+
+
+def count_document_embeddings() -> int:
+    """Count documents with a stored embedding (cheap staleness check)."""
+    from sqlalchemy import func
+    from sqlmodel import select
+
+    from kurt.db import managed_session
+    from kurt.tools.fetch.models import FetchDocument
+
+    with managed_session() as session:
+        return int(
+            session.exec(
+                select(func.count()).where(
+                    FetchDocument.embedding.is_not(None)  # type: ignore[union-attr]
+                )
+            ).one()
+        )
+
+
+def build_index(embeddings: dict[str, bytes], model: str | None = None) -> VectorIndex | None:
+    """
+    Build an index from stored embeddings.
+
+    The index dimension is the most common embedding size; vectors of any
+    other size (e.g. from a previous embedding model) are skipped.
+
+    Returns:
+        VectorIndex, or None if there are no embeddings
+    """
+    ids = list(embeddings)
+    matrix, kept = bytes_to_matrix([embeddings[i] for i in ids])
+    if not kept:
+        return None
+
+    index = VectorIndex(dimension=matrix.shape[1], model=model)
+    index.add([ids[i] for i in kept], matrix)
+    return index
+
+
+def load_document_index(
+    project_root: str | Path | None = None,
+    rebuild: bool = False,
+) -> VectorIndex | None:
+    """
+    Load the document index, rebuilding it from the database if needed.
+
+    Args:
+        project_root: Project root (default: current project)
+        rebuild: Force a rebuild from ``fetch_documents``
+
+    Returns:
+        VectorIndex, or None if no document has an embedding
+    """
+    index_dir = get_index_dir(project_root)
+
+    if not rebuild and (index_dir / "meta.json").exists():
+        try:
+            with index_lock(index_dir, exclusive=False):
+                index = VectorIndex.load(index_dir)
+            if len(index) == count_document_embeddings():
+                return index
+            logger.debug("Vector index is stale, rebuilding")
+        except Exception as e:
+            logger.debug(f"Could not load vector index, rebuilding: {e}")
+
+    index = build_index(load_document_embeddings())
+    if index is None:
+        return None
+    if len(index) >= 2:
+        index.train_ivf()
+    with index_lock(index_dir):
+        index.save(index_dir)
+    return index
+
+
+def update_document_index(
+    embeddings: dict[str, bytes],
+    project_root: str | Path | None = None,
+) -> int:
+    """
+    Add or replace vectors in the saved index (no-op if no index exists yet).
+
+    Vectors whose dimension differs from the index are ignored; the next
+    ``load_document_index`` call picks up any mismatch as staleness.
+
+    Returns:
+        Number of vectors written
+    """
+    index_dir = get_index_dir(project_root)
+    if np is None or not embeddings or not (index_dir / "meta.json").exists():
+        return 0
+
+    # Load, add and save under one lock so concurrent updates are not lost
+    with index_lock(index_dir):
+        index = VectorIndex.load(index_dir)
+        ids = list(embeddings)
+        matrix, kept = bytes_to_matrix([embeddings[i] for i in ids], dimension=index.dimension)
+        if not kept:
+            return 0
+
+        index.add([ids[i] for i in kept], matrix)
+        index.save(index_dir)
+    return len(kept)
+
+
+__all__ = [
+    "VECTOR_INDEX_DIR",
+    "build_index",
+    "count_document_embeddings",
+    "get_index_dir",
+    "index_lock",
+    "load_document_embeddings",
+    "load_document_index",
+    "update_document_index",
+]
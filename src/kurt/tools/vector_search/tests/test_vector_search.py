@@ -0,0 +1,261 @@
+"""
+Unit tests for the vector index and VectorSearchTool.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from kurt.tools.core import ToolContext
+from kurt.tools.vector_search import (
+    VectorIndex,
+    VectorSearchParams,
+    VectorSearchTool,
+    update_document_index,
+)
+from kurt.tools.vector_search.store import build_index, get_index_dir
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+def _random_vectors(n: int, d: int = 16, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((n, d)).astype(np.float32)
+
+
+def _brute_force(matrix: np.ndarray, query: np.ndarray, k: int) -> list[int]:
+    normed = matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+    scores = normed @ (query / np.linalg.norm(query))
+    return list(np.argsort(-scores)[:k])
+
+
+@pytest.fixture
+def small_index() -> VectorIndex:
+    index = VectorIndex(dimension=3)
+    index.add(
+        ["x", "y", "xy", "z"],
+        [[1, 0, 0], [0, 1, 0], [1, 1, 0], [0, 0, 1]],
+    )
+    return index
+
+
+# ============================================================================
+# VectorIndex
+# ============================================================================
+
+
+class TestVectorIndex:
+    """Test exact/IVF search, mutation and persistence."""
+
+    def test_exact_search_orders_by_cosine(self, small_index):
+        hits = small_index.search([1.0, 0.1, 0.0], k=3, method="exact")
+        assert [doc_id for doc_id, _ in hits] == ["x", "xy", "y"]
+        assert hits[0][1] == pytest.approx(0.995, abs=1e-3)
+
+    def test_exact_matches_brute_force(self):
+        matrix = _random_vectors(500)
+        index = VectorIndex(dimension=16)
+        index.add([str(i) for i in range(500)], matrix)
+        query = _random_vectors(1, seed=1)[0]
+
+        hits = index.search(query, k=10, method="exact")
+        assert [int(doc_id) for doc_id, _ in hits] == _brute_force(matrix, query, 10)
+
+    def test_ivf_full_probe_is_exact(self):
+        matrix = _random_vectors(400)
+        index = VectorIndex(dimension=16)
+        index.add([str(i) for i in range(400)], matrix)
+        index.train_ivf(n_lists=8)
+        query = _random_vectors(1, seed=2)[0]
+
+        ivf = index.search(query, k=5, method="ivf", nprobe=8)
+        exact = index.search(query, k=5, method="exact")
+        assert ivf == exact
+
+    def test_ivf_recall(self):
+        matrix = _random_vectors(2000)
+        index = VectorIndex(dimension=16)
+        index.add([str(i) for i in range(2000)], matrix)
+        index.train_ivf()
+
+        recalls = []
+        for seed in range(10):
+            query = _random_vectors(1, seed=100 + seed)[0]
+            truth = {str(i) for i in _brute_force(matrix, query, 10)}
+            found = {doc_id for doc_id, _ in index.search(query, k=10, method="ivf", nprobe=16)}
+            recalls.append(len(truth & found) / 10)
+        assert np.mean(recalls) >= 0.8
+
+    def test_add_upserts(self, small_index):
+        assert small_index.add(["x", "new"], [[0, 0, 1], [0, 1, 1]]) == 1
+        assert len(small_index) == 5
+        assert small_index.search([0, 0, 1], k=1, method="exact")[0][0] in {"x", "z"}
+
+    def test_remove(self, small_index):
+        assert small_index.remove(["y", "missing"]) == 1
+        assert "y" not in small_index
+        assert [d for d, _ in small_index.search([0, 1, 0], k=4)] == ["xy", "x", "z"]
+
+    def test_exclude(self, small_index):
+        hits = small_index.search([1, 0, 0], k=2, exclude=["x"])
+        assert [d for d, _ in hits] == ["xy", "y"]
+
+    def test_dimension_mismatch(self, small_index):
+        with pytest.raises(ValueError, match="dimension"):
+            small_index.add(["bad"], [[1.0, 2.0]])
+        with pytest.raises(ValueError, match="dimension"):
+            small_index.search([1.0, 2.0])
+
+    def test_save_load_roundtrip(self, tmp_path):
+        matrix = _random_vectors(100)
+        index = VectorIndex(dimension=16, model="m")
+        index.add([str(i) for i in range(100)], matrix)
+        index.train_ivf(n_lists=4)
+        index.save(tmp_path)
+
+        loaded = VectorIndex.load(tmp_path)
+        assert isinstance(loaded.vectors.base, np.memmap) or isinstance(loaded.vectors, np.memmap)
+        assert loaded.model == "m"
+        assert loaded.is_trained
+        query = matrix[3]
+        assert loaded.search(query, k=3, method="ivf", nprobe=4) == index.search(
+            query, k=3, method="ivf", nprobe=4
+        )
+
+        # First write copies the read-only map
+        loaded.add(["extra"], _random_vectors(1, seed=9))
+        assert len(loaded) == 101
+
+    def test_save_replaces_files_under_a_mapped_reader(self, tmp_path):
+        index = VectorIndex(dimension=16)
+        index.add([str(i) for i in range(10)], _random_vectors(10))
+        index.save(tmp_path)
+        reader = VectorIndex.load(tmp_path)
+        before = np.array(reader.vectors)
+
+        index.add(["new"], _random_vectors(1, seed=3))
+        index.save(tmp_path)
+
+        # The reader's map still points at the old, untruncated file
+        assert np.array_equal(np.array(reader.vectors), before)
+        assert len(VectorIndex.load(tmp_path)) == 11
+        assert not list(tmp_path.glob("*.tmp"))
+
+
+# ============================================================================
+# Document index store
+# ============================================================================
+
+
+class TestDocumentIndexStore:
+    """Test building and updating the on-disk document index."""
+
+    def test_build_skips_mismatched_dimension(self):
+        embeddings = {
+            "a": np.ones(4, dtype=np.float32).tobytes(),
+            "b": np.ones(4, dtype=np.float32).tobytes(),
+            "old": np.ones(2, dtype=np.float32).tobytes(),
+        }
+        index = build_index(embeddings)
+        assert index.dimension == 4
+        assert sorted(index.ids) == ["a", "b"]
+
+    def test_build_empty(self):
+        assert build_index({}) is None
+
+    def test_update_without_index_is_noop(self, tmp_path):
+        vector = np.ones(4, dtype=np.float32).tobytes()
+        assert update_document_index({"a": vector}, project_root=tmp_path) == 0
+
+    def test_update_existing_index(self, tmp_path):
+        index_dir = get_index_dir(tmp_path)
+        build_index({"a": np.array([1, 0], dtype=np.float32).tobytes()}).save(index_dir)
+
+        written = update_document_index(
+            {
+                "b": np.array([0, 1], dtype=np.float32).tobytes(),
+                "wrong-dim": np.ones(3, dtype=np.float32).tobytes(),
+            },
+            project_root=tmp_path,
+        )
+
+        assert written == 1
+        assert VectorIndex.load(index_dir).ids == ["a", "b"]
+
+    def test_concurrent_updates_are_not_lost(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        index_dir = get_index_dir(tmp_path)
+        build_index({"a": np.array([1, 0], dtype=np.float32).tobytes()}).save(index_dir)
+
+        def update(i):
+            vector = np.array([i, 1], dtype=np.float32).tobytes()
+            return update_document_index({f"doc{i}": vector}, project_root=tmp_path)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert sum(pool.map(update, range(20))) == 20
+
+        assert len(VectorIndex.load(index_dir)) == 21
+
+
+# ============================================================================
+# VectorSearchTool
+# ============================================================================
+
+
+class TestVectorSearchTool:
+    """Test VectorSearchTool with a patched index loader."""
+
+    @pytest.mark.asyncio
+    async def test_document_query(self, small_index):
+        params = VectorSearchParams(input_data=[{"document_id": "x"}], k=2)
+        with patch(
+            "kurt.tools.vector_search.load_document_index", return_value=small_index
+        ):
+            result = await VectorSearchTool().run(params, ToolContext())
+
+        assert result.success
+        assert [(r["source_id"], r["document_id"], r["rank"]) for r in result.data] == [
+            ("x", "xy", 1),
+            ("x", "y", 2),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_text_query_embedded_once(self, small_index):
+        params = VectorSearchParams(query="about z", k=1)
+        with (
+            patch("kurt.tools.vector_search.load_document_index", return_value=small_index),
+            patch(
+                "kurt.tools.vector_search.embed_query", return_value=[[0.0, 0.0, 1.0]]
+            ) as mock_embed,
+        ):
+            result = await VectorSearchTool().run(params, ToolContext())
+
+        mock_embed.assert_called_once_with(["about z"])
+        assert result.data[0]["document_id"] == "z"
+        assert result.data[0]["query"] == "about z"
+
+    @pytest.mark.asyncio
+    async def test_unindexed_document(self, small_index):
+        params = VectorSearchParams(input_data=[{"document_id": "missing"}, {"document_id": "y"}])
+        with patch(
+            "kurt.tools.vector_search.load_document_index", return_value=small_index
+        ):
+            result = await VectorSearchTool().run(params, ToolContext())
+
+        assert result.success
+        assert result.errors[0].error_type == "not_indexed"
+        assert all(r["source_id"] == "y" for r in result.data)
+
+    @pytest.mark.asyncio
+    async def test_no_embeddings(self):
+        params = VectorSearchParams(query="anything")
+        with patch("kurt.tools.vector_search.load_document_index", return_value=None):
+            result = await VectorSearchTool().run(params, ToolContext())
+
+        assert not result.success
+        assert result.errors[0].error_type == "no_embeddings"
@@ -6,6 +6,14 @@ Supports three write modes:
 - upsert: INSERT or UPDATE on key conflict
 - replace: DELETE then INSERT on key match
 
+Upsert and replace are set-based: rows are written in chunks of
+``batch_size`` (and at most ``max_batch_bytes`` of parameters) with one
+multi-row statement per chunk. Rows repeating a key within a chunk are
+collapsed to the last one, and inserted vs. updated comes from one SELECT of
+the chunk's existing keys rather than a SELECT per row.
+With ``load_data``, rows are bulk-loaded into a staging table from a CSV
+file (LOAD DATA INFILE) and merged with a few set-based statements.
+
 Handles schema inference for auto-creating tables.
 """
 
@@ -13,6 +21,10 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Literal
 
@@ -42,6 +54,13 @@ TYPE_MAPPING = {
 # Default type for unknown Python types
 DEFAULT_SQL_TYPE = "TEXT"
 
+# Rows per multi-row statement in set-based writes
+DEFAULT_BATCH_SIZE = 1000
+
+# Approximate parameter bytes per multi-row statement, kept well below the
+# server's max_allowed_packet when rows carry large text values
+DEFAULT_MAX_BATCH_BYTES = 8 * 1024 * 1024
+
 
 # ============================================================================
 # Pydantic Models
@@ -62,6 +81,8 @@ class WriteStatus(str, Enum):
     INSERTED = "inserted"
     UPDATED = "updated"
     UNCHANGED = "unchanged"
+    # Written by a bulk load that both inserted and updated rows (per-row outcome unknown)
+    WRITTEN = "written"
     ERROR = "error"
 
 
@@ -87,6 +108,20 @@ class WriteConfig(BaseModel):
         default=False,
         description="If True, continue processing after individual row errors",
     )
+    batch_size: int = Field(
+        default=DEFAULT_BATCH_SIZE,
+        ge=1,
+        description="Rows per multi-row statement for upsert/replace",
+    )
+    max_batch_bytes: int = Field(
+        default=DEFAULT_MAX_BATCH_BYTES,
+        ge=1,
+        description="Approximate parameter bytes per multi-row statement",
+    )
+    load_data: bool = Field(
+        default=False,
+        description="Bulk-load rows through a staging table (LOAD DATA INFILE)",
+    )
 
     @model_validator(mode="after")
     def validate_key_for_upsert(self) -> WriteConfig:
@@ -103,7 +138,7 @@ class WriteOutput(BaseModel):
         default=None,
         description="Primary key of the written row",
     )
-    status: Literal["inserted", "updated", "unchanged", "error"] = Field(
+    status: Literal["inserted", "updated", "unchanged", "written", "error"] = Field(
         default="inserted",
         description="Write status",
     )
@@ -151,6 +186,20 @@ class WriteParams(BaseModel):
         default=False,
         description="If True, continue processing after individual row errors",
     )
+    batch_size: int = Field(
+        default=DEFAULT_BATCH_SIZE,
+        ge=1,
+        description="Rows per multi-row statement for upsert/replace",
+    )
+    max_batch_bytes: int = Field(
+        default=DEFAULT_MAX_BATCH_BYTES,
+        ge=1,
+        description="Approximate parameter bytes per multi-row statement",
+    )
+    load_data: bool = Field(
+        default=False,
+        description="Bulk-load rows through a staging table (LOAD DATA INFILE)",
+    )
 
     def get_inputs(self) -> list[WriteInput]:
         """Get the input list from either input_data or inputs field."""
@@ -173,6 +222,9 @@ class WriteParams(BaseModel):
             mode=self.mode,
             key=self.key,
             continue_on_error=self.continue_on_error,
+            batch_size=self.batch_size,
+            max_batch_bytes=self.max_batch_bytes,
+            load_data=self.load_data,
         )
 
 
@@ -273,23 +325,31 @@ def serialize_value(value: Any) -> Any:
     return value
 
 
-def build_insert_sql(table: str, columns: list[str]) -> str:
+def build_insert_sql(table: str, columns: list[str], rows: int = 1) -> str:
     """
     Build INSERT SQL statement.
 
     Args:
         table: Table name
         columns: List of column names
+        rows: Number of VALUES tuples (multi-row insert)
 
     Returns:
         SQL INSERT statement with ? placeholders
     """
     cols = ", ".join(f"`{col}`" for col in columns)
-    placeholders = ", ".join("?" for _ in columns)
-    return f"INSERT INTO `{table}` ({cols}) VALUES ({placeholders})"
+    placeholders = _values_placeholders(len(columns), rows)
+    return f"INSERT INTO `{table}` ({cols}) VALUES {placeholders}"
 
 
-def build_upsert_sql(table: str, columns: list[str], key_columns: list[str]) -> str:
+def _values_placeholders(columns: int, rows: int) -> str:
+    row = "(" + ", ".join("?" for _ in range(columns)) + ")"
+    return ", ".join(row for _ in range(rows))
+
+
+def build_upsert_sql(
+    table: str, columns: list[str], key_columns: list[str], rows: int = 1
+) -> str:
     """
     Build INSERT ... ON DUPLICATE KEY UPDATE SQL statement.
 
@@ -297,12 +357,13 @@ def build_upsert_sql(table: str, columns: list[str], key_columns: list[str]) ->
         table: Table name
         columns: List of column names
         key_columns: Key columns for conflict detection
+        rows: Number of VALUES tuples (multi-row upsert)
 
     Returns:
         SQL upsert statement with ? placeholders
     """
     cols = ", ".join(f"`{col}`" for col in columns)
-    placeholders = ", ".join("?" for _ in columns)
+    placeholders = _values_placeholders(len(columns), rows)
 
     # Build UPDATE clause for non-key columns
     update_cols = [col for col in columns if col not in key_columns]
@@ -313,7 +374,7 @@ def build_upsert_sql(table: str, columns: list[str], key_columns: list[str]) ->
         update_clause = f"`{key_columns[0]}` = `{key_columns[0]}`"
 
     return (
-        f"INSERT INTO `{table}` ({cols}) VALUES ({placeholders}) "
+        f"INSERT INTO `{table}` ({cols}) VALUES {placeholders} "
         f"ON DUPLICATE KEY UPDATE {update_clause}"
     )
 
@@ -333,6 +394,47 @@ def build_delete_sql(table: str, key_columns: list[str]) -> str:
     return f"DELETE FROM `{table}` WHERE {where_clause}"
 
 
+def build_delete_in_sql(table: str, key_columns: list[str], rows: int) -> str:
+    """
+    Build a DELETE SQL statement matching many keys at once.
+
+    Args:
+        table: Table name
+        key_columns: Key columns for the IN clause
+        rows: Number of keys
+
+    Returns:
+        SQL DELETE statement with ? placeholders (key values row by row)
+    """
+    if len(key_columns) == 1:
+        placeholders = ", ".join("?" for _ in range(rows))
+        return f"DELETE FROM `{table}` WHERE `{key_columns[0]}` IN ({placeholders})"
+    cols = ", ".join(f"`{col}`" for col in key_columns)
+    return f"DELETE FROM `{table}` WHERE ({cols}) IN ({_values_placeholders(len(key_columns), rows)})"
+
+
+def build_select_keys_in_sql(table: str, key_columns: list[str], rows: int) -> str:
+    """
+    Build a SELECT returning which of many keys already exist.
+
+    Args:
+        table: Table name
+        key_columns: Key columns for the IN clause
+        rows: Number of keys
+
+    Returns:
+        SQL SELECT statement with ? placeholders (key values row by row)
+    """
+    cols = ", ".join(f"`{col}`" for col in key_columns)
+    if len(key_columns) == 1:
+        placeholders = ", ".join("?" for _ in range(rows))
+        return f"SELECT {cols} FROM `{table}` WHERE {cols} IN ({placeholders})"
+    return (
+        f"SELECT {cols} FROM `{table}` WHERE ({cols}) IN "
+        f"({_values_placeholders(len(key_columns), rows)})"
+    )
+
+
 def build_select_exists_sql(table: str, key_columns: list[str]) -> str:
     """
     Build SELECT EXISTS SQL to check if row exists.
@@ -371,6 +473,172 @@ def table_exists(db: Any, table: str) -> bool:
         return False
 
 
+# ============================================================================
+# Set-based Writes
+# ============================================================================
+
+
+@dataclass
+class _Chunk:
+    """Consecutive input rows with the same columns, written by one statement."""
+
+    columns: list[str]
+    rows: list[dict[str, Any]] = field(default_factory=list)
+    # Input positions each row stands for (several when a key repeats)
+    indices: list[list[int]] = field(default_factory=list)
+    size: int = 0
+
+
+def _row_key(row: dict[str, Any], key_columns: list[str]) -> tuple[Any, ...]:
+    return tuple(serialize_value(row.get(col)) for col in key_columns)
+
+
+def _row_bytes(row: dict[str, Any]) -> int:
+    """Rough size of a row's parameters on the wire."""
+    return sum(len(str(serialize_value(value)).encode("utf-8")) + 8 for value in row.values())
+
+
+def _chunk_rows(
+    inputs: list[WriteInput],
+    batch_size: int,
+    max_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    key_columns: list[str] | None = None,
+) -> list[_Chunk]:
+    """
+    Split rows into chunks sharing the same columns.
+
+    A chunk holds at most batch_size rows and, unless it has a single row,
+    about max_bytes of parameters. With key_columns, a row repeating a key
+    already in its chunk replaces the earlier row (the last occurrence wins).
+    """
+    chunks: list[_Chunk] = []
+    slots: dict[tuple[Any, ...], int] = {}
+    for idx, input_item in enumerate(inputs):
+        row = input_item.row
+        columns = list(row.keys())
+        row_bytes = _row_bytes(row)
+        key = _row_key(row, key_columns) if key_columns else None
+        last = chunks[-1] if chunks else None
+
+        if last is not None and last.columns == columns and key in slots:
+            pos = slots[key]
+            last.size += row_bytes - _row_bytes(last.rows[pos])
+            last.rows[pos] = row
+            last.indices[pos].append(idx)
+            continue
+
+        if (
+            last is None
+            or last.columns != columns
+            or len(last.rows) >= batch_size
+            or last.size + row_bytes > max_bytes
+        ):
+            last = _Chunk(columns=columns)
+            chunks.append(last)
+            slots = {}
+        if key is not None:
+            slots[key] = len(last.rows)
+        last.rows.append(row)
+        last.indices.append([idx])
+        last.size += row_bytes
+    return chunks
+
+
+def _chunk_status(rows: int, inserted: int, updated: int) -> str:
+    """Per-row status when only a set's inserted/updated totals are known."""
+    if inserted == rows:
+        return WriteStatus.INSERTED.value
+    if updated == rows:
+        return WriteStatus.UPDATED.value
+    if inserted == 0 and updated == 0:
+        return WriteStatus.UNCHANGED.value
+    return WriteStatus.WRITTEN.value
+
+
+def _csv_field(value: Any) -> str:
+    """Format a value for LOAD DATA (enclosed by ", escaped by \\, NULL as \\N)."""
+    value = serialize_value(value)
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        value = int(value)
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{text}"'
+
+
+def _supports_load_data(db: Any) -> bool:
+    """LOAD DATA INFILE reads the file on the server, so the server must be local."""
+    is_local = getattr(db, "_is_local_server_target", None)
+    return callable(is_local) and bool(is_local())
+
+
+def build_load_data_sql(
+    table: str,
+    stage: str,
+    csv_path: str,
+    columns: list[str],
+    key_columns: list[str],
+    mode: str,
+) -> tuple[list[str], int, int | None]:
+    """
+    Build the statements of a staging-table bulk load.
+
+    The CSV file is loaded into a temporary copy of the table, merged into
+    the table with set-based statements, and the copy is dropped. For
+    upsert/replace the load uses REPLACE, so a key repeated in the file keeps
+    its last row instead of failing the load.
+
+    Args:
+        table: Target table name
+        stage: Staging (temporary) table name
+        csv_path: CSV file readable by the server
+        columns: Columns in CSV order
+        key_columns: Key columns (upsert/replace)
+        mode: Write mode
+
+    Returns:
+        (statements, index of the statement counting inserted rows,
+        index of the statement counting updated rows or None)
+    """
+    cols = ", ".join(f"`{col}`" for col in columns)
+    staged = ", ".join(f"s.`{col}`" for col in columns)
+    path = csv_path.replace("\\", "\\\\").replace("'", "\\'")
+    duplicates = "REPLACE " if mode in ("upsert", "replace") else ""
+    statements = [
+        f"CREATE TEMPORARY TABLE `{stage}` LIKE `{table}`",
+        f"LOAD DATA INFILE '{path}' {duplicates}INTO TABLE `{stage}` CHARACTER SET utf8mb4 "
+        f"FIELDS TERMINATED BY ',' ENCLOSED BY '\"' LINES TERMINATED BY '\\n' ({cols})",
+    ]
+    on_keys = " AND ".join(f"t.`{col}` = s.`{col}`" for col in key_columns)
+    updated_at: int | None = None
+
+    if mode == "upsert":
+        update_cols = [col for col in columns if col not in key_columns]
+        if update_cols:
+            assignments = ", ".join(f"t.`{col}` = s.`{col}`" for col in update_cols)
+            statements.append(
+                f"UPDATE `{table}` t JOIN `{stage}` s ON {on_keys} SET {assignments}"
+            )
+            updated_at = len(statements) - 1
+        statements.append(
+            f"INSERT INTO `{table}` ({cols}) SELECT {staged} FROM `{stage}` s "
+            f"LEFT JOIN `{table}` t ON {on_keys} WHERE t.`{key_columns[0]}` IS NULL"
+        )
+    elif mode == "replace":
+        keys = ", ".join(f"`{col}`" for col in key_columns)
+        statements.append(
+            f"DELETE FROM `{table}` WHERE ({keys}) IN (SELECT {keys} FROM `{stage}`)"
+        )
+        updated_at = len(statements) - 1
+        statements.append(f"INSERT INTO `{table}` ({cols}) SELECT {staged} FROM `{stage}` s")
+    else:
+        statements.append(f"INSERT INTO `{table}` ({cols}) SELECT {staged} FROM `{stage}` s")
+    inserted_at = len(statements) - 1
+
+    statements.append(f"DROP TEMPORARY TABLE `{stage}`")
+    return statements, inserted_at, updated_at
+
+
 # ============================================================================
 # WriteTool Implementation
 # ============================================================================
@@ -386,8 +654,13 @@ class WriteTool(Tool[WriteParams, WriteOutput]):
 
     Write modes:
     - insert: Simple INSERT (fails on duplicates)
-    - upsert: INSERT or UPDATE on key conflict
-    - replace: DELETE then INSERT on key match
+    - upsert: Multi-row INSERT ... ON DUPLICATE KEY UPDATE per chunk
+    - replace: DELETE ... WHERE key IN (...) then multi-row INSERT per chunk
+
+    Bulk loading (load_data=True):
+    - Rows are written to a CSV file, loaded into a temporary staging table
+      with LOAD DATA INFILE and merged with set-based statements
+    - Requires a local dolt sql-server (falls back to multi-row statements)
 
     Schema creation:
     - Auto-creates table if it doesn't exist
@@ -400,6 +673,8 @@ class WriteTool(Tool[WriteParams, WriteOutput]):
     description = "Persist data to Dolt database tables"
     InputModel = WriteParams
     OutputModel = WriteOutput
+    stream_input = True
+    cacheable = False  # Run for its side effects
 
     async def run(
         self,
@@ -433,7 +708,6 @@ class WriteTool(Tool[WriteParams, WriteOutput]):
 
         db = context.db
         total_rows = len(inputs)
-        results: list[dict[str, Any]] = []
 
         # Normalize key to list
         key_columns: list[str] | None = None
@@ -478,7 +752,76 @@ class WriteTool(Tool[WriteParams, WriteOutput]):
                     cause=e,
                 )
 
-        # Write rows within a transaction
+        if config.load_data or config.mode != "insert":
+            results, inserted_count, updated_count = self._write_set_based(
+                db, config, inputs, key_columns, on_progress
+            )
+        else:
+            results = self._write_in_transaction(db, config, inputs, key_columns, on_progress)
+            inserted_count = sum(
+                1 for r in results if r["status"] == WriteStatus.INSERTED.value
+            )
+            updated_count = sum(1 for r in results if r["status"] == WriteStatus.UPDATED.value)
+        error_count = sum(1 for r in results if r["status"] == WriteStatus.ERROR.value)
+
+        self.emit_progress(
+            on_progress,
+            substep="write_rows",
+            status="completed",
+            current=total_rows,
+            total=total_rows,
+            message=f"Inserted {inserted_count}, updated {updated_count}, errors {error_count}",
+        )
+
+        # Build result
+        result = ToolResult(
+            success=error_count == 0 or config.continue_on_error,
+            data=results,
+        )
+
+        result.add_substep(
+            name="write_rows",
+            status="completed" if error_count == 0 else "completed_with_errors",
+            current=total_rows - error_count,
+            total=total_rows,
+        )
+
+        # Add errors to result
+        for idx, r in enumerate(results):
+            if r.get("error"):
+                result.add_error(
+                    error_type=r["status"],
+                    message=r["error"],
+                    row_idx=idx,
+                    details={"row_id": r["row_id"]},
+                )
+
+        return result
+
+    def _insert_row(
+        self,
+        tx: Any,
+        table: str,
+        columns: list[str],
+        values: list[Any],
+    ) -> str:
+        """Execute an INSERT statement."""
+        sql = build_insert_sql(table, columns)
+        tx.execute(sql, values)
+        return WriteStatus.INSERTED.value
+
+    def _write_in_transaction(
+        self,
+        db: Any,
+        config: WriteConfig,
+        inputs: list[WriteInput],
+        key_columns: list[str] | None,
+        on_progress: ProgressCallback | None,
+    ) -> list[dict[str, Any]]:
+        """Insert rows one statement per row in a transaction (batched on commit)."""
+        total_rows = len(inputs)
+        results: list[dict[str, Any]] = []
+
         try:
             with db.transaction() as tx:
                 inserted_count = 0
@@ -491,19 +834,7 @@ class WriteTool(Tool[WriteParams, WriteOutput]):
                     values = [serialize_value(row[col]) for col in columns]
 
                     try:
-                        if config.mode == "insert":
-                            status = self._insert_row(tx, config.table, columns, values)
-                        elif config.mode == "upsert":
-                            status = self._upsert_row(
-                                tx, config.table, columns, values, key_columns, row
-                            )
-                        elif config.mode == "replace":
-                            status = self._replace_row(
-                                tx, config.table, columns, values, key_columns, row
-                            )
-                        else:
-                            status = WriteStatus.ERROR.value
-                            raise ValueError(f"Unknown mode: {config.mode}")
+                        status = self._insert_row(tx, config.table, columns, values)
 
                         # Get row ID from key columns
                         row_id = self._get_row_id(row, key_columns)
@@ -563,104 +894,232 @@ class WriteTool(Tool[WriteParams, WriteOutput]):
                 cause=e,
             )
 
-        # Count statuses
-        inserted_count = sum(1 for r in results if r["status"] == WriteStatus.INSERTED.value)
-        updated_count = sum(1 for r in results if r["status"] == WriteStatus.UPDATED.value)
-        error_count = sum(1 for r in results if r["status"] == WriteStatus.ERROR.value)
+        return results
 
-        self.emit_progress(
-            on_progress,
-            substep="write_rows",
-            status="completed",
-            current=total_rows,
-            total=total_rows,
-            message=f"Inserted {inserted_count}, updated {updated_count}, errors {error_count}",
-        )
+    def _write_set_based(
+        self,
+        db: Any,
+        config: WriteConfig,
+        inputs: list[WriteInput],
+        key_columns: list[str] | None,
+        on_progress: ProgressCallback | None,
+    ) -> tuple[list[dict[str, Any]], int, int]:
+        """
+        Write rows with one multi-row statement per chunk.
 
-        # Build result
-        result = ToolResult(
-            success=error_count == 0 or config.continue_on_error,
-            data=results,
-        )
+        Without continue_on_error, every chunk runs in one transaction, so a
+        failure writes nothing. With it, each chunk is its own transaction and
+        a failing chunk is retried row by row to isolate the bad rows.
 
-        result.add_substep(
-            name="write_rows",
-            status="completed" if error_count == 0 else "completed_with_errors",
-            current=total_rows - error_count,
-            total=total_rows,
-        )
+        Returns:
+            (per-row results, inserted count, updated count)
+        """
+        if config.load_data:
+            if _supports_load_data(db):
+                return self._write_load_data(db, config, inputs, key_columns)
+            logger.warning("LOAD DATA needs a local dolt sql-server, using multi-row statements")
 
-        # Add errors to result
-        for idx, r in enumerate(results):
-            if r.get("error"):
-                result.add_error(
-                    error_type=r["status"],
-                    message=r["error"],
-                    row_idx=idx,
-                    details={"row_id": r["row_id"]},
+        total_rows = len(inputs)
+        results: list[dict[str, Any]] = [{} for _ in range(total_rows)]
+        counts = {"inserted": 0, "updated": 0}
+        dedupe_keys = key_columns if config.mode in ("upsert", "replace") else None
+        chunks = _chunk_rows(inputs, config.batch_size, config.max_batch_bytes, dedupe_keys)
+        # Keys written by earlier chunks count as existing for later ones
+        written_keys: set[tuple[Any, ...]] = set()
+
+        if not config.continue_on_error:
+            try:
+                existing = []
+                for chunk in chunks:
+                    existing.append(
+                        self._existing_keys(db, config, chunk, dedupe_keys, written_keys)
+                    )
+                    written_keys.update(self._chunk_keys(chunk, dedupe_keys))
+                plans = [self._chunk_batches(config, chunk, key_columns) for chunk in chunks]
+                db.execute_batches([batch for plan in plans for batch in plan])
+            except Exception as e:
+                raise ToolExecutionError(
+                    tool_name="write-db",
+                    message=f"Write failed: {e}",
+                    cause=e,
                 )
-
-        return result
-
-    def _insert_row(
+            for chunk, keys in zip(chunks, existing):
+                self._record_chunk(chunk, keys, dedupe_keys, key_columns, results, counts)
+            self._emit_write_progress(on_progress, total_rows, total_rows, counts, 0)
+            return results, counts["inserted"], counts["updated"]
+
+        written = 0
+        error_count = 0
+        for chunk in chunks:
+            try:
+                keys = self._existing_keys(db, config, chunk, dedupe_keys, written_keys)
+                db.execute_batches(self._chunk_batches(config, chunk, key_columns))
+                self._record_chunk(chunk, keys, dedupe_keys, key_columns, results, counts)
+                written_keys.update(self._chunk_keys(chunk, dedupe_keys))
+            except Exception:
+                # Retry the chunk row by row to find the failing rows
+                for row, indices in zip(chunk.rows, chunk.indices):
+                    single = _Chunk(columns=chunk.columns, rows=[row], indices=[indices])
+                    try:
+                        keys = self._existing_keys(db, config, single, dedupe_keys, written_keys)
+                        db.execute_batches(self._chunk_batches(config, single, key_columns))
+                        self._record_chunk(single, keys, dedupe_keys, key_columns, results, counts)
+                        written_keys.update(self._chunk_keys(single, dedupe_keys))
+                    except Exception as e:
+                        for idx in indices:
+                            results[idx] = {
+                                "row_id": self._get_row_id(row, key_columns),
+                                "status": WriteStatus.ERROR.value,
+                                "error": str(e),
+                            }
+                        error_count += len(indices)
+            written += sum(len(indices) for indices in chunk.indices)
+            self._emit_write_progress(on_progress, written, total_rows, counts, error_count)
+
+        return results, counts["inserted"], counts["updated"]
+
+    def _existing_keys(
         self,
-        tx: Any,
-        table: str,
-        columns: list[str],
-        values: list[Any],
-    ) -> str:
-        """Execute an INSERT statement."""
-        sql = build_insert_sql(table, columns)
-        tx.execute(sql, values)
-        return WriteStatus.INSERTED.value
-
-    def _upsert_row(
+        db: Any,
+        config: WriteConfig,
+        chunk: _Chunk,
+        key_columns: list[str] | None,
+        written_keys: set[tuple[Any, ...]],
+    ) -> set[tuple[Any, ...]]:
+        """Keys of a chunk that already exist, found with one SELECT ... IN."""
+        keys = self._chunk_keys(chunk, key_columns)
+        existing = {key for key in keys if key in written_keys}
+        pending = [key for key in keys if key not in existing]
+        if pending:
+            sql = build_select_keys_in_sql(config.table, key_columns or [], len(pending))
+            result = db.query(sql, [value for key in pending for value in key])
+            existing.update(_row_key(row, key_columns or []) for row in result.rows)
+        return existing
+
+    def _chunk_keys(
+        self, chunk: _Chunk, key_columns: list[str] | None
+    ) -> list[tuple[Any, ...]]:
+        if not key_columns:
+            return []
+        return [_row_key(row, key_columns) for row in chunk.rows]
+
+    def _chunk_batches(
+        self, config: WriteConfig, chunk: _Chunk, key_columns: list[str] | None
+    ) -> list[tuple[str, list[list[Any]]]]:
+        """Statements writing one chunk (see DoltDB.execute_batches)."""
+        n = len(chunk.rows)
+        values = [serialize_value(row[col]) for row in chunk.rows for col in chunk.columns]
+        if config.mode == "upsert":
+            sql = build_upsert_sql(config.table, chunk.columns, key_columns or [], n)
+            return [(sql, [values])]
+        insert = (build_insert_sql(config.table, chunk.columns, n), [values])
+        if config.mode == "replace":
+            keys = [serialize_value(row[col]) for row in chunk.rows for col in key_columns or []]
+            return [(build_delete_in_sql(config.table, key_columns or [], n), [keys]), insert]
+        return [insert]
+
+    def _record_chunk(
         self,
-        tx: Any,
-        table: str,
-        columns: list[str],
-        values: list[Any],
-        key_columns: list[str],
-        row: dict[str, Any],
-    ) -> str:
-        """Execute an UPSERT (INSERT ... ON DUPLICATE KEY UPDATE)."""
-        # Check if row exists
-        exists_sql = build_select_exists_sql(table, key_columns)
-        key_values = [row[col] for col in key_columns]
-        result = tx.query(exists_sql, key_values)
-        existed = len(result.rows) > 0
-
-        # Execute upsert
-        sql = build_upsert_sql(table, columns, key_columns)
-        tx.execute(sql, values)
-
-        return WriteStatus.UPDATED.value if existed else WriteStatus.INSERTED.value
-
-    def _replace_row(
+        chunk: _Chunk,
+        existing: set[tuple[Any, ...]],
+        dedupe_keys: list[str] | None,
+        key_columns: list[str] | None,
+        results: list[dict[str, Any]],
+        counts: dict[str, int],
+    ) -> None:
+        """Record a written chunk: rows whose key existed were updated."""
+        for row, indices in zip(chunk.rows, chunk.indices):
+            if dedupe_keys and _row_key(row, dedupe_keys) in existing:
+                status = WriteStatus.UPDATED.value
+                counts["updated"] += 1
+            else:
+                status = WriteStatus.INSERTED.value
+                counts["inserted"] += 1
+            for idx in indices:
+                results[idx] = {
+                    "row_id": self._get_row_id(row, key_columns),
+                    "status": status,
+                    "error": None,
+                }
+
+    def _write_load_data(
         self,
-        tx: Any,
-        table: str,
-        columns: list[str],
-        values: list[Any],
-        key_columns: list[str],
-        row: dict[str, Any],
-    ) -> str:
-        """Execute DELETE then INSERT (replace mode)."""
-        # Check if row exists and delete if so
-        exists_sql = build_select_exists_sql(table, key_columns)
-        key_values = [row[col] for col in key_columns]
-        result = tx.query(exists_sql, key_values)
-        existed = len(result.rows) > 0
-
-        if existed:
-            delete_sql = build_delete_sql(table, key_columns)
-            tx.execute(delete_sql, key_values)
+        db: Any,
+        config: WriteConfig,
+        inputs: list[WriteInput],
+        key_columns: list[str] | None,
+    ) -> tuple[list[dict[str, Any]], int, int]:
+        """
+        Bulk-load rows into a staging table from a CSV file, then merge.
 
-        # Insert new row
-        insert_sql = build_insert_sql(table, columns)
-        tx.execute(insert_sql, values)
+        Columns missing from a row are loaded as NULL. For upsert/replace a
+        repeated key keeps its last row, as in the multi-row path.
+        """
+        columns: list[str] = []
+        for input_item in inputs:
+            columns.extend(col for col in input_item.row if col not in columns)
+
+        rows: list[dict[str, Any]] = [item.row for item in inputs]
+        if key_columns and config.mode in ("upsert", "replace"):
+            unique: dict[tuple[Any, ...], dict[str, Any]] = {}
+            for row in rows:
+                unique[_row_key(row, key_columns)] = row
+            rows = list(unique.values())
+
+        stage = f"_kurt_stage_{uuid.uuid4().hex[:12]}"
+        fd, csv_path = tempfile.mkstemp(prefix="kurt-write-", suffix=".csv")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                for row in rows:
+                    f.write(",".join(_csv_field(row.get(col)) for col in columns) + "\n")
 
-        return WriteStatus.UPDATED.value if existed else WriteStatus.INSERTED.value
+            statements, inserted_at, updated_at = build_load_data_sql(
+                config.table, stage, csv_path, columns, key_columns or [], config.mode
+            )
+            outcomes = db.execute_batches([(sql, [[]]) for sql in statements])
+        except Exception as e:
+            raise ToolExecutionError(
+                tool_name="write-db",
+                message=f"Bulk load failed: {e}",
+                cause=e,
+            )
+        finally:
+            os.unlink(csv_path)
+
+        n = len(rows)
+        updated = min(outcomes[updated_at].affected_rows or 0, n) if updated_at is not None else 0
+        inserted = min(outcomes[inserted_at].affected_rows or 0, n)
+        if config.mode == "replace":
+            inserted = n - updated
+
+        status = _chunk_status(n, inserted, updated)
+        results = [
+            {"row_id": self._get_row_id(item.row, key_columns), "status": status, "error": None}
+            for item in inputs
+        ]
+        return results, inserted, updated
+
+    def _emit_write_progress(
+        self,
+        on_progress: ProgressCallback | None,
+        written: int,
+        total_rows: int,
+        counts: dict[str, int],
+        error_count: int,
+    ) -> None:
+        self.emit_progress(
+            on_progress,
+            substep="write_rows",
+            status="progress",
+            current=written,
+            total=total_rows,
+            message=f"Written {written}/{total_rows}",
+            metadata={
+                "inserted": counts["inserted"],
+                "updated": counts["updated"],
+                "errors": error_count,
+            },
+        )
 
     def _get_row_id(
         self,
@@ -700,6 +1159,8 @@ __all__ = [
     "build_insert_sql",
     "build_upsert_sql",
     "build_delete_sql",
+    "build_delete_in_sql",
+    "build_select_keys_in_sql",
     "build_select_exists_sql",
     "table_exists",
 ]
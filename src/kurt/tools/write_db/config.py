@@ -5,6 +5,9 @@ Config values can be set in kurt.config with WRITE_DB.* prefix:
 
     WRITE_DB.MODE=upsert
     WRITE_DB.CONTINUE_ON_ERROR=true
+    WRITE_DB.BATCH_SIZE=5000
+    WRITE_DB.MAX_BATCH_BYTES=4194304
+    WRITE_DB.LOAD_DATA=true
 
 Usage:
     # Load from config file
@@ -40,3 +43,17 @@ class WriteToolConfig(StepConfig):
         default=False,
         description="If True, continue processing after individual row errors",
     )
+    batch_size: int = ConfigParam(
+        default=1000,
+        ge=1,
+        description="Rows per multi-row statement for upsert/replace",
+    )
+    max_batch_bytes: int = ConfigParam(
+        default=8 * 1024 * 1024,
+        ge=1,
+        description="Approximate parameter bytes per multi-row statement",
+    )
+    load_data: bool = ConfigParam(
+        default=False,
+        description="Bulk-load rows through a staging table (LOAD DATA INFILE)",
+    )
@@ -4,11 +4,14 @@ Unit tests for WriteTool.
 
 from __future__ import annotations
 
+import re
+import sqlite3
 from unittest.mock import MagicMock
 
 import pytest
 from pydantic import ValidationError
 
+from kurt.db.exceptions import QueryResult
 from kurt.tools.core import TOOLS, SubstepEvent, ToolContext, ToolExecutionError, clear_registry
 from kurt.tools.write_db import (
     WriteConfig,
@@ -17,9 +20,12 @@ from kurt.tools.write_db import (
     WriteParams,
     WriteTool,
     build_create_table_sql,
+    build_delete_in_sql,
     build_delete_sql,
     build_insert_sql,
+    build_load_data_sql,
     build_select_exists_sql,
+    build_select_keys_in_sql,
     build_upsert_sql,
     infer_schema_from_row,
     infer_sql_type,
@@ -61,6 +67,47 @@ def mock_db():
     return db
 
 
+class SqliteDB:
+    """DoltDB stand-in running the tool's statements on in-memory SQLite."""
+
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.row_factory = sqlite3.Row
+
+    def _sql(self, sql):
+        return re.sub(
+            r"ON DUPLICATE KEY UPDATE (.*)",
+            lambda m: "ON CONFLICT DO UPDATE SET "
+            + re.sub(r"VALUES\((`\w+`)\)", r"excluded.\1", m.group(1)),
+            sql.replace(" AUTO_INCREMENT", ""),
+        )
+
+    def query(self, sql, params=None):
+        cursor = self.conn.execute(self._sql(sql), params or [])
+        return QueryResult(rows=[dict(row) for row in cursor.fetchall()])
+
+    def execute(self, sql, params=None):
+        with self.conn:
+            cursor = self.conn.execute(self._sql(sql), params or [])
+        return QueryResult(rows=[], affected_rows=cursor.rowcount)
+
+    def execute_batches(self, batches):
+        results = []
+        with self.conn:
+            for sql, params_list in batches:
+                affected = sum(
+                    self.conn.execute(self._sql(sql), params).rowcount for params in params_list
+                )
+                results.append(QueryResult(rows=[], affected_rows=affected))
+        return results
+
+
+@pytest.fixture
+def sqlite_db():
+    """A DoltDB stand-in backed by SQLite."""
+    return SqliteDB()
+
+
 @pytest.fixture
 def mock_context(mock_db):
     """Create a ToolContext with mock database."""
@@ -212,6 +259,12 @@ class TestBuildInsertSql:
 
         assert sql == "INSERT INTO `items` (`value`) VALUES (?)"
 
+    def test_multi_row_insert(self):
+        """Insert several rows in one statement."""
+        sql = build_insert_sql("items", ["a", "b"], rows=2)
+
+        assert sql == "INSERT INTO `items` (`a`, `b`) VALUES (?, ?), (?, ?)"
+
 
 class TestBuildUpsertSql:
     """Test UPSERT (INSERT ON DUPLICATE KEY UPDATE) SQL generation."""
@@ -243,6 +296,12 @@ class TestBuildUpsertSql:
         # Should have a no-op update
         assert "ON DUPLICATE KEY UPDATE `k1` = `k1`" in sql
 
+    def test_multi_row_upsert(self):
+        """Upsert several rows in one statement."""
+        sql = build_upsert_sql("pages", ["url", "title"], ["url"], rows=3)
+
+        assert "VALUES (?, ?), (?, ?), (?, ?) ON DUPLICATE KEY UPDATE" in sql
+
 
 class TestBuildDeleteSql:
     """Test DELETE SQL generation."""
@@ -260,6 +319,67 @@ class TestBuildDeleteSql:
         assert sql == "DELETE FROM `items` WHERE `source` = ? AND `url` = ?"
 
 
+class TestBuildDeleteInSql:
+    """Test set-based DELETE SQL generation."""
+
+    def test_single_key(self):
+        sql = build_delete_in_sql("pages", ["url"], 3)
+
+        assert sql == "DELETE FROM `pages` WHERE `url` IN (?, ?, ?)"
+
+    def test_composite_key(self):
+        sql = build_delete_in_sql("items", ["source", "url"], 2)
+
+        assert sql == "DELETE FROM `items` WHERE (`source`, `url`) IN ((?, ?), (?, ?))"
+
+
+class TestBuildLoadDataSql:
+    """Test staging-table bulk load SQL generation."""
+
+    def test_upsert(self):
+        statements, inserted_at, updated_at = build_load_data_sql(
+            "pages", "stage", "/tmp/rows.csv", ["url", "title"], ["url"], "upsert"
+        )
+
+        assert statements[0] == "CREATE TEMPORARY TABLE `stage` LIKE `pages`"
+        assert statements[1].startswith(
+            "LOAD DATA INFILE '/tmp/rows.csv' REPLACE INTO TABLE `stage`"
+        )
+        assert statements[updated_at].startswith("UPDATE `pages` t JOIN `stage` s")
+        assert "WHERE t.`url` IS NULL" in statements[inserted_at]
+        assert statements[-1] == "DROP TEMPORARY TABLE `stage`"
+
+    def test_replace(self):
+        statements, inserted_at, updated_at = build_load_data_sql(
+            "pages", "stage", "/tmp/rows.csv", ["url", "title"], ["url"], "replace"
+        )
+
+        assert statements[updated_at] == (
+            "DELETE FROM `pages` WHERE (`url`) IN (SELECT `url` FROM `stage`)"
+        )
+        assert statements[inserted_at].startswith("INSERT INTO `pages`")
+
+    def test_insert_has_no_update_step(self):
+        statements, _, updated_at = build_load_data_sql(
+            "pages", "stage", "/tmp/rows.csv", ["url"], [], "insert"
+        )
+
+        assert updated_at is None
+        assert "REPLACE" not in statements[1]
+
+
+class TestBuildSelectKeysInSql:
+    """Test build_select_keys_in_sql function."""
+
+    def test_single_key(self):
+        sql = build_select_keys_in_sql("pages", ["url"], 2)
+        assert sql == "SELECT `url` FROM `pages` WHERE `url` IN (?, ?)"
+
+    def test_composite_key(self):
+        sql = build_select_keys_in_sql("t", ["a", "b"], 2)
+        assert sql == "SELECT `a`, `b` FROM `t` WHERE (`a`, `b`) IN ((?, ?), (?, ?))"
+
+
 class TestBuildSelectExistsSql:
     """Test SELECT EXISTS SQL generation."""
 
@@ -526,12 +646,8 @@ class TestWriteToolExecution:
 
     @pytest.mark.asyncio
     async def test_upsert_new_row(self, mock_db):
-        """Upsert a new row (insert)."""
-        tx = MagicMock()
-        tx.query.return_value = MagicMock(rows=[])  # Row doesn't exist
-        tx.execute.return_value = None
-        mock_db.transaction.return_value.__enter__.return_value = tx
-        mock_db.transaction.return_value.__exit__.return_value = False
+        """Upsert a row whose key does not exist yet (insert)."""
+        mock_db.execute_batches.return_value = [QueryResult(rows=[], affected_rows=1)]
 
         tool = WriteTool()
         params = WriteParams(
@@ -547,12 +663,9 @@ class TestWriteToolExecution:
 
     @pytest.mark.asyncio
     async def test_upsert_existing_row(self, mock_db):
-        """Upsert an existing row (update)."""
-        tx = MagicMock()
-        tx.query.return_value = MagicMock(rows=[{"1": 1}])  # Row exists
-        tx.execute.return_value = None
-        mock_db.transaction.return_value.__enter__.return_value = tx
-        mock_db.transaction.return_value.__exit__.return_value = False
+        """Upsert a row whose key already exists (update)."""
+        mock_db.query.return_value = QueryResult(rows=[{"url": "https://example.com"}])
+        mock_db.execute_batches.return_value = [QueryResult(rows=[], affected_rows=2)]
 
         tool = WriteTool()
         params = WriteParams(
@@ -565,15 +678,44 @@ class TestWriteToolExecution:
 
         assert result.success is True
         assert result.data[0]["status"] == "updated"
+        mock_db.transaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upsert_is_chunked(self, mock_db):
+        """Upsert writes one multi-row statement per chunk, in one transaction."""
+        mock_db.query.side_effect = lambda sql, params=None: QueryResult(
+            rows=[{"url": url} for url in params or [] if url == "/p1"]
+        )
+        mock_db.execute_batches.return_value = [
+            QueryResult(rows=[], affected_rows=3),
+            QueryResult(rows=[], affected_rows=1),
+        ]
+
+        tool = WriteTool()
+        params = WriteParams(
+            inputs=[WriteInput(row={"url": f"/p{i}", "title": "t"}) for i in range(3)],
+            config=WriteConfig(table="pages", mode="upsert", key="url", batch_size=2),
+        )
+        events: list[SubstepEvent] = []
+
+        result = await tool.run(params, ToolContext(db=mock_db), events.append)
+
+        (batches,) = mock_db.execute_batches.call_args.args
+        assert len(batches) == 2
+        assert "VALUES (?, ?), (?, ?) ON DUPLICATE KEY UPDATE" in batches[0][0]
+        assert batches[0][1] == [["/p0", "t", "/p1", "t"]]
+        assert [r["status"] for r in result.data] == ["inserted", "updated", "inserted"]
+        completed = [e for e in events if e.status == "completed"][-1]
+        assert completed.message == "Inserted 2, updated 1, errors 0"
 
     @pytest.mark.asyncio
     async def test_replace_existing_row(self, mock_db):
-        """Replace an existing row."""
-        tx = MagicMock()
-        tx.query.return_value = MagicMock(rows=[{"1": 1}])  # Row exists
-        tx.execute.return_value = None
-        mock_db.transaction.return_value.__enter__.return_value = tx
-        mock_db.transaction.return_value.__exit__.return_value = False
+        """Replace deletes existing keys in bulk, then inserts."""
+        mock_db.query.return_value = QueryResult(rows=[{"url": "https://example.com"}])
+        mock_db.execute_batches.return_value = [
+            QueryResult(rows=[], affected_rows=1),  # DELETE found the row
+            QueryResult(rows=[], affected_rows=1),
+        ]
 
         tool = WriteTool()
         params = WriteParams(
@@ -587,12 +729,127 @@ class TestWriteToolExecution:
         assert result.success is True
         assert result.data[0]["status"] == "updated"
 
-        # Verify DELETE was called
-        delete_calls = [
-            call for call in tx.execute.call_args_list
-            if "DELETE" in str(call)
+        (batches,) = mock_db.execute_batches.call_args.args
+        assert batches[0] == (
+            "DELETE FROM `pages` WHERE `url` IN (?)",
+            [["https://example.com"]],
+        )
+        assert batches[1][0].startswith("INSERT INTO `pages`")
+
+    @pytest.mark.asyncio
+    async def test_replace_collapses_repeated_keys(self, mock_db):
+        """A key repeated within a chunk is written once, with the last row."""
+        mock_db.execute_batches.return_value = [
+            QueryResult(rows=[], affected_rows=0),
+            QueryResult(rows=[], affected_rows=2),
         ]
-        assert len(delete_calls) == 1
+
+        tool = WriteTool()
+        params = WriteParams(
+            inputs=[
+                WriteInput(row={"url": "/a", "title": "old"}),
+                WriteInput(row={"url": "/b", "title": "b"}),
+                WriteInput(row={"url": "/a", "title": "new"}),
+            ],
+            config=WriteConfig(table="pages", mode="replace", key="url"),
+        )
+
+        result = await tool.run(params, ToolContext(db=mock_db))
+
+        (batches,) = mock_db.execute_batches.call_args.args
+        assert batches[0][1] == [["/a", "/b"]]
+        assert batches[1][1] == [["/a", "new", "/b", "b"]]
+        assert [r["row_id"] for r in result.data] == ["/a", "/b", "/a"]
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_capped_by_bytes(self, mock_db):
+        """Large rows split chunks before batch_size is reached."""
+        mock_db.execute_batches.return_value = [QueryResult(rows=[], affected_rows=1)] * 3
+
+        tool = WriteTool()
+        params = WriteParams(
+            inputs=[WriteInput(row={"url": f"/p{i}", "text": "x" * 600}) for i in range(3)],
+            config=WriteConfig(table="pages", mode="upsert", key="url", max_batch_bytes=1000),
+        )
+
+        await tool.run(params, ToolContext(db=mock_db))
+
+        (batches,) = mock_db.execute_batches.call_args.args
+        assert len(batches) == 3
+
+    @pytest.mark.asyncio
+    async def test_load_data(self, mock_db):
+        """load_data stages rows from a CSV file and merges them."""
+        staged: list[str] = []
+
+        def execute_batches(batches):
+            path = batches[1][0].split("'")[1]
+            with open(path, encoding="utf-8") as f:
+                staged.append(f.read())
+            return [QueryResult(rows=[], affected_rows=n) for n in (0, 2, 1, 1, 0)]
+
+        mock_db.execute_batches.side_effect = execute_batches
+
+        tool = WriteTool()
+        params = WriteParams(
+            inputs=[
+                WriteInput(row={"url": "/a", "title": 'Say "hi"'}),
+                WriteInput(row={"url": "/b", "title": None}),
+            ],
+            config=WriteConfig(table="pages", mode="upsert", key="url", load_data=True),
+        )
+
+        result = await tool.run(params, ToolContext(db=mock_db))
+
+        assert staged == ['"/a","Say \\"hi\\""\n"/b",\\N\n']
+        assert [r["status"] for r in result.data] == ["written", "written"]
+        assert result.substeps[0].current == 2
+
+    @pytest.mark.asyncio
+    async def test_load_data_repeated_key_keeps_last_row(self, mock_db):
+        """A key repeated in the input is staged once, with its last row."""
+        staged: list[str] = []
+
+        def execute_batches(batches):
+            path = batches[1][0].split("'")[1]
+            with open(path, encoding="utf-8") as f:
+                staged.append(f.read())
+            return [QueryResult(rows=[], affected_rows=n) for n in (0, 2, 0, 2, 0)]
+
+        mock_db.execute_batches.side_effect = execute_batches
+
+        tool = WriteTool()
+        params = WriteParams(
+            inputs=[
+                WriteInput(row={"url": "/a", "title": "old"}),
+                WriteInput(row={"url": "/b", "title": "b"}),
+                WriteInput(row={"url": "/a", "title": "new"}),
+            ],
+            config=WriteConfig(table="pages", mode="upsert", key="url", load_data=True),
+        )
+
+        result = await tool.run(params, ToolContext(db=mock_db))
+
+        assert staged == ['"/a","new"\n"/b","b"\n']
+        assert [r["status"] for r in result.data] == ["inserted"] * 3
+        assert result.success
+
+    @pytest.mark.asyncio
+    async def test_load_data_falls_back_for_remote_server(self, mock_db):
+        """load_data uses multi-row statements when the server is not local."""
+        mock_db._is_local_server_target.return_value = False
+        mock_db.execute_batches.return_value = [QueryResult(rows=[], affected_rows=1)]
+
+        tool = WriteTool()
+        params = WriteParams(
+            inputs=[WriteInput(row={"url": "/a"})],
+            config=WriteConfig(table="pages", mode="upsert", key="url", load_data=True),
+        )
+
+        await tool.run(params, ToolContext(db=mock_db))
+
+        (batches,) = mock_db.execute_batches.call_args.args
+        assert "LOAD DATA" not in batches[0][0]
 
     @pytest.mark.asyncio
     async def test_auto_create_table(self, mock_db):
@@ -749,6 +1006,45 @@ class TestWriteToolErrorHandling:
         # Transaction context manager's __exit__ was called
         assert mock_db.transaction.return_value.__exit__.called
 
+    @pytest.mark.asyncio
+    async def test_set_based_failure_writes_nothing(self, mock_db):
+        """Without continue_on_error, a failing chunk fails the whole write."""
+        mock_db.execute_batches.side_effect = Exception("Duplicate entry")
+
+        tool = WriteTool()
+        params = WriteParams(
+            inputs=[WriteInput(row={"url": f"/p{i}"}) for i in range(3)],
+            config=WriteConfig(table="pages", mode="upsert", key="url", batch_size=2),
+        )
+
+        with pytest.raises(ToolExecutionError, match="Write failed"):
+            await tool.run(params, ToolContext(db=mock_db))
+        mock_db.execute_batches.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_set_based_continue_on_error_isolates_rows(self, mock_db):
+        """With continue_on_error, a failing chunk is retried row by row."""
+
+        def execute_batches(batches):
+            if "?), (?" in batches[0][0] or batches[0][1] == [["/bad"]]:
+                raise Exception("Bad row")
+            return [QueryResult(rows=[], affected_rows=1)]
+
+        mock_db.execute_batches.side_effect = execute_batches
+
+        tool = WriteTool()
+        params = WriteParams(
+            inputs=[WriteInput(row={"url": u}) for u in ("/a", "/bad", "/c")],
+            config=WriteConfig(
+                table="pages", mode="upsert", key="url", batch_size=2, continue_on_error=True
+            ),
+        )
+
+        result = await tool.run(params, ToolContext(db=mock_db))
+
+        assert [r["status"] for r in result.data] == ["inserted", "error", "inserted"]
+        assert result.errors[0].row_idx == 1
+
     @pytest.mark.asyncio
     async def test_table_creation_failure(self, mock_db):
         """Handle table creation failure."""
@@ -766,6 +1062,71 @@ class TestWriteToolErrorHandling:
             await tool.run(params, context)
 
 
+class TestWriteToolSqlite:
+    """Inserted/updated reporting against a real SQL engine."""
+
+    async def _write(self, db, rows, mode="upsert", **config):
+        params = WriteParams(
+            inputs=[WriteInput(row=row) for row in rows],
+            config=WriteConfig(table="pages", mode=mode, key="url", **config),
+        )
+        return await WriteTool().run(params, ToolContext(db=db))
+
+    @pytest.mark.asyncio
+    async def test_unchanged_rows_are_updated(self, sqlite_db):
+        """Re-writing identical rows reports updates, whatever affected rows say."""
+        rows = [{"url": "/a", "title": "A"}, {"url": "/b", "title": "B"}]
+        await self._write(sqlite_db, rows)
+
+        result = await self._write(sqlite_db, rows)
+
+        assert [r["status"] for r in result.data] == ["updated", "updated"]
+
+    @pytest.mark.asyncio
+    async def test_mixed_chunk(self, sqlite_db):
+        """A chunk mixing new, changed and unchanged rows is classified per row."""
+        await self._write(sqlite_db, [{"url": "/a", "title": "A"}, {"url": "/b", "title": "B"}])
+
+        result = await self._write(
+            sqlite_db,
+            [
+                {"url": "/a", "title": "A"},
+                {"url": "/b", "title": "B2"},
+                {"url": "/c", "title": "C"},
+            ],
+        )
+
+        assert [r["status"] for r in result.data] == ["updated", "updated", "inserted"]
+        assert sqlite_db.query("SELECT title FROM pages WHERE url = '/b'").rows == [
+            {"title": "B2"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_replace_repeated_key_last_wins(self, sqlite_db):
+        """Replace with a key repeated in one chunk keeps the last row."""
+        result = await self._write(
+            sqlite_db,
+            [{"url": "/a", "title": "old"}, {"url": "/a", "title": "new"}],
+            mode="replace",
+        )
+
+        assert result.success is True
+        assert sqlite_db.query("SELECT url, title FROM pages").rows == [
+            {"url": "/a", "title": "new"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_key_repeated_across_chunks(self, sqlite_db):
+        """A key written by an earlier chunk counts as updated in a later one."""
+        result = await self._write(
+            sqlite_db,
+            [{"url": "/a", "title": "1"}, {"url": "/b", "title": "2"}, {"url": "/a", "title": "3"}],
+            batch_size=1,
+        )
+
+        assert [r["status"] for r in result.data] == ["inserted", "inserted", "updated"]
+
+
 # ============================================================================
 # Row ID Extraction Tests
 # ============================================================================
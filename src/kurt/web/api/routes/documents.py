@@ -6,7 +6,7 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Request
 
-from kurt.web.api.server_helpers import get_session_for_request
+from kurt.web.api.server_helpers import DOCUMENT_TABLES, cached_read, get_session_for_request
 
 router = APIRouter()
 
@@ -18,6 +18,7 @@ def api_list_documents(
     limit: Optional[int] = None,
     offset: Optional[int] = None,
     url_pattern: Optional[str] = None,
+    after: Optional[str] = None,
 ):
     """
     List documents with optional filters.
@@ -36,12 +37,15 @@ def api_list_documents(
             limit=limit,
             offset=offset,
             url_contains=url_pattern,
+            after=after,
         )
 
-        registry = DocumentRegistry()
-        with get_session_for_request(request) as session:
-            docs = registry.list(session, filters)
-            return [asdict(doc) for doc in docs]
+        def load() -> list[dict]:
+            registry = DocumentRegistry()
+            with get_session_for_request(request) as session:
+                return [asdict(doc) for doc in registry.list(session, filters)]
+
+        return cached_read(("documents.list", asdict(filters)), DOCUMENT_TABLES, load)
     except Exception as e:
         logging.error(f"Documents API error: {e}")
         logging.error(traceback.format_exc())
@@ -59,6 +63,8 @@ def api_count_documents(
 
     Used by both CLI (in cloud mode) and web UI.
     """
+    from dataclasses import asdict
+
     from kurt.documents import DocumentFilters, DocumentRegistry
 
     filters = DocumentFilters(
@@ -66,9 +72,12 @@ def api_count_documents(
         url_contains=url_pattern,
     )
 
-    registry = DocumentRegistry()
-    with get_session_for_request(request) as session:
-        return {"count": registry.count(session, filters)}
+    def load() -> dict:
+        registry = DocumentRegistry()
+        with get_session_for_request(request) as session:
+            return {"count": registry.count(session, filters)}
+
+    return cached_read(("documents.count", asdict(filters)), DOCUMENT_TABLES, load)
 
 
 @router.get("/api/documents/{document_id}")
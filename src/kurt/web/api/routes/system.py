@@ -16,7 +16,12 @@ from kurt.cloud.auth import (
 )
 from kurt.cloud.tenant import is_cloud_mode
 from kurt.web.api.auth import get_authenticated_user
-from kurt.web.api.server_helpers import get_session_for_request, project_root
+from kurt.web.api.server_helpers import (
+    DOCUMENT_TABLES,
+    cached_read,
+    get_session_for_request,
+    project_root,
+)
 
 router = APIRouter()
 
@@ -237,9 +242,12 @@ def api_status(request: Request):
 
     from kurt.status.queries import get_status_data
 
-    try:
+    def load() -> dict:
         with get_session_for_request(request) as session:
             return get_status_data(session)
+
+    try:
+        return cached_read("status", DOCUMENT_TABLES, load)
     except Exception as e:
         logging.error(f"Status API error: {e}")
         logging.error(traceback.format_exc())
@@ -1,4 +1,4 @@
-"""Workflow routes: list, get, cancel, retry, status, logs, streaming."""
+"""Workflow routes: list, get, cancel, retry, status, profile, logs, streaming."""
 
 from __future__ import annotations
 
@@ -17,10 +17,10 @@ router = APIRouter()
 # --- Helper functions ---
 
 def _get_dolt_db():
-    """Get a DoltDB instance for workflow queries."""
-    from kurt.db.utils import get_dolt_db
+    """Get a DoltDB instance for workflow queries (shared, query cache on)."""
+    from kurt.web.api.server_helpers import get_api_dolt_db
 
-    return get_dolt_db(return_none_if_missing=True)
+    return get_api_dolt_db()
 
 
 def _normalize_workflow_status(dolt_status: str) -> str:
@@ -95,6 +95,31 @@ def _normalize_step_status(db_status: str | None) -> str:
     return status_map.get(db_status.lower(), db_status.lower())
 
 
+def _format_step_event(row: dict[str, Any]) -> dict[str, Any]:
+    """Format a step_events row for the logs stream."""
+    event_data = {
+        "id": row.get("id"),
+        "step_id": row.get("step_id"),
+        "substep": row.get("substep"),
+        "status": _normalize_step_status(row.get("status")),
+        "current": row.get("current"),
+        "total": row.get("total"),
+        "message": row.get("message"),
+        "created_at": str(row.get("created_at")) if row.get("created_at") else None,
+    }
+    # Parse metadata if present
+    metadata_raw = row.get("metadata_json")
+    if metadata_raw:
+        try:
+            if isinstance(metadata_raw, str):
+                event_data["metadata"] = json.loads(metadata_raw)
+            else:
+                event_data["metadata"] = metadata_raw
+        except (json.JSONDecodeError, TypeError):
+            pass
+    return event_data
+
+
 # --- Endpoints ---
 
 @router.get("/api/workflows")
@@ -138,7 +163,7 @@ def api_list_workflows(
         params.append(limit)
         params.append(offset)
 
-        result = db.query(sql, params)
+        result = db.query_cached(sql, params)
         workflows = []
         raw_count = len(result.rows)  # Count before Python filtering
 
@@ -235,7 +260,7 @@ def api_get_workflow(workflow_id: str):
             WHERE id LIKE CONCAT(?, '%')
             LIMIT 1
         """
-        result = db.query(sql, [workflow_id])
+        result = db.query_cached(sql, [workflow_id])
 
         if not result.rows:
             raise HTTPException(status_code=404, detail="Workflow not found")
@@ -471,6 +496,35 @@ def api_get_workflow_status(workflow_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/api/workflows/{workflow_id}/profile")
+def api_get_workflow_profile(
+    workflow_id: str,
+    format: str = Query("json", pattern="^(json|chrome)$"),
+):
+    """Get the performance profile of a workflow run.
+
+    Returns per-step wall and queue time, achieved concurrency and the
+    critical path. With format=chrome, returns a Chrome trace instead.
+    """
+    from kurt.observability.profile import get_run_profile, to_chrome_trace
+
+    db = _get_dolt_db()
+    if db is None:
+        raise HTTPException(status_code=503, detail="Database not available")
+
+    try:
+        profile = get_run_profile(db, workflow_id)
+        if profile is None:
+            raise HTTPException(status_code=404, detail="Workflow not found")
+        if format == "chrome":
+            return to_chrome_trace(profile)
+        return profile.to_dict()
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/api/workflows/{workflow_id}/step-logs")
 def api_get_step_logs(
     workflow_id: str,
@@ -543,19 +597,22 @@ async def api_stream_workflow_status(workflow_id: str):
     """Stream live workflow status via Server-Sent Events.
 
     Streams the same comprehensive status as /api/workflows/{id}/status
-    but continuously until the workflow completes.
+    but continuously until the workflow completes. All streams of a run share
+    one reader (see kurt.web.api.run_feed), which wakes on change
+    notifications instead of polling.
     """
     import asyncio
 
     from kurt.observability.status import get_live_status
+    from kurt.web.api.run_feed import subscribe_run
 
     db = _get_dolt_db()
     if db is None:
         raise HTTPException(status_code=503, detail="Database not available")
 
     try:
-        # Verify workflow exists
-        status = get_live_status(db, workflow_id)
+        # Verify workflow exists (get_live_status is sync; keep it off the loop)
+        status = await asyncio.to_thread(get_live_status, db, workflow_id)
         if status is None:
             raise HTTPException(status_code=404, detail="Workflow not found")
 
@@ -568,32 +625,25 @@ async def api_stream_workflow_status(workflow_id: str):
 
     async def event_generator():
         last_status_json = None
-        while True:
-            try:
-                # Re-fetch status from Dolt
-                db_inner = _get_dolt_db()
-                if db_inner is None:
-                    break
-
-                status = get_live_status(db_inner, full_id)
-                if status is None:
-                    break
-
-                status_json = json.dumps(status)
-
-                # Only send if changed
-                if status_json != last_status_json:
-                    yield f"data: {status_json}\n\n"
-                    last_status_json = status_json
+        async with subscribe_run(full_id, _get_dolt_db, live_status=True) as updates:
+            while True:
+                update = await updates.get()
+                status = update.live_status
+                if status is not None:
+                    status_json = json.dumps(status)
+
+                    # Only send if changed
+                    if status_json != last_status_json:
+                        yield f"data: {status_json}\n\n"
+                        last_status_json = status_json
+
+                    # Stop streaming if workflow completed
+                    if status.get("status") in ("completed", "completed_with_errors", "failed", "canceled"):
+                        break
 
-                # Stop streaming if workflow completed
-                if status.get("status") in ("completed", "completed_with_errors", "failed", "canceled"):
+                if update.done:
                     break
 
-                await asyncio.sleep(0.5)
-            except Exception:
-                break
-
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
@@ -608,11 +658,13 @@ async def api_stream_workflow_status(workflow_id: str):
 async def api_stream_workflow_logs(
     workflow_id: str,
     step_id: Optional[str] = Query(None, description="Filter by step ID"),
+    since_id: int = Query(0, ge=0, description="Stream events after this ID"),
 ):
     """Stream workflow logs via Server-Sent Events.
 
-    Streams step_events with messages as structured log entries.
-    Also checks for and streams file-based logs as fallback.
+    Streams step_events with messages as structured log entries, read by the
+    run's shared feed (see kurt.web.api.run_feed). Also checks for and
+    streams file-based logs as fallback.
 
     Events are JSON with format:
         {"type": "event", "event": {...}}  - Structured step event
@@ -621,6 +673,7 @@ async def api_stream_workflow_logs(
     """
     import asyncio
 
+    from kurt.web.api.run_feed import subscribe_run
 
     db = _get_dolt_db()
     if db is None:
@@ -628,7 +681,7 @@ async def api_stream_workflow_logs(
 
     try:
         # Get full workflow ID
-        result = db.query(
+        result = await db.aquery(
             "SELECT id, status FROM workflow_runs WHERE id LIKE CONCAT(?, '%') LIMIT 1",
             [workflow_id],
         )
@@ -645,118 +698,50 @@ async def api_stream_workflow_logs(
 
     log_file = Path(".kurt") / "logs" / f"workflow-{full_id}.log"
 
+    last_file_size = 0
+
+    def read_log_file() -> str:
+        nonlocal last_file_size
+        if not log_file.exists():
+            return ""
+        current_size = log_file.stat().st_size
+        if current_size <= last_file_size:
+            return ""
+        with open(log_file, "r") as f:
+            f.seek(last_file_size)
+            new_content = f.read()
+        last_file_size = current_size
+        return new_content
+
     async def event_generator():
-        cursor_id = 0
-        last_file_size = 0
-        terminal_statuses = ("completed", "failed", "canceled")
+        async with subscribe_run(full_id, _get_dolt_db, after=since_id) as updates:
+            while True:
+                try:
+                    # Wake up periodically to tail the log file
+                    update = await asyncio.wait_for(updates.get(), timeout=0.5)
+                except asyncio.TimeoutError:
+                    update = None
 
-        while True:
-            try:
-                db_inner = _get_dolt_db()
-                if not db_inner:
-                    await asyncio.sleep(0.5)
-                    continue
-
-                # Fetch new step_events since cursor
-                conditions = ["run_id = ?", "id > ?"]
-                params: list[Any] = [full_id, cursor_id]
-
-                if step_id:
-                    conditions.append("step_id = ?")
-                    params.append(step_id)
-
-                params.append(50)  # Batch limit
-
-                sql = f"""
-                    SELECT id, step_id, substep, status, current, total, message,
-                           metadata_json, created_at
-                    FROM step_events
-                    WHERE {' AND '.join(conditions)}
-                    ORDER BY id ASC
-                    LIMIT ?
-                """
-                events_result = db_inner.query(sql, params)
-
-                # Yield new events
-                for row in events_result.rows:
-                    event_data = {
-                        "id": row.get("id"),
-                        "step_id": row.get("step_id"),
-                        "substep": row.get("substep"),
-                        "status": _normalize_step_status(row.get("status")),
-                        "current": row.get("current"),
-                        "total": row.get("total"),
-                        "message": row.get("message"),
-                        "created_at": str(row.get("created_at")) if row.get("created_at") else None,
-                    }
-                    # Parse metadata if present
-                    metadata_raw = row.get("metadata_json")
-                    if metadata_raw:
-                        try:
-                            if isinstance(metadata_raw, str):
-                                event_data["metadata"] = json.loads(metadata_raw)
-                            else:
-                                event_data["metadata"] = metadata_raw
-                        except (json.JSONDecodeError, TypeError):
-                            pass
-
-                    yield f"data: {json.dumps({'type': 'event', 'event': event_data})}\n\n"
-                    cursor_id = max(cursor_id, row.get("id", 0))
+                if update is not None and update.error:
+                    yield f"data: {json.dumps({'type': 'error', 'message': update.error})}\n\n"
+                    break
+
+                if update is not None:
+                    for row in update.events:
+                        if step_id and row.get("step_id") != step_id:
+                            continue
+                        event_data = _format_step_event(row)
+                        yield f"data: {json.dumps({'type': 'event', 'event': event_data})}\n\n"
 
                 # Also check file-based logs
-                if log_file.exists():
-                    current_size = log_file.stat().st_size
-                    if current_size > last_file_size:
-                        with open(log_file, "r") as f:
-                            f.seek(last_file_size)
-                            new_content = f.read()
-                            if new_content:
-                                yield f"data: {json.dumps({'type': 'log', 'content': new_content})}\n\n"
-                        last_file_size = current_size
-
-                # Check if workflow is done
-                status_result = db_inner.query(
-                    "SELECT status FROM workflow_runs WHERE id = ?",
-                    [full_id],
-                )
-                if status_result.rows:
-                    status = status_result.rows[0].get("status")
-                    if status in terminal_statuses:
-                        # Final poll for any remaining events
-                        await asyncio.sleep(0.3)
-
-                        # Fetch final events
-                        final_result = db_inner.query(sql, [full_id, cursor_id, step_id, 50] if step_id else [full_id, cursor_id, 50])
-                        for row in final_result.rows:
-                            event_data = {
-                                "id": row.get("id"),
-                                "step_id": row.get("step_id"),
-                                "substep": row.get("substep"),
-                                "status": _normalize_step_status(row.get("status")),
-                                "current": row.get("current"),
-                                "total": row.get("total"),
-                                "message": row.get("message"),
-                                "created_at": str(row.get("created_at")) if row.get("created_at") else None,
-                            }
-                            yield f"data: {json.dumps({'type': 'event', 'event': event_data})}\n\n"
-
-                        # Final file content
-                        if log_file.exists():
-                            current_size = log_file.stat().st_size
-                            if current_size > last_file_size:
-                                with open(log_file, "r") as f:
-                                    f.seek(last_file_size)
-                                    new_content = f.read()
-                                    if new_content:
-                                        yield f"data: {json.dumps({'type': 'log', 'content': new_content})}\n\n"
-
-                        yield f"data: {json.dumps({'done': True, 'status': _normalize_workflow_status(status)})}\n\n"
-                        break
+                new_content = read_log_file()
+                if new_content:
+                    yield f"data: {json.dumps({'type': 'log', 'content': new_content})}\n\n"
 
-                await asyncio.sleep(0.5)
-            except Exception as e:
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-                break
+                if update is not None and update.done:
+                    status = _normalize_workflow_status(update.status) if update.status else None
+                    yield f"data: {json.dumps({'done': True, 'status': status})}\n\n"
+                    break
 
     return StreamingResponse(
         event_generator(),
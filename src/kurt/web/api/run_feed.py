@@ -0,0 +1,279 @@
+"""
+Shared per-run feeds for the workflow SSE endpoints.
+
+Each open /status/stream or /logs/stream connection used to run its own loop
+re-querying Dolt every 500ms, so database load grew with the number of
+browser tabs watching a run. A RunFeed reads a run once for every connection
+watching it:
+
+- it wakes on change notifications (kurt.observability.notify), or every
+  FALLBACK_POLL_INTERVAL when none arrive;
+- it reads new step_events by cursor and the run status with the async
+  query API (DoltDB.aquery) and, when a status stream is subscribed, one
+  get_live_status() snapshot in a worker thread;
+- it pushes the result as a RunUpdate to each subscriber's queue.
+
+Each subscriber has its own event cursor (``after``, the client's since_id)
+and only receives events above it. Late subscribers get the last
+HISTORY_LIMIT events read so far replayed first; events older than those are
+read from the database for that subscriber before it joins the feed. A feed
+stops when the run reaches a terminal state or its last subscriber leaves.
+
+Usage:
+    async with subscribe_run(run_id, get_db, live_status=True) as updates:
+        update = await updates.get()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Callable
+
+from kurt.observability.notify import CHANNEL_POLL_INTERVAL, RunWatcher
+
+logger = logging.getLogger(__name__)
+
+# Seconds between reads when no change notification arrives
+FALLBACK_POLL_INTERVAL = 2.0
+
+# Seconds to wait after a terminal status before the final read, so events
+# written right after the status change are included
+FINAL_READ_DELAY = 0.3
+
+# Maximum step_events rows per query
+BATCH_LIMIT = 500
+
+# Events kept for replay to late subscribers (older ones are served by
+# /logs?since_id=...)
+HISTORY_LIMIT = 1000
+
+TERMINAL_STATUSES = ("completed", "failed", "canceled")
+
+_EVENTS_SQL = """
+    SELECT id, step_id, substep, status, current, total, message,
+           metadata_json, created_at
+    FROM step_events
+    WHERE run_id = ? AND id > ?
+    ORDER BY id ASC
+    LIMIT ?
+"""
+
+
+@dataclass
+class RunUpdate:
+    """One read of a run, as delivered to subscribers.
+
+    Attributes:
+        events: New step_events rows since the previous update
+        status: workflow_runs.status
+        live_status: get_live_status() snapshot (status subscribers only)
+        done: True on the last update of the feed
+        error: Error message if the read failed (also the last update)
+    """
+
+    events: list[dict[str, Any]] = field(default_factory=list)
+    status: str | None = None
+    live_status: dict[str, Any] | None = None
+    done: bool = False
+    error: str | None = None
+
+
+@dataclass
+class _Subscriber:
+    """Per-connection state: whether it wants snapshots and its event cursor."""
+
+    live_status: bool
+    cursor: int
+
+
+class RunFeed:
+    """
+    Reads one workflow run and fans the result out to subscriber queues.
+
+    Args:
+        run_id: Full workflow run ID
+        get_db: Returns a DoltDB instance, or None if unavailable
+    """
+
+    def __init__(self, run_id: str, get_db: Callable[[], Any]):
+        self.run_id = run_id
+        self._get_db = get_db
+        self._db: Any = None
+        self._subscribers: dict[asyncio.Queue[RunUpdate], _Subscriber] = {}
+        self._history: deque[dict[str, Any]] = deque(maxlen=HISTORY_LIMIT)
+        self._cursor = 0
+        # Highest event id not kept in _history (read before the feed started
+        # or evicted); subscribers behind it catch up from the database
+        self._floor = 0
+        self._status: str | None = None
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    def subscribe(
+        self,
+        live_status: bool = False,
+        after: int = 0,
+        backlog: list[dict[str, Any]] | None = None,
+    ) -> asyncio.Queue[RunUpdate]:
+        """
+        Add a subscriber that receives events with an id above ``after``.
+
+        ``backlog`` holds events already read for it by catch_up(); they are
+        queued ahead of the kept history.
+        """
+        if self._task is None and not self._history:
+            # First reader: nothing at or below the client's cursor is needed
+            self._cursor = self._floor = max(self._cursor, after)
+        backlog = backlog or []
+        if backlog:
+            after = max(after, *(e.get("id") or 0 for e in backlog))
+        queue: asyncio.Queue[RunUpdate] = asyncio.Queue()
+        events = backlog + [e for e in self._history if (e.get("id") or 0) > after]
+        if events:
+            after = max(after, *(e.get("id") or 0 for e in events))
+        self._subscribers[queue] = _Subscriber(live_status=live_status, cursor=after)
+        if events or self._status is not None:
+            queue.put_nowait(RunUpdate(events=events, status=self._status))
+        if live_status:
+            self._wake.set()  # Read a snapshot for the new subscriber now
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[RunUpdate]) -> None:
+        self._subscribers.pop(queue, None)
+        if not self._subscribers:
+            self._wake.set()
+
+    async def catch_up(self, after: int) -> list[dict[str, Any]]:
+        """Read events above ``after`` that are older than the kept history."""
+        events: list[dict[str, Any]] = []
+        while after < self._floor:
+            db = self._database()
+            if db is None:
+                break
+            rows = (await db.aquery(_EVENTS_SQL, [self.run_id, after, BATCH_LIMIT])).rows
+            if not rows:
+                break
+            events.extend(rows)
+            after = max(after, *(row.get("id") or 0 for row in rows))
+        return events
+
+    def _broadcast(self, update: RunUpdate) -> None:
+        for queue, subscriber in self._subscribers.items():
+            events = [e for e in update.events if (e.get("id") or 0) > subscriber.cursor]
+            if events:
+                subscriber.cursor = max(subscriber.cursor, *(e.get("id") or 0 for e in events))
+            queue.put_nowait(replace(update, events=events))
+
+    def _database(self) -> Any:
+        # One DoltDB for the feed's lifetime, so its async pool is reused
+        if self._db is None:
+            self._db = self._get_db()
+        return self._db
+
+    async def _read(self) -> RunUpdate | None:
+        """Read new events and the run status. Returns None if the DB is unavailable."""
+        db = self._database()
+        if db is None:
+            return None
+
+        events: list[dict[str, Any]] = []
+        while True:
+            rows = (await db.aquery(_EVENTS_SQL, [self.run_id, self._cursor, BATCH_LIMIT])).rows
+            events.extend(rows)
+            if rows:
+                self._cursor = max(self._cursor, *(row.get("id") or 0 for row in rows))
+            if len(rows) < BATCH_LIMIT:
+                break
+        overflow = len(self._history) + len(events) - (self._history.maxlen or 0)
+        if overflow > 0:
+            evicted = (list(self._history) + events)[:overflow]
+            self._floor = max(self._floor, *(e.get("id") or 0 for e in evicted))
+        self._history.extend(events)
+
+        result = await db.aquery("SELECT status FROM workflow_runs WHERE id = ?", [self.run_id])
+        self._status = result.rows[0].get("status") if result.rows else None
+
+        update = RunUpdate(events=events, status=self._status)
+        if any(s.live_status for s in self._subscribers.values()):
+            from kurt.observability.status import get_live_status
+
+            # get_live_status runs several sync queries; keep them off the loop
+            update.live_status = await asyncio.to_thread(get_live_status, db, self.run_id)
+            if update.live_status is None:
+                update.done = True
+        return update
+
+    async def _wait_for_change(self, watcher: RunWatcher) -> None:
+        waited = 0.0
+        while self._subscribers and waited < FALLBACK_POLL_INTERVAL:
+            if watcher.changed() or self._wake.is_set():
+                break
+            await asyncio.sleep(CHANNEL_POLL_INTERVAL)
+            waited += CHANNEL_POLL_INTERVAL
+        self._wake.clear()
+
+    async def _run(self) -> None:
+        watcher = RunWatcher(self.run_id)
+        try:
+            while self._subscribers:
+                try:
+                    update = await self._read()
+                    if update is not None and update.status in TERMINAL_STATUSES:
+                        await asyncio.sleep(FINAL_READ_DELAY)
+                        final = await self._read()
+                        if final is not None:
+                            final.events = update.events + final.events
+                            update = final
+                        update.done = True
+                except Exception as e:
+                    logger.debug("Reading run %s failed", self.run_id, exc_info=True)
+                    update = RunUpdate(done=True, error=str(e))
+
+                if update is not None:
+                    self._broadcast(update)
+                    if update.done:
+                        break
+                await self._wait_for_change(watcher)
+        finally:
+            if _FEEDS.get(self.run_id) is self:
+                del _FEEDS[self.run_id]
+
+
+_FEEDS: dict[str, RunFeed] = {}
+
+
+@asynccontextmanager
+async def subscribe_run(
+    run_id: str,
+    get_db: Callable[[], Any],
+    *,
+    live_status: bool = False,
+    after: int = 0,
+) -> AsyncIterator[asyncio.Queue[RunUpdate]]:
+    """
+    Subscribe to the shared feed for ``run_id``, starting it if needed.
+
+    Args:
+        run_id: Full workflow run ID
+        get_db: Returns a DoltDB instance, or None if unavailable
+        live_status: Also deliver get_live_status() snapshots
+        after: Only deliver events with a higher id (the client's cursor)
+
+    Yields:
+        Queue of RunUpdate objects; the last one has ``done=True``
+    """
+    feed = _FEEDS.get(run_id)
+    if feed is None:
+        feed = _FEEDS[run_id] = RunFeed(run_id, get_db)
+    backlog = await feed.catch_up(after)
+    queue = feed.subscribe(live_status=live_status, after=after, backlog=backlog)
+    try:
+        yield queue
+    finally:
+        feed.unsubscribe(queue)
@@ -10,6 +10,7 @@ from __future__ import annotations
 import os
 from pathlib import Path
 from threading import Lock
+from typing import Any, Callable, Hashable, Iterable, TypeVar
 
 from fastapi import Request
 
@@ -30,6 +31,17 @@ APPROVALS: dict[str, dict] = {}
 APPROVAL_TIMEOUT_SECONDS = int(os.environ.get("KURT_APPROVAL_TIMEOUT", "600"))
 APPROVAL_CLEANUP_SECONDS = int(os.environ.get("KURT_APPROVAL_CLEANUP_SECONDS", "600"))
 
+# Seconds a cached API read is served without re-checking Dolt table hashes.
+# Writes made in this process invalidate immediately; others show up after this.
+API_CACHE_TTL = float(os.environ.get("KURT_API_CACHE_TTL", "1.0"))
+
+# Tables behind the document list/count/status endpoints
+DOCUMENT_TABLES = ("map_documents", "fetch_documents")
+
+_api_dbs: dict[Path, Any] = {}
+
+T = TypeVar("T")
+
 
 # --- Shared functions ---
 
@@ -76,6 +88,36 @@ def get_session_for_request(request: Request):
     return managed_session()
 
 
+def get_api_dolt_db():
+    """Get a DoltDB instance for API reads, or None if the database is missing.
+
+    Instances are reused per database path so their connection pools (sync
+    and async) and query cache survive across requests.
+    """
+    from kurt.db.utils import get_dolt_db
+
+    db = get_dolt_db(return_none_if_missing=True)
+    if db is None:
+        return None
+    if db.path not in _api_dbs:
+        db.enable_query_cache(ttl=API_CACHE_TTL)
+    return _api_dbs.setdefault(db.path, db)
+
+
+def cached_read(key: Hashable, tables: Iterable[str], compute: Callable[[], T]) -> T:
+    """Serve a local-mode API read from the Dolt query cache.
+
+    ``compute()`` runs on a miss, or directly in cloud (PostgreSQL) mode.
+    Its result must not be mutated by the caller.
+    """
+    if os.environ.get("DATABASE_URL", "").startswith("postgresql"):
+        return compute()
+    db = get_api_dolt_db()
+    if db is None:
+        return compute()
+    return db.cached(key, tables, compute)
+
+
 def get_storage():
     mode = os.environ.get("KURT_STORAGE", "local")
     if mode == "s3":
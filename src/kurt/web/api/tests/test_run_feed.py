@@ -0,0 +1,150 @@
+"""Tests for shared per-run SSE feeds."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from kurt.db.dolt import QueryResult
+from kurt.web.api.run_feed import _FEEDS, subscribe_run
+
+
+def _db(events_batches, statuses):
+    """Mock DB returning event batches and run statuses in read order."""
+    db = MagicMock()
+    events = iter(events_batches)
+    statuses = iter(statuses)
+
+    def query(sql, params):
+        if "step_events" in sql:
+            return QueryResult(rows=next(events, []))
+        return QueryResult(rows=[{"status": next(statuses)}])
+
+    db.aquery = AsyncMock(side_effect=query)
+    return db
+
+
+def _table_db(events, status="running"):
+    """Mock DB serving ``id > cursor`` reads from a fixed step_events table."""
+    db = MagicMock()
+
+    def query(sql, params):
+        if "step_events" in sql:
+            _, after, limit = params
+            return QueryResult(rows=[e for e in events if e["id"] > after][:limit])
+        return QueryResult(rows=[{"status": status}])
+
+    db.aquery = AsyncMock(side_effect=query)
+    return db
+
+
+class TestRunFeed:
+    @pytest.mark.asyncio
+    async def test_subscribers_share_one_reader(self):
+        db = _db([[{"id": 1, "step_id": "map"}], [], []], ["running", "completed", "completed"])
+
+        with patch("kurt.web.api.run_feed.FINAL_READ_DELAY", 0):
+            async with (
+                subscribe_run("run-1", lambda: db) as first,
+                subscribe_run("run-1", lambda: db) as second,
+            ):
+                assert list(_FEEDS) == ["run-1"]
+                update = await asyncio.wait_for(first.get(), 1)
+                assert [e["id"] for e in update.events] == [1]
+                assert (await asyncio.wait_for(second.get(), 1)).events == update.events
+
+                # Run finishes: the next read sees the terminal status
+                from kurt.observability.notify import notify_run
+
+                notify_run("run-1")
+                final = await asyncio.wait_for(first.get(), 1)
+                assert final.done is True
+                assert final.status == "completed"
+
+        # Two reads (plus one final read) regardless of subscriber count
+        step_event_reads = [c for c in db.aquery.call_args_list if "step_events" in c.args[0]]
+        assert len(step_event_reads) == 3
+        assert "run-1" not in _FEEDS
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_gets_history(self):
+        db = _db([[{"id": 1}, {"id": 2}]], ["running"] * 10)
+
+        async with subscribe_run("run-2", lambda: db) as first:
+            await asyncio.wait_for(first.get(), 1)
+            async with subscribe_run("run-2", lambda: db) as late:
+                replay = await asyncio.wait_for(late.get(), 1)
+                assert [e["id"] for e in replay.events] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self):
+        db = _db([[{"id": i} for i in range(1, 6)]], ["running"] * 10)
+
+        with patch("kurt.web.api.run_feed.HISTORY_LIMIT", 3):
+            async with subscribe_run("run-4", lambda: db) as first:
+                await asyncio.wait_for(first.get(), 1)
+                assert list(_FEEDS["run-4"]._history) == [{"id": 3}, {"id": 4}, {"id": 5}]
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_behind_history_reads_the_gap(self):
+        db = _table_db([{"id": i} for i in range(1, 6)])
+
+        with patch("kurt.web.api.run_feed.HISTORY_LIMIT", 3):
+            async with subscribe_run("run-6", lambda: db) as first:
+                await asyncio.wait_for(first.get(), 1)
+                async with subscribe_run("run-6", lambda: db, after=1) as late:
+                    replay = await asyncio.wait_for(late.get(), 1)
+
+        # 2 was evicted from history; it is read from the database instead
+        assert [e["id"] for e in replay.events] == [2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_first_subscriber_starts_at_its_cursor(self):
+        db = _table_db([{"id": i} for i in range(1, 6)])
+
+        async with subscribe_run("run-7", lambda: db, after=3) as updates:
+            update = await asyncio.wait_for(updates.get(), 1)
+
+        assert [e["id"] for e in update.events] == [4, 5]
+        first_read = next(c for c in db.aquery.call_args_list if "step_events" in c.args[0])
+        assert first_read.args[1][1] == 3
+
+    @pytest.mark.asyncio
+    async def test_broadcast_is_filtered_per_subscriber(self):
+        db = _table_db([{"id": i} for i in range(1, 6)])
+
+        async with (
+            subscribe_run("run-8", lambda: db, after=4) as ahead,
+            subscribe_run("run-8", lambda: db) as behind,
+        ):
+            update = await asyncio.wait_for(ahead.get(), 1)
+            replay = await asyncio.wait_for(behind.get(), 1)
+
+        assert [e["id"] for e in update.events] == [5]
+        # Caught up from the database; the shared read of 5 is not sent twice
+        assert [e["id"] for e in replay.events] == [1, 2, 3, 4, 5]
+        assert (await asyncio.wait_for(behind.get(), 1)).events == []
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_replays_from_cursor(self):
+        db = _db([[{"id": 1}, {"id": 2}, {"id": 3}]], ["running"] * 10)
+
+        async with subscribe_run("run-5", lambda: db) as first:
+            await asyncio.wait_for(first.get(), 1)
+            async with subscribe_run("run-5", lambda: db, after=2) as late:
+                replay = await asyncio.wait_for(late.get(), 1)
+
+        assert [e["id"] for e in replay.events] == [3]
+
+    @pytest.mark.asyncio
+    async def test_read_error_ends_feed(self):
+        db = MagicMock()
+        db.aquery = AsyncMock(side_effect=RuntimeError("boom"))
+
+        async with subscribe_run("run-3", lambda: db) as updates:
+            update = await asyncio.wait_for(updates.get(), 1)
+
+        assert update.done is True
+        assert update.error == "boom"
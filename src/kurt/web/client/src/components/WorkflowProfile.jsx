@@ -0,0 +1,115 @@
+import { useState, useEffect } from 'react'
+
+const apiBase = import.meta.env.VITE_API_URL || ''
+const apiUrl = (path) => `${apiBase}${path}`
+
+/**
+ * WorkflowProfile - Gantt view of a workflow run from /profile
+ *
+ * Shows each step as a bar positioned at its start time with:
+ * - Queue time (ready but waiting for a slot) shaded before the bar
+ * - Critical-path steps highlighted
+ * - Summary of wall time, concurrency and critical path
+ * - Link to download the run as a Chrome trace
+ */
+
+const formatDuration = (ms) => {
+  if (ms == null) return '-'
+  if (ms < 1000) return `${ms}ms`
+  const seconds = ms / 1000
+  if (seconds < 60) return `${seconds.toFixed(1)}s`
+  const minutes = Math.floor(seconds / 60)
+  const remainingSeconds = Math.round(seconds % 60)
+  return `${minutes}m ${remainingSeconds}s`
+}
+
+const getStatusClass = (status) => {
+  if (status === 'completed') return 'success'
+  if (status === 'failed' || status === 'canceled') return 'error'
+  return 'running'
+}
+
+export default function WorkflowProfile({ workflowId, refreshKey }) {
+  const [profile, setProfile] = useState(null)
+  const [error, setError] = useState(null)
+
+  useEffect(() => {
+    if (!workflowId) return
+    let cancelled = false
+    fetch(apiUrl(`/api/workflows/${workflowId}/profile`))
+      .then((response) => {
+        if (!response.ok) throw new Error(`HTTP ${response.status}`)
+        return response.json()
+      })
+      .then((data) => {
+        if (!cancelled) {
+          setProfile(data)
+          setError(null)
+        }
+      })
+      .catch((err) => {
+        if (!cancelled) setError(err.message)
+      })
+    return () => {
+      cancelled = true
+    }
+  }, [workflowId, refreshKey])
+
+  if (error) {
+    return <div className="workflow-profile-empty">Profile unavailable: {error}</div>
+  }
+  if (!profile || profile.steps.length === 0) {
+    return null
+  }
+
+  const wall = Math.max(profile.wall_ms, 1)
+  const pct = (ms) => `${Math.min((ms / wall) * 100, 100)}%`
+
+  return (
+    <div className="workflow-profile">
+      <div className="workflow-profile-summary">
+        <span>Wall {formatDuration(profile.wall_ms)}</span>
+        <span>
+          Concurrency peak {profile.peak_concurrency}, avg {profile.avg_concurrency.toFixed(2)}
+        </span>
+        <span>Critical path {formatDuration(profile.critical_path_ms)}</span>
+        <a
+          className="workflow-profile-download"
+          href={apiUrl(`/api/workflows/${workflowId}/profile?format=chrome`)}
+          download={`${workflowId}-trace.json`}
+        >
+          Chrome trace
+        </a>
+      </div>
+      <div className="workflow-profile-content">
+        {profile.steps.map((step) => (
+          <div key={step.step_id} className="workflow-profile-row">
+            <div
+              className={`workflow-profile-label ${step.on_critical_path ? 'workflow-profile-critical' : ''}`}
+              title={step.tool || step.step_id}
+            >
+              {step.step_id}
+            </div>
+            <div className="workflow-profile-track">
+              {step.queued_ms > 0 && (
+                <div
+                  className="workflow-profile-queue"
+                  style={{ left: pct(step.start_ms - step.queued_ms), width: pct(step.queued_ms) }}
+                  title={`Queued ${formatDuration(step.queued_ms)}`}
+                />
+              )}
+              <div
+                className={`workflow-profile-bar workflow-timeline-bar-${getStatusClass(step.status)} ${
+                  step.on_critical_path ? 'workflow-profile-bar-critical' : ''
+                }`}
+                style={{ left: pct(step.start_ms), width: pct(step.duration_ms) }}
+                title={`${step.step_id}: ${formatDuration(step.duration_ms)}`}
+              />
+            </div>
+            <span className="workflow-profile-duration">{formatDuration(step.duration_ms)}</span>
+          </div>
+        ))}
+      </div>
+    </div>
+  )
+}
@@ -1,6 +1,7 @@
 import { useState, useEffect, useCallback, useRef } from 'react'
 import { ArrowLeft, RefreshCw, Copy, ExternalLink } from 'lucide-react'
 import WorkflowTimeline from '../components/WorkflowTimeline'
+import WorkflowProfile from '../components/WorkflowProfile'
 
 const apiBase = import.meta.env.VITE_API_URL || ''
 const apiUrl = (path) => `${apiBase}${path}`
@@ -642,6 +643,14 @@ export default function WorkflowDetailPanel({ params }) {
               </div>
             )}
 
+            {/* Profile: start offsets, queue time and critical path */}
+            {liveStatus?.steps?.length > 0 && !isRunning && (
+              <div className="workflow-detail-section">
+                <h3 className="workflow-detail-section-title">Profile</h3>
+                <WorkflowProfile workflowId={workflowId} refreshKey={workflow?.status} />
+              </div>
+            )}
+
             <StepsSection liveStatus={liveStatus} />
             <OutputSection workflow={workflow} liveStatus={liveStatus} />
             <ErrorSection liveStatus={liveStatus} />
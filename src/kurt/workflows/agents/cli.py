@@ -799,3 +799,66 @@ tags = []
     console.print(f"[cyan]  kurt agents run {name}[/cyan]")
 
 
+@click.command(name="scheduler")
+@click.option(
+    "--interval",
+    default=30,
+    type=click.FloatRange(min=1),
+    show_default=True,
+    help="Seconds between schedule checks",
+)
+@click.option(
+    "--max-workers",
+    default=2,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help="Scheduled workflows running at the same time",
+)
+@click.option("--once", is_flag=True, help="Check schedules once, wait for runs, then exit")
+@track_command
+def scheduler_cmd(interval: float, max_workers: int, once: bool):
+    """
+    Run scheduled workflows (long-running service).
+
+    Evaluates the [schedule] cron of every workflow definition and runs due
+    workflows in this process, at most --max-workers at a time. A workflow
+    never overlaps itself; runs missed while the scheduler was stopped
+    follow the schedule's catch_up policy (skip, once, all).
+
+    \\b
+    Examples:
+        kurt scheduler
+        kurt scheduler --interval 10 --max-workers 4
+        kurt scheduler --once
+    """
+    import signal
+    import threading
+
+    from .scheduler import CronScheduler, get_scheduled_workflows
+
+    schedules = [s for s in get_scheduled_workflows() if s["enabled"]]
+    scheduler = CronScheduler(max_workers=max_workers)
+
+    if once:
+        started = scheduler.tick()
+        scheduler.shutdown(wait=True)
+        console.print(f"[green]✓[/green] Started {len(started)} scheduled run(s)")
+        for name in started:
+            console.print(f"  {name}")
+        return
+
+    console.print(
+        f"[bold]Kurt scheduler[/bold] [dim]({len(schedules)} schedule(s), "
+        f"checking every {interval:g}s, {max_workers} worker(s))[/dim]"
+    )
+    for s in schedules:
+        console.print(f"  {s['name']}: {s['cron']} ({s['timezone']})")
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    try:
+        scheduler.run_forever(interval=interval, stop=stop)
+    except KeyboardInterrupt:
+        stop.set()
+        scheduler.shutdown(wait=True)
+    console.print("[dim]Scheduler stopped[/dim]")
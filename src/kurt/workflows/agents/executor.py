@@ -26,7 +26,7 @@ from kurt.db.utils import get_dolt_db
 from kurt.observability import WorkflowLifecycle
 from kurt.observability.tracking import track_event
 
-from .parser import ParsedWorkflow
+from .parser import DEFAULT_MAX_PARALLEL_STEPS, ParsedWorkflow
 from .registry import get_workflow_dir
 
 logger = logging.getLogger(__name__)
@@ -699,12 +699,16 @@ def execute_steps_workflow(
     trigger: str = "manual",
     run_id: str | None = None,
     db: DoltDB | None = None,
+    max_parallel_steps: int | None = None,
 ) -> dict[str, Any]:
     """
     Execute a DAG-orchestrated workflow with observability tracking.
 
-    Steps are executed in topological order based on their depends_on fields.
-    Results from each step are passed to dependent steps via context.
+    Steps run as soon as all steps in their depends_on have completed, so
+    independent steps run concurrently (in threads, up to max_parallel_steps
+    at a time). Results from each step are passed to dependent steps via
+    context. If a step fails, no new steps are started; steps already
+    running are allowed to finish before the error is raised.
 
     Args:
         definition_dict: ParsedWorkflow as dict
@@ -712,10 +716,13 @@ def execute_steps_workflow(
         trigger: What triggered this run (manual, scheduled, api)
         run_id: Optional existing run ID (for background execution)
         db: Optional DoltDB instance (created if not provided)
+        max_parallel_steps: Steps running at once (default: [workflow]
+            max_parallel_steps, or 4)
 
     Returns:
         Dict with workflow results and step outputs
     """
+    from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
     from graphlib import TopologicalSorter
 
     from .parser import ParsedWorkflow
@@ -775,65 +782,127 @@ def execute_steps_workflow(
         "lifecycle": lifecycle,
     }
 
+    if max_parallel_steps is None:
+        max_parallel_steps = (
+            definition.workflow.max_parallel_steps
+            if definition.workflow
+            else DEFAULT_MAX_PARALLEL_STEPS
+        )
+    total = len(definition.steps)
+
     try:
-        # Build dependency graph and get execution order
+        # Build dependency graph
         graph = {name: set(step.depends_on) for name, step in definition.steps.items()}
         sorter = TopologicalSorter(graph)
-        execution_order = list(sorter.static_order())
+        sorter.prepare()
 
         track_event(
             run_id=run_id,
             step_id="workflow",
             substep="dag",
             status="progress",
-            message=f"Execution order: {', '.join(execution_order)}",
+            message=(
+                f"Execution order: {', '.join(TopologicalSorter(graph).static_order())} "
+                f"(up to {max_parallel_steps} in parallel)"
+            ),
             db=db,
         )
 
-        # Execute steps in order
-        for idx, step_name in enumerate(execution_order):
+        execution_order: list[str] = []
+        running: dict[Future, str] = {}
+        error: Exception | None = None
+
+        step_started: dict[str, float] = {}
+
+        def start_step(step_name: str) -> Future:
             step = definition.steps[step_name]
+            idx = len(execution_order)
+            execution_order.append(step_name)
 
-            # Create step log
             lifecycle.create_step_log(
                 run_id=run_id,
                 step_id=step_name,
                 tool=step.type,
-                metadata={"index": idx + 1, "total": len(execution_order)},
+                metadata={"index": idx + 1, "total": total},
             )
-
             track_event(
                 run_id=run_id,
                 step_id=step_name,
                 status="running",
                 current=idx + 1,
-                total=len(execution_order),
+                total=total,
                 message=f"Starting step {step_name}",
+                metadata={"depends_on": list(step.depends_on)},
                 db=db,
             )
-
-            # Execute step based on type
-            step_result = _execute_step(step_name, step, context, definition)
-
-            # Store result in context for dependent steps
-            context["outputs"][step_name] = step_result
-
-            # Update step log
-            lifecycle.update_step_log(
-                run_id, step_name,
-                status="completed",
-                output_count=len(step_result) if isinstance(step_result, dict) else 1,
-            )
-
-            track_event(
-                run_id=run_id,
-                step_id=step_name,
-                status="completed",
-                current=idx + 1,
-                total=len(execution_order),
-                message=f"Completed step {step_name}",
-                db=db,
-            )
+            step_started[step_name] = time.monotonic()
+
+            # Each step sees the outputs of every step completed so far;
+            # outputs are only added to the shared context in this thread.
+            step_context = {**context, "outputs": dict(context["outputs"])}
+            return pool.submit(_execute_step, step_name, step, step_context, definition)
+
+        with ThreadPoolExecutor(
+            max_workers=max_parallel_steps, thread_name_prefix=f"steps-{run_id[:8]}"
+        ) as pool:
+            while True:
+                # After a failure, only wait for the steps already running
+                if error is None:
+                    for step_name in sorter.get_ready():
+                        running[start_step(step_name)] = step_name
+                if not running:
+                    break
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step_name = running.pop(future)
+                    idx = execution_order.index(step_name)
+                    duration_ms = int((time.monotonic() - step_started[step_name]) * 1000)
+                    try:
+                        step_result = future.result()
+                    except Exception as e:
+                        lifecycle.update_step_log(
+                            run_id, step_name,
+                            status="failed",
+                            error_count=1,
+                            errors=[{"row_idx": None, "error_type": "exception", "message": str(e)}],
+                        )
+                        track_event(
+                            run_id=run_id,
+                            step_id=step_name,
+                            status="failed",
+                            current=idx + 1,
+                            total=total,
+                            message=f"Step {step_name} failed: {e}",
+                            metadata={"duration_ms": duration_ms},
+                            db=db,
+                        )
+                        if error is None:
+                            error = e
+                        continue
+
+                    # Store result in context for dependent steps
+                    context["outputs"][step_name] = step_result
+                    sorter.done(step_name)
+
+                    lifecycle.update_step_log(
+                        run_id, step_name,
+                        status="completed",
+                        output_count=len(step_result) if isinstance(step_result, dict) else 1,
+                    )
+                    track_event(
+                        run_id=run_id,
+                        step_id=step_name,
+                        status="completed",
+                        current=idx + 1,
+                        total=total,
+                        message=f"Completed step {step_name}",
+                        metadata={"duration_ms": duration_ms},
+                        db=db,
+                    )
+
+        if error is not None:
+            raise error
 
         # Complete workflow
         lifecycle.update_status(run_id, "completed")
@@ -1153,6 +1222,12 @@ def _spawn_background_agent_run(
         "project_root": _get_project_root(),
     }
 
+    # Hand the run to the warm worker pool when one is running
+    from kurt.tools.core.worker_pool import submit_job
+
+    if submit_job("workflow", payload, project_root=payload["project_root"]):
+        return {"workflow_id": run_id, "status": "started"}
+
     payload_file = tempfile.NamedTemporaryFile("w", delete=False, suffix=".json")
     with payload_file as handle:
         json.dump(payload, handle)
@@ -1173,8 +1248,11 @@ def _spawn_background_agent_run(
 
 def _run_from_payload(payload_path: str) -> None:
     """Run a workflow from a payload file (called by subprocess)."""
-    payload = json.loads(Path(payload_path).read_text())
+    run_payload(json.loads(Path(payload_path).read_text()))
+
 
+def run_payload(payload: dict[str, Any], db: DoltDB | None = None) -> None:
+    """Run a background workflow payload (from a payload file or the job queue)."""
     run_id = payload["run_id"]
     workflow_type = payload["workflow_type"]
     definition_dict = payload["definition_dict"]
@@ -1187,6 +1265,7 @@ def _run_from_payload(payload_path: str) -> None:
             inputs=inputs,
             trigger=trigger,
             run_id=run_id,
+            db=db,
         )
     else:
         execute_agent_workflow(
@@ -1194,6 +1273,7 @@ def _run_from_payload(payload_path: str) -> None:
             inputs=inputs,
             trigger=trigger,
             run_id=run_id,
+            db=db,
         )
 
 
@@ -1205,6 +1285,7 @@ def run_definition(
     inputs: Optional[dict[str, Any]] = None,
     background: bool = True,
     trigger: str = "manual",
+    db: DoltDB | None = None,
 ) -> dict[str, Any]:
     """
     Run a workflow definition by name.
@@ -1218,6 +1299,7 @@ def run_definition(
         inputs: Input parameters (will use defaults if not provided)
         background: Run in background worker (default True)
         trigger: What triggered this run (manual, scheduled, api)
+        db: DoltDB instance for foreground runs (created if not provided)
 
     Returns:
         dict with workflow_id
@@ -1254,6 +1336,7 @@ def run_definition(
             definition_dict=definition.model_dump(),
             inputs=resolved_inputs,
             trigger=trigger,
+            db=db,
         )
 
 
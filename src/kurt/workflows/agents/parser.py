@@ -17,6 +17,9 @@ from pydantic import BaseModel, Field
 
 from kurt.workflows.core import GuardrailsConfig, ScheduleConfig
 
+# Default cap on steps of a step-driven workflow running at once
+DEFAULT_MAX_PARALLEL_STEPS = 4
+
 
 class WorkflowConfig(BaseModel):
     """Top-level workflow configuration."""
@@ -24,6 +27,7 @@ class WorkflowConfig(BaseModel):
     name: str  # Unique identifier (kebab-case)
     title: str  # Display name
     description: Optional[str] = None
+    max_parallel_steps: int = Field(default=DEFAULT_MAX_PARALLEL_STEPS, ge=1)
 
 
 class AgentConfig(BaseModel):
@@ -148,6 +152,7 @@ def parse_toml_workflow(path: Path) -> ParsedWorkflow:
         name=workflow_data.get("name", path.stem),
         title=workflow_data.get("title", path.stem),
         description=workflow_data.get("description"),
+        max_parallel_steps=workflow_data.get("max_parallel_steps", DEFAULT_MAX_PARALLEL_STEPS),
     )
 
     # Extract agent section (optional)
@@ -1,22 +1,56 @@
 """
 Cron-based scheduling for agent workflows.
 
-Schedules are tracked via workflow definitions and executed via run_definition.
+Schedules are tracked via workflow definitions (``[schedule]`` section) and
+executed by ``kurt scheduler``, a long-running service that evaluates every
+enabled cron expression and dispatches due runs to a bounded pool of worker
+threads. Runs execute in the scheduler's own interpreter via run_definition
+and share one database connection pool, so a tick does not pay for a new
+Python process, imports and schema migration.
 
-Note: For production use, consider integrating with an external scheduler
-like cron, systemd timers, or a task queue (Celery, APScheduler, etc.).
-This module provides the interface for reading schedule configurations.
+Guarantees:
+- A workflow never overlaps itself: a slot that comes due while the previous
+  run is still going is skipped.
+- Slots missed while the scheduler was not running follow the schedule's
+  ``catch_up`` policy (skip, once, all).
+
+The last time each workflow's schedule was evaluated is kept in
+``.kurt/scheduler/state.json`` so catch-up works across restarts.
+
+Usage:
+    scheduler = CronScheduler(max_workers=2)
+    scheduler.run_forever(interval=30)
 """
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+from zoneinfo import ZoneInfo
+
+from kurt.workflows.core import ScheduleConfig
 
 from .registry import list_definitions
 
 logger = logging.getLogger(__name__)
 
+# Scheduler state file, relative to the project root
+SCHEDULER_STATE_FILE = Path(".kurt") / "scheduler" / "state.json"
+
+# Seconds between two evaluations of the schedules
+DEFAULT_TICK_INTERVAL = 30
+
+# Upper bound on catch-up runs queued for one workflow
+MAX_CATCH_UP_RUNS = 24
+
+# Runs one workflow by name and returns run_definition's result
+WorkflowRunner = Callable[[str], dict[str, Any]]
+
 
 def get_scheduled_workflows() -> list[dict[str, Any]]:
     """
@@ -35,8 +69,251 @@ def get_scheduled_workflows() -> list[dict[str, Any]]:
                     "cron": definition.schedule.cron,
                     "timezone": definition.schedule.timezone,
                     "enabled": definition.schedule.enabled,
+                    "catch_up": definition.schedule.catch_up,
                 }
             )
     return result
 
 
+def due_slots(
+    cron: str,
+    tz: str,
+    after: datetime,
+    until: datetime,
+    limit: int = MAX_CATCH_UP_RUNS,
+) -> list[datetime]:
+    """
+    Cron slots in ``(after, until]``, oldest first, at most ``limit`` (the newest).
+
+    Raises:
+        ValueError: Invalid cron expression or timezone
+    """
+    from croniter import croniter
+
+    try:
+        zone = ZoneInfo(tz)
+    except Exception as e:
+        raise ValueError(f"Invalid timezone: {tz}") from e
+    try:
+        slots = croniter(cron, after.astimezone(zone))
+    except Exception as e:
+        raise ValueError(f"Invalid cron expression: {cron}") from e
+
+    result: list[datetime] = []
+    while True:
+        slot = slots.get_next(datetime)
+        if slot > until:
+            return result
+        result.append(slot)
+        if len(result) > limit:
+            result.pop(0)
+
+
+class CronScheduler:
+    """
+    Evaluates workflow schedules and runs due workflows in a thread pool.
+
+    Args:
+        max_workers: Workflows running at the same time
+        runner: Runs a workflow by name (default: run_definition in the
+            foreground, with trigger "scheduled" and a shared DoltDB)
+        state_path: State file (default: ``<project>/.kurt/scheduler/state.json``)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        runner: WorkflowRunner | None = None,
+        state_path: Path | str | None = None,
+    ):
+        if state_path is None:
+            from kurt.config.base import get_project_root
+
+            state_path = get_project_root() / SCHEDULER_STATE_FILE
+        self.state_path = Path(state_path)
+        self.max_workers = max_workers
+        self.started_at = datetime.now(timezone.utc)
+        self._runner = runner or self._run_definition
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="kurt-scheduler"
+        )
+        self._lock = threading.RLock()
+        self._db: Any = None
+        self._running: dict[str, Future] = {}
+        self._pending: dict[str, int] = {}
+        self._state = self._read_state()
+
+    # -- Runs --------------------------------------------------------------
+
+    def _run_definition(self, name: str) -> dict[str, Any]:
+        from .executor import _get_dolt_db, run_definition
+
+        with self._lock:
+            if self._db is None:
+                self._db = _get_dolt_db()
+            db = self._db
+        return run_definition(name, background=False, trigger="scheduled", db=db)
+
+    def tick(self, now: datetime | None = None) -> list[str]:
+        """
+        Evaluate all schedules once and dispatch due runs.
+
+        A workflow seen for the first time starts its schedule at ``now``
+        (earlier slots are never back-filled).
+
+        Returns:
+            Names of the workflows dispatched by this tick
+        """
+        now = now or datetime.now(timezone.utc)
+        definitions = [d for d in list_definitions() if d.schedule and d.schedule.enabled]
+
+        with self._lock:
+            workflows = self._state.setdefault("workflows", {})
+            for definition in definitions:
+                self._evaluate(definition.name, definition.schedule, workflows, now)
+
+        dispatched = self._dispatch()
+        self._write_state()
+        return dispatched
+
+    def _evaluate(
+        self, name: str, schedule: ScheduleConfig, workflows: dict[str, Any], now: datetime
+    ) -> None:
+        """Queue the runs of one workflow that came due since its last check."""
+        entry = workflows.setdefault(name, {})
+        checked_at = entry.get("checked_at")
+        entry["checked_at"] = now.isoformat()
+        if checked_at is None:
+            return
+
+        try:
+            slots = due_slots(
+                schedule.cron, schedule.timezone, datetime.fromisoformat(checked_at), now
+            )
+        except ValueError as e:
+            logger.warning("Skipping schedule of %s: %s", name, e)
+            return
+        if not slots:
+            return
+
+        missed = sum(1 for slot in slots if slot < self.started_at)
+        catch_up = {"skip": 0, "once": min(missed, 1), "all": missed}[schedule.catch_up]
+        pending = self._pending.get(name, 0) + catch_up
+        if len(slots) > missed:
+            if name in self._running or pending:
+                entry["skipped"] = entry.get("skipped", 0) + 1
+                logger.info("Skipping %s: previous run still in progress", name)
+            else:
+                pending += 1
+        self._pending[name] = min(pending, MAX_CATCH_UP_RUNS)
+
+    def _dispatch(self) -> list[str]:
+        """Start one run for every workflow with pending runs that is idle."""
+        dispatched = []
+        with self._lock:
+            for name in list(self._pending):
+                pending = self._pending.get(name, 0)
+                if pending <= 0:
+                    self._pending.pop(name, None)
+                    continue
+                if name in self._running:
+                    continue
+                if pending > 1:
+                    self._pending[name] = pending - 1
+                else:
+                    del self._pending[name]
+                future = self._pool.submit(self._runner, name)
+                self._running[name] = future
+                future.add_done_callback(lambda f, name=name: self._finished(name, f))
+                dispatched.append(name)
+        for name in dispatched:
+            logger.info("Started scheduled run of %s", name)
+        return dispatched
+
+    def _finished(self, name: str, future: Future) -> None:
+        try:
+            result = future.result()
+            status = (result or {}).get("status", "completed")
+            run_id = (result or {}).get("workflow_id") or (result or {}).get("run_id")
+        except Exception as e:
+            logger.error("Scheduled run of %s failed: %s", name, e)
+            status, run_id = "failed", None
+
+        with self._lock:
+            self._running.pop(name, None)
+            entry = self._state.setdefault("workflows", {}).setdefault(name, {})
+            entry["last_run_at"] = datetime.now(timezone.utc).isoformat()
+            entry["last_status"] = status
+            entry["last_run_id"] = run_id
+        self._write_state()
+
+        # Catch-up runs are sequential: start the next one right away
+        with self._lock:
+            more = bool(self._pending.get(name))
+        if more:
+            try:
+                self._dispatch()
+            except RuntimeError:
+                pass  # Pool shut down
+
+    @property
+    def running(self) -> list[str]:
+        """Workflows with a run in progress."""
+        with self._lock:
+            return sorted(self._running)
+
+    # -- Lifecycle ---------------------------------------------------------
+
+    def run_forever(
+        self,
+        interval: float = DEFAULT_TICK_INTERVAL,
+        stop: threading.Event | None = None,
+    ) -> None:
+        """Tick every ``interval`` seconds until ``stop`` is set, then drain the pool."""
+        stop = stop or threading.Event()
+        try:
+            while not stop.is_set():
+                try:
+                    self.tick()
+                except Exception:
+                    logger.exception("Scheduler tick failed")
+                stop.wait(interval)
+        finally:
+            self.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop dispatching; with ``wait``, let running workflows finish."""
+        with self._lock:
+            self._pending.clear()
+        self._pool.shutdown(wait=wait)
+
+    # -- State -------------------------------------------------------------
+
+    def _read_state(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.state_path.read_text())
+        except FileNotFoundError:
+            return {"workflows": {}}
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable scheduler state %s", self.state_path)
+            return {"workflows": {}}
+
+    def _write_state(self) -> None:
+        with self._lock:
+            try:
+                self.state_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.state_path.with_suffix(".json.tmp")
+                tmp.write_text(json.dumps(self._state, indent=2, default=str))
+                tmp.replace(self.state_path)
+            except OSError:
+                logger.warning("Could not write scheduler state %s", self.state_path, exc_info=True)
+
+
+__all__ = [
+    "DEFAULT_TICK_INTERVAL",
+    "MAX_CATCH_UP_RUNS",
+    "SCHEDULER_STATE_FILE",
+    "CronScheduler",
+    "due_slots",
+    "get_scheduled_workflows",
+]
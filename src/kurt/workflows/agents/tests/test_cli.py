@@ -775,3 +775,30 @@ class TestHistoryCommand:
         assert call_args is not None
         # Third parameter should be the limit
         assert 5 in call_args[0][1]
+
+
+class TestSchedulerCommand:
+    """Tests for the scheduler command."""
+
+    def test_scheduler_help(self, cli_runner: CliRunner):
+        """Test scheduler command shows help."""
+        from kurt.workflows.agents.cli import scheduler_cmd
+
+        result = invoke_cli(cli_runner, scheduler_cmd, ["--help"])
+        assert_cli_success(result)
+        assert_output_contains(result, "--max-workers")
+
+    @patch("kurt.workflows.agents.scheduler.CronScheduler")
+    @patch("kurt.workflows.agents.scheduler.get_scheduled_workflows", return_value=[])
+    def test_scheduler_once(self, mock_list, mock_scheduler, cli_runner: CliRunner):
+        """Test --once ticks once and waits for the started runs."""
+        from kurt.workflows.agents.cli import scheduler_cmd
+
+        mock_scheduler.return_value.tick.return_value = ["daily-research"]
+
+        result = cli_runner.invoke(scheduler_cmd, ["--once", "--max-workers", "3"])
+        assert result.exit_code == 0
+        assert "Started 1 scheduled run(s)" in result.output
+        assert "daily-research" in result.output
+        mock_scheduler.assert_called_once_with(max_workers=3)
+        mock_scheduler.return_value.shutdown.assert_called_once_with(wait=True)
@@ -389,6 +389,115 @@ class TestRunDefinition:
         mock_execute.assert_called_once()
 
 
+class TestExecuteStepsWorkflow:
+    """Tests for parallel DAG execution of step-driven workflows."""
+
+    @staticmethod
+    def _definition(steps: dict, max_parallel_steps: int = 4) -> dict:
+        from kurt.workflows.agents.parser import ParsedWorkflow, StepConfig, WorkflowConfig
+
+        return ParsedWorkflow(
+            name="research",
+            title="Research",
+            workflow=WorkflowConfig(
+                name="research", title="Research", max_parallel_steps=max_parallel_steps
+            ),
+            steps={
+                name: StepConfig(type="function", function=name, depends_on=deps)
+                for name, deps in steps.items()
+            },
+        ).model_dump()
+
+    @staticmethod
+    def _run(definition: dict, execute_step, lifecycle=None, **kwargs):
+        from kurt.workflows.agents.executor import execute_steps_workflow
+
+        with patch(
+            "kurt.workflows.agents.executor.WorkflowLifecycle",
+            return_value=lifecycle or MagicMock(),
+        ), patch("kurt.workflows.agents.executor.track_event"), patch(
+            "kurt.workflows.agents.executor._execute_step", side_effect=execute_step
+        ):
+            return execute_steps_workflow(definition, {}, db=MagicMock(), **kwargs)
+
+    def test_independent_steps_run_concurrently(self):
+        """Four independent steps all run at the same time."""
+        import threading
+
+        barrier = threading.Barrier(4, timeout=5)
+
+        def execute_step(step_name, step, context, definition):
+            barrier.wait()  # Raises BrokenBarrierError if steps run one by one
+            return {"step": step_name}
+
+        definition = self._definition({"a": [], "b": [], "c": [], "d": []})
+        result = self._run(definition, execute_step)
+
+        assert result["status"] == "completed"
+        assert set(result["outputs"]) == {"a", "b", "c", "d"}
+
+    def test_dependencies_see_upstream_outputs(self):
+        """A step starts after its dependencies and receives their outputs."""
+        seen = {}
+
+        def execute_step(step_name, step, context, definition):
+            seen[step_name] = set(context["outputs"])
+            return {"step": step_name}
+
+        definition = self._definition({"a": [], "b": [], "merge": ["a", "b"]})
+        result = self._run(definition, execute_step)
+
+        assert seen["merge"] == {"a", "b"}
+        assert result["execution_order"][-1] == "merge"
+        assert result["outputs"]["merge"] == {"step": "merge"}
+
+    def test_concurrency_cap(self):
+        """No more than max_parallel_steps steps run at once."""
+        import threading
+        import time
+
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def execute_step(step_name, step, context, definition):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return {}
+
+        definition = self._definition({name: [] for name in "abcdef"}, max_parallel_steps=2)
+        self._run(definition, execute_step)
+        assert peak[0] == 2
+
+        self._run(definition, execute_step, max_parallel_steps=1)
+        assert peak[0] == 2  # Unchanged: override ran steps one at a time
+
+    def test_failure_stops_dependents(self):
+        """A failed step raises; its dependents never start."""
+        started = []
+
+        def execute_step(step_name, step, context, definition):
+            started.append(step_name)
+            if step_name == "a":
+                raise RuntimeError("boom")
+            return {}
+
+        lifecycle = MagicMock()
+        definition = self._definition({"a": [], "after_a": ["a"]})
+        with pytest.raises(RuntimeError, match="boom"):
+            self._run(definition, execute_step, lifecycle=lifecycle)
+
+        assert started == ["a"]
+        assert lifecycle.update_status.call_args.args[1] == "failed"
+        step_log = lifecycle.update_step_log.call_args
+        assert step_log.args[1] == "a"
+        assert step_log.kwargs["status"] == "failed"
+
+
 class TestToolExtraction:
     """Tests for tool extraction from tools.py."""
 
@@ -0,0 +1,160 @@
+"""Tests for the cron scheduler."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from kurt.workflows.agents.parser import AgentConfig, ParsedWorkflow, ScheduleConfig
+from kurt.workflows.agents.scheduler import CronScheduler, due_slots
+
+T0 = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _definition(name: str, cron: str = "*/5 * * * *", **schedule) -> ParsedWorkflow:
+    return ParsedWorkflow(
+        name=name,
+        title=name,
+        body="Do things",
+        agent=AgentConfig(),
+        schedule=ScheduleConfig(cron=cron, **schedule),
+    )
+
+
+class RecordingRunner:
+    """Runner that records calls and optionally blocks until released."""
+
+    def __init__(self, block: bool = False):
+        self.calls: list[str] = []
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def __call__(self, name: str) -> dict:
+        self.calls.append(name)
+        self.release.wait(5)
+        return {"workflow_id": f"run-{len(self.calls)}", "status": "completed"}
+
+
+def _wait_idle(scheduler: CronScheduler) -> None:
+    """Wait until queued catch-up runs have all been started and finished."""
+    deadline = time.monotonic() + 5
+    while (scheduler.running or scheduler._pending) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def make_scheduler(tmp_path):
+    schedulers = []
+
+    def factory(definitions, runner, started_at=T0):
+        scheduler = CronScheduler(max_workers=2, runner=runner, state_path=tmp_path / "state.json")
+        scheduler.started_at = started_at
+        schedulers.append(scheduler)
+        patcher = patch(
+            "kurt.workflows.agents.scheduler.list_definitions", return_value=definitions
+        )
+        patcher.start()
+        schedulers.append(patcher)
+        return scheduler
+
+    yield factory
+    for item in schedulers:
+        if isinstance(item, CronScheduler):
+            item.shutdown(wait=True)
+        else:
+            item.stop()
+
+
+class TestDueSlots:
+    def test_slots_in_window(self):
+        slots = due_slots("*/5 * * * *", "UTC", T0, T0 + timedelta(minutes=12))
+        assert [s.minute for s in slots] == [5, 10]
+
+    def test_timezone(self):
+        slots = due_slots("0 9 * * *", "Europe/Paris", T0, T0 + timedelta(days=1))
+        assert len(slots) == 1
+        assert slots[0].astimezone(timezone.utc).hour == 8
+
+    def test_limit_keeps_newest(self):
+        slots = due_slots("* * * * *", "UTC", T0, T0 + timedelta(hours=1), limit=3)
+        assert [s.minute for s in slots] == [58, 59, 0]
+
+    def test_invalid_cron(self):
+        with pytest.raises(ValueError, match="Invalid cron"):
+            due_slots("not a cron", "UTC", T0, T0)
+
+
+class TestCronScheduler:
+    def test_first_tick_does_not_backfill(self, make_scheduler):
+        runner = RecordingRunner()
+        scheduler = make_scheduler([_definition("a")], runner)
+
+        assert scheduler.tick(T0) == []
+        assert scheduler.tick(T0 + timedelta(minutes=1)) == []
+        assert scheduler.tick(T0 + timedelta(minutes=5)) == ["a"]
+        scheduler.shutdown(wait=True)
+        assert runner.calls == ["a"]
+
+    def test_disabled_schedule_never_runs(self, make_scheduler):
+        runner = RecordingRunner()
+        scheduler = make_scheduler([_definition("a", enabled=False)], runner)
+
+        scheduler.tick(T0)
+        assert scheduler.tick(T0 + timedelta(hours=1)) == []
+
+    def test_no_overlap(self, make_scheduler):
+        runner = RecordingRunner(block=True)
+        scheduler = make_scheduler([_definition("a")], runner)
+
+        scheduler.tick(T0)
+        assert scheduler.tick(T0 + timedelta(minutes=5)) == ["a"]
+        assert scheduler.tick(T0 + timedelta(minutes=10)) == []
+        assert scheduler.running == ["a"]
+
+        runner.release.set()
+        scheduler.shutdown(wait=True)
+        assert runner.calls == ["a"]
+        assert scheduler._state["workflows"]["a"]["skipped"] == 1
+        assert scheduler._state["workflows"]["a"]["last_status"] == "completed"
+
+    @pytest.mark.parametrize("policy,expected", [("skip", 0), ("once", 1), ("all", 3)])
+    def test_catch_up_policy(self, make_scheduler, tmp_path, policy, expected):
+        # Last checked at T0, scheduler restarted 16 minutes later (3 missed slots)
+        (tmp_path / "state.json").write_text(
+            '{"workflows": {"a": {"checked_at": "%s"}}}' % T0.isoformat()
+        )
+        runner = RecordingRunner()
+        restart = T0 + timedelta(minutes=16)
+        scheduler = make_scheduler([_definition("a", catch_up=policy)], runner, restart)
+
+        scheduler.tick(restart)
+        _wait_idle(scheduler)
+        scheduler.shutdown(wait=True)
+        assert runner.calls == ["a"] * expected
+
+    def test_runner_error_is_recorded(self, make_scheduler):
+        def runner(name):
+            raise RuntimeError("boom")
+
+        scheduler = make_scheduler([_definition("a")], runner)
+        scheduler.tick(T0)
+        scheduler.tick(T0 + timedelta(minutes=5))
+        scheduler.shutdown(wait=True)
+
+        assert scheduler._state["workflows"]["a"]["last_status"] == "failed"
+        assert scheduler.running == []
+
+    def test_state_persists(self, make_scheduler, tmp_path):
+        scheduler = make_scheduler([_definition("a")], RecordingRunner())
+        scheduler.tick(T0)
+
+        reloaded = CronScheduler(runner=RecordingRunner(), state_path=tmp_path / "state.json")
+        try:
+            assert reloaded._state["workflows"]["a"]["checked_at"] == T0.isoformat()
+        finally:
+            reloaded.shutdown()
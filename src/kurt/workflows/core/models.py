@@ -5,6 +5,8 @@ These Pydantic models are used across different workflow types
 (agent workflows, TOML workflows, etc.).
 """
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -16,6 +18,9 @@ class ScheduleConfig(BaseModel):
         cron: Cron expression (e.g., "0 9 * * 1-5" for weekdays at 9am)
         timezone: Timezone for the schedule (default: UTC)
         enabled: Whether the schedule is active
+        catch_up: Runs missed while ``kurt scheduler`` was not running:
+            skip (default) drops them, once runs the workflow once,
+            all runs every missed slot
 
     Example:
         >>> config = ScheduleConfig(cron="0 9 * * 1-5")
@@ -28,6 +33,7 @@ class ScheduleConfig(BaseModel):
     cron: str
     timezone: str = "UTC"
     enabled: bool = True
+    catch_up: Literal["skip", "once", "all"] = "skip"
 
 
 class GuardrailsConfig(BaseModel):
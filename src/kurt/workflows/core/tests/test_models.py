@@ -55,7 +55,12 @@ class TestScheduleConfig:
         """Config can be serialized to dict."""
         config = ScheduleConfig(cron="0 9 * * *")
         data = config.model_dump()
-        assert data == {"cron": "0 9 * * *", "timezone": "UTC", "enabled": True}
+        assert data == {
+            "cron": "0 9 * * *",
+            "timezone": "UTC",
+            "enabled": True,
+            "catch_up": "skip",
+        }
 
 
 class TestGuardrailsConfig:
@@ -31,6 +31,7 @@ from kurt.workflows.agents.cli import (
 from kurt.workflows.toml.cli import (
     cancel_cmd,
     logs_cmd,
+    profile_cmd,
     run_cmd,
     status_cmd,
     test_cmd,
@@ -65,6 +66,12 @@ class TestWorkflowHelp:
         assert_cli_success(result)
         assert_output_contains(result, "step logs")
 
+    def test_workflow_profile_help(self, cli_runner: CliRunner):
+        """Verify workflow profile shows help."""
+        result = invoke_cli(cli_runner, profile_cmd, ["--help"])
+        assert_cli_success(result)
+        assert_output_contains(result, "critical path")
+
     def test_workflow_cancel_help(self, cli_runner: CliRunner):
         """Verify workflow cancel shows help."""
         result = invoke_cli(cli_runner, cancel_cmd, ["--help"])
@@ -227,6 +234,51 @@ class TestWorkflowStatus:
         assert result.exit_code in (0, 1, 2)
 
 
+class TestWorkflowProfile:
+    """E2E tests for workflow profile command."""
+
+    def test_workflow_profile_report_and_trace(self, cli_runner: CliRunner, tmp_path: Path):
+        """Verify profile prints the critical path and writes a Chrome trace."""
+        import json
+        from unittest.mock import patch
+
+        from kurt.observability.profile import build_profile
+
+        run = {"id": "run-1", "workflow": "wf", "status": "completed", "started_at": None}
+        step_logs = [
+            {"step_id": "fetch", "tool": "fetch", "status": "completed",
+             "started_at": "2026-01-01 12:00:00", "completed_at": "2026-01-01 12:00:02"},
+            {"step_id": "map", "tool": "map", "status": "completed",
+             "started_at": "2026-01-01 12:00:02", "completed_at": "2026-01-01 12:00:03"},
+        ]
+        trace = tmp_path / "trace.json"
+
+        with (
+            patch("kurt.workflows.toml.cli._get_dolt_db"),
+            patch(
+                "kurt.observability.profile.get_run_profile",
+                return_value=build_profile(run, step_logs, []),
+            ),
+        ):
+            result = invoke_cli(cli_runner, profile_cmd, ["run-1", "--trace", str(trace)])
+
+        assert_cli_success(result)
+        assert_output_contains(result, "fetch -> map")
+        assert json.loads(trace.read_text())["traceEvents"]
+
+    def test_workflow_profile_not_found(self, cli_runner: CliRunner):
+        """Verify profile reports a missing run."""
+        from unittest.mock import patch
+
+        with (
+            patch("kurt.workflows.toml.cli._get_dolt_db"),
+            patch("kurt.observability.profile.get_run_profile", return_value=None),
+        ):
+            result = invoke_cli(cli_runner, profile_cmd, ["missing", "--json"])
+
+        assert '"not_found"' in result.output
+
+
 class TestWorkflowLogs:
     """E2E tests for workflow logs command."""
 
@@ -0,0 +1,318 @@
+"""
+Step-level memoization for TOML workflows.
+
+A step's output is cached under a fingerprint of everything that determines
+it: tool name, tool version, resolved config (after provider resolution and
+provider TOML defaults) and a hash of its input records. Re-running a
+workflow reuses the output of every ``cache = true`` step whose fingerprint
+is unchanged, so iterating on the last step of a pipeline does not re-run
+expensive LLM or embedding steps. Tools that read live state or exist for
+their side effects (map, fetch, sql, write-db, ...) are never cached.
+
+Entries live in a local store (one pickle file per fingerprint under
+``.kurt/cache/steps``). Only successful steps without row errors are cached.
+Entries expire after ``max_age``, and the least recently used ones are
+evicted once the store exceeds ``max_bytes``.
+
+Usage:
+    cache = StepCache()
+    key = step_fingerprint("batch-llm", config, input_data, tool_version("batch-llm"))
+    output = cache.get(key)
+    if output is None:
+        output = ...
+        cache.put(key, output, step_id="summarize", tool_name="batch-llm")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached step (fingerprint or entry layout changed)
+STEP_CACHE_FORMAT = 1
+
+# Cache directory, relative to the project root
+STEP_CACHE_DIR = Path(".kurt") / "cache" / "steps"
+
+# Store bounds: entry lifetime and total size before LRU eviction
+DEFAULT_STEP_CACHE_MAX_AGE = timedelta(days=30)
+DEFAULT_STEP_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+
+def _canonical_json(value: Any) -> bytes:
+    """Serialize a value deterministically for hashing."""
+
+    def default(obj: Any) -> Any:
+        if isinstance(obj, bytes):
+            return {"__bytes__": hashlib.sha256(obj).hexdigest()}
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj, key=repr)
+        return repr(obj)
+
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), default=default
+    ).encode("utf-8")
+
+
+def hash_records(records: list[dict[str, Any]]) -> str:
+    """Return the SHA256 hex digest of a list of records (key order ignored)."""
+    return hashlib.sha256(_canonical_json(records)).hexdigest()
+
+
+def write_pickle(path: Path, obj: Any) -> None:
+    """Pickle ``obj`` to ``path`` atomically (write to a temp file, then rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("kurt-core")
+    except Exception:
+        return "unknown"
+
+
+def tool_version(tool_name: str, function_source: Path | None = None) -> str:
+    """
+    Version string for the code that runs a step.
+
+    Combines the kurt-core version with the tool's ``version`` attribute.
+    For function steps (``function_source`` set) the hash of tools.py is used
+    instead, so editing the function invalidates its cached output.
+    """
+    if function_source is not None:
+        try:
+            digest = hashlib.sha256(function_source.read_bytes()).hexdigest()
+        except OSError:
+            digest = "missing"
+        return f"function:{digest}"
+
+    from kurt.tools.core import get_tool
+
+    try:
+        version = getattr(get_tool(tool_name), "version", "1")
+    except Exception:
+        version = "unknown"
+    return f"{_package_version()}:{version}"
+
+
+def step_fingerprint(
+    tool_name: str,
+    config: dict[str, Any],
+    input_data: list[dict[str, Any]],
+    version: str,
+) -> str:
+    """
+    Fingerprint a step execution.
+
+    Args:
+        tool_name: Resolved tool name (or function name for function steps)
+        config: Resolved step config (interpolated, provider defaults applied)
+        input_data: Records passed to the step
+        version: Output of tool_version()
+
+    Returns:
+        SHA256 hex digest
+    """
+    payload = {
+        "format": STEP_CACHE_FORMAT,
+        "tool": tool_name,
+        "version": version,
+        "config": config,
+        "input": hash_records(input_data),
+    }
+    return hashlib.sha256(_canonical_json(payload)).hexdigest()
+
+
+@dataclass
+class StepCacheStats:
+    """Cache hits and misses for one workflow run."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+
+class StepCache:
+    """
+    Local store of step outputs keyed by fingerprint.
+
+    Storage errors never fail a run: unreadable entries are treated as
+    misses and failed writes are logged and skipped.
+
+    An entry's file modification time is when it was written (for
+    max_age) and its access time is when it was last read (for LRU).
+
+    Args:
+        root: Cache directory (default: ``<project>/.kurt/cache/steps``)
+        max_age: Entries older than this are misses and get deleted
+            (None = no expiry)
+        max_bytes: Evict least recently used entries beyond this total
+            size (None = unbounded)
+    """
+
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        *,
+        max_age: timedelta | None = DEFAULT_STEP_CACHE_MAX_AGE,
+        max_bytes: int | None = DEFAULT_STEP_CACHE_MAX_BYTES,
+    ):
+        if root is None:
+            from kurt.config.base import get_project_root
+
+            root = get_project_root() / STEP_CACHE_DIR
+        self.root = Path(root)
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.stats = StepCacheStats()
+
+    def _expired(self, mtime: float) -> bool:
+        return self.max_age is not None and time.time() - mtime > self.max_age.total_seconds()
+
+    def _path(self, fingerprint: str) -> Path:
+        return self.root / fingerprint[:2] / f"{fingerprint}.pkl"
+
+    def get(self, fingerprint: str) -> list[dict[str, Any]] | None:
+        """Return cached output records, or None on a miss."""
+        path = self._path(fingerprint)
+        try:
+            mtime = path.stat().st_mtime
+            if self._expired(mtime):
+                path.unlink(missing_ok=True)
+                self.stats.evictions += 1
+                raise FileNotFoundError(path)
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            if entry.get("format") != STEP_CACHE_FORMAT:
+                raise ValueError("stale cache entry format")
+            data = entry["data"]
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        except Exception:
+            logger.debug("Ignoring unreadable step cache entry %s", path, exc_info=True)
+            self.stats.misses += 1
+            return None
+        try:
+            # Record the read for LRU eviction (keeps the write time)
+            os.utime(path, (time.time(), mtime))
+        except OSError:
+            pass
+        self.stats.hits += 1
+        return data
+
+    def put(
+        self,
+        fingerprint: str,
+        data: list[dict[str, Any]],
+        *,
+        step_id: str | None = None,
+        tool_name: str | None = None,
+    ) -> None:
+        """Store a step's output records (atomic replace)."""
+        path = self._path(fingerprint)
+        entry = {
+            "format": STEP_CACHE_FORMAT,
+            "step_id": step_id,
+            "tool": tool_name,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "data": data,
+        }
+        try:
+            write_pickle(path, entry)
+        except Exception:
+            logger.warning("Could not write step cache entry for %s", step_id, exc_info=True)
+            return
+        self.stats.writes += 1
+        self.prune()
+
+    def prune(self) -> int:
+        """
+        Delete expired entries, then least recently used ones over max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        if not self.root.exists():
+            return 0
+        entries = []
+        for path in self.root.glob("*/*.pkl"):
+            try:
+                entries.append((path, path.stat()))
+            except OSError:
+                continue
+
+        removed = 0
+        kept = []
+        for path, st in entries:
+            if self._expired(st.st_mtime):
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                kept.append((path, st))
+
+        if self.max_bytes is not None:
+            total = sum(st.st_size for _, st in kept)
+            for path, st in sorted(kept, key=lambda e: e[1].st_atime):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= st.st_size
+                removed += 1
+
+        self.stats.evictions += removed
+        return removed
+
+    def clear(self) -> int:
+        """Delete every cached entry. Returns the number of entries removed."""
+        removed = 0
+        if not self.root.exists():
+            return 0
+        for path in self.root.glob("*/*.pkl"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+__all__ = [
+    "DEFAULT_STEP_CACHE_MAX_AGE",
+    "DEFAULT_STEP_CACHE_MAX_BYTES",
+    "STEP_CACHE_DIR",
+    "STEP_CACHE_FORMAT",
+    "StepCache",
+    "StepCacheStats",
+    "hash_records",
+    "step_fingerprint",
+    "tool_version",
+    "write_pickle",
+]
@@ -0,0 +1,343 @@
+"""
+Checkpoints for resuming failed or interrupted TOML workflow runs.
+
+A run's checkpoint lives in ``.kurt/runs/<run_id>/``:
+
+    manifest.json             workflow path, inputs, status, completed steps
+    steps/<step>.pkl          output records of each completed step
+    steps/<step>/batch-N.pkl  output of each completed input batch of a
+                              row-wise step that has not finished yet
+
+The executor writes a step's output as soon as the step completes, and for
+row-wise tools (``stream_input``) after every batch of
+``checkpoint_batch_size`` input records. Steps whose records are only
+streamed to their dependents are recorded as completed without their output
+(keeping it would undo the memory savings of streaming), so a resume runs
+them again. ``kurt workflow resume <run_id>`` reloads completed steps, skips
+completed batches, and runs everything else.
+
+A run's checkpoint is deleted once the run completes; checkpoints of failed
+runs are pruned after ``CHECKPOINT_MAX_AGE`` (see ``RunCheckpoint.prune``).
+
+A completed step is only reused if its definition is unchanged; a batch is
+only reused if its input records are identical.
+
+Usage:
+    checkpoint = RunCheckpoint.create(run_id, workflow_path=path, inputs=inputs)
+    result = await execute_workflow(workflow, inputs, run_id=run_id, checkpoint=checkpoint)
+
+    # Later
+    checkpoint = RunCheckpoint.load(run_id)
+    result = await execute_workflow(
+        parse_workflow(checkpoint.workflow_path), checkpoint.inputs,
+        run_id=checkpoint.run_id, checkpoint=checkpoint,
+    )
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import pickle
+import re
+import shutil
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from kurt.workflows.toml.cache import hash_records, write_pickle
+from kurt.workflows.toml.parser import StepDef
+
+logger = logging.getLogger(__name__)
+
+# Checkpoint directory, relative to the project root
+CHECKPOINT_DIR = Path(".kurt") / "runs"
+
+# Input records per checkpointed batch of a row-wise step
+DEFAULT_CHECKPOINT_BATCH_SIZE = 500
+
+# Checkpoints of failed or interrupted runs older than this are pruned
+CHECKPOINT_MAX_AGE = timedelta(days=7)
+
+_SAFE_NAME = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+
+class CheckpointNotFoundError(LookupError):
+    """No checkpoint exists for a run ID (or the ID prefix is ambiguous)."""
+
+    def __init__(self, run_id: str, message: str | None = None):
+        self.run_id = run_id
+        super().__init__(message or f"No checkpoint found for run {run_id}")
+
+
+def _default_root() -> Path:
+    from kurt.config.base import get_project_root
+
+    return get_project_root() / CHECKPOINT_DIR
+
+
+def _file_name(step_id: str) -> str:
+    """Step IDs are TOML keys; quote anything that is not a safe file name."""
+    if _SAFE_NAME.match(step_id):
+        return step_id
+    return "step-" + hash_records([{"step": step_id}])[:16]
+
+
+def step_signature(step_def: StepDef) -> str:
+    """Hash of a step definition (a changed step is never restored)."""
+    return hash_records([step_def.model_dump(mode="json")])
+
+
+class RunCheckpoint:
+    """
+    On-disk checkpoint of one workflow run.
+
+    Write errors are logged and never fail the run; unreadable entries are
+    treated as missing, so the affected step or batch simply runs again.
+    """
+
+    def __init__(self, run_id: str, root: Path | str | None = None):
+        self.run_id = run_id
+        self.root = Path(root) if root is not None else _default_root()
+        self.path = self.root / run_id
+        self._manifest: dict[str, Any] = {}
+
+    # -- Lifecycle ---------------------------------------------------------
+
+    @classmethod
+    def create(
+        cls,
+        run_id: str,
+        *,
+        workflow_path: Path | str,
+        inputs: dict[str, Any],
+        tools_path: Path | str | None = None,
+        max_parallel_steps: int | None = None,
+        root: Path | str | None = None,
+    ) -> RunCheckpoint:
+        """Start a checkpoint for a new run."""
+        checkpoint = cls(run_id, root)
+        now = datetime.now(timezone.utc).isoformat()
+        checkpoint._manifest = {
+            "run_id": run_id,
+            "workflow_path": str(Path(workflow_path).resolve()),
+            "inputs": inputs,
+            "tools_path": str(Path(tools_path).resolve()) if tools_path else None,
+            "max_parallel_steps": max_parallel_steps,
+            "status": "running",
+            "created_at": now,
+            "updated_at": now,
+            "steps": {},
+        }
+        checkpoint._write_manifest()
+        return checkpoint
+
+    @classmethod
+    def load(cls, run_id: str, root: Path | str | None = None) -> RunCheckpoint:
+        """
+        Load the checkpoint of an earlier run.
+
+        Args:
+            run_id: Full run ID or a unique prefix of one
+
+        Raises:
+            CheckpointNotFoundError: No (or more than one) matching checkpoint
+        """
+        base = Path(root) if root is not None else _default_root()
+        if (base / run_id / "manifest.json").exists():
+            matches = [run_id]
+        elif base.exists():
+            matches = [
+                p.name
+                for p in base.iterdir()
+                if p.name.startswith(run_id) and (p / "manifest.json").exists()
+            ]
+        else:
+            matches = []
+
+        if not matches:
+            raise CheckpointNotFoundError(run_id)
+        if len(matches) > 1:
+            raise CheckpointNotFoundError(
+                run_id, f"Run ID prefix {run_id} matches {len(matches)} checkpoints"
+            )
+
+        checkpoint = cls(matches[0], base)
+        try:
+            checkpoint._manifest = json.loads((checkpoint.path / "manifest.json").read_text())
+        except (OSError, ValueError) as e:
+            raise CheckpointNotFoundError(
+                run_id, f"Checkpoint for run {run_id} is unreadable: {e}"
+            ) from e
+        return checkpoint
+
+    @classmethod
+    def prune(
+        cls, max_age: timedelta = CHECKPOINT_MAX_AGE, root: Path | str | None = None
+    ) -> int:
+        """
+        Delete checkpoints not updated for longer than max_age.
+
+        Returns:
+            Number of checkpoints deleted
+        """
+        base = Path(root) if root is not None else _default_root()
+        if not base.exists():
+            return 0
+        cutoff = time.time() - max_age.total_seconds()
+        pruned = 0
+        for path in base.iterdir():
+            manifest = path / "manifest.json"
+            try:
+                updated = (manifest if manifest.exists() else path).stat().st_mtime
+            except OSError:
+                continue
+            if updated < cutoff:
+                shutil.rmtree(path, ignore_errors=True)
+                pruned += 1
+        return pruned
+
+    def mark(self, status: str) -> None:
+        """Record the run's latest status (running, completed, failed, canceled)."""
+        self._manifest["status"] = status
+        self._write_manifest()
+
+    def discard(self) -> None:
+        """Delete the checkpoint (e.g. once the run has completed)."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    # -- Manifest ----------------------------------------------------------
+
+    @property
+    def workflow_path(self) -> Path:
+        return Path(self._manifest["workflow_path"])
+
+    @property
+    def inputs(self) -> dict[str, Any]:
+        return dict(self._manifest.get("inputs") or {})
+
+    @property
+    def tools_path(self) -> Path | None:
+        tools_path = self._manifest.get("tools_path")
+        return Path(tools_path) if tools_path else None
+
+    @property
+    def max_parallel_steps(self) -> int | None:
+        return self._manifest.get("max_parallel_steps")
+
+    @property
+    def status(self) -> str | None:
+        return self._manifest.get("status")
+
+    def completed_steps(self) -> list[str]:
+        """Steps that completed (with or without checkpointed output)."""
+        return list(self._manifest.get("steps", {}))
+
+    def _write_manifest(self) -> None:
+        self._manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp = self.path / "manifest.json.tmp"
+            tmp.write_text(json.dumps(self._manifest, indent=2, default=str))
+            tmp.replace(self.path / "manifest.json")
+        except OSError:
+            logger.warning("Could not write checkpoint manifest for %s", self.run_id, exc_info=True)
+
+    # -- Steps -------------------------------------------------------------
+
+    def _step_path(self, step_id: str) -> Path:
+        return self.path / "steps" / f"{_file_name(step_id)}.pkl"
+
+    def _batch_path(self, step_id: str, index: int) -> Path:
+        return self.path / "steps" / _file_name(step_id) / f"batch-{index:06d}.pkl"
+
+    def save_step(self, step_id: str, step_def: StepDef, data: list[dict[str, Any]]) -> None:
+        """Checkpoint a completed step's output (replaces its batches)."""
+        try:
+            write_pickle(self._step_path(step_id), data)
+        except Exception:
+            logger.warning("Could not checkpoint step %s", step_id, exc_info=True)
+            return
+        shutil.rmtree(self._step_path(step_id).with_suffix(""), ignore_errors=True)
+        self._record_step(step_id, step_def, len(data), records=True)
+
+    def save_step_marker(self, step_id: str, step_def: StepDef, output_count: int) -> None:
+        """Record a completed step without its output (it runs again on resume)."""
+        self._step_path(step_id).unlink(missing_ok=True)
+        shutil.rmtree(self._step_path(step_id).with_suffix(""), ignore_errors=True)
+        self._record_step(step_id, step_def, output_count, records=False)
+
+    def _record_step(
+        self, step_id: str, step_def: StepDef, output_count: int, *, records: bool
+    ) -> None:
+        self._manifest.setdefault("steps", {})[step_id] = {
+            "signature": step_signature(step_def),
+            "output_count": output_count,
+            "records": records,
+            "completed_at": datetime.now(timezone.utc).isoformat(),
+        }
+        self._write_manifest()
+
+    def has_step(self, step_id: str, step_def: StepDef) -> bool:
+        """True if the step completed with its current definition and output."""
+        entry = self._manifest.get("steps", {}).get(step_id)
+        return (
+            bool(entry)
+            and entry.get("records", True)
+            and entry.get("signature") == step_signature(step_def)
+            and self._step_path(step_id).exists()
+        )
+
+    def load_step(self, step_id: str, step_def: StepDef) -> list[dict[str, Any]] | None:
+        """Output of a completed step, or None if it must run (again)."""
+        if not self.has_step(step_id, step_def):
+            return None
+        return self._read(self._step_path(step_id))
+
+    def forget_step(self, step_id: str) -> None:
+        """Drop a step's checkpointed output and batches so it runs again."""
+        if self._manifest.get("steps", {}).pop(step_id, None) is not None:
+            self._write_manifest()
+        self._step_path(step_id).unlink(missing_ok=True)
+        shutil.rmtree(self._step_path(step_id).with_suffix(""), ignore_errors=True)
+
+    # -- Batches -----------------------------------------------------------
+
+    def save_batch(
+        self, step_id: str, index: int, input_hash: str, data: list[dict[str, Any]]
+    ) -> None:
+        """Checkpoint the output of one completed input batch of a step."""
+        try:
+            write_pickle(self._batch_path(step_id, index), {"input": input_hash, "data": data})
+        except Exception:
+            logger.warning("Could not checkpoint batch %d of %s", index, step_id, exc_info=True)
+
+    def load_batch(
+        self, step_id: str, index: int, input_hash: str
+    ) -> list[dict[str, Any]] | None:
+        """Output of a completed batch with identical input, else None."""
+        entry = self._read(self._batch_path(step_id, index))
+        if not isinstance(entry, dict) or entry.get("input") != input_hash:
+            return None
+        return entry.get("data")
+
+    def _read(self, path: Path) -> Any:
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug("Ignoring unreadable checkpoint file %s", path, exc_info=True)
+            return None
+
+
+__all__ = [
+    "CHECKPOINT_DIR",
+    "CHECKPOINT_MAX_AGE",
+    "DEFAULT_CHECKPOINT_BATCH_SIZE",
+    "CheckpointNotFoundError",
+    "RunCheckpoint",
+    "step_signature",
+]
@@ -6,8 +6,10 @@ Commands:
     kurt workflow run <workflow> [--input key=value]...  - Run workflow (TOML or MD)
     kurt workflow logs <run_id> [--json]                 - View step logs for workflow run
     kurt workflow logs <run_id> --tail                   - Stream progress events
+    kurt workflow resume <run_id>                        - Resume a failed/interrupted run
     kurt workflow cancel <run_id>                        - Cancel running workflow
     kurt workflow status <run_id>                        - Show workflow status
+    kurt workflow profile <run_id> [--trace FILE]        - Profile a run (critical path, trace)
     kurt workflow test <workflow.toml>                   - Test workflow with fixtures
     kurt workflow list                                   - List all workflow definitions
     kurt workflow show <name>                            - Show workflow details
@@ -71,9 +73,34 @@ def _get_dolt_db():
     is_flag=True,
     help="Parse and validate workflow without executing",
 )
+@click.option(
+    "--max-parallel",
+    "max_parallel_steps",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum steps running at once (overrides [workflow] max_parallel_steps)",
+)
+@click.option(
+    "--force-step",
+    "force_steps",
+    multiple=True,
+    help="Re-run this step even if its cached output is valid (can specify multiple)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Run every step without reading or writing the step cache",
+)
 @track_command
 def run_cmd(
-    workflow_path: Path, inputs: tuple[str, ...], background: bool, foreground: bool, dry_run: bool
+    workflow_path: Path,
+    inputs: tuple[str, ...],
+    background: bool,
+    foreground: bool,
+    dry_run: bool,
+    max_parallel_steps: int | None,
+    force_steps: tuple[str, ...],
+    no_cache: bool,
 ):
     """Run a workflow from a TOML or Markdown file.
 
@@ -90,6 +117,9 @@ def run_cmd(
         kurt workflow run workflows/pipeline.toml --input url=https://example.com
         kurt workflow run workflows/pipeline.toml -i url=https://example.com -i max_pages=100
         kurt workflow run workflows/pipeline.toml --background
+        kurt workflow run workflows/pipeline.toml --max-parallel 2
+        kurt workflow run workflows/pipeline.toml --force-step summarize
+        kurt workflow run workflows/pipeline.toml --no-cache
     """
     # Detect workflow type by extension
     suffix = workflow_path.suffix.lower()
@@ -171,6 +201,11 @@ def run_cmd(
         console.print(f"[red]Error parsing workflow: {e}[/red]")
         raise click.Abort()
 
+    unknown_steps = [name for name in force_steps if name not in workflow_def.steps]
+    if unknown_steps:
+        console.print(f"[red]Error: Unknown step(s) for --force-step: {', '.join(unknown_steps)}[/red]")
+        raise click.Abort()
+
     # Dry run mode
     if dry_run:
         output = _build_dry_run_output(workflow_def, parsed_inputs, workflow_path)
@@ -254,17 +289,45 @@ def run_cmd(
     # Look for tools.py in the same directory as the workflow file
     tools_path = workflow_path.parent / "tools.py"
     db = _get_dolt_db()
+
+    import uuid
+
+    from kurt.workflows.toml.cache import StepCache
+    from kurt.workflows.toml.checkpoint import RunCheckpoint
+
+    run_id = str(uuid.uuid4())
+    RunCheckpoint.prune()
+    checkpoint = RunCheckpoint.create(
+        run_id,
+        workflow_path=workflow_path,
+        inputs=merged_inputs,
+        tools_path=tools_path if tools_path.exists() else None,
+        max_parallel_steps=max_parallel_steps,
+    )
+    step_cache = None if no_cache else StepCache()
     result = asyncio.run(
         execute_workflow(
             workflow=workflow_def,
             inputs=merged_inputs,
             context=context,
             db=db,
+            run_id=run_id,
             tools_path=tools_path if tools_path.exists() else None,
+            max_parallel_steps=max_parallel_steps,
+            step_cache=step_cache,
+            force_steps=force_steps,
+            checkpoint=checkpoint,
         )
     )
+    _finish_foreground_run(workflow_def, result, step_cache)
 
-    # Output result
+
+def _finish_foreground_run(workflow_def, result, step_cache) -> None:
+    """Print a finished run as JSON and exit with its exit code.
+
+    The executor discards the checkpoint of a completed run; failed or
+    canceled runs keep it for ``kurt workflow resume``.
+    """
     output = {
         "run_id": result.run_id,
         "status": result.status,
@@ -275,19 +338,108 @@ def run_cmd(
             {
                 "step_id": step_id,
                 "status": step_result.status,
-                "output_count": len(step_result.output_data),
+                "output_count": (
+                    step_result.output_count
+                    if step_result.output_count is not None
+                    else len(step_result.output_data)
+                ),
+                "cached": step_result.cached,
+                "resumed": step_result.resumed,
             }
             for step_id, step_result in result.step_results.items()
         ],
+        "cache": step_cache.stats.to_dict() if step_cache else None,
         "error": result.error,
         "exit_code": result.exit_code,
     }
+    if result.status != "completed":
+        output["resume"] = f"kurt workflow resume {result.run_id}"
     print(json.dumps(output, indent=2, default=str))
 
     # Exit with workflow exit code
     sys.exit(result.exit_code)
 
 
+@click.command(name="resume")
+@click.argument("run_id")
+@click.option(
+    "--force-step",
+    "force_steps",
+    multiple=True,
+    help="Re-run this step even if it completed or is cached (can specify multiple)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Run remaining steps without reading or writing the step cache",
+)
+@track_command
+def resume_cmd(run_id: str, force_steps: tuple[str, ...], no_cache: bool):
+    """Resume a failed or interrupted TOML workflow run.
+
+    Reloads the outputs of steps that completed (and of completed batches
+    within row-wise steps), then runs only the failed and pending work under
+    the same run ID. The workflow file and inputs of the original run are
+    used; steps whose definition changed since are re-run.
+
+    Examples:
+        kurt workflow resume 3f2a9c1e
+        kurt workflow resume 3f2a9c1e --force-step summarize
+    """
+    from kurt.workflows.toml import parse_workflow
+    from kurt.workflows.toml.cache import StepCache
+    from kurt.workflows.toml.checkpoint import CheckpointNotFoundError, RunCheckpoint
+    from kurt.workflows.toml.executor import execute_workflow
+
+    try:
+        checkpoint = RunCheckpoint.load(run_id)
+    except CheckpointNotFoundError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise click.Abort()
+
+    if checkpoint.status == "completed":
+        console.print(f"[yellow]Run {checkpoint.run_id} already completed[/yellow]")
+        return
+
+    try:
+        workflow_def = parse_workflow(checkpoint.workflow_path)
+    except FileNotFoundError:
+        console.print(f"[red]Error: Workflow file not found: {checkpoint.workflow_path}[/red]")
+        raise click.Abort()
+    except Exception as e:
+        console.print(f"[red]Error parsing workflow: {e}[/red]")
+        raise click.Abort()
+
+    unknown_steps = [name for name in force_steps if name not in workflow_def.steps]
+    if unknown_steps:
+        console.print(f"[red]Error: Unknown step(s) for --force-step: {', '.join(unknown_steps)}[/red]")
+        raise click.Abort()
+    for name in force_steps:
+        checkpoint.forget_step(name)
+
+    from kurt.tools.core import ToolContext
+
+    db = _get_dolt_db()
+    tools_path = checkpoint.tools_path
+    step_cache = None if no_cache else StepCache()
+    checkpoint.mark("running")
+    result = asyncio.run(
+        execute_workflow(
+            workflow=workflow_def,
+            inputs=checkpoint.inputs,
+            context=ToolContext(db=db),
+            db=db,
+            run_id=checkpoint.run_id,
+            tools_path=tools_path if tools_path and tools_path.exists() else None,
+            max_parallel_steps=checkpoint.max_parallel_steps,
+            step_cache=step_cache,
+            force_steps=force_steps,
+            checkpoint=checkpoint,
+        )
+    )
+    _finish_foreground_run(workflow_def, result, step_cache)
+
+
 @click.command(name="status")
 @click.argument("run_id")
 @click.option("--json", "output_json", is_flag=True, help="Output as JSON")
@@ -441,6 +593,116 @@ def _follow_workflow(db, run_id: str):
             console.print("\n[yellow]Workflow canceled[/yellow]")
 
 
+@click.command(name="profile")
+@click.argument("run_id")
+@click.option("--json", "output_json", is_flag=True, help="Output as JSON")
+@click.option(
+    "--trace",
+    "trace_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Write a Chrome trace (open in chrome://tracing or ui.perfetto.dev)",
+)
+@track_command
+def profile_cmd(run_id: str, output_json: bool, trace_path: Path | None):
+    """Profile a workflow run.
+
+    Shows per-step wall time, time spent queued behind other steps,
+    achieved concurrency and the critical path of the run.
+
+    Examples:
+        kurt workflow profile abc-123-def
+        kurt workflow profile abc-123-def --json
+        kurt workflow profile abc-123-def --trace trace.json
+    """
+    from kurt.observability.profile import get_run_profile, to_chrome_trace
+
+    db = _get_dolt_db()
+    profile = get_run_profile(db, run_id)
+
+    if profile is None:
+        if output_json:
+            print(
+                json.dumps({"run_id": run_id, "status": "not_found", "error": "Workflow not found"})
+            )
+        else:
+            console.print(f"[red]Workflow not found: {run_id}[/red]")
+        return
+
+    if trace_path is not None:
+        trace_path.write_text(json.dumps(to_chrome_trace(profile)))
+
+    if output_json:
+        print(json.dumps(profile.to_dict(), indent=2))
+        return
+
+    console.print(f"\n[bold]Run:[/bold] {profile.run_id}")
+    console.print(f"[bold]Workflow:[/bold] {profile.workflow}")
+    console.print(f"[bold]Status:[/bold] {profile.status}")
+    console.print(f"[bold]Wall time:[/bold] {_format_ms(profile.wall_ms)}")
+    console.print(
+        f"[bold]Concurrency:[/bold] peak {profile.peak_concurrency}, "
+        f"average {profile.avg_concurrency:.2f}"
+    )
+    if profile.critical_path:
+        console.print(
+            f"[bold]Critical path:[/bold] {' -> '.join(profile.critical_path)} "
+            f"({_format_ms(profile.critical_path_ms)})"
+        )
+
+    if profile.steps:
+        console.print()
+        table = Table(box=None, show_edge=False)
+        table.add_column("Step", style="cyan")
+        table.add_column("Tool")
+        table.add_column("Status")
+        table.add_column("Start", justify="right")
+        table.add_column("Queued", justify="right")
+        table.add_column("Duration", justify="right")
+        table.add_column("Share", justify="right")
+
+        critical = set(profile.critical_path)
+        for step in profile.steps:
+            name = f"[bold]{step.step_id}[/bold] *" if step.step_id in critical else step.step_id
+            share = f"{step.duration_ms / profile.wall_ms:.0%}" if profile.wall_ms else "-"
+            table.add_row(
+                name,
+                step.tool or "-",
+                step.status,
+                _format_ms(step.start_ms),
+                _format_ms(step.queued_ms) if step.queued_ms else "-",
+                _format_ms(step.duration_ms),
+                share,
+            )
+            for sub in step.substeps:
+                table.add_row(
+                    f"  [dim]{sub.name}[/dim]",
+                    "",
+                    f"[dim]{sub.events} events[/dim]",
+                    _format_ms(sub.start_ms),
+                    "",
+                    _format_ms(sub.duration_ms),
+                    "",
+                )
+
+        console.print(table)
+        console.print("[dim]* on the critical path[/dim]")
+
+    if trace_path is not None:
+        console.print(f"\n[dim]Chrome trace written to {trace_path}[/dim]")
+    console.print()
+
+
+def _format_ms(ms: int) -> str:
+    """Format milliseconds as 850ms, 12.3s or 4m05s."""
+    if ms < 1000:
+        return f"{ms}ms"
+    if ms < 60_000:
+        return f"{ms / 1000:.1f}s"
+    minutes, seconds = divmod(ms // 1000, 60)
+    return f"{minutes}m{seconds:02d}s"
+
+
 @click.command(name="logs")
 @click.argument("run_id")
 @click.option("--step", "step_filter", default=None, help="Filter by step name")
@@ -892,6 +1154,8 @@ def _build_dry_run_output(
             "total_steps": plan.total_steps,
             "parallelizable": plan.parallelizable,
             "critical_path": plan.critical_path,
+            "schedule_order": plan.schedule_order,
+            "max_parallel_steps": workflow_def.workflow.max_parallel_steps,
         }
     except CycleDetectedError as e:
         plan_output = {
@@ -1269,7 +1533,9 @@ def workflow_group():
       run        Run a workflow (handles both formats)
       status     Show workflow status
       logs       View step logs for a workflow run
+      profile    Profile a run (timeline, critical path)
       cancel     Cancel a running workflow
+      resume     Resume a failed or interrupted run
       test       Test a workflow with fixtures
 
     \\b
@@ -1288,7 +1554,9 @@ def workflow_group():
 workflow_group.add_command(run_cmd, name="run")
 workflow_group.add_command(status_cmd, name="status")
 workflow_group.add_command(logs_cmd, name="logs")
+workflow_group.add_command(profile_cmd, name="profile")
 workflow_group.add_command(cancel_cmd, name="cancel")
+workflow_group.add_command(resume_cmd, name="resume")
 workflow_group.add_command(test_cmd, name="test")
 
 # Import and add agent workflow commands (at end to avoid circular imports)
@@ -2,7 +2,8 @@
 DAG builder for Kurt workflow engine.
 
 Builds an execution plan from step dependencies using topological sort.
-Groups steps into execution levels for parallel execution.
+Groups steps into execution levels and computes the order in which the
+executor's ready queue starts steps that become runnable at the same time.
 """
 
 from __future__ import annotations
@@ -28,12 +29,16 @@ class ExecutionPlan:
         total_steps: Total number of steps in the plan.
         parallelizable: True if any level has more than one step.
         critical_path: Longest dependency chain (step names from start to end).
+        schedule_order: All steps in ready-queue priority order. Critical-path
+                steps come first, then steps with the longest chain of
+                dependents, then by config priority and name.
     """
 
     levels: list[list[str]] = field(default_factory=list)
     total_steps: int = 0
     parallelizable: bool = False
     critical_path: list[str] = field(default_factory=list)
+    schedule_order: list[str] = field(default_factory=list)
 
 
 def _compute_levels(
@@ -182,18 +187,59 @@ def _compute_critical_path(
     return path
 
 
+def _compute_schedule_order(
+    steps: dict[str, StepDef],
+    levels: list[list[str]],
+    critical_path: list[str],
+) -> list[str]:
+    """
+    Compute the ready-queue priority of every step.
+
+    When several steps are runnable and parallelism is capped, the executor
+    starts them in this order. Sorted by:
+    1. On the critical path (from _compute_critical_path) first
+    2. Longest chain of dependent steps (tail length, including the step)
+    3. Priority (from step config, lower = higher priority, default 100)
+    4. Alphabetically by step name
+
+    Returns:
+        All step names, highest priority first.
+    """
+    dependents: dict[str, list[str]] = {name: [] for name in steps}
+    for name, step in steps.items():
+        for dep in step.depends_on:
+            if dep in steps:
+                dependents[dep].append(name)
+
+    # tail[name] = length of the longest chain starting at this step
+    tail: dict[str, int] = {}
+    for level in reversed(levels):
+        for name in level:
+            tail[name] = 1 + max((tail[d] for d in dependents[name]), default=0)
+
+    on_critical_path = set(critical_path)
+
+    def sort_key(name: str) -> tuple[bool, int, int, str]:
+        priority = steps[name].config.get("priority", 100)
+        return (name not in on_critical_path, -tail[name], priority, name)
+
+    return sorted(steps, key=sort_key)
+
+
 def build_dag(steps: dict[str, StepDef]) -> ExecutionPlan:
     """
     Build an execution plan from step definitions.
 
     Performs topological sort to group steps into execution levels.
-    Steps within a level can run in parallel.
+    Steps within a level can run in parallel; the executor starts each step
+    as soon as its own dependencies complete, in schedule_order.
 
     Args:
         steps: Dictionary mapping step names to StepDef objects.
 
     Returns:
-        ExecutionPlan with levels, total_steps, parallelizable, and critical_path.
+        ExecutionPlan with levels, total_steps, parallelizable, critical_path
+        and schedule_order.
 
     Raises:
         CycleDetectedError: If circular dependencies are detected.
@@ -241,4 +287,5 @@ def build_dag(steps: dict[str, StepDef]) -> ExecutionPlan:
         total_steps=len(steps),
         parallelizable=parallelizable,
         critical_path=critical_path,
+        schedule_order=_compute_schedule_order(steps, levels, critical_path),
     )
@@ -1,10 +1,24 @@
 """
 Async workflow executor for Kurt engine.
 
-Executes workflow DAG with asyncio. Runs parallel steps concurrently.
+Executes workflow DAG with asyncio. A dependency-counting ready queue starts
+each step as soon as its depends_on are complete (no level barriers), up to
+max_parallel_steps at once, critical-path steps first.
 Resolves step type to tool name via ToolRegistry/execute_tool.
 Passes output data between steps via depends_on.
 Fan-in: concatenates outputs in depends_on order.
+Streaming (opt-in per step with ``stream = true``): the step starts as soon as
+its dependencies start and consumes their records through bounded
+RecordStreams in chunks, so upstream and downstream stages overlap.
+Memoization (with a StepCache): a step whose tool, resolved config and input
+records match an earlier successful run reuses that run's output instead of
+executing; force_steps re-runs the named steps regardless.
+Checkpointing (with a RunCheckpoint): completed step outputs and completed
+input batches of row-wise steps are persisted, so a failed or interrupted
+run can be resumed without repeating finished work.
+Fan-out (``foreach`` / ``shard_size``): input_data is split into shards that
+run as concurrent tool invocations (up to max_concurrent_shards) and are
+merged back in input order.
 
 Exit Codes:
     0: All steps succeeded
@@ -16,6 +30,7 @@ Exit Codes:
 from __future__ import annotations
 
 import asyncio
+import heapq
 import importlib.util
 import logging
 import uuid
@@ -24,15 +39,30 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import IntEnum
 from pathlib import Path
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Collection, Literal
 
+from kurt.db.diff import record_run_revision
 from kurt.db.dolt import DoltDB
-from kurt.observability.tracking import track_event
-from kurt.tools.core import ToolCanceledError, ToolContext, ToolError, ToolResult, execute_tool
+from kurt.observability.tracking import atrack_event, track_event
+from kurt.tools.core import (
+    RecordStream,
+    ToolCanceledError,
+    ToolContext,
+    ToolError,
+    ToolResult,
+    execute_tool,
+    execute_tool_stream,
+    get_tool,
+    merge_streams,
+    rechunk,
+)
 from kurt.tools.core.provider import get_provider_registry
-from kurt.workflows.toml.dag import build_dag
+from kurt.workflows.toml.cache import StepCache, hash_records, step_fingerprint, tool_version
+from kurt.workflows.toml.checkpoint import DEFAULT_CHECKPOINT_BATCH_SIZE, RunCheckpoint
+from kurt.workflows.toml.dag import ExecutionPlan, build_dag
 from kurt.workflows.toml.interpolation import interpolate_step_config
 from kurt.workflows.toml.parser import StepDef, WorkflowDefinition, resolve_step_type
+from kurt.workflows.toml.process_pool import FunctionLoadError, FunctionProcessPool
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +134,11 @@ async def _execute_user_function(
         loop = asyncio.get_event_loop()
         result = await loop.run_in_executor(None, func, context_dict)
 
-    # Normalize result to dict
+    return _normalize_function_output(result)
+
+
+def _normalize_function_output(result: Any) -> dict[str, Any]:
+    """Normalize a user function's return value to a dict."""
     if result is None:
         return {}
     if not isinstance(result, dict):
@@ -131,6 +165,27 @@ def _translate_provider_config(tool_name: str, config: dict) -> None:
             config["max_pages"] = config["max_urls"]
 
 
+def _merge_results(
+    combined: ToolResult,
+    partial: ToolResult,
+    *,
+    row_offset: int = 0,
+    keep_data: bool = True,
+) -> None:
+    """Fold a partial ToolResult into a combined one (in place)."""
+    combined.success = combined.success and partial.success
+    if keep_data:
+        combined.data.extend(partial.data)
+    for error in partial.errors:
+        combined.add_error(
+            error_type=error.error_type,
+            message=error.message,
+            row_idx=error.row_idx + row_offset if error.row_idx is not None else None,
+            details=error.details,
+        )
+    combined.substeps.extend(partial.substeps)
+
+
 # Exit codes for CLI integration
 class ExitCode(IntEnum):
     """Exit codes for workflow execution."""
@@ -163,6 +218,10 @@ class StepResult:
         started_at: ISO timestamp when step started.
         completed_at: ISO timestamp when step completed.
         duration_ms: Execution time in milliseconds.
+        output_count: Records produced. Differs from len(output_data) when a
+            step's records were only streamed to its dependents.
+        cached: True if the output was reused from the step cache.
+        resumed: True if the output was restored from a run checkpoint.
     """
 
     step_id: str
@@ -174,6 +233,9 @@ class StepResult:
     started_at: str | None = None
     completed_at: str | None = None
     duration_ms: int | None = None
+    output_count: int | None = None
+    cached: bool = False
+    resumed: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -187,6 +249,9 @@ class StepResult:
             "started_at": self.started_at,
             "completed_at": self.completed_at,
             "duration_ms": self.duration_ms,
+            "output_count": self.output_count,
+            "cached": self.cached,
+            "resumed": self.resumed,
         }
 
 
@@ -236,8 +301,9 @@ class WorkflowExecutor:
 
     The executor:
     1. Builds execution plan from step dependencies
-    2. Executes steps level by level
-    3. Runs steps within a level in parallel
+    2. Starts each step as soon as all of its dependencies are done
+    3. Runs up to max_parallel_steps steps concurrently, picking ready
+       steps in the plan's schedule_order (critical path first)
     4. Passes outputs between dependent steps (fan-in)
     5. Emits progress events for monitoring
 
@@ -266,6 +332,10 @@ class WorkflowExecutor:
         continue_on_error: bool = False,
         run_id: str | None = None,
         tools_path: Path | str | None = None,
+        max_parallel_steps: int | None = None,
+        step_cache: StepCache | None = None,
+        force_steps: Collection[str] | None = None,
+        checkpoint: RunCheckpoint | None = None,
     ) -> None:
         """
         Initialize the workflow executor.
@@ -280,6 +350,15 @@ class WorkflowExecutor:
             run_id: Optional run ID. If not provided, generates a UUID.
             tools_path: Path to tools.py for custom function steps.
                        If None, looks for tools.py in current directory.
+            max_parallel_steps: Maximum steps running at once. Defaults to
+                       [workflow] max_parallel_steps, else unlimited.
+            step_cache: Reuse and record step outputs keyed by fingerprint.
+                       If None, every step runs.
+            force_steps: Steps to re-run even on a cache hit (their fresh
+                       output still replaces the cached entry).
+            checkpoint: Persist completed steps and batches, and restore
+                       those already recorded (resume). Deleted once the
+                       run completes.
         """
         self.workflow = workflow
         self.inputs = inputs
@@ -288,14 +367,30 @@ class WorkflowExecutor:
         self.continue_on_error = continue_on_error
         self.run_id = run_id or str(uuid.uuid4())
         self.tools_path = Path(tools_path) if tools_path else Path("tools.py")
+        self.max_parallel_steps = max_parallel_steps or workflow.workflow.max_parallel_steps
+        self.step_cache = step_cache
+        self.force_steps = frozenset(force_steps or ())
+        self.checkpoint = checkpoint
+        # Worker pool for executor = "process" function steps
+        self._process_pool: FunctionProcessPool | None = None
+        # Steps restored from the checkpoint (decided once per run)
+        self._restorable: set[str] = set()
+        # When each step became ready to run (its queue wait is reported)
+        self._ready_at: dict[str, datetime] = {}
 
         # Execution state
         self._status: WorkflowRunStatus = "pending"
         self._step_outputs: dict[str, list[dict[str, Any]]] = {}
         self._step_results: dict[str, StepResult] = {}
         self._running_tasks: dict[str, asyncio.Task[StepResult]] = {}
+        # Streaming edges: producer step -> streams, consumer step -> streams
+        self._out_streams: dict[str, list[RecordStream]] = {}
+        self._in_streams: dict[str, list[RecordStream]] = {}
         self._cancel_event = asyncio.Event()
         self._lock = asyncio.Lock()
+        # Progress events waiting for the writer task, kept in emit order
+        self._events: asyncio.Queue[dict[str, Any]] | None = None
+        self._event_writer: asyncio.Task | None = None
 
     async def run(self) -> WorkflowResult:
         """
@@ -306,6 +401,9 @@ class WorkflowExecutor:
         """
         started_at = datetime.now(timezone.utc)
         self._status = "running"
+        # Async pools this run opens on its loop are closed when it finishes
+        dbs = {id(db): db for db in (self.context.db, self._db) if isinstance(db, DoltDB)}
+        pooled = {key for key, db in dbs.items() if db.has_async_pool()}
 
         # Emit workflow start event
         self._emit_event(
@@ -323,42 +421,25 @@ class WorkflowExecutor:
                 self._status = "completed"
                 return self._create_result(started_at)
 
-            # Execute level by level
-            for level_idx, level in enumerate(plan.levels):
-                # Check for cancellation before starting level
-                if self._cancel_event.is_set():
-                    await self._handle_cancellation(level)
-                    return self._create_result(started_at)
-
-                # Execute all steps in this level in parallel
-                await self._execute_level(level, level_idx)
-
-                # Check if workflow should stop due to cancellation
-                if self._status == "canceling" or self._cancel_event.is_set():
-                    # Handle any remaining cancellation
-                    if self._status == "canceling":
-                        self._status = "canceled"
-                    return self._create_result(started_at)
-
-                if self._status == "canceled":
-                    return self._create_result(started_at)
-
-                # Check for failures
-                failed_steps = [
-                    step_id
-                    for step_id in level
-                    if self._step_results.get(step_id, StepResult(step_id, "pending", "")).status
-                    == "failed"
-                ]
-
-                if failed_steps and not self.continue_on_error:
-                    self._status = "failed"
-                    return self._create_result(started_at)
-
-            # All levels completed
+            # Start steps as their dependencies complete
+            stopped_on_failure = await self._execute_plan(plan)
+
+            # Check if workflow should stop due to cancellation
+            if self._status == "canceling":
+                self._status = "canceled"
+            if self._status == "canceled":
+                return self._create_result(started_at)
+
+            if stopped_on_failure:
+                self._status = "failed"
+                return self._create_result(started_at)
+
+            # All steps completed
             # Check if any step failed
             any_failed = any(r.status == "failed" for r in self._step_results.values())
             self._status = "failed" if any_failed else "completed"
+            if self._status == "completed":
+                await self._record_revision()
 
             return self._create_result(started_at)
 
@@ -368,6 +449,47 @@ class WorkflowExecutor:
             self._status = "failed"
             return self._create_result(started_at, error=f"Internal error: {e}")
 
+        finally:
+            await self._flush_events()
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+            for key, db in dbs.items():
+                if key not in pooled:
+                    try:
+                        await db.close_async_pool()
+                    except Exception:
+                        logger.debug("Could not close the async pool", exc_info=True)
+
+    async def _record_revision(self) -> None:
+        """Commit and tag the run's writes so ``run:<run_id>`` resolves to them.
+
+        Done when ``[workflow] commit`` is set, or by default when the
+        workflow has a ``changes`` step (its next run diffs from here; see
+        kurt.db.diff). Failures are logged; the run still completes.
+        """
+        meta = self.workflow.workflow
+        commit = meta.commit
+        if commit is None:
+            commit = any(
+                resolve_step_type(step.type) == "changes" for step in self.workflow.steps.values()
+            )
+        if not commit or self.context.db is None:
+            return
+
+        try:
+            revision = await asyncio.to_thread(
+                record_run_revision, self.context.db, self.run_id, meta.name
+            )
+        except Exception:
+            logger.warning("Could not record a revision for run %s", self.run_id, exc_info=True)
+            return
+        self._emit_event(
+            step_id="workflow",
+            status="running",
+            message=f"Recorded revision {revision[:8]}",
+            metadata={"revision": revision},
+        )
+
     async def cancel(self) -> None:
         """
         Request cancellation of the workflow.
@@ -391,78 +513,180 @@ class WorkflowExecutor:
                 metadata={"canceling": True},
             )
 
-    async def _execute_level(self, level: list[str], level_idx: int) -> None:
-        """Execute all steps in a level in parallel."""
-        # Create tasks for all steps in the level
-        tasks: dict[str, asyncio.Task[StepResult]] = {}
-
-        for step_id in level:
-            step_def = self.workflow.steps[step_id]
-
-            # Skip step if a dependency failed and continue_on_error is False
-            # (This is handled by workflow stopping, but guard anyway)
-            if not self.continue_on_error:
-                failed_deps = [
-                    dep
-                    for dep in step_def.depends_on
-                    if self._step_results.get(dep, StepResult(dep, "pending", "")).status
-                    == "failed"
-                ]
-                if failed_deps:
-                    # Mark as skipped (should not reach here if continue_on_error=False)
-                    self._step_results[step_id] = StepResult(
-                        step_id=step_id,
-                        status="skipped",
-                        tool_name=step_def.type,
-                        error=f"Skipped due to failed dependencies: {failed_deps}",
-                    )
+    async def _execute_plan(self, plan: ExecutionPlan) -> bool:
+        """
+        Run all steps with a dependency-counting ready queue.
+
+        A step becomes ready when every step it depends on has finished
+        (completed, canceled, or - with continue_on_error - failed). Ready
+        steps start in plan.schedule_order while fewer than
+        max_parallel_steps are running.
+
+        Streaming steps become ready when their dependencies have started,
+        and do not count against max_parallel_steps (they mostly wait on
+        input, and holding a slot could starve the producers they wait on).
+
+        On failure without continue_on_error, or on cancellation, no new
+        steps are started; running steps are awaited.
+
+        Returns:
+            True if execution stopped early because a step failed.
+        """
+        steps = self.workflow.steps
+        rank = {name: i for i, name in enumerate(plan.schedule_order)}
+        limit = self.max_parallel_steps or len(steps)
+
+        # Count unfinished dependencies per step (missing deps are ignored)
+        remaining: dict[str, int] = {}
+        dependents: dict[str, list[str]] = {name: [] for name in steps}
+        for name, step_def in steps.items():
+            deps = {dep for dep in step_def.depends_on if dep in steps}
+            remaining[name] = len(deps)
+            for dep in deps:
+                dependents[dep].append(name)
+
+        streaming = self._setup_streams()
+        self._restorable = self._restorable_steps(plan)
+
+        ready = [(rank[name], name) for name, count in remaining.items() if count == 0]
+        heapq.heapify(ready)
+        now = datetime.now(timezone.utc)
+        self._ready_at.update((name, now) for _, name in ready)
+        running: dict[asyncio.Task[StepResult], str] = {}
+        started: set[str] = set()
+        stopped_on_failure = False
+
+        def release(step_id: str, streaming_children: bool) -> None:
+            for child in dependents[step_id]:
+                if (child in streaming) == streaming_children:
+                    remaining[child] -= 1
+                    if remaining[child] == 0:
+                        self._ready_at[child] = datetime.now(timezone.utc)
+                        heapq.heappush(ready, (rank[child], child))
+
+        while True:
+            if self._cancel_event.is_set():
+                self._detach_unstarted(started)
+                if not running:
+                    await self._handle_cancellation([name for _, name in sorted(ready)])
+                    break
+            elif not stopped_on_failure:
+                while ready:
+                    step_id = ready[0][1]
+                    throttled = sum(1 for name in running.values() if name not in streaming)
+                    if step_id not in streaming and throttled >= limit:
+                        break
+                    heapq.heappop(ready)
+                    task = asyncio.create_task(self._execute_step(step_id, steps[step_id]))
+                    running[task] = step_id
+                    started.add(step_id)
+                    async with self._lock:
+                        self._running_tasks[step_id] = task
+                    release(step_id, streaming_children=True)
+
+            if not running:
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step_id = running.pop(task)
+                result = await self._record_step_result(step_id, task)
+
+                if result.status == "failed" and not self.continue_on_error:
+                    stopped_on_failure = True
+                    # Producers must not block on consumers that will never start
+                    self._detach_unstarted(started)
                     continue
 
-            task = asyncio.create_task(self._execute_step(step_id, step_def))
-            tasks[step_id] = task
+                release(step_id, streaming_children=False)
 
-            async with self._lock:
-                self._running_tasks[step_id] = task
+        return stopped_on_failure
 
-        if not tasks:
-            return
+    def _restorable_steps(self, plan: ExecutionPlan) -> set[str]:
+        """
+        Steps whose checkpointed output can be reused on resume.
 
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        A step is restorable if it has a checkpoint for its current
+        definition, is not forced, and all of its dependencies are restorable
+        too (a re-run dependency may produce different records).
+        """
+        if self.checkpoint is None:
+            return set()
+        steps = self.workflow.steps
+        restorable: set[str] = set()
+        for level in plan.levels:
+            for name in level:
+                step_def = steps[name]
+                if (
+                    name not in self.force_steps
+                    and self.checkpoint.has_step(name, step_def)
+                    and all(dep in restorable for dep in step_def.depends_on if dep in steps)
+                ):
+                    restorable.add(name)
+        return restorable
+
+    def _setup_streams(self) -> set[str]:
+        """
+        Create one RecordStream per edge into each streaming step.
 
-        # Process results
-        any_canceled = False
-        for step_id, result in zip(tasks.keys(), results):
-            async with self._lock:
-                self._running_tasks.pop(step_id, None)
+        Returns:
+            Names of streaming steps (stream = true and at least one dependency)
+        """
+        steps = self.workflow.steps
+        streaming: set[str] = set()
+        for name, step_def in steps.items():
+            if not step_def.stream:
+                continue
+            for dep in dict.fromkeys(step_def.depends_on):
+                if dep not in steps:
+                    continue
+                stream = RecordStream()
+                self._out_streams.setdefault(dep, []).append(stream)
+                self._in_streams.setdefault(name, []).append(stream)
+                streaming.add(name)
+        return streaming
+
+    def _detach_unstarted(self, started: set[str]) -> None:
+        """Detach input streams of steps that have not started."""
+        for name, streams in self._in_streams.items():
+            if name not in started:
+                for stream in streams:
+                    stream.detach()
+
+    async def _record_step_result(
+        self, step_id: str, task: asyncio.Task[StepResult]
+    ) -> StepResult:
+        """Store the result of a finished step task."""
+        async with self._lock:
+            self._running_tasks.pop(step_id, None)
 
-            if isinstance(result, asyncio.CancelledError):
-                any_canceled = True
-                self._step_results[step_id] = StepResult(
-                    step_id=step_id,
-                    status="canceled",
-                    tool_name=self.workflow.steps[step_id].type,
-                    error="Step canceled",
-                )
-            elif isinstance(result, Exception):
-                self._step_results[step_id] = StepResult(
-                    step_id=step_id,
-                    status="failed",
-                    tool_name=self.workflow.steps[step_id].type,
-                    error=str(result),
-                    error_type=type(result).__name__,
-                )
-            else:
-                # result is StepResult
-                self._step_results[step_id] = result
-                if result.status == "completed":
-                    self._step_outputs[step_id] = result.output_data
-                elif result.status == "canceled":
-                    any_canceled = True
-
-        # If any step was canceled and we were canceling, mark as fully canceled
-        if any_canceled and self._status == "canceling":
+        if task.cancelled():
+            result = StepResult(
+                step_id=step_id,
+                status="canceled",
+                tool_name=self.workflow.steps[step_id].type,
+                error="Step canceled",
+            )
+        elif task.exception() is not None:
+            exc = task.exception()
+            result = StepResult(
+                step_id=step_id,
+                status="failed",
+                tool_name=self.workflow.steps[step_id].type,
+                error=str(exc),
+                error_type=type(exc).__name__,
+            )
+        else:
+            result = task.result()
+            if result.status == "completed":
+                self._step_outputs[step_id] = result.output_data
+
+        self._step_results[step_id] = result
+
+        # If a step was canceled and we were canceling, mark as fully canceled
+        if result.status == "canceled" and self._status == "canceling":
             self._status = "canceled"
+        return result
 
     async def _execute_step(self, step_id: str, step_def: StepDef) -> StepResult:
         """Execute a single step."""
@@ -470,17 +694,32 @@ class WorkflowExecutor:
         # Resolve step type aliases (e.g., "llm" -> "batch-llm")
         tool_name = resolve_step_type(step_def.type)
 
-        # Emit step start event
+        # Emit step start event (with what the profiler needs for the timeline)
+        ready_at = self._ready_at.get(step_id, started_at)
         self._emit_event(
             step_id=step_id,
             status="running",
             message=f"Step {step_id} started (tool={tool_name})",
-            metadata={"tool": tool_name},
+            metadata={
+                "tool": tool_name,
+                "depends_on": list(step_def.depends_on),
+                "queued_ms": max(0, int((started_at - ready_at).total_seconds() * 1000)),
+            },
         )
 
         try:
+            restored = (
+                self.checkpoint.load_step(step_id, step_def)
+                if step_id in self._restorable
+                else None
+            )
+            if restored is not None:
+                return await self._restore_step(step_id, tool_name, restored, started_at)
+
+            streamed = step_def.stream and step_id in self._in_streams
+
             # Build input data from dependencies (fan-in)
-            input_data = self._build_input_data(step_def)
+            input_data = [] if streamed else self._build_input_data(step_def)
 
             # Interpolate step config with workflow inputs
             workflow_input_names = set(self.workflow.inputs.keys())
@@ -495,39 +734,59 @@ class WorkflowExecutor:
             if self._cancel_event.is_set():
                 raise ToolCanceledError(tool_name, reason="Workflow canceled")
 
-            # Handle function-type steps differently
-            if step_def.type == "function":
-                result = await self._execute_function_step(
-                    step_id, step_def, input_data, interpolated_config
+            keep_data = self._keeps_output(step_id)
+            cache_key = (
+                None
+                if streamed
+                else self._step_cache_key(
+                    step_id, step_def, tool_name, input_data, interpolated_config
+                )
+            )
+            cached = (
+                self.step_cache.get(cache_key)
+                if cache_key and step_id not in self.force_steps
+                else None
+            )
+
+            if cached is not None:
+                await self._publish(step_id, cached)
+                result = ToolResult(success=True, data=cached if keep_data else [])
+                output_count = len(cached)
+                self._emit_event(
+                    step_id=step_id,
+                    status="running",
+                    message=f"Step {step_id} reused cached output",
+                    metadata={"cached": True, "fingerprint": cache_key},
+                )
+            elif streamed:
+                result, output_count = await self._execute_streaming_step(
+                    step_id, step_def, tool_name, interpolated_config
+                )
+            elif self._shard_size(step_def) and input_data:
+                result, output_count = await self._run_sharded(
+                    step_id, step_def, tool_name, input_data, interpolated_config
+                )
+            elif keep_data and self._checkpoints_batches(step_def, tool_name, input_data):
+                result, output_count = await self._run_checkpointed_batches(
+                    step_id, step_def, tool_name, input_data, interpolated_config
                 )
             else:
-                # Resolve provider via ProviderRegistry
-                resolved_config = self._resolve_provider_for_step(
-                    tool_name, interpolated_config, input_data=input_data
+                result, output_count = await self._run_step_tool(
+                    step_id, step_def, tool_name, input_data, interpolated_config,
+                    keep_data=keep_data or cache_key is not None,
                 )
 
-                # Build tool parameters
-                # Tools receive: input_data (from deps) + config
-                params = {
-                    "input_data": input_data,
-                    **resolved_config,
-                }
-
-                # Execute tool with progress tracking
-                def on_progress(event):
-                    self._emit_event(
-                        step_id=step_id,
-                        substep=event.substep,
-                        status=event.status,
-                        current=event.current,
-                        total=event.total,
-                        message=event.message,
-                        metadata=event.metadata,
-                    )
+            if cache_key and cached is None and result.success and not result.errors:
+                self.step_cache.put(cache_key, result.data, step_id=step_id, tool_name=tool_name)
 
-                result = await execute_tool(
-                    tool_name, params, self.context, on_progress=on_progress
-                )
+            if self.checkpoint and result.success:
+                if keep_data:
+                    self.checkpoint.save_step(step_id, step_def, result.data)
+                else:
+                    # Streamed-only records are not retained; resume re-runs the step
+                    self.checkpoint.save_step_marker(step_id, step_def, output_count)
+            if not keep_data:
+                result.data = []
 
             completed_at = datetime.now(timezone.utc)
             duration_ms = int((completed_at - started_at).total_seconds() * 1000)
@@ -548,8 +807,10 @@ class WorkflowExecutor:
                 status="completed" if result.success else "failed",
                 message=f"Step {step_id} {status}" + (f": {error}" if error else ""),
                 metadata={
-                    "output_count": len(result.data),
+                    "output_count": output_count,
                     "error_count": len(result.errors),
+                    "cached": cached is not None,
+                    "duration_ms": duration_ms,
                 },
             )
 
@@ -563,6 +824,8 @@ class WorkflowExecutor:
                 started_at=started_at.isoformat(),
                 completed_at=completed_at.isoformat(),
                 duration_ms=duration_ms,
+                output_count=output_count,
+                cached=cached is not None,
             )
 
         except asyncio.CancelledError:
@@ -574,6 +837,7 @@ class WorkflowExecutor:
                 step_id=step_id,
                 status="failed",
                 message=f"Step {step_id} canceled",
+                metadata={"duration_ms": duration_ms},
             )
 
             return StepResult(
@@ -595,6 +859,7 @@ class WorkflowExecutor:
                 step_id=step_id,
                 status="failed",
                 message=f"Step {step_id} canceled: {e.reason or 'No reason'}",
+                metadata={"duration_ms": duration_ms},
             )
 
             return StepResult(
@@ -617,7 +882,7 @@ class WorkflowExecutor:
                 step_id=step_id,
                 status="failed",
                 message=f"Step {step_id} failed: {e.message}",
-                metadata=e.details,
+                metadata={**(e.details or {}), "duration_ms": duration_ms},
             )
 
             return StepResult(
@@ -642,6 +907,7 @@ class WorkflowExecutor:
                 step_id=step_id,
                 status="failed",
                 message=f"Step {step_id} failed: {e}",
+                metadata={"duration_ms": duration_ms},
             )
 
             return StepResult(
@@ -655,6 +921,378 @@ class WorkflowExecutor:
                 duration_ms=duration_ms,
             )
 
+        finally:
+            # End of this step's records for streaming dependents
+            for stream in self._out_streams.get(step_id, []):
+                await stream.close()
+
+    async def _run_step_tool(
+        self,
+        step_id: str,
+        step_def: StepDef,
+        tool_name: str,
+        input_data: list[dict[str, Any]],
+        config: dict[str, Any],
+        *,
+        keep_data: bool = True,
+        publish: bool = True,
+    ) -> tuple[ToolResult, int]:
+        """
+        Run a step's tool (or function) on one batch of input records.
+
+        Records are forwarded to streaming dependents as they are produced
+        (per partial result of Tool.run_stream when the step has any).
+
+        Args:
+            keep_data: Keep streamed records in the returned result
+            publish: Forward records to streaming dependents (the caller
+                publishes them itself when False)
+
+        Returns:
+            Tuple of (result, number of records produced)
+        """
+        # Handle function-type steps differently
+        if step_def.type == "function":
+            result = await self._execute_function_step(step_id, step_def, input_data, config)
+            if publish:
+                await self._publish(step_id, result.data)
+            return result, len(result.data)
+
+        # Resolve provider via ProviderRegistry
+        resolved_config = self._resolve_provider_for_step(
+            tool_name, config, input_data=input_data
+        )
+
+        # Build tool parameters
+        # Tools receive: input_data (from deps) + config
+        params = {
+            "input_data": input_data,
+            **resolved_config,
+        }
+
+        # Execute tool with progress tracking
+        def on_progress(event):
+            self._emit_event(
+                step_id=step_id,
+                substep=event.substep,
+                status=event.status,
+                current=event.current,
+                total=event.total,
+                message=event.message,
+                metadata=event.metadata,
+            )
+
+        if not publish or not self._out_streams.get(step_id):
+            result = await execute_tool(tool_name, params, self.context, on_progress=on_progress)
+            return result, len(result.data)
+
+        combined = ToolResult(success=True)
+        produced = 0
+        async for partial in execute_tool_stream(
+            tool_name, params, self.context, on_progress=on_progress
+        ):
+            await self._publish(step_id, partial.data)
+            produced += len(partial.data)
+            _merge_results(combined, partial, keep_data=keep_data)
+        return combined, produced
+
+    async def _execute_streaming_step(
+        self,
+        step_id: str,
+        step_def: StepDef,
+        tool_name: str,
+        config: dict[str, Any],
+    ) -> tuple[ToolResult, int]:
+        """
+        Run a streaming step on its dependencies' records as they arrive.
+
+        Tools with ``stream_input`` run once per chunk of stream_chunk_size
+        records; other tools (and function steps) get all records in one
+        batch once every dependency has finished. Records are only kept in
+        the step result if a non-streaming step (or the caller) needs them.
+
+        Returns:
+            Tuple of (combined result, number of records produced)
+        """
+        chunks = rechunk(merge_streams(self._in_streams[step_id]), step_def.stream_chunk_size)
+
+        if step_def.type == "function" or not get_tool(tool_name).stream_input:
+            input_data = [record async for chunk in chunks for record in chunk]
+            return await self._run_step_tool(
+                step_id, step_def, tool_name, input_data, config,
+                keep_data=self._keeps_output(step_id),
+            )
+
+        keep = self._keeps_output(step_id)
+        combined = ToolResult(success=True)
+        any_success = False
+        ran = False
+        rows_in = 0
+        output_count = 0
+        async for chunk in chunks:
+            if self._cancel_event.is_set():
+                raise ToolCanceledError(tool_name, reason="Workflow canceled")
+            partial, produced = await self._run_step_tool(
+                step_id, step_def, tool_name, chunk, config, keep_data=keep
+            )
+            ran = True
+            any_success = any_success or partial.success
+            output_count += produced
+            _merge_results(combined, partial, row_offset=rows_in, keep_data=keep)
+            rows_in += len(chunk)
+
+        # Like row-wise tools: success if any chunk succeeded (or no input)
+        combined.success = any_success or not ran
+        return combined, output_count
+
+    async def _restore_step(
+        self,
+        step_id: str,
+        tool_name: str,
+        data: list[dict[str, Any]],
+        started_at: datetime,
+    ) -> StepResult:
+        """Complete a step from its checkpointed output (resume)."""
+        await self._publish(step_id, data)
+        completed_at = datetime.now(timezone.utc)
+        self._emit_event(
+            step_id=step_id,
+            status="completed",
+            message=f"Step {step_id} restored from checkpoint",
+            metadata={"output_count": len(data), "error_count": 0, "resumed": True},
+        )
+        return StepResult(
+            step_id=step_id,
+            status="completed",
+            tool_name=tool_name,
+            output_data=data,
+            started_at=started_at.isoformat(),
+            completed_at=completed_at.isoformat(),
+            duration_ms=int((completed_at - started_at).total_seconds() * 1000),
+            output_count=len(data),
+            resumed=True,
+        )
+
+    @staticmethod
+    def _shard_size(step_def: StepDef) -> int | None:
+        """Records per shard for fan-out steps (None = no fan-out)."""
+        return 1 if step_def.foreach else step_def.shard_size
+
+    async def _run_sharded(
+        self,
+        step_id: str,
+        step_def: StepDef,
+        tool_name: str,
+        input_data: list[dict[str, Any]],
+        config: dict[str, Any],
+    ) -> tuple[ToolResult, int]:
+        """
+        Fan a step out over shards of its input and merge the results.
+
+        Up to max_concurrent_shards invocations run at once. Outputs (and
+        row indices of errors) are merged in input order, and forwarded to
+        streaming dependents in that order as soon as every earlier shard
+        is done. With a checkpoint, finished shards are saved and restored
+        like checkpoint batches (unless the step's records are only
+        streamed).
+
+        Row-wise tools succeed if any shard succeeded; other tools and
+        function steps fail if any shard failed.
+
+        Returns:
+            Tuple of (combined result, number of records produced)
+        """
+        size = self._shard_size(step_def)
+        starts = list(range(0, len(input_data), size))
+        total = len(starts)
+        semaphore = asyncio.Semaphore(step_def.max_concurrent_shards)
+        results: list[tuple[ToolResult, int] | None] = [None] * total
+        published = 0
+        done = 0
+        publish_lock = asyncio.Lock()
+        checkpoint = self.checkpoint if self._keeps_output(step_id) else None
+
+        async def run_shard(index: int) -> None:
+            nonlocal done, published
+            shard = input_data[starts[index] : starts[index] + size]
+            async with semaphore:
+                if self._cancel_event.is_set():
+                    raise ToolCanceledError(tool_name, reason="Workflow canceled")
+                input_hash = hash_records(shard) if checkpoint else ""
+                data = checkpoint.load_batch(step_id, index, input_hash) if checkpoint else None
+                if data is not None:
+                    partial, produced = ToolResult(success=True, data=data), len(data)
+                else:
+                    partial, produced = await self._run_step_tool(
+                        step_id, step_def, tool_name, shard, config, publish=False
+                    )
+                    if checkpoint and partial.success and not partial.errors:
+                        checkpoint.save_batch(step_id, index, input_hash, partial.data)
+
+            results[index] = (partial, produced)
+            done += 1
+            self._emit_event(
+                step_id=step_id,
+                substep="shard",
+                status="progress",
+                current=done,
+                total=total,
+                message=(
+                    f"Shard {index + 1}/{total} "
+                    f"{'completed' if partial.success else 'failed'} ({len(shard)} records)"
+                ),
+                metadata={"shard": index, "records": len(shard), "success": partial.success},
+            )
+
+            # Forward finished shards to streaming dependents in input order
+            async with publish_lock:
+                while published < total and results[published] is not None:
+                    await self._publish(step_id, results[published][0].data)
+                    published += 1
+
+        tasks = [asyncio.create_task(run_shard(i)) for i in range(total)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        row_wise = step_def.type != "function" and get_tool(tool_name).stream_input
+        combined = ToolResult(success=True)
+        outcomes = []
+        output_count = 0
+        for start, (partial, produced) in zip(starts, results):
+            outcomes.append(partial.success)
+            output_count += produced
+            _merge_results(combined, partial, row_offset=start)
+        combined.success = any(outcomes) if row_wise else all(outcomes)
+        return combined, output_count
+
+    def _checkpoints_batches(
+        self, step_def: StepDef, tool_name: str, input_data: list[dict[str, Any]]
+    ) -> bool:
+        """True if a step runs in checkpointed input batches."""
+        if self.checkpoint is None or step_def.type == "function":
+            return False
+        size = step_def.checkpoint_batch_size or DEFAULT_CHECKPOINT_BATCH_SIZE
+        if len(input_data) <= size:
+            return False
+        try:
+            return get_tool(tool_name).stream_input
+        except Exception:
+            return False
+
+    async def _run_checkpointed_batches(
+        self,
+        step_id: str,
+        step_def: StepDef,
+        tool_name: str,
+        input_data: list[dict[str, Any]],
+        config: dict[str, Any],
+    ) -> tuple[ToolResult, int]:
+        """
+        Run a row-wise step in batches, checkpointing each completed batch.
+
+        Batches completed by an earlier attempt of this run (same index and
+        identical input records) are restored instead of re-run. Batches with
+        row errors are not checkpointed, so a resume retries them.
+
+        Returns:
+            Tuple of (combined result, number of records produced)
+        """
+        size = step_def.checkpoint_batch_size or DEFAULT_CHECKPOINT_BATCH_SIZE
+        combined = ToolResult(success=True)
+        any_success = False
+        output_count = 0
+        restored = 0
+        for index, start in enumerate(range(0, len(input_data), size)):
+            if self._cancel_event.is_set():
+                raise ToolCanceledError(tool_name, reason="Workflow canceled")
+
+            batch = input_data[start : start + size]
+            input_hash = hash_records(batch)
+            data = self.checkpoint.load_batch(step_id, index, input_hash)
+            if data is not None:
+                await self._publish(step_id, data)
+                partial, produced = ToolResult(success=True, data=data), len(data)
+                restored += 1
+            else:
+                partial, produced = await self._run_step_tool(
+                    step_id, step_def, tool_name, batch, config
+                )
+                if partial.success and not partial.errors:
+                    self.checkpoint.save_batch(step_id, index, input_hash, partial.data)
+
+            any_success = any_success or partial.success
+            output_count += produced
+            _merge_results(combined, partial, row_offset=start)
+
+        if restored:
+            self._emit_event(
+                step_id=step_id,
+                status="progress",
+                message=f"Step {step_id} restored {restored} batch(es) from checkpoint",
+                metadata={"restored_batches": restored, "batch_size": size},
+            )
+
+        # Like row-wise tools: success if any batch succeeded
+        combined.success = any_success
+        return combined, output_count
+
+    def _step_cache_key(
+        self,
+        step_id: str,
+        step_def: StepDef,
+        tool_name: str,
+        input_data: list[dict[str, Any]],
+        config: dict[str, Any],
+    ) -> str | None:
+        """
+        Fingerprint a step for the step cache.
+
+        Returns:
+            None if the step must not be cached (no cache, ``cache = false``,
+            or a tool whose output depends on more than config and input)
+        """
+        if self.step_cache is None or not step_def.cache:
+            return None
+
+        if step_def.type == "function":
+            return step_fingerprint(
+                f"function:{step_def.function}",
+                config,
+                input_data,
+                tool_version(tool_name, function_source=self.tools_path),
+            )
+
+        try:
+            if not get_tool(tool_name).cacheable:
+                return None
+        except Exception:
+            return None
+
+        resolved_config = self._resolve_provider_for_step(
+            tool_name, config, input_data=input_data
+        )
+        return step_fingerprint(
+            tool_name, resolved_config, input_data, tool_version(tool_name)
+        )
+
+    async def _publish(self, step_id: str, records: list[dict[str, Any]]) -> None:
+        """Send records to every streaming dependent (waits on full buffers)."""
+        for stream in self._out_streams.get(step_id, []):
+            await stream.put(records)
+
+    def _keeps_output(self, step_id: str) -> bool:
+        """False if every dependent consumes this step's records as a stream."""
+        dependents = [
+            name for name, step_def in self.workflow.steps.items()
+            if step_id in step_def.depends_on
+        ]
+        return not dependents or any(
+            not self.workflow.steps[name].stream for name in dependents
+        )
+
     async def _execute_function_step(
         self,
         step_id: str,
@@ -665,7 +1303,8 @@ class WorkflowExecutor:
         """
         Execute a custom function step.
 
-        Loads the function from tools.py and executes it with context.
+        Loads the function from tools.py and executes it with context, in the
+        executor process or (``executor = "process"``) in the run's worker pool.
 
         Args:
             step_id: Step identifier
@@ -685,31 +1324,6 @@ class WorkflowExecutor:
             )
             return result
 
-        # Load the user function
-        try:
-            func = _load_user_function(self.tools_path, function_name)
-        except FileNotFoundError as e:
-            result = ToolResult(success=False)
-            result.add_error(
-                error_type="file_not_found",
-                message=str(e),
-            )
-            return result
-        except AttributeError as e:
-            result = ToolResult(success=False)
-            result.add_error(
-                error_type="function_not_found",
-                message=str(e),
-            )
-            return result
-        except Exception as e:
-            result = ToolResult(success=False)
-            result.add_error(
-                error_type="import_error",
-                message=f"Failed to load function: {e}",
-            )
-            return result
-
         # Build context for the function
         context_dict = {
             "inputs": self.inputs,
@@ -719,16 +1333,34 @@ class WorkflowExecutor:
             "step_id": step_id,
         }
 
+        if step_def.executor == "process":
+            # Loaded (and cached) inside the worker
+            async def call() -> dict[str, Any]:
+                output = await self._function_pool().run(
+                    self.tools_path, function_name, context_dict
+                )
+                return _normalize_function_output(output)
+
+        else:
+            # Load the user function
+            try:
+                func = _load_user_function(self.tools_path, function_name)
+            except Exception as e:
+                return self._function_load_error(e)
+
+            async def call() -> dict[str, Any]:
+                return await _execute_user_function(func, context_dict)
+
         # Execute the function
         try:
-            output = await _execute_user_function(func, context_dict)
+            output = await call()
 
             # Emit progress event
             self._emit_event(
                 step_id=step_id,
                 status="completed",
                 message=f"Function {function_name} completed",
-                metadata={"function": function_name},
+                metadata={"function": function_name, "executor": step_def.executor},
             )
 
             # Wrap output in list if needed (tools return list of records)
@@ -736,6 +1368,9 @@ class WorkflowExecutor:
 
             return ToolResult(success=True, data=output_data)
 
+        except FunctionLoadError as e:
+            return self._function_load_error(e)
+
         except Exception as e:
             self._emit_event(
                 step_id=step_id,
@@ -750,6 +1385,40 @@ class WorkflowExecutor:
             )
             return result
 
+    @staticmethod
+    def _function_load_error(e: Exception) -> ToolResult:
+        """Result for a tools.py / function that could not be loaded."""
+        if isinstance(e, FunctionLoadError):
+            result = ToolResult(success=False)
+            result.add_error(error_type=e.kind, message=e.message)
+            return result
+        if isinstance(e, FileNotFoundError):
+            result = ToolResult(success=False)
+            result.add_error(
+                error_type="file_not_found",
+                message=str(e),
+            )
+            return result
+        if isinstance(e, AttributeError):
+            result = ToolResult(success=False)
+            result.add_error(
+                error_type="function_not_found",
+                message=str(e),
+            )
+            return result
+        result = ToolResult(success=False)
+        result.add_error(
+            error_type="import_error",
+            message=f"Failed to load function: {e}",
+        )
+        return result
+
+    def _function_pool(self) -> FunctionProcessPool:
+        """The run's worker pool for process function steps (started on first use)."""
+        if self._process_pool is None:
+            self._process_pool = FunctionProcessPool(self.workflow.workflow.max_process_workers)
+        return self._process_pool
+
     def _build_input_data(self, step_def: StepDef) -> list[dict[str, Any]]:
         """
         Build input data for a step from its dependencies.
@@ -920,7 +1589,7 @@ class WorkflowExecutor:
 
         return config
 
-    async def _handle_cancellation(self, pending_level: list[str]) -> None:
+    async def _handle_cancellation(self, pending_steps: list[str]) -> None:
         """Handle cancellation: cancel running tasks, skip pending steps."""
         # Cancel all running tasks
         async with self._lock:
@@ -940,8 +1609,8 @@ class WorkflowExecutor:
             except asyncio.TimeoutError:
                 logger.warning("Cancellation timeout - some tasks may still be running")
 
-        # Mark pending steps in current level as canceled
-        for step_id in pending_level:
+        # Mark ready-but-unstarted steps as canceled
+        for step_id in pending_steps:
             if step_id not in self._step_results:
                 self._step_results[step_id] = StepResult(
                     step_id=step_id,
@@ -957,7 +1626,7 @@ class WorkflowExecutor:
             step_id="workflow",
             status="failed",
             message="Workflow canceled",
-            metadata={"canceled_steps": pending_level},
+            metadata={"canceled_steps": pending_steps},
         )
 
     def _create_result(self, started_at: datetime, error: str | None = None) -> WorkflowResult:
@@ -975,6 +1644,12 @@ class WorkflowExecutor:
         else:
             exit_code = ExitCode.FAILED
 
+        if self.checkpoint is not None:
+            if self._status == "completed":
+                self.checkpoint.discard()
+            else:
+                self.checkpoint.mark(self._status)
+
         # Emit workflow complete event
         self._emit_event(
             step_id="workflow",
@@ -1008,22 +1683,58 @@ class WorkflowExecutor:
         message: str | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> None:
-        """Emit a progress event via track_event."""
+        """Queue a progress event for the writer task (see _write_events)."""
+        event = {
+            "run_id": self.run_id,
+            "step_id": step_id,
+            "substep": substep,
+            "status": status,
+            "current": current,
+            "total": total,
+            "message": message,
+            "metadata": metadata,
+        }
         try:
-            track_event(
-                run_id=self.run_id,
-                step_id=step_id,
-                substep=substep,
-                status=status,  # type: ignore
-                current=current,
-                total=total,
-                message=message,
-                metadata=metadata,
-                db=self._db,
-            )
-        except Exception:
-            # Event tracking should not break execution
-            pass
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Not on the event loop: nothing to block, write directly
+            try:
+                track_event(**event, db=self._db)
+            except Exception:
+                pass
+            return
+
+        if self._events is None:
+            self._events = asyncio.Queue()
+            self._event_writer = asyncio.create_task(self._write_events(self._events))
+        self._events.put_nowait(event)
+
+    async def _write_events(self, events: asyncio.Queue[dict[str, Any]]) -> None:
+        """Insert queued events one at a time with atrack_event, in emit order.
+
+        Steps emit events from the event loop (including from sync progress
+        callbacks); writing them here keeps the inserts off the loop's
+        critical path and preserves their order.
+        """
+        while True:
+            event = await events.get()
+            try:
+                await atrack_event(**event, db=self._db)
+            except Exception:
+                # Event tracking should not break execution
+                pass
+            finally:
+                events.task_done()
+
+    async def _flush_events(self) -> None:
+        """Wait for queued events to be written and stop the writer task."""
+        if self._events is None:
+            return
+        events, writer = self._events, self._event_writer
+        self._events = self._event_writer = None
+        await events.join()
+        if writer is not None:
+            writer.cancel()
 
 
 async def execute_workflow(
@@ -1035,13 +1746,17 @@ async def execute_workflow(
     continue_on_error: bool = False,
     run_id: str | None = None,
     tools_path: Path | str | None = None,
+    max_parallel_steps: int | None = None,
+    step_cache: StepCache | None = None,
+    force_steps: Collection[str] | None = None,
+    checkpoint: RunCheckpoint | None = None,
 ) -> WorkflowResult:
     """
     Execute a workflow with the given inputs.
 
     This is the main entry point for workflow execution. It:
     1. Builds an execution plan using build_dag()
-    2. Executes steps level by level using asyncio.gather for parallel steps
+    2. Starts each step as soon as its dependencies complete (ready queue)
     3. Calls execute_tool() for each step (or user function for type=function)
     4. Handles cancellation and partial failure
     5. Emits progress events via track_event()
@@ -1056,6 +1771,13 @@ async def execute_workflow(
         run_id: Optional run ID. If not provided, generates a UUID.
         tools_path: Path to tools.py for custom function steps.
                    If None, looks for tools.py in current directory.
+        max_parallel_steps: Maximum steps running at once (default: the
+                   workflow's max_parallel_steps, else unlimited).
+        step_cache: Reuse outputs of steps whose fingerprint is unchanged
+                   since an earlier run (default: no caching).
+        force_steps: Steps to re-run despite a cache hit.
+        checkpoint: Persist completed steps and batches, and restore those
+                   already recorded by an earlier attempt of the run.
 
     Returns:
         WorkflowResult with:
@@ -1085,5 +1807,9 @@ async def execute_workflow(
         continue_on_error=continue_on_error,
         run_id=run_id,
         tools_path=tools_path,
+        max_parallel_steps=max_parallel_steps,
+        step_cache=step_cache,
+        force_steps=force_steps,
+        checkpoint=checkpoint,
     )
     return await executor.run()
@@ -33,11 +33,12 @@ InputType = Literal["string", "int", "float", "bool"]
 STEP_TYPE_ALIASES: dict[str, str] = {
     "llm": "batch-llm",
     "embed": "batch-embedding",
+    "similar": "vector-search",
 }
 
 # Valid step types - must match tool registry keys (after alias resolution)
 # "function" is special: executes user-defined Python function from tools.py
-VALID_STEP_TYPES = frozenset(["map", "fetch", "llm", "embed", "write-db", "sql", "agent", "function"])
+VALID_STEP_TYPES = frozenset(["map", "fetch", "llm", "embed", "write-db", "sql", "changes", "agent", "similar", "function"])
 
 
 def resolve_step_type(step_type: str) -> str:
@@ -119,6 +120,21 @@ class StepDef(BaseModel):
         config: Tool-specific configuration (validated at execution time)
         function: For type="function", the name of the function to call from tools.py
         continue_on_error: Whether to continue workflow on step failure
+        stream: Consume dependency records as they are produced, in chunks of
+                stream_chunk_size, instead of waiting for dependencies to finish
+        stream_chunk_size: Records per input chunk in streaming mode
+        cache: Opt in to reusing this step's output from an earlier run when
+               its tool, resolved config and input records are unchanged
+               (ignored for tools that are not cacheable)
+        checkpoint_batch_size: Input records per checkpointed batch for
+               row-wise tools (None = executor default)
+        foreach: Run the step once per input record (same as shard_size = 1)
+        shard_size: Split input_data into shards of this many records, run
+               one tool (or function) invocation per shard concurrently and
+               merge the outputs in input order
+        max_concurrent_shards: Shards of this step running at once
+        executor: Where a function step runs: "thread" (executor process;
+               sync functions in a thread) or "process" (worker pool)
     """
 
     type: str
@@ -126,6 +142,14 @@ class StepDef(BaseModel):
     config: dict[str, Any] = Field(default_factory=dict)
     function: str | None = Field(default=None)
     continue_on_error: bool = False
+    stream: bool = False
+    stream_chunk_size: int = Field(default=100, ge=1)
+    cache: bool = False
+    checkpoint_batch_size: int | None = Field(default=None, ge=1)
+    foreach: bool = False
+    shard_size: int | None = Field(default=None, ge=1)
+    max_concurrent_shards: int = Field(default=4, ge=1)
+    executor: Literal["thread", "process"] = "thread"
 
 
 class WorkflowMeta(BaseModel):
@@ -135,10 +159,19 @@ class WorkflowMeta(BaseModel):
     Attributes:
         name: Workflow identifier
         description: Human-readable description (optional)
+        max_parallel_steps: Maximum steps running at once (None = unlimited)
+        max_process_workers: Worker processes for executor = "process"
+                             function steps (None = CPU count)
+        commit: Commit and tag the database when a run completes, so
+                ``run:<run_id>`` diffs start there (None = only when the
+                workflow has a ``changes`` step)
     """
 
     name: str
     description: str | None = None
+    max_parallel_steps: int | None = Field(default=None, ge=1)
+    max_process_workers: int | None = Field(default=None, ge=1)
+    commit: bool | None = None
 
 
 class WorkflowDefinition(BaseModel):
@@ -157,10 +190,28 @@ class WorkflowDefinition(BaseModel):
 
 
 # Valid keys for each section (strict validation)
-_WORKFLOW_KEYS = frozenset(["name", "description"])
+_WORKFLOW_KEYS = frozenset(
+    ["name", "description", "max_parallel_steps", "max_process_workers", "commit"]
+)
 _INPUT_KEYS = frozenset(["type", "required", "default"])
 # function step uses "function" key instead of "config" to specify the function name
-_STEP_KEYS = frozenset(["type", "depends_on", "config", "continue_on_error", "function"])
+_STEP_KEYS = frozenset(
+    [
+        "type",
+        "depends_on",
+        "config",
+        "continue_on_error",
+        "function",
+        "stream",
+        "stream_chunk_size",
+        "cache",
+        "checkpoint_batch_size",
+        "foreach",
+        "shard_size",
+        "max_concurrent_shards",
+        "executor",
+    ]
+)
 _TOP_LEVEL_KEYS = frozenset(["workflow", "inputs", "steps"])
 
 
@@ -319,7 +370,21 @@ def parse_workflow(
                 _resolve_output_schema(config, models_path)
                 step_data = {**step_data, "config": config}
 
-            steps[step_name] = StepDef.model_validate(step_data)
+            step_def = StepDef.model_validate(step_data)
+            if step_def.foreach and step_def.shard_size not in (None, 1):
+                raise WorkflowParseError(
+                    f"Step {step_name} sets both 'foreach' and 'shard_size'"
+                )
+            if step_def.executor == "process" and step_type != "function":
+                raise WorkflowParseError(
+                    f"Step {step_name}: executor = \"process\" is only supported for function steps"
+                )
+            if step_def.stream and (step_def.foreach or step_def.shard_size):
+                raise WorkflowParseError(
+                    f"Step {step_name} cannot combine 'stream' with 'foreach'/'shard_size' "
+                    "(use stream_chunk_size)"
+                )
+            steps[step_name] = step_def
 
     # Validate dependencies: all depends_on must reference existing steps
     step_names = set(steps.keys())
@@ -0,0 +1,149 @@
+"""
+Warm process pool for CPU-heavy function steps.
+
+Function steps with ``executor = "process"`` run in worker processes instead
+of the executor's event loop, so a long scoring or parsing function does not
+stall other steps. Workers are started once per workflow run and keep each
+tools.py module loaded (re-imported only when the file changes).
+
+The function's context is pickled once in the parent with the highest pickle
+protocol, and its result once in the worker, so large record lists cross the
+process boundary as a single bytes payload.
+
+Workers use the ``spawn`` start method (forking a process that runs an event
+loop and tracking threads is unsafe); their start-up cost is paid once per
+run, not per call.
+
+Usage:
+    pool = FunctionProcessPool(max_workers=4)
+    try:
+        output = await pool.run(Path("tools.py"), "score", context_dict)
+    finally:
+        pool.shutdown()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# Worker-side cache of loaded tools modules: path -> (mtime_ns, module)
+_MODULES: dict[str, tuple[int, Any]] = {}
+
+
+class FunctionLoadError(Exception):
+    """tools.py or the function could not be loaded in a worker.
+
+    Attributes:
+        kind: file_not_found, function_not_found or import_error
+    """
+
+    def __init__(self, kind: str, message: str):
+        super().__init__(kind, message)
+        self.kind = kind
+        self.message = message
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def _load_function(tools_path: str, function_name: str) -> Any:
+    """Load (or reuse) a function from tools.py inside a worker."""
+    try:
+        mtime = os.stat(tools_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FunctionLoadError("file_not_found", f"tools.py not found at {tools_path}")
+
+    cached = _MODULES.get(tools_path)
+    if cached is not None and cached[0] == mtime:
+        module = cached[1]
+    else:
+        try:
+            spec = importlib.util.spec_from_file_location("tools", tools_path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load module from {tools_path}")
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception as e:
+            raise FunctionLoadError("import_error", f"Failed to load function: {e}")
+        _MODULES[tools_path] = (mtime, module)
+
+    if not hasattr(module, function_name):
+        raise FunctionLoadError(
+            "function_not_found", f"Function '{function_name}' not found in {tools_path}"
+        )
+    return getattr(module, function_name)
+
+
+def _call_function(tools_path: str, function_name: str, payload: bytes) -> bytes:
+    """Worker entry point: unpickle the context, call the function, pickle the result."""
+    func = _load_function(tools_path, function_name)
+    context_dict = pickle.loads(payload)
+    if asyncio.iscoroutinefunction(func):
+        result = asyncio.run(func(context_dict))
+    else:
+        result = func(context_dict)
+    return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+class FunctionProcessPool:
+    """
+    Lazily started pool of worker processes for function steps.
+
+    Args:
+        max_workers: Functions running in parallel (default: CPU count)
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool: ProcessPoolExecutor | None = None
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    async def run(
+        self, tools_path: Path, function_name: str, context_dict: dict[str, Any]
+    ) -> Any:
+        """
+        Run ``function_name`` from ``tools_path`` in a worker.
+
+        Returns:
+            The function's return value (not normalized)
+
+        Raises:
+            FunctionLoadError: tools.py or the function could not be loaded
+            Exception: Whatever the function raised
+        """
+        payload = pickle.dumps(context_dict, protocol=pickle.HIGHEST_PROTOCOL)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            self._executor(),
+            _call_function,
+            str(Path(tools_path).resolve()),
+            function_name,
+            payload,
+        )
+        return pickle.loads(result)
+
+    def shutdown(self) -> None:
+        """Stop the workers (no-op if none were started)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+__all__ = [
+    "FunctionLoadError",
+    "FunctionProcessPool",
+]
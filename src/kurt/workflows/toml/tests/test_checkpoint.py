@@ -0,0 +1,237 @@
+"""
+Tests for checkpoint/resume of TOML workflow runs.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from kurt.tools.core import ToolResult
+from kurt.workflows.toml.checkpoint import CheckpointNotFoundError, RunCheckpoint
+from kurt.workflows.toml.executor import execute_workflow
+from kurt.workflows.toml.parser import StepDef, WorkflowDefinition, WorkflowMeta
+
+
+def make_workflow(steps: dict[str, StepDef]) -> WorkflowDefinition:
+    return WorkflowDefinition(workflow=WorkflowMeta(name="resumable"), steps=steps)
+
+
+def pipeline(**fetch_options) -> WorkflowDefinition:
+    return make_workflow(
+        {
+            "discover": StepDef(type="map", config={"source": "https://example.com"}),
+            "download": StepDef(type="fetch", depends_on=["discover"], **fetch_options),
+            "summarize": StepDef(
+                type="batch-llm",
+                depends_on=["download"],
+                config={"prompt_template": "Summarize {content}"},
+            ),
+        }
+    )
+
+
+def new_checkpoint(tmp_path: Path, run_id: str = "run-1") -> RunCheckpoint:
+    return RunCheckpoint.create(
+        run_id, workflow_path=tmp_path / "wf.toml", inputs={"x": 1}, root=tmp_path / "runs"
+    )
+
+
+class FlakyTools:
+    """execute_tool stand-in that fails selected tools on their first calls."""
+
+    def __init__(self, fail: dict[str, int] | None = None, map_records: int = 1):
+        self.fail = dict(fail or {})
+        self.map_records = map_records
+        self.calls: list[tuple[str, int]] = []
+
+    async def __call__(self, name, params, context=None, on_progress=None):
+        records = params["input_data"]
+        self.calls.append((name, len(records)))
+        if self.fail.get(name):
+            self.fail[name] -= 1
+            raise RuntimeError(f"{name} crashed")
+        if name == "map":
+            records = [{"url": f"https://example.com/{i}"} for i in range(self.map_records)]
+        return ToolResult(success=True, data=[{**r, name: True} for r in records])
+
+
+async def run(workflow, checkpoint, tools: FlakyTools, **kwargs):
+    async def stream(name, params, context=None, on_progress=None):
+        yield await tools(name, params, context, on_progress)
+
+    with (
+        patch("kurt.workflows.toml.executor.execute_tool", tools),
+        patch("kurt.workflows.toml.executor.execute_tool_stream", stream),
+    ):
+        return await execute_workflow(
+            workflow, checkpoint.inputs, run_id=checkpoint.run_id, checkpoint=checkpoint, **kwargs
+        )
+
+
+class TestRunCheckpoint:
+    def test_create_and_load(self, tmp_path: Path):
+        new_checkpoint(tmp_path, "3f2a9c1e-aaaa")
+        loaded = RunCheckpoint.load("3f2a", root=tmp_path / "runs")
+        assert loaded.run_id == "3f2a9c1e-aaaa"
+        assert loaded.inputs == {"x": 1}
+        assert loaded.status == "running"
+
+    def test_missing_and_ambiguous(self, tmp_path: Path):
+        with pytest.raises(CheckpointNotFoundError):
+            RunCheckpoint.load("nope", root=tmp_path / "runs")
+        new_checkpoint(tmp_path, "ab-1")
+        new_checkpoint(tmp_path, "ab-2")
+        with pytest.raises(CheckpointNotFoundError, match="matches 2"):
+            RunCheckpoint.load("ab", root=tmp_path / "runs")
+
+    def test_step_requires_same_definition(self, tmp_path: Path):
+        checkpoint = new_checkpoint(tmp_path)
+        step = StepDef(type="fetch", config={"engine": "httpx"})
+        checkpoint.save_step("download", step, [{"url": "u", "embedding": b"\x00"}])
+
+        reloaded = RunCheckpoint.load("run-1", root=tmp_path / "runs")
+        assert reloaded.load_step("download", step) == [{"url": "u", "embedding": b"\x00"}]
+        changed = StepDef(type="fetch", config={"engine": "trafilatura"})
+        assert reloaded.load_step("download", changed) is None
+
+        reloaded.forget_step("download")
+        assert reloaded.load_step("download", step) is None
+
+    def test_batch_requires_same_input(self, tmp_path: Path):
+        checkpoint = new_checkpoint(tmp_path)
+        checkpoint.save_batch("download", 0, "hash-a", [{"n": 1}])
+        assert checkpoint.load_batch("download", 0, "hash-a") == [{"n": 1}]
+        assert checkpoint.load_batch("download", 0, "hash-b") is None
+        assert checkpoint.load_batch("download", 1, "hash-a") is None
+
+    def test_completed_step_replaces_batches(self, tmp_path: Path):
+        checkpoint = new_checkpoint(tmp_path)
+        checkpoint.save_batch("download", 0, "hash-a", [{"n": 1}])
+        checkpoint.save_step("download", StepDef(type="fetch"), [{"n": 1}])
+        assert checkpoint.load_batch("download", 0, "hash-a") is None
+
+    def test_discard(self, tmp_path: Path):
+        checkpoint = new_checkpoint(tmp_path)
+        checkpoint.discard()
+        with pytest.raises(CheckpointNotFoundError):
+            RunCheckpoint.load("run-1", root=tmp_path / "runs")
+
+    def test_step_marker_is_not_restorable(self, tmp_path: Path):
+        checkpoint = new_checkpoint(tmp_path)
+        step = StepDef(type="map")
+        checkpoint.save_step_marker("discover", step, 5)
+        assert checkpoint.completed_steps() == ["discover"]
+        assert not checkpoint.has_step("discover", step)
+
+    def test_prune_old_checkpoints(self, tmp_path: Path):
+        old = new_checkpoint(tmp_path, "old")
+        new_checkpoint(tmp_path, "new")
+        stale = time.time() - 8 * 24 * 3600
+        os.utime(old.path / "manifest.json", (stale, stale))
+
+        assert RunCheckpoint.prune(root=tmp_path / "runs") == 1
+        assert not old.path.exists()
+        assert RunCheckpoint.load("new", root=tmp_path / "runs").run_id == "new"
+
+
+class TestResume:
+    @pytest.mark.asyncio
+    async def test_resume_runs_only_failed_and_pending_steps(self, tmp_path: Path):
+        checkpoint = new_checkpoint(tmp_path)
+        tools = FlakyTools(fail={"batch-llm": 1})
+        first = await run(pipeline(), checkpoint, tools)
+        assert first.status == "failed"
+        assert checkpoint.status == "failed"
+        assert sorted(checkpoint.completed_steps()) == ["discover", "download"]
+
+        tools.calls.clear()
+        resumed = await run(pipeline(), RunCheckpoint.load("run-1", root=tmp_path / "runs"), tools)
+
+        assert resumed.status == "completed"
+        assert resumed.run_id == "run-1"
+        assert [name for name, _ in tools.calls] == ["batch-llm"]
+        assert resumed.step_results["discover"].resumed
+        assert resumed.step_results["download"].resumed
+        assert not resumed.step_results["summarize"].resumed
+        assert resumed.step_results["summarize"].output_data[0]["fetch"] is True
+        assert not checkpoint.path.exists()  # discarded once the run completed
+
+    @pytest.mark.asyncio
+    async def test_streamed_step_is_not_retained(self, tmp_path: Path):
+        """A step only streamed to its dependents is re-run on resume, not stored."""
+        workflow = pipeline(stream=True)
+        checkpoint = new_checkpoint(tmp_path)
+        tools = FlakyTools(fail={"batch-llm": 1})
+        first = await run(workflow, checkpoint, tools)
+
+        assert first.status == "failed"
+        assert first.step_results["discover"].output_data == []
+        assert sorted(checkpoint.completed_steps()) == ["discover", "download"]
+        assert not (checkpoint.path / "steps" / "discover.pkl").exists()
+
+        tools.calls.clear()
+        resumed = await run(workflow, RunCheckpoint.load("run-1", root=tmp_path / "runs"), tools)
+
+        assert resumed.status == "completed"
+        assert [name for name, _ in tools.calls] == ["map", "fetch", "batch-llm"]
+
+    @pytest.mark.asyncio
+    async def test_resume_within_batched_step(self, tmp_path: Path):
+        checkpoint = new_checkpoint(tmp_path)
+        workflow = pipeline(checkpoint_batch_size=2)
+        tools = FlakyTools(map_records=5)
+
+        # Crash on the third fetch batch
+        original = tools.__call__
+
+        async def crash_third_fetch(name, params, context=None, on_progress=None):
+            if name == "fetch" and sum(1 for n, _ in tools.calls if n == "fetch") == 2:
+                tools.calls.append((name, len(params["input_data"])))
+                raise RuntimeError("interrupted")
+            return await original(name, params, context, on_progress)
+
+        with patch("kurt.workflows.toml.executor.execute_tool", crash_third_fetch):
+            first = await execute_workflow(
+                workflow, {}, run_id="run-1", checkpoint=checkpoint
+            )
+        assert first.status == "failed"
+
+        tools.calls.clear()
+        resumed = await run(workflow, RunCheckpoint.load("run-1", root=tmp_path / "runs"), tools)
+
+        assert resumed.status == "completed"
+        # Only the unfinished batch (one record) and the downstream step run again
+        assert tools.calls == [("fetch", 1), ("batch-llm", 5)]
+        assert resumed.step_results["download"].output_count == 5
+
+    @pytest.mark.asyncio
+    async def test_rerun_dependency_invalidates_downstream(self, tmp_path: Path):
+        checkpoint = new_checkpoint(tmp_path)
+        tools = FlakyTools(fail={"batch-llm": 1})
+        await run(pipeline(), checkpoint, tools)
+
+        tools.calls.clear()
+        await run(
+            pipeline(),
+            RunCheckpoint.load("run-1", root=tmp_path / "runs"),
+            tools,
+            force_steps=["discover"],
+        )
+        assert [name for name, _ in tools.calls] == ["map", "fetch", "batch-llm"]
+
+    @pytest.mark.asyncio
+    async def test_changed_step_definition_reruns(self, tmp_path: Path):
+        checkpoint = new_checkpoint(tmp_path)
+        tools = FlakyTools(fail={"batch-llm": 1})
+        await run(pipeline(), checkpoint, tools)
+
+        tools.calls.clear()
+        workflow = pipeline()
+        workflow.steps["download"].config["engine"] = "httpx"
+        await run(workflow, RunCheckpoint.load("run-1", root=tmp_path / "runs"), tools)
+        assert [name for name, _ in tools.calls] == ["fetch", "batch-llm"]
@@ -10,7 +10,7 @@ from pathlib import Path
 import pytest
 from click.testing import CliRunner
 
-from kurt.workflows.toml.cli import run_cmd, test_cmd
+from kurt.workflows.toml.cli import resume_cmd, run_cmd, test_cmd
 
 
 @pytest.fixture
@@ -181,6 +181,23 @@ class TestRunDryRun:
         # With URL provided and no cycle, should be valid
         # (tool validation may vary based on registered tools)
 
+    def test_force_step_must_exist(self, cli_runner: CliRunner, sample_workflow: Path):
+        """--force-step rejects step names not in the workflow."""
+        result = cli_runner.invoke(
+            run_cmd,
+            [
+                str(sample_workflow),
+                "--dry-run",
+                "-i",
+                "url=https://example.com",
+                "--force-step",
+                "missing",
+            ],
+        )
+
+        assert result.exit_code != 0
+        assert "missing" in result.output
+
 
 # ============================================================================
 # Test Command Tests
@@ -388,3 +405,32 @@ description = "Empty workflow"
         assert result.exit_code != 0
         # Error message in output (may be JSON or text depending on where error occurs)
         assert "Invalid JSON" in result.output or "error" in result.output.lower()
+
+
+# ============================================================================
+# Resume Tests
+# ============================================================================
+
+
+class TestResumeCommand:
+    """Tests for kurt workflow resume."""
+
+    def test_resume_unknown_run(self, cli_runner: CliRunner, tmp_path: Path, monkeypatch):
+        """Resuming a run without a checkpoint fails cleanly."""
+        monkeypatch.chdir(tmp_path)
+        result = cli_runner.invoke(resume_cmd, ["does-not-exist"])
+
+        assert result.exit_code != 0
+        assert "No checkpoint found" in result.output
+
+    def test_resume_completed_run(self, cli_runner: CliRunner, sample_workflow: Path, tmp_path: Path, monkeypatch):
+        """A completed run has nothing to resume."""
+        from kurt.workflows.toml.checkpoint import RunCheckpoint
+
+        monkeypatch.chdir(tmp_path)
+        RunCheckpoint.create("run-1", workflow_path=sample_workflow, inputs={}).mark("completed")
+
+        result = cli_runner.invoke(resume_cmd, ["run-1"])
+
+        assert result.exit_code == 0
+        assert "already completed" in result.output
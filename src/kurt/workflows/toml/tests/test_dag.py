@@ -367,6 +367,53 @@ class TestBuildDagCriticalPath:
 # ============================================================================
 
 
+class TestBuildDagScheduleOrder:
+    """Tests for ready-queue priority order."""
+
+    def test_contains_every_step(self):
+        steps = {
+            "a": StepDef(type="map"),
+            "b": StepDef(type="fetch", depends_on=["a"]),
+            "c": StepDef(type="llm"),
+        }
+        plan = build_dag(steps)
+        assert sorted(plan.schedule_order) == ["a", "b", "c"]
+
+    def test_critical_path_first(self):
+        steps = {
+            "short": StepDef(type="map"),
+            "long_a": StepDef(type="fetch"),
+            "long_b": StepDef(type="llm", depends_on=["long_a"]),
+        }
+        plan = build_dag(steps)
+        assert plan.critical_path == ["long_a", "long_b"]
+        assert plan.schedule_order == ["long_a", "long_b", "short"]
+
+    def test_longer_tail_before_shorter(self):
+        steps = {
+            "root": StepDef(type="map"),
+            "chain1": StepDef(type="fetch", depends_on=["root"]),
+            "chain2": StepDef(type="llm", depends_on=["chain1"]),
+            "chain3": StepDef(type="llm", depends_on=["chain2"]),
+            "side_a": StepDef(type="fetch"),
+            "side_b": StepDef(type="llm", depends_on=["side_a"]),
+            "leaf": StepDef(type="map"),
+        }
+        plan = build_dag(steps)
+        order = plan.schedule_order
+        assert order[:4] == ["root", "chain1", "chain2", "chain3"]
+        assert order.index("side_a") < order.index("leaf")
+
+    def test_priority_breaks_ties(self):
+        steps = {
+            "a": StepDef(type="map"),
+            "b": StepDef(type="map", config={"priority": 1}),
+            "c": StepDef(type="map", config={"priority": 50}),
+        }
+        plan = build_dag(steps)
+        assert plan.schedule_order == ["b", "c", "a"]
+
+
 class TestBuildDagCycleDetection:
     """Tests for cycle detection."""
 
@@ -6,10 +6,11 @@ from __future__ import annotations
 
 import asyncio
 from typing import Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from kurt.db.dolt import DoltDB
 from kurt.tools.core import (
     ToolContext,
     ToolExecutionError,
@@ -395,6 +396,135 @@ class TestExecuteWorkflowParallel:
         assert set(execution_order[1:3]) == {"fetch", "batch-llm"}
 
 
+class TestExecuteWorkflowReadyQueue:
+    """Tests for dependency-driven step scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_step_starts_when_own_dependencies_complete(self):
+        """A slow step does not hold back unrelated steps at the next depth."""
+        workflow = make_workflow(
+            steps={
+                "slow": make_step("map"),
+                "fast": make_step("fetch"),
+                "after_fast": make_step("llm", depends_on=["fast"]),
+            }
+        )
+
+        slow_done = asyncio.Event()
+        after_fast_started_early = False
+
+        async def mock_execute(name, params, context=None, on_progress=None):
+            nonlocal after_fast_started_early
+            if name == "map":
+                await asyncio.sleep(0.1)
+                slow_done.set()
+            elif name == "batch-llm":
+                after_fast_started_early = not slow_done.is_set()
+            return make_tool_result(success=True)
+
+        with patch(
+            "kurt.workflows.toml.executor.execute_tool", side_effect=mock_execute
+        ):
+            result = await execute_workflow(workflow, {})
+
+        assert result.status == "completed"
+        assert after_fast_started_early
+
+    @pytest.mark.asyncio
+    async def test_max_parallel_steps_caps_concurrency(self):
+        """No more than max_parallel_steps steps run at once."""
+        workflow = make_workflow(
+            steps={
+                "a": make_step("map"),
+                "b": make_step("fetch"),
+                "c": make_step("llm"),
+                "d": make_step("sql"),
+            }
+        )
+
+        active_tasks = 0
+        max_concurrent = 0
+
+        async def mock_execute(name, params, context=None, on_progress=None):
+            nonlocal active_tasks, max_concurrent
+            active_tasks += 1
+            max_concurrent = max(max_concurrent, active_tasks)
+            await asyncio.sleep(0.01)
+            active_tasks -= 1
+            return make_tool_result(success=True)
+
+        with patch(
+            "kurt.workflows.toml.executor.execute_tool", side_effect=mock_execute
+        ):
+            result = await execute_workflow(workflow, {}, max_parallel_steps=2)
+
+        assert result.status == "completed"
+        assert len(result.step_results) == 4
+        assert max_concurrent == 2
+
+    @pytest.mark.asyncio
+    async def test_max_parallel_steps_from_workflow(self):
+        """[workflow] max_parallel_steps is the default limit."""
+        workflow = make_workflow(
+            steps={"a": make_step("map"), "b": make_step("fetch")}
+        )
+        workflow.workflow.max_parallel_steps = 1
+
+        executor = WorkflowExecutor(workflow, {})
+        assert executor.max_parallel_steps == 1
+        assert WorkflowExecutor(workflow, {}, max_parallel_steps=3).max_parallel_steps == 3
+
+    @pytest.mark.asyncio
+    async def test_critical_path_starts_first(self):
+        """With one slot, ready critical-path steps run before other steps."""
+        workflow = make_workflow(
+            steps={
+                "a_short": make_step("map"),
+                "b_long": make_step("fetch"),
+                "b_long_next": make_step("llm", depends_on=["b_long"]),
+            }
+        )
+
+        call_order = []
+
+        async def mock_execute(name, params, context=None, on_progress=None):
+            call_order.append(name)
+            return make_tool_result(success=True)
+
+        with patch(
+            "kurt.workflows.toml.executor.execute_tool", side_effect=mock_execute
+        ):
+            result = await execute_workflow(workflow, {}, max_parallel_steps=1)
+
+        assert result.status == "completed"
+        assert call_order == ["fetch", "batch-llm", "map"]
+
+    @pytest.mark.asyncio
+    async def test_failure_stops_scheduling_new_steps(self):
+        """Without continue_on_error, no step starts after a failure."""
+        workflow = make_workflow(
+            steps={
+                "fails": make_step("map"),
+                "independent": make_step("fetch"),
+            }
+        )
+
+        call_order = []
+
+        async def mock_execute(name, params, context=None, on_progress=None):
+            call_order.append(name)
+            return make_tool_result(success=name != "map")
+
+        with patch(
+            "kurt.workflows.toml.executor.execute_tool", side_effect=mock_execute
+        ):
+            result = await execute_workflow(workflow, {}, max_parallel_steps=1)
+
+        assert result.status == "failed"
+        assert call_order == ["map"]
+        assert "independent" not in result.step_results
+
+
 # ============================================================================
 # Fan-In Tests
 # ============================================================================
@@ -753,7 +883,7 @@ class TestExecuteWorkflowEvents:
 
         with (
             patch("kurt.workflows.toml.executor.execute_tool", new_callable=AsyncMock) as mock_execute,
-            patch("kurt.workflows.toml.executor.track_event", side_effect=capture_event),
+            patch("kurt.workflows.toml.executor.atrack_event", side_effect=capture_event),
         ):
             mock_execute.return_value = make_tool_result(success=True)
             await execute_workflow(workflow, {})
@@ -777,7 +907,7 @@ class TestExecuteWorkflowEvents:
 
         with (
             patch("kurt.workflows.toml.executor.execute_tool", new_callable=AsyncMock) as mock_execute,
-            patch("kurt.workflows.toml.executor.track_event", side_effect=capture_event),
+            patch("kurt.workflows.toml.executor.atrack_event", side_effect=capture_event),
         ):
             mock_execute.return_value = make_tool_result(success=True)
             await execute_workflow(workflow, {})
@@ -942,6 +1072,91 @@ class TestExecuteWorkflowContext:
         assert isinstance(captured_context, ToolContext)
 
 
+class TestExecuteWorkflowRevision:
+    """Tests for the revision recorded when a run completes."""
+
+    async def _run(self, workflow: WorkflowDefinition, success: bool = True) -> MagicMock:
+        record = MagicMock(return_value="abcdef0123")
+        with (
+            patch(
+                "kurt.workflows.toml.executor.execute_tool",
+                new_callable=AsyncMock,
+                return_value=make_tool_result(success=success),
+            ),
+            patch("kurt.workflows.toml.executor.record_run_revision", record),
+        ):
+            await execute_workflow(workflow, {}, context=ToolContext(db=MagicMock()), run_id="r1")
+        return record
+
+    @pytest.mark.asyncio
+    async def test_records_revision_with_changes_step(self):
+        """Workflows with a changes step tag their completed runs."""
+        workflow = make_workflow(name="nightly", steps={"delta": make_step("changes")})
+
+        record = await self._run(workflow)
+
+        assert record.call_args.args[1:] == ("r1", "nightly")
+
+    @pytest.mark.asyncio
+    async def test_no_revision_by_default(self):
+        """Other workflows don't commit unless [workflow] commit is set."""
+        record = await self._run(make_workflow(steps={"step1": make_step("map")}))
+        record.assert_not_called()
+
+        workflow = make_workflow(steps={"step1": make_step("map")})
+        workflow.workflow.commit = True
+        record = await self._run(workflow)
+        record.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_no_revision_for_failed_run(self):
+        """Failed runs leave no revision to diff from."""
+        workflow = make_workflow(steps={"delta": make_step("changes")})
+        record = await self._run(workflow, success=False)
+        record.assert_not_called()
+
+
+class TestExecuteWorkflowAsyncPool:
+    """Tests for closing the run's async DB pool."""
+
+    @staticmethod
+    def _db(has_pool: bool) -> MagicMock:
+        db = MagicMock(spec=DoltDB)
+        db.has_async_pool.return_value = has_pool
+        return db
+
+    @pytest.mark.asyncio
+    async def test_closes_pool_opened_by_run(self):
+        """A pool first opened during the run is closed when it finishes."""
+        db = self._db(has_pool=False)
+        with patch(
+            "kurt.workflows.toml.executor.execute_tool",
+            new_callable=AsyncMock,
+            side_effect=ToolExecutionError("map", "boom"),
+        ):
+            result = await execute_workflow(
+                make_workflow(steps={"step1": make_step("map")}), {}, context=ToolContext(db=db)
+            )
+
+        assert result.status == "failed"
+        db.close_async_pool.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_keeps_callers_pool(self):
+        """A pool the caller already had open on the loop is left alone."""
+        db = self._db(has_pool=True)
+        with patch(
+            "kurt.workflows.toml.executor.execute_tool",
+            new_callable=AsyncMock,
+            return_value=make_tool_result(),
+        ):
+            await execute_workflow(
+                make_workflow(steps={"step1": make_step("map")}), {}, context=ToolContext(db=db)
+            )
+
+        db.close_async_pool.assert_not_awaited()
+
+
 # ============================================================================
 # Duration and Timestamp Tests
 # ============================================================================
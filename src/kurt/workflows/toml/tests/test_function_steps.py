@@ -403,6 +403,89 @@ function = "failing_function"
         assert "Something went wrong" in result.step_results["process"].error
 
 
+class TestProcessExecutor:
+    """Function steps with executor = "process" run in a worker pool."""
+
+    def _write_workflow(self, tmp_path: Path, body: str) -> Path:
+        workflow_toml = tmp_path / "workflow.toml"
+        workflow_toml.write_text(
+            '[workflow]\nname = "process-functions"\nmax_process_workers = 2\n\n' + body
+        )
+        return workflow_toml
+
+    def test_parse_executor(self, tmp_path: Path):
+        workflow = parse_workflow(
+            self._write_workflow(
+                tmp_path,
+                '[steps.score]\ntype = "function"\nfunction = "score"\nexecutor = "process"\n',
+            ),
+            validate_tools=False,
+        )
+        assert workflow.steps["score"].executor == "process"
+        assert workflow.workflow.max_process_workers == 2
+
+    def test_process_executor_requires_function_step(self, tmp_path: Path):
+        path = self._write_workflow(
+            tmp_path, '[steps.fetch]\ntype = "fetch"\nexecutor = "process"\n'
+        )
+        with pytest.raises(WorkflowParseError, match="only supported for function steps"):
+            parse_workflow(path, validate_tools=False)
+
+    @pytest.mark.asyncio
+    async def test_runs_in_worker_process(self, tmp_path: Path):
+        tools_py = tmp_path / "tools.py"
+        tools_py.write_text("""
+import os
+
+def score(context):
+    return {"pid": os.getpid(), "threshold": context["inputs"]["threshold"]}
+""")
+        path = self._write_workflow(tmp_path, """
+[inputs.threshold]
+type = "int"
+default = 3
+
+[steps.score]
+type = "function"
+function = "score"
+executor = "process"
+""")
+        workflow = parse_workflow(path, validate_tools=False)
+        result = await execute_workflow(workflow, inputs={"threshold": 5}, tools_path=tools_py)
+
+        assert result.status == "completed", result.step_results
+        step = result.step_results["score"]
+        assert step.output_data[0]["threshold"] == 5
+        assert step.output_data[0]["pid"] != os.getpid()
+
+    @pytest.mark.asyncio
+    async def test_process_function_errors(self, tmp_path: Path):
+        tools_py = tmp_path / "tools.py"
+        tools_py.write_text("""
+def boom(context):
+    raise ValueError("bad record")
+""")
+        path = self._write_workflow(tmp_path, """
+[steps.boom]
+type = "function"
+function = "boom"
+executor = "process"
+
+[steps.missing]
+type = "function"
+function = "not_there"
+executor = "process"
+""")
+        workflow = parse_workflow(path, validate_tools=False)
+        result = await execute_workflow(
+            workflow, inputs={}, tools_path=tools_py, continue_on_error=True
+        )
+
+        assert result.step_results["boom"].status == "failed"
+        assert "bad record" in result.step_results["boom"].error
+        assert result.step_results["missing"].error_type == "function_not_found"
+
+
 @pytest.mark.skipif(
     os.environ.get("CI") == "true",
     reason="Dolt server tests require manual server setup in CI",
@@ -0,0 +1,191 @@
+"""
+Tests for fan-out (foreach / shard_size) steps.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from kurt.tools.core import ToolResult
+from kurt.workflows.toml.executor import execute_workflow
+from kurt.workflows.toml.parser import (
+    StepDef,
+    WorkflowDefinition,
+    WorkflowMeta,
+    WorkflowParseError,
+    parse_workflow,
+)
+
+
+def make_workflow(steps: dict[str, StepDef]) -> WorkflowDefinition:
+    return WorkflowDefinition(workflow=WorkflowMeta(name="fanout"), steps=steps)
+
+
+def source_step(n: int) -> StepDef:
+    return StepDef(type="map", config={"source": "https://example.com", "n": n})
+
+
+class ShardedTools:
+    """execute_tool stand-in: map emits n records, other tools echo with a delay."""
+
+    def __init__(self, fail_shard_containing: int | None = None):
+        self.fail_shard_containing = fail_shard_containing
+        self.active = 0
+        self.peak = 0
+        self.shards: list[list[int]] = []
+
+    async def __call__(self, name, params, context=None, on_progress=None):
+        if name == "map":
+            return ToolResult(success=True, data=[{"i": i} for i in range(params["n"])])
+
+        ids = [r["i"] for r in params["input_data"]]
+        self.shards.append(ids)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        # Later shards finish first
+        await asyncio.sleep(0.001 * (10 - ids[0] % 10))
+        self.active -= 1
+
+        if self.fail_shard_containing in ids:
+            result = ToolResult(success=False)
+            result.add_error(error_type="ERROR", message="shard failed", row_idx=0)
+            return result
+        return ToolResult(success=True, data=[{"i": i, name: True} for i in ids])
+
+
+async def run(workflow: WorkflowDefinition, tools: ShardedTools):
+    with patch("kurt.workflows.toml.executor.execute_tool", tools):
+        return await execute_workflow(workflow, {})
+
+
+class TestShardedSteps:
+    @pytest.mark.asyncio
+    async def test_shards_merge_in_input_order(self):
+        tools = ShardedTools()
+        workflow = make_workflow(
+            {
+                "discover": source_step(10),
+                "download": StepDef(
+                    type="fetch", depends_on=["discover"], shard_size=3, max_concurrent_shards=2
+                ),
+            }
+        )
+        result = await run(workflow, tools)
+
+        assert result.status == "completed"
+        assert sorted(tools.shards) == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+        assert tools.peak == 2
+        assert [r["i"] for r in result.step_results["download"].output_data] == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_foreach_runs_once_per_record(self):
+        tools = ShardedTools()
+        workflow = make_workflow(
+            {
+                "discover": source_step(5),
+                "download": StepDef(
+                    type="fetch", depends_on=["discover"], foreach=True, max_concurrent_shards=8
+                ),
+            }
+        )
+        result = await run(workflow, tools)
+
+        assert len(tools.shards) == 5
+        assert all(len(s) == 1 for s in tools.shards)
+        assert result.step_results["download"].output_count == 5
+
+    @pytest.mark.asyncio
+    async def test_progress_per_shard(self):
+        tools = ShardedTools()
+        workflow = make_workflow(
+            {
+                "discover": source_step(4),
+                "download": StepDef(type="fetch", depends_on=["discover"], shard_size=2),
+            }
+        )
+        with patch("kurt.workflows.toml.executor.atrack_event") as track:
+            await run(workflow, tools)
+
+        shard_events = [
+            c.kwargs for c in track.call_args_list if c.kwargs.get("substep") == "shard"
+        ]
+        assert [e["current"] for e in shard_events] == [1, 2]
+        assert all(e["total"] == 2 for e in shard_events)
+
+    @pytest.mark.asyncio
+    async def test_row_wise_tool_tolerates_failed_shard(self):
+        tools = ShardedTools(fail_shard_containing=4)
+        workflow = make_workflow(
+            {
+                "discover": source_step(6),
+                "download": StepDef(type="fetch", depends_on=["discover"], shard_size=2),
+            }
+        )
+        result = await run(workflow, tools)
+
+        download = result.step_results["download"]
+        assert download.status == "completed"
+        assert [r["i"] for r in download.output_data] == [0, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_other_tools_fail_on_failed_shard(self):
+        tools = ShardedTools(fail_shard_containing=4)
+        workflow = make_workflow(
+            {
+                "discover": source_step(6),
+                "query": StepDef(type="sql", depends_on=["discover"], shard_size=2),
+            }
+        )
+        result = await run(workflow, tools)
+
+        assert result.step_results["query"].status == "failed"
+
+    @pytest.mark.asyncio
+    async def test_function_step_foreach(self, tmp_path: Path):
+        tools_py = tmp_path / "tools.py"
+        tools_py.write_text(
+            "def square(ctx):\n"
+            "    (record,) = ctx['input_data']\n"
+            "    return {'i': record['i'], 'square': record['i'] ** 2}\n"
+        )
+        workflow = make_workflow(
+            {
+                "discover": source_step(4),
+                "square": StepDef(
+                    type="function", function="square", depends_on=["discover"], foreach=True
+                ),
+            }
+        )
+        with patch("kurt.workflows.toml.executor.execute_tool", ShardedTools()):
+            result = await execute_workflow(workflow, {}, tools_path=tools_py)
+
+        assert result.step_results["square"].output_data == [
+            {"i": i, "square": i * i} for i in range(4)
+        ]
+
+
+class TestParseSharding:
+    def _parse(self, tmp_path: Path, step_body: str):
+        path = tmp_path / "wf.toml"
+        path.write_text(
+            '[workflow]\nname = "w"\n\n[steps.a]\ntype = "map"\n\n'
+            f'[steps.b]\ntype = "fetch"\ndepends_on = ["a"]\n{step_body}\n'
+        )
+        return parse_workflow(path, validate_tools=False)
+
+    def test_shard_options(self, tmp_path: Path):
+        workflow = self._parse(tmp_path, "shard_size = 50\nmax_concurrent_shards = 8")
+        assert workflow.steps["b"].shard_size == 50
+        assert workflow.steps["b"].max_concurrent_shards == 8
+
+    def test_foreach_conflicts_with_shard_size(self, tmp_path: Path):
+        with pytest.raises(WorkflowParseError, match="foreach"):
+            self._parse(tmp_path, "foreach = true\nshard_size = 10")
+
+    def test_stream_conflicts_with_sharding(self, tmp_path: Path):
+        with pytest.raises(WorkflowParseError, match="stream"):
+            self._parse(tmp_path, "stream = true\nforeach = true")
@@ -0,0 +1,239 @@
+"""
+Tests for step-level memoization in TOML workflows.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from kurt.tools.core import ToolResult
+from kurt.workflows.toml.cache import StepCache, hash_records, step_fingerprint, tool_version
+from kurt.workflows.toml.executor import execute_workflow
+from kurt.workflows.toml.parser import StepDef, WorkflowDefinition, WorkflowMeta
+
+
+def make_workflow(steps: dict[str, StepDef]) -> WorkflowDefinition:
+    return WorkflowDefinition(workflow=WorkflowMeta(name="cached"), steps=steps)
+
+
+def pipeline() -> WorkflowDefinition:
+    return make_workflow(
+        {
+            "summarize": StepDef(
+                type="batch-llm", config={"prompt_template": "Summarize {content}"}, cache=True
+            ),
+            "embed": StepDef(type="batch-embedding", depends_on=["summarize"], cache=True),
+            "classify": StepDef(
+                type="batch-llm",
+                depends_on=["embed"],
+                config={"prompt_template": "Classify {content}"},
+                cache=True,
+            ),
+        }
+    )
+
+
+class ToolCalls:
+    """execute_tool stand-in that records calls and echoes input records."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    async def __call__(self, name, params, context=None, on_progress=None):
+        self.calls.append(name)
+        records = params["input_data"] or [{"url": "https://example.com/a"}]
+        return ToolResult(success=True, data=[{**r, name: True} for r in records])
+
+
+async def run(workflow, cache, inputs=None, **kwargs) -> tuple[Any, list[str]]:
+    tool = ToolCalls()
+    with patch("kurt.workflows.toml.executor.execute_tool", tool):
+        result = await execute_workflow(workflow, inputs or {}, step_cache=cache, **kwargs)
+    return result, tool.calls
+
+
+class TestFingerprint:
+    def test_key_order_does_not_matter(self):
+        assert hash_records([{"a": 1, "b": 2}]) == hash_records([{"b": 2, "a": 1}])
+
+    def test_record_order_matters(self):
+        assert hash_records([{"a": 1}, {"a": 2}]) != hash_records([{"a": 2}, {"a": 1}])
+
+    def test_every_component_changes_fingerprint(self):
+        base = step_fingerprint("fetch", {"engine": "httpx"}, [{"url": "u"}], "v1")
+        assert base == step_fingerprint("fetch", {"engine": "httpx"}, [{"url": "u"}], "v1")
+        assert base != step_fingerprint("map", {"engine": "httpx"}, [{"url": "u"}], "v1")
+        assert base != step_fingerprint("fetch", {"engine": "trafilatura"}, [{"url": "u"}], "v1")
+        assert base != step_fingerprint("fetch", {"engine": "httpx"}, [{"url": "v"}], "v1")
+        assert base != step_fingerprint("fetch", {"engine": "httpx"}, [{"url": "u"}], "v2")
+
+    def test_bytes_values_are_hashed(self):
+        assert hash_records([{"e": b"\x00\x01"}]) != hash_records([{"e": b"\x00\x02"}])
+
+    def test_function_version_tracks_source(self, tmp_path: Path):
+        tools = tmp_path / "tools.py"
+        tools.write_text("def f(ctx): return 1\n")
+        before = tool_version("function", function_source=tools)
+        tools.write_text("def f(ctx): return 2\n")
+        assert tool_version("function", function_source=tools) != before
+
+
+class TestStepCacheStore:
+    def test_round_trip(self, tmp_path: Path):
+        cache = StepCache(tmp_path)
+        assert cache.get("ab" * 32) is None
+        cache.put("ab" * 32, [{"embedding": b"\x00\x01", "n": 1}], step_id="s")
+        assert cache.get("ab" * 32) == [{"embedding": b"\x00\x01", "n": 1}]
+        assert cache.stats.to_dict() == {"hits": 1, "misses": 1, "writes": 1, "evictions": 0}
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path):
+        cache = StepCache(tmp_path)
+        cache.put("cd" * 32, [{"n": 1}])
+        next(tmp_path.glob("*/*.pkl")).write_bytes(b"not a pickle")
+        assert cache.get("cd" * 32) is None
+
+    def test_clear(self, tmp_path: Path):
+        cache = StepCache(tmp_path)
+        cache.put("ab" * 32, [])
+        cache.put("cd" * 32, [])
+        assert cache.clear() == 2
+        assert cache.get("ab" * 32) is None
+
+    def test_expired_entry_is_a_miss(self, tmp_path: Path):
+        cache = StepCache(tmp_path, max_age=timedelta(days=1))
+        cache.put("ab" * 32, [{"n": 1}])
+        stale = time.time() - 2 * 24 * 3600
+        os.utime(next(tmp_path.glob("*/*.pkl")), (stale, stale))
+        assert cache.get("ab" * 32) is None
+        assert not list(tmp_path.glob("*/*.pkl"))
+
+    def test_size_bound_evicts_least_recently_used(self, tmp_path: Path):
+        cache = StepCache(tmp_path, max_bytes=None)
+        for key in ("aa", "bb", "cc"):
+            cache.put(key * 32, [{"text": "x" * 1000}])
+        for age, key in enumerate(("bb", "aa", "cc")):
+            path = cache._path(key * 32)
+            os.utime(path, (time.time() - 100 + age, path.stat().st_mtime))
+
+        cache.max_bytes = 2 * cache._path("aa" * 32).stat().st_size
+        assert cache.prune() == 1
+        assert cache.get("bb" * 32) is None
+        assert cache.get("aa" * 32) is not None
+
+
+class TestExecutorMemoization:
+    @pytest.mark.asyncio
+    async def test_second_run_reuses_every_step(self, tmp_path: Path):
+        cache = StepCache(tmp_path)
+        first, calls = await run(pipeline(), cache)
+        assert calls == ["batch-llm", "batch-embedding", "batch-llm"]
+
+        second, calls = await run(pipeline(), cache)
+        assert calls == []
+        assert second.status == "completed"
+        assert all(r.cached for r in second.step_results.values())
+        assert second.step_results["classify"].output_data == (
+            first.step_results["classify"].output_data
+        )
+
+    @pytest.mark.asyncio
+    async def test_config_change_reruns_only_that_step(self, tmp_path: Path):
+        cache = StepCache(tmp_path)
+        await run(pipeline(), cache)
+
+        workflow = pipeline()
+        workflow.steps["classify"].config["prompt_template"] = "Shorter: {content}"
+        result, calls = await run(workflow, cache)
+
+        assert calls == ["batch-llm"]
+        assert result.step_results["summarize"].cached
+        assert not result.step_results["classify"].cached
+
+    @pytest.mark.asyncio
+    async def test_input_change_propagates_downstream(self, tmp_path: Path):
+        cache = StepCache(tmp_path)
+        await run(pipeline(), cache, inputs={"seed": 1})
+        _, calls = await run(pipeline(), cache, inputs={"seed": 2})
+        assert calls == ["batch-llm", "batch-embedding", "batch-llm"]
+
+    @pytest.mark.asyncio
+    async def test_force_step(self, tmp_path: Path):
+        cache = StepCache(tmp_path)
+        await run(pipeline(), cache)
+
+        result, calls = await run(pipeline(), cache, force_steps=["embed"])
+
+        # Same output as before, so the downstream step is still a hit
+        assert calls == ["batch-embedding"]
+        assert not result.step_results["embed"].cached
+        assert result.step_results["classify"].cached
+
+    @pytest.mark.asyncio
+    async def test_failed_step_is_not_cached(self, tmp_path: Path):
+        cache = StepCache(tmp_path)
+        workflow = make_workflow({"summarize": StepDef(type="batch-llm", cache=True)})
+
+        async def failing(name, params, context=None, on_progress=None):
+            result = ToolResult(success=False)
+            result.add_error(error_type="ERROR", message="boom")
+            return result
+
+        with patch("kurt.workflows.toml.executor.execute_tool", side_effect=failing):
+            await execute_workflow(workflow, {}, step_cache=cache)
+
+        _, calls = await run(workflow, cache)
+        assert calls == ["batch-llm"]
+
+    @pytest.mark.asyncio
+    async def test_opt_outs(self, tmp_path: Path):
+        """Steps without cache = true and non-cacheable tools always run."""
+        cache = StepCache(tmp_path)
+        workflow = make_workflow(
+            {
+                "discover": StepDef(type="map", cache=True),
+                "download": StepDef(type="fetch", depends_on=["discover"], cache=True),
+                "summarize": StepDef(type="batch-llm", depends_on=["download"]),
+                "query": StepDef(
+                    type="sql", depends_on=["summarize"], config={"query": "SELECT 1"}, cache=True
+                ),
+            }
+        )
+        await run(workflow, cache)
+        _, calls = await run(workflow, cache)
+        assert calls == ["map", "fetch", "batch-llm", "sql"]
+
+    @pytest.mark.asyncio
+    async def test_no_cache_by_default(self, tmp_path: Path):
+        _, calls = await run(pipeline(), None)
+        _, calls = await run(pipeline(), None)
+        assert calls == ["batch-llm", "batch-embedding", "batch-llm"]
+
+    @pytest.mark.asyncio
+    async def test_function_step(self, tmp_path: Path):
+        tools = tmp_path / "tools.py"
+        tools.write_text(
+            "COUNT = []\n"
+            "def tag(ctx):\n"
+            "    COUNT.append(1)\n"
+            "    return {'n': len(ctx['input_data'])}\n"
+        )
+        cache = StepCache(tmp_path / "cache")
+        workflow = make_workflow({"tag": StepDef(type="function", function="tag", cache=True)})
+
+        first = await execute_workflow(workflow, {"x": 1}, tools_path=tools, step_cache=cache)
+        second = await execute_workflow(workflow, {"x": 1}, tools_path=tools, step_cache=cache)
+
+        assert not first.step_results["tag"].cached
+        assert second.step_results["tag"].cached
+        assert second.step_results["tag"].output_data == [{"n": 1}]
+
+        tools.write_text(tools.read_text() + "# edited\n")
+        third = await execute_workflow(workflow, {"x": 1}, tools_path=tools, step_cache=cache)
+        assert not third.step_results["tag"].cached
@@ -0,0 +1,179 @@
+"""
+Tests for streaming record flow between workflow steps.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from kurt.tools.core import ToolResult
+from kurt.workflows.toml.executor import _merge_results, execute_workflow
+from kurt.workflows.toml.parser import StepDef, WorkflowDefinition, WorkflowMeta
+
+
+def make_workflow(steps: dict[str, StepDef]) -> WorkflowDefinition:
+    return WorkflowDefinition(workflow=WorkflowMeta(name="streaming"), steps=steps)
+
+
+def rows(prefix: str, n: int) -> list[dict[str, Any]]:
+    return [{"url": f"https://example.com/{prefix}{i}"} for i in range(n)]
+
+
+class TestStreamingSteps:
+    @pytest.mark.asyncio
+    async def test_consumer_starts_before_producer_finishes(self):
+        """A stream step processes the first chunk while its dependency still runs."""
+        workflow = make_workflow(
+            {
+                "discover": StepDef(type="map"),
+                "download": StepDef(
+                    type="fetch", depends_on=["discover"], stream=True, stream_chunk_size=2
+                ),
+            }
+        )
+
+        consumer_started = asyncio.Event()
+        producer_done = False
+        started_early = False
+        consumer_inputs: list[int] = []
+
+        async def mock_stream(name, params, context=None, on_progress=None):
+            nonlocal producer_done
+            yield ToolResult(success=True, data=rows("a", 2))
+            await asyncio.wait_for(consumer_started.wait(), timeout=2)
+            yield ToolResult(success=True, data=rows("b", 3))
+            producer_done = True
+
+        async def mock_execute(name, params, context=None, on_progress=None):
+            nonlocal started_early
+            if not consumer_started.is_set():
+                started_early = not producer_done
+                consumer_started.set()
+            consumer_inputs.append(len(params["input_data"]))
+            return ToolResult(success=True, data=[{"ok": True}] * len(params["input_data"]))
+
+        with (
+            patch("kurt.workflows.toml.executor.execute_tool_stream", mock_stream),
+            patch("kurt.workflows.toml.executor.execute_tool", side_effect=mock_execute),
+        ):
+            result = await execute_workflow(workflow, {})
+
+        assert result.status == "completed"
+        assert started_early
+        assert consumer_inputs == [2, 2, 1]
+
+        producer = result.step_results["discover"]
+        assert producer.output_count == 5
+        assert producer.output_data == []  # only streamed, not retained
+        consumer = result.step_results["download"]
+        assert consumer.output_count == 5
+        assert len(consumer.output_data) == 5
+
+    @pytest.mark.asyncio
+    async def test_non_row_wise_tool_gets_all_records(self):
+        """Tools without stream_input run once on the complete input."""
+        workflow = make_workflow(
+            {
+                "discover": StepDef(type="map"),
+                "query": StepDef(type="sql", depends_on=["discover"], stream=True),
+            }
+        )
+        sql_inputs: list[int] = []
+
+        async def mock_stream(name, params, context=None, on_progress=None):
+            for prefix in "abc":
+                yield ToolResult(success=True, data=rows(prefix, 2))
+
+        async def mock_execute(name, params, context=None, on_progress=None):
+            sql_inputs.append(len(params["input_data"]))
+            return ToolResult(success=True)
+
+        with (
+            patch("kurt.workflows.toml.executor.execute_tool_stream", mock_stream),
+            patch("kurt.workflows.toml.executor.execute_tool", side_effect=mock_execute),
+        ):
+            result = await execute_workflow(workflow, {})
+
+        assert result.status == "completed"
+        assert sql_inputs == [6]
+
+    @pytest.mark.asyncio
+    async def test_stream_step_does_not_deadlock_with_one_slot(self):
+        """Stream consumers run beside their producer even with max_parallel_steps=1."""
+        workflow = make_workflow(
+            {
+                "discover": StepDef(type="map"),
+                "download": StepDef(
+                    type="fetch", depends_on=["discover"], stream=True, stream_chunk_size=1
+                ),
+            }
+        )
+
+        async def mock_stream(name, params, context=None, on_progress=None):
+            for i in range(20):
+                yield ToolResult(success=True, data=rows(str(i), 1))
+
+        async def mock_execute(name, params, context=None, on_progress=None):
+            return ToolResult(success=True, data=params["input_data"])
+
+        with (
+            patch("kurt.workflows.toml.executor.execute_tool_stream", mock_stream),
+            patch("kurt.workflows.toml.executor.execute_tool", side_effect=mock_execute),
+        ):
+            result = await asyncio.wait_for(
+                execute_workflow(workflow, {}, max_parallel_steps=1), timeout=5
+            )
+
+        assert result.status == "completed"
+        assert result.step_results["download"].output_count == 20
+
+    @pytest.mark.asyncio
+    async def test_step_completes_when_any_chunk_succeeds(self):
+        """A failing chunk does not fail the step while other chunks succeed."""
+        workflow = make_workflow(
+            {
+                "discover": StepDef(type="map"),
+                "download": StepDef(
+                    type="fetch", depends_on=["discover"], stream=True, stream_chunk_size=2
+                ),
+            }
+        )
+
+        async def mock_stream(name, params, context=None, on_progress=None):
+            yield ToolResult(success=True, data=rows("a", 4))
+
+        calls = 0
+
+        async def mock_execute(name, params, context=None, on_progress=None):
+            nonlocal calls
+            calls += 1
+            result = ToolResult(success=calls == 1, data=[])
+            if calls == 2:
+                result.add_error(error_type="ERROR", message="boom", row_idx=1)
+            return result
+
+        with (
+            patch("kurt.workflows.toml.executor.execute_tool_stream", mock_stream),
+            patch("kurt.workflows.toml.executor.execute_tool", side_effect=mock_execute),
+        ):
+            executor_result = await execute_workflow(workflow, {})
+
+        assert calls == 2
+        assert executor_result.step_results["download"].status == "completed"
+
+
+def test_merge_results_offsets_row_indices():
+    combined = ToolResult(success=True, data=[{"n": 0}])
+    partial = ToolResult(success=False, data=[{"n": 1}])
+    partial.add_error(error_type="ERROR", message="boom", row_idx=1)
+
+    _merge_results(combined, partial, row_offset=10)
+    _merge_results(combined, ToolResult(success=True, data=[{"n": 2}]), keep_data=False)
+
+    assert combined.success is False
+    assert combined.data == [{"n": 0}, {"n": 1}]
+    assert combined.errors[0].row_idx == 11